@@ -1100,6 +1100,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -1124,9 +1131,22 @@ id:
     returned: always
     type: str
     sample: id
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Network/applicationGateways/myApplicationGateway",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2017-11-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Network/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -1237,7 +1257,8 @@ class AzureRMApplicationGateways(AzureRMModuleBase):
 
         super(AzureRMApplicationGateways, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                          supports_check_mode=True,
-                                                         supports_tags=False)
+                                                         supports_tags=False,
+                                                         supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -1383,9 +1404,8 @@ class AzureRMApplicationGateways(AzureRMModuleBase):
         self.mgmt_client = self.get_mgmt_svc_client(NetworkManagementClient,
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
         if "location" not in self.parameters:
+            resource_group = self.get_resource_group(self.resource_group)
             self.parameters["location"] = resource_group.location
 
         old_response = self.get_applicationgateway()
@@ -1402,7 +1422,8 @@ class AzureRMApplicationGateways(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Application Gateway instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.parameters, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Application Gateway instance")
@@ -1428,8 +1449,7 @@ class AzureRMApplicationGateways(AzureRMModuleBase):
             self.delete_applicationgateway()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_applicationgateway():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_applicationgateway)
         else:
             self.log("Application Gateway instance unchanged")
             self.results['changed'] = False
@@ -1446,7 +1466,7 @@ class AzureRMApplicationGateways(AzureRMModuleBase):
 
         :return: deserialized Application Gateway instance state dictionary
         '''
-        self.log("Creating / Updating the Application Gateway instance {0}".format(self.name))
+        self.log("Creating / Updating the Application Gateway instance {0}", self.name)
 
         try:
             response = self.mgmt_client.application_gateways.create_or_update(resource_group_name=self.resource_group,
@@ -1456,7 +1476,7 @@ class AzureRMApplicationGateways(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Application Gateway instance.')
+            self.log('Error attempting to create the Application Gateway instance.', level='error')
             self.fail("Error creating the Application Gateway instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -1466,12 +1486,14 @@ class AzureRMApplicationGateways(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Application Gateway instance {0}".format(self.name))
+        self.log("Deleting the Application Gateway instance {0}", self.name)
         try:
             response = self.mgmt_client.application_gateways.delete(resource_group_name=self.resource_group,
                                                                     application_gateway_name=self.name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Application Gateway instance.')
+            self.log('Error attempting to delete the Application Gateway instance.', level='error')
             self.fail("Error deleting the Application Gateway instance: {0}".format(str(e)))
 
         return True
@@ -1482,14 +1504,14 @@ class AzureRMApplicationGateways(AzureRMModuleBase):
 
         :return: deserialized Application Gateway instance state dictionary
         '''
-        self.log("Checking if the Application Gateway instance {0} is present".format(self.name))
+        self.log("Checking if the Application Gateway instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.application_gateways.get(resource_group_name=self.resource_group,
                                                                  application_gateway_name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Application Gateway instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Application Gateway instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Application Gateway instance.')
         if found is True:
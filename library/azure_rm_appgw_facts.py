@@ -30,6 +30,15 @@ options:
         description:
             - The name of the application gateway.
         required: True
+    fields:
+        description:
+            - List of attributes to return for every item, nested attributes are separated by dots, e.g. C(sku.name).
+            - Only the listed attributes are read from the service response and serialized.
+        type: list
+    query:
+        description:
+            - JMESPath expression applied to every returned item, after I(fields). Requires the jmespath package.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -97,7 +106,8 @@ class AzureRMApplicationGatewaysFacts(AzureRMModuleBase):
         self.mgmt_client = None
         self.resource_group = None
         self.name = None
-        super(AzureRMApplicationGatewaysFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMApplicationGatewaysFacts, self).__init__(self.module_arg_spec,
+                                                              supports_projection=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -121,12 +131,12 @@ class AzureRMApplicationGatewaysFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.application_gateways.get(resource_group_name=self.resource_group,
                                                                  application_gateway_name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
-            self.log('Could not get facts for ApplicationGateways.')
+            self.log('Could not get facts for ApplicationGateways.', level='warning')
 
         if response is not None:
-            results[response.name] = response.as_dict()
+            results[response.name] = self.serialize_facts(response)
 
         return results
 
@@ -44,6 +44,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -68,9 +75,22 @@ id:
     returned: always
     type: str
     sample: /subscriptions/subid/resourceGroups/rg1/providers/Microsoft.Network/applicationSecurityGroups/test-asg
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Network/applicationSecurityGroups/myApplicationSecurityGroup",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2017-11-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Network/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -124,7 +144,8 @@ class AzureRMApplicationSecurityGroups(AzureRMModuleBase):
 
         super(AzureRMApplicationSecurityGroups, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                                supports_check_mode=True,
-                                                               supports_tags=False)
+                                                               supports_tags=False,
+                                                               supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -144,9 +165,8 @@ class AzureRMApplicationSecurityGroups(AzureRMModuleBase):
         self.mgmt_client = self.get_mgmt_svc_client(NetworkManagementClient,
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
         if "location" not in self.parameters:
+            resource_group = self.get_resource_group(self.resource_group)
             self.parameters["location"] = resource_group.location
 
         old_response = self.get_applicationsecuritygroup()
@@ -163,7 +183,8 @@ class AzureRMApplicationSecurityGroups(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Application Security Group instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.parameters, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Application Security Group instance")
@@ -189,8 +210,7 @@ class AzureRMApplicationSecurityGroups(AzureRMModuleBase):
             self.delete_applicationsecuritygroup()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_applicationsecuritygroup():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_applicationsecuritygroup)
         else:
             self.log("Application Security Group instance unchanged")
             self.results['changed'] = False
@@ -207,7 +227,7 @@ class AzureRMApplicationSecurityGroups(AzureRMModuleBase):
 
         :return: deserialized Application Security Group instance state dictionary
         '''
-        self.log("Creating / Updating the Application Security Group instance {0}".format(self.application_security_group_name))
+        self.log("Creating / Updating the Application Security Group instance {0}", self.application_security_group_name)
 
         try:
             response = self.mgmt_client.application_security_groups.create_or_update(resource_group_name=self.resource_group,
@@ -217,7 +237,7 @@ class AzureRMApplicationSecurityGroups(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Application Security Group instance.')
+            self.log('Error attempting to create the Application Security Group instance.', level='error')
             self.fail("Error creating the Application Security Group instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -227,12 +247,14 @@ class AzureRMApplicationSecurityGroups(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Application Security Group instance {0}".format(self.application_security_group_name))
+        self.log("Deleting the Application Security Group instance {0}", self.application_security_group_name)
         try:
             response = self.mgmt_client.application_security_groups.delete(resource_group_name=self.resource_group,
                                                                            application_security_group_name=self.application_security_group_name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Application Security Group instance.')
+            self.log('Error attempting to delete the Application Security Group instance.', level='error')
             self.fail("Error deleting the Application Security Group instance: {0}".format(str(e)))
 
         return True
@@ -243,14 +265,14 @@ class AzureRMApplicationSecurityGroups(AzureRMModuleBase):
 
         :return: deserialized Application Security Group instance state dictionary
         '''
-        self.log("Checking if the Application Security Group instance {0} is present".format(self.application_security_group_name))
+        self.log("Checking if the Application Security Group instance {0} is present", self.application_security_group_name)
         found = False
         try:
             response = self.mgmt_client.application_security_groups.get(resource_group_name=self.resource_group,
                                                                         application_security_group_name=self.application_security_group_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Application Security Group instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Application Security Group instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Application Security Group instance.')
         if found is True:
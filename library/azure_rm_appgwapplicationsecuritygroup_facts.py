@@ -30,6 +30,15 @@ options:
         description:
             - The name of the application security group.
         required: True
+    fields:
+        description:
+            - List of attributes to return for every item, nested attributes are separated by dots, e.g. C(sku.name).
+            - Only the listed attributes are read from the service response and serialized.
+        type: list
+    query:
+        description:
+            - JMESPath expression applied to every returned item, after I(fields). Requires the jmespath package.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -115,7 +124,8 @@ class AzureRMApplicationSecurityGroupsFacts(AzureRMModuleBase):
         self.mgmt_client = None
         self.resource_group = None
         self.application_security_group_name = None
-        super(AzureRMApplicationSecurityGroupsFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMApplicationSecurityGroupsFacts, self).__init__(self.module_arg_spec,
+                                                                    supports_projection=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -139,12 +149,12 @@ class AzureRMApplicationSecurityGroupsFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.application_security_groups.get(resource_group_name=self.resource_group,
                                                                         application_security_group_name=self.application_security_group_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
-            self.log('Could not get facts for ApplicationSecurityGroups.')
+            self.log('Could not get facts for ApplicationSecurityGroups.', level='warning')
 
         if response is not None:
-            results[response.name] = response.as_dict()
+            results[response.name] = self.serialize_facts(response)
 
         return results
 
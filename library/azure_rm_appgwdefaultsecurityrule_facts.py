@@ -34,6 +34,15 @@ options:
         description:
             - The name of the default security rule.
         required: True
+    fields:
+        description:
+            - List of attributes to return for every item, nested attributes are separated by dots, e.g. C(sku.name).
+            - Only the listed attributes are read from the service response and serialized.
+        type: list
+    query:
+        description:
+            - JMESPath expression applied to every returned item, after I(fields). Requires the jmespath package.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -146,7 +155,8 @@ class AzureRMDefaultSecurityRulesFacts(AzureRMModuleBase):
         self.resource_group = None
         self.network_security_group_name = None
         self.default_security_rule_name = None
-        super(AzureRMDefaultSecurityRulesFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMDefaultSecurityRulesFacts, self).__init__(self.module_arg_spec,
+                                                               supports_projection=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -172,12 +182,12 @@ class AzureRMDefaultSecurityRulesFacts(AzureRMModuleBase):
             response = self.mgmt_client.default_security_rules.get(resource_group_name=self.resource_group,
                                                                    network_security_group_name=self.network_security_group_name,
                                                                    default_security_rule_name=self.default_security_rule_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
-            self.log('Could not get facts for DefaultSecurityRules.')
+            self.log('Could not get facts for DefaultSecurityRules.', level='warning')
 
         if response is not None:
-            results[response.name] = response.as_dict()
+            results[response.name] = self.serialize_facts(response)
 
         return results
 
@@ -570,6 +570,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -594,9 +601,22 @@ id:
     returned: always
     type: str
     sample: id
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Network/expressRouteCircuits/myExpressRouteCircuit",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2017-11-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Network/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -687,7 +707,8 @@ class AzureRMExpressRouteCircuits(AzureRMModuleBase):
 
         super(AzureRMExpressRouteCircuits, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                           supports_check_mode=True,
-                                                          supports_tags=False)
+                                                          supports_tags=False,
+                                                          supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -759,9 +780,8 @@ class AzureRMExpressRouteCircuits(AzureRMModuleBase):
         self.mgmt_client = self.get_mgmt_svc_client(NetworkManagementClient,
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
         if "location" not in self.parameters:
+            resource_group = self.get_resource_group(self.resource_group)
             self.parameters["location"] = resource_group.location
 
         old_response = self.get_expressroutecircuit()
@@ -778,7 +798,8 @@ class AzureRMExpressRouteCircuits(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Express Route Circuit instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.parameters, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Express Route Circuit instance")
@@ -804,8 +825,7 @@ class AzureRMExpressRouteCircuits(AzureRMModuleBase):
             self.delete_expressroutecircuit()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_expressroutecircuit():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_expressroutecircuit)
         else:
             self.log("Express Route Circuit instance unchanged")
             self.results['changed'] = False
@@ -822,7 +842,7 @@ class AzureRMExpressRouteCircuits(AzureRMModuleBase):
 
         :return: deserialized Express Route Circuit instance state dictionary
         '''
-        self.log("Creating / Updating the Express Route Circuit instance {0}".format(self.circuit_name))
+        self.log("Creating / Updating the Express Route Circuit instance {0}", self.circuit_name)
 
         try:
             response = self.mgmt_client.express_route_circuits.create_or_update(resource_group_name=self.resource_group,
@@ -832,7 +852,7 @@ class AzureRMExpressRouteCircuits(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Express Route Circuit instance.')
+            self.log('Error attempting to create the Express Route Circuit instance.', level='error')
             self.fail("Error creating the Express Route Circuit instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -842,12 +862,14 @@ class AzureRMExpressRouteCircuits(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Express Route Circuit instance {0}".format(self.circuit_name))
+        self.log("Deleting the Express Route Circuit instance {0}", self.circuit_name)
         try:
             response = self.mgmt_client.express_route_circuits.delete(resource_group_name=self.resource_group,
                                                                       circuit_name=self.circuit_name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Express Route Circuit instance.')
+            self.log('Error attempting to delete the Express Route Circuit instance.', level='error')
             self.fail("Error deleting the Express Route Circuit instance: {0}".format(str(e)))
 
         return True
@@ -858,14 +880,14 @@ class AzureRMExpressRouteCircuits(AzureRMModuleBase):
 
         :return: deserialized Express Route Circuit instance state dictionary
         '''
-        self.log("Checking if the Express Route Circuit instance {0} is present".format(self.circuit_name))
+        self.log("Checking if the Express Route Circuit instance {0} is present", self.circuit_name)
         found = False
         try:
             response = self.mgmt_client.express_route_circuits.get(resource_group_name=self.resource_group,
                                                                    circuit_name=self.circuit_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Express Route Circuit instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Express Route Circuit instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Express Route Circuit instance.')
         if found is True:
@@ -60,6 +60,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -84,9 +91,22 @@ id:
     returned: always
     type: str
     sample: id
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Network/expressRouteCircuits/myExpressRouteCircuit/authorizations/myAuthorization",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2017-11-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Network/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -156,7 +176,8 @@ class AzureRMExpressRouteCircuitAuthorizations(AzureRMModuleBase):
 
         super(AzureRMExpressRouteCircuitAuthorizations, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                                        supports_check_mode=True,
-                                                                       supports_tags=False)
+                                                                       supports_tags=False,
+                                                                       supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -198,7 +219,8 @@ class AzureRMExpressRouteCircuitAuthorizations(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Express Route Circuit Authorization instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.parameters, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Express Route Circuit Authorization instance")
@@ -224,8 +246,7 @@ class AzureRMExpressRouteCircuitAuthorizations(AzureRMModuleBase):
             self.delete_expressroutecircuitauthorization()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_expressroutecircuitauthorization():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_expressroutecircuitauthorization)
         else:
             self.log("Express Route Circuit Authorization instance unchanged")
             self.results['changed'] = False
@@ -242,7 +263,7 @@ class AzureRMExpressRouteCircuitAuthorizations(AzureRMModuleBase):
 
         :return: deserialized Express Route Circuit Authorization instance state dictionary
         '''
-        self.log("Creating / Updating the Express Route Circuit Authorization instance {0}".format(self.authorization_name))
+        self.log("Creating / Updating the Express Route Circuit Authorization instance {0}", self.authorization_name)
 
         try:
             response = self.mgmt_client.express_route_circuit_authorizations.create_or_update(resource_group_name=self.resource_group,
@@ -253,7 +274,7 @@ class AzureRMExpressRouteCircuitAuthorizations(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Express Route Circuit Authorization instance.')
+            self.log('Error attempting to create the Express Route Circuit Authorization instance.', level='error')
             self.fail("Error creating the Express Route Circuit Authorization instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -263,13 +284,15 @@ class AzureRMExpressRouteCircuitAuthorizations(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Express Route Circuit Authorization instance {0}".format(self.authorization_name))
+        self.log("Deleting the Express Route Circuit Authorization instance {0}", self.authorization_name)
         try:
             response = self.mgmt_client.express_route_circuit_authorizations.delete(resource_group_name=self.resource_group,
                                                                                     circuit_name=self.circuit_name,
                                                                                     authorization_name=self.authorization_name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Express Route Circuit Authorization instance.')
+            self.log('Error attempting to delete the Express Route Circuit Authorization instance.', level='error')
             self.fail("Error deleting the Express Route Circuit Authorization instance: {0}".format(str(e)))
 
         return True
@@ -280,15 +303,15 @@ class AzureRMExpressRouteCircuitAuthorizations(AzureRMModuleBase):
 
         :return: deserialized Express Route Circuit Authorization instance state dictionary
         '''
-        self.log("Checking if the Express Route Circuit Authorization instance {0} is present".format(self.authorization_name))
+        self.log("Checking if the Express Route Circuit Authorization instance {0} is present", self.authorization_name)
         found = False
         try:
             response = self.mgmt_client.express_route_circuit_authorizations.get(resource_group_name=self.resource_group,
                                                                                  circuit_name=self.circuit_name,
                                                                                  authorization_name=self.authorization_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Express Route Circuit Authorization instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Express Route Circuit Authorization instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Express Route Circuit Authorization instance.')
         if found is True:
@@ -34,6 +34,15 @@ options:
         description:
             - The name of the authorization.
         required: True
+    fields:
+        description:
+            - List of attributes to return for every item, nested attributes are separated by dots, e.g. C(sku.name).
+            - Only the listed attributes are read from the service response and serialized.
+        type: list
+    query:
+        description:
+            - JMESPath expression applied to every returned item, after I(fields). Requires the jmespath package.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -107,7 +116,8 @@ class AzureRMExpressRouteCircuitAuthorizationsFacts(AzureRMModuleBase):
         self.resource_group = None
         self.circuit_name = None
         self.authorization_name = None
-        super(AzureRMExpressRouteCircuitAuthorizationsFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMExpressRouteCircuitAuthorizationsFacts, self).__init__(self.module_arg_spec,
+                                                                            supports_projection=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -133,12 +143,12 @@ class AzureRMExpressRouteCircuitAuthorizationsFacts(AzureRMModuleBase):
             response = self.mgmt_client.express_route_circuit_authorizations.get(resource_group_name=self.resource_group,
                                                                                  circuit_name=self.circuit_name,
                                                                                  authorization_name=self.authorization_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
-            self.log('Could not get facts for ExpressRouteCircuitAuthorizations.')
+            self.log('Could not get facts for ExpressRouteCircuitAuthorizations.', level='warning')
 
         if response is not None:
-            results[response.name] = response.as_dict()
+            results[response.name] = self.serialize_facts(response)
 
         return results
 
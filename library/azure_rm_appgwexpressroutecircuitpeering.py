@@ -688,6 +688,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+            - Wait for the long running create, update or delete operation to complete.
+            - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+            - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -718,9 +725,22 @@ state:
     returned: always
     type: str
     sample: state
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Network/expressRouteCircuits/myExpressRouteCircuit/peerings/myPeering",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2017-11-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Network/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -835,7 +855,8 @@ class AzureRMExpressRouteCircuitPeerings(AzureRMModuleBase):
 
         super(AzureRMExpressRouteCircuitPeerings, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                                  supports_check_mode=True,
-                                                                 supports_tags=False)
+                                                                 supports_tags=False,
+                                                                 supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -921,7 +942,8 @@ class AzureRMExpressRouteCircuitPeerings(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Express Route Circuit Peering instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.parameters, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Express Route Circuit Peering instance")
@@ -947,8 +969,7 @@ class AzureRMExpressRouteCircuitPeerings(AzureRMModuleBase):
             self.delete_expressroutecircuitpeering()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_expressroutecircuitpeering():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_expressroutecircuitpeering)
         else:
             self.log("Express Route Circuit Peering instance unchanged")
             self.results['changed'] = False
@@ -966,7 +987,7 @@ class AzureRMExpressRouteCircuitPeerings(AzureRMModuleBase):
 
         :return: deserialized Express Route Circuit Peering instance state dictionary
         '''
-        self.log("Creating / Updating the Express Route Circuit Peering instance {0}".format(self.peering_name))
+        self.log("Creating / Updating the Express Route Circuit Peering instance {0}", self.peering_name)
 
         try:
             response = self.mgmt_client.express_route_circuit_peerings.create_or_update(resource_group_name=self.resource_group,
@@ -977,7 +998,7 @@ class AzureRMExpressRouteCircuitPeerings(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Express Route Circuit Peering instance.')
+            self.log('Error attempting to create the Express Route Circuit Peering instance.', level='error')
             self.fail("Error creating the Express Route Circuit Peering instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -987,13 +1008,15 @@ class AzureRMExpressRouteCircuitPeerings(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Express Route Circuit Peering instance {0}".format(self.peering_name))
+        self.log("Deleting the Express Route Circuit Peering instance {0}", self.peering_name)
         try:
             response = self.mgmt_client.express_route_circuit_peerings.delete(resource_group_name=self.resource_group,
                                                                               circuit_name=self.circuit_name,
                                                                               peering_name=self.peering_name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Express Route Circuit Peering instance.')
+            self.log('Error attempting to delete the Express Route Circuit Peering instance.', level='error')
             self.fail("Error deleting the Express Route Circuit Peering instance: {0}".format(str(e)))
 
         return True
@@ -1004,15 +1027,15 @@ class AzureRMExpressRouteCircuitPeerings(AzureRMModuleBase):
 
         :return: deserialized Express Route Circuit Peering instance state dictionary
         '''
-        self.log("Checking if the Express Route Circuit Peering instance {0} is present".format(self.peering_name))
+        self.log("Checking if the Express Route Circuit Peering instance {0} is present", self.peering_name)
         found = False
         try:
             response = self.mgmt_client.express_route_circuit_peerings.get(resource_group_name=self.resource_group,
                                                                            circuit_name=self.circuit_name,
                                                                            peering_name=self.peering_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Express Route Circuit Peering instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Express Route Circuit Peering instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Express Route Circuit Peering instance.')
         if found is True:
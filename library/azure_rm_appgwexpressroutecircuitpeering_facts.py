@@ -34,6 +34,15 @@ options:
         description:
             - The name of the peering.
         required: True
+    fields:
+        description:
+            - List of attributes to return for every item, nested attributes are separated by dots, e.g. C(sku.name).
+            - Only the listed attributes are read from the service response and serialized.
+        type: list
+    query:
+        description:
+            - JMESPath expression applied to every returned item, after I(fields). Requires the jmespath package.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -113,7 +122,8 @@ class AzureRMExpressRouteCircuitPeeringsFacts(AzureRMModuleBase):
         self.resource_group = None
         self.circuit_name = None
         self.peering_name = None
-        super(AzureRMExpressRouteCircuitPeeringsFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMExpressRouteCircuitPeeringsFacts, self).__init__(self.module_arg_spec,
+                                                                      supports_projection=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -139,12 +149,12 @@ class AzureRMExpressRouteCircuitPeeringsFacts(AzureRMModuleBase):
             response = self.mgmt_client.express_route_circuit_peerings.get(resource_group_name=self.resource_group,
                                                                            circuit_name=self.circuit_name,
                                                                            peering_name=self.peering_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
-            self.log('Could not get facts for ExpressRouteCircuitPeerings.')
+            self.log('Could not get facts for ExpressRouteCircuitPeerings.', level='warning')
 
         if response is not None:
-            results[response.name] = response.as_dict()
+            results[response.name] = self.serialize_facts(response)
 
         return results
 
@@ -82,6 +82,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -106,9 +113,22 @@ id:
     returned: always
     type: str
     sample: /subscriptions/subid/resourceGroups/testrg/providers/Microsoft.Network/loadBalancers/lb1/inboundNatRules/natRule1.1
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Network/loadBalancers/myLoadBalancer/inboundNatRules/myInboundNatRule",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2017-11-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Network/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -194,7 +214,8 @@ class AzureRMInboundNatRules(AzureRMModuleBase):
 
         super(AzureRMInboundNatRules, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                      supports_check_mode=True,
-                                                     supports_tags=False)
+                                                     supports_tags=False,
+                                                     supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -246,7 +267,8 @@ class AzureRMInboundNatRules(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Inbound Nat Rule instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.parameters, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Inbound Nat Rule instance")
@@ -272,8 +294,7 @@ class AzureRMInboundNatRules(AzureRMModuleBase):
             self.delete_inboundnatrule()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_inboundnatrule():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_inboundnatrule)
         else:
             self.log("Inbound Nat Rule instance unchanged")
             self.results['changed'] = False
@@ -290,7 +311,7 @@ class AzureRMInboundNatRules(AzureRMModuleBase):
 
         :return: deserialized Inbound Nat Rule instance state dictionary
         '''
-        self.log("Creating / Updating the Inbound Nat Rule instance {0}".format(self.inbound_nat_rule_name))
+        self.log("Creating / Updating the Inbound Nat Rule instance {0}", self.inbound_nat_rule_name)
 
         try:
             response = self.mgmt_client.inbound_nat_rules.create_or_update(resource_group_name=self.resource_group,
@@ -301,7 +322,7 @@ class AzureRMInboundNatRules(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Inbound Nat Rule instance.')
+            self.log('Error attempting to create the Inbound Nat Rule instance.', level='error')
             self.fail("Error creating the Inbound Nat Rule instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -311,13 +332,15 @@ class AzureRMInboundNatRules(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Inbound Nat Rule instance {0}".format(self.inbound_nat_rule_name))
+        self.log("Deleting the Inbound Nat Rule instance {0}", self.inbound_nat_rule_name)
         try:
             response = self.mgmt_client.inbound_nat_rules.delete(resource_group_name=self.resource_group,
                                                                  load_balancer_name=self.load_balancer_name,
                                                                  inbound_nat_rule_name=self.inbound_nat_rule_name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Inbound Nat Rule instance.')
+            self.log('Error attempting to delete the Inbound Nat Rule instance.', level='error')
             self.fail("Error deleting the Inbound Nat Rule instance: {0}".format(str(e)))
 
         return True
@@ -328,15 +351,15 @@ class AzureRMInboundNatRules(AzureRMModuleBase):
 
         :return: deserialized Inbound Nat Rule instance state dictionary
         '''
-        self.log("Checking if the Inbound Nat Rule instance {0} is present".format(self.inbound_nat_rule_name))
+        self.log("Checking if the Inbound Nat Rule instance {0} is present", self.inbound_nat_rule_name)
         found = False
         try:
             response = self.mgmt_client.inbound_nat_rules.get(resource_group_name=self.resource_group,
                                                               load_balancer_name=self.load_balancer_name,
                                                               inbound_nat_rule_name=self.inbound_nat_rule_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Inbound Nat Rule instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Inbound Nat Rule instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Inbound Nat Rule instance.')
         if found is True:
@@ -37,6 +37,15 @@ options:
     expand:
         description:
             - Expands referenced resources.
+    fields:
+        description:
+            - List of attributes to return for every item, nested attributes are separated by dots, e.g. C(sku.name).
+            - Only the listed attributes are read from the service response and serialized.
+        type: list
+    query:
+        description:
+            - JMESPath expression applied to every returned item, after I(fields). Requires the jmespath package.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -127,7 +136,8 @@ class AzureRMInboundNatRulesFacts(AzureRMModuleBase):
         self.load_balancer_name = None
         self.inbound_nat_rule_name = None
         self.expand = None
-        super(AzureRMInboundNatRulesFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMInboundNatRulesFacts, self).__init__(self.module_arg_spec,
+                                                          supports_projection=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -153,12 +163,12 @@ class AzureRMInboundNatRulesFacts(AzureRMModuleBase):
             response = self.mgmt_client.inbound_nat_rules.get(resource_group_name=self.resource_group,
                                                               load_balancer_name=self.load_balancer_name,
                                                               inbound_nat_rule_name=self.inbound_nat_rule_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
-            self.log('Could not get facts for InboundNatRules.')
+            self.log('Could not get facts for InboundNatRules.', level='warning')
 
         if response is not None:
-            results[response.name] = response.as_dict()
+            results[response.name] = self.serialize_facts(response)
 
         return results
 
@@ -775,6 +775,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -799,9 +806,22 @@ id:
     returned: always
     type: str
     sample: /subscriptions/subid/resourceGroups/rg1/providers/Microsoft.Network/loadBalancers/lb
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Network/loadBalancers/myLoadBalancer",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2017-11-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Network/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -888,7 +908,8 @@ class AzureRMLoadBalancers(AzureRMModuleBase):
 
         super(AzureRMLoadBalancers, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                    supports_check_mode=True,
-                                                   supports_tags=False)
+                                                   supports_tags=False,
+                                                   supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -979,9 +1000,8 @@ class AzureRMLoadBalancers(AzureRMModuleBase):
         self.mgmt_client = self.get_mgmt_svc_client(NetworkManagementClient,
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
         if "location" not in self.parameters:
+            resource_group = self.get_resource_group(self.resource_group)
             self.parameters["location"] = resource_group.location
 
         old_response = self.get_loadbalancer()
@@ -998,7 +1018,8 @@ class AzureRMLoadBalancers(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Load Balancer instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.parameters, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Load Balancer instance")
@@ -1024,8 +1045,7 @@ class AzureRMLoadBalancers(AzureRMModuleBase):
             self.delete_loadbalancer()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_loadbalancer():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_loadbalancer)
         else:
             self.log("Load Balancer instance unchanged")
             self.results['changed'] = False
@@ -1042,7 +1062,7 @@ class AzureRMLoadBalancers(AzureRMModuleBase):
 
         :return: deserialized Load Balancer instance state dictionary
         '''
-        self.log("Creating / Updating the Load Balancer instance {0}".format(self.load_balancer_name))
+        self.log("Creating / Updating the Load Balancer instance {0}", self.load_balancer_name)
 
         try:
             response = self.mgmt_client.load_balancers.create_or_update(resource_group_name=self.resource_group,
@@ -1052,7 +1072,7 @@ class AzureRMLoadBalancers(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Load Balancer instance.')
+            self.log('Error attempting to create the Load Balancer instance.', level='error')
             self.fail("Error creating the Load Balancer instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -1062,12 +1082,14 @@ class AzureRMLoadBalancers(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Load Balancer instance {0}".format(self.load_balancer_name))
+        self.log("Deleting the Load Balancer instance {0}", self.load_balancer_name)
         try:
             response = self.mgmt_client.load_balancers.delete(resource_group_name=self.resource_group,
                                                               load_balancer_name=self.load_balancer_name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Load Balancer instance.')
+            self.log('Error attempting to delete the Load Balancer instance.', level='error')
             self.fail("Error deleting the Load Balancer instance: {0}".format(str(e)))
 
         return True
@@ -1078,14 +1100,14 @@ class AzureRMLoadBalancers(AzureRMModuleBase):
 
         :return: deserialized Load Balancer instance state dictionary
         '''
-        self.log("Checking if the Load Balancer instance {0} is present".format(self.load_balancer_name))
+        self.log("Checking if the Load Balancer instance {0} is present", self.load_balancer_name)
         found = False
         try:
             response = self.mgmt_client.load_balancers.get(resource_group_name=self.resource_group,
                                                            load_balancer_name=self.load_balancer_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Load Balancer instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Load Balancer instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Load Balancer instance.')
         if found is True:
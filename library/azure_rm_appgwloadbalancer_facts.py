@@ -33,6 +33,15 @@ options:
     expand:
         description:
             - Expands referenced resources.
+    fields:
+        description:
+            - List of attributes to return for every item, nested attributes are separated by dots, e.g. C(sku.name).
+            - Only the listed attributes are read from the service response and serialized.
+        type: list
+    query:
+        description:
+            - JMESPath expression applied to every returned item, after I(fields). Requires the jmespath package.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -48,6 +57,17 @@ EXAMPLES = '''
       resource_group: resource_group_name
       load_balancer_name: load_balancer_name
       expand: expand
+
+  - name: Get frontend configurations and rules of Load Balancer
+    azure_rm_appgwloadbalancer_facts:
+      resource_group: resource_group_name
+      load_balancer_name: load_balancer_name
+      fields:
+        - frontend_ip_configurations.name
+        - frontend_ip_configurations.private_ip_address
+        - load_balancing_rules.name
+        - load_balancing_rules.frontend_port
+        - load_balancing_rules.backend_port
 '''
 
 RETURN = '''
@@ -143,7 +163,8 @@ class AzureRMLoadBalancersFacts(AzureRMModuleBase):
         self.resource_group = None
         self.load_balancer_name = None
         self.expand = None
-        super(AzureRMLoadBalancersFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMLoadBalancersFacts, self).__init__(self.module_arg_spec,
+                                                        supports_projection=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -167,12 +188,12 @@ class AzureRMLoadBalancersFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.load_balancers.get(resource_group_name=self.resource_group,
                                                            load_balancer_name=self.load_balancer_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
-            self.log('Could not get facts for LoadBalancers.')
+            self.log('Could not get facts for LoadBalancers.', level='warning')
 
         if response is not None:
-            results[response.name] = response.as_dict()
+            results[response.name] = self.serialize_facts(response)
 
         return results
 
@@ -34,6 +34,15 @@ options:
         description:
             - The name of the backend address pool.
         required: True
+    fields:
+        description:
+            - List of attributes to return for every item, nested attributes are separated by dots, e.g. C(sku.name).
+            - Only the listed attributes are read from the service response and serialized.
+        type: list
+    query:
+        description:
+            - JMESPath expression applied to every returned item, after I(fields). Requires the jmespath package.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -119,7 +128,8 @@ class AzureRMLoadBalancerBackendAddressPoolsFacts(AzureRMModuleBase):
         self.resource_group = None
         self.load_balancer_name = None
         self.backend_address_pool_name = None
-        super(AzureRMLoadBalancerBackendAddressPoolsFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMLoadBalancerBackendAddressPoolsFacts, self).__init__(self.module_arg_spec,
+                                                                          supports_projection=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -145,12 +155,12 @@ class AzureRMLoadBalancerBackendAddressPoolsFacts(AzureRMModuleBase):
             response = self.mgmt_client.load_balancer_backend_address_pools.get(resource_group_name=self.resource_group,
                                                                                 load_balancer_name=self.load_balancer_name,
                                                                                 backend_address_pool_name=self.backend_address_pool_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
-            self.log('Could not get facts for LoadBalancerBackendAddressPools.')
+            self.log('Could not get facts for LoadBalancerBackendAddressPools.', level='warning')
 
         if response is not None:
-            results[response.name] = response.as_dict()
+            results[response.name] = self.serialize_facts(response)
 
         return results
 
@@ -34,6 +34,15 @@ options:
         description:
             - The name of the frontend IP configuration.
         required: True
+    fields:
+        description:
+            - List of attributes to return for every item, nested attributes are separated by dots, e.g. C(sku.name).
+            - Only the listed attributes are read from the service response and serialized.
+        type: list
+    query:
+        description:
+            - JMESPath expression applied to every returned item, after I(fields). Requires the jmespath package.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -132,7 +141,8 @@ class AzureRMLoadBalancerFrontendIPConfigurationsFacts(AzureRMModuleBase):
         self.resource_group = None
         self.load_balancer_name = None
         self.frontend_ip_configuration_name = None
-        super(AzureRMLoadBalancerFrontendIPConfigurationsFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMLoadBalancerFrontendIPConfigurationsFacts, self).__init__(self.module_arg_spec,
+                                                                               supports_projection=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -158,12 +168,12 @@ class AzureRMLoadBalancerFrontendIPConfigurationsFacts(AzureRMModuleBase):
             response = self.mgmt_client.load_balancer_frontend_ip_configurations.get(resource_group_name=self.resource_group,
                                                                                      load_balancer_name=self.load_balancer_name,
                                                                                      frontend_ip_configuration_name=self.frontend_ip_configuration_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
-            self.log('Could not get facts for LoadBalancerFrontendIPConfigurations.')
+            self.log('Could not get facts for LoadBalancerFrontendIPConfigurations.', level='warning')
 
         if response is not None:
-            results[response.name] = response.as_dict()
+            results[response.name] = self.serialize_facts(response)
 
         return results
 
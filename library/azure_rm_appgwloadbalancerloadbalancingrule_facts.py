@@ -34,6 +34,15 @@ options:
         description:
             - The name of the load balancing rule.
         required: True
+    fields:
+        description:
+            - List of attributes to return for every item, nested attributes are separated by dots, e.g. C(sku.name).
+            - Only the listed attributes are read from the service response and serialized.
+        type: list
+    query:
+        description:
+            - JMESPath expression applied to every returned item, after I(fields). Requires the jmespath package.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -138,7 +147,8 @@ class AzureRMLoadBalancerLoadBalancingRulesFacts(AzureRMModuleBase):
         self.resource_group = None
         self.load_balancer_name = None
         self.load_balancing_rule_name = None
-        super(AzureRMLoadBalancerLoadBalancingRulesFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMLoadBalancerLoadBalancingRulesFacts, self).__init__(self.module_arg_spec,
+                                                                         supports_projection=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -164,12 +174,12 @@ class AzureRMLoadBalancerLoadBalancingRulesFacts(AzureRMModuleBase):
             response = self.mgmt_client.load_balancer_load_balancing_rules.get(resource_group_name=self.resource_group,
                                                                                load_balancer_name=self.load_balancer_name,
                                                                                load_balancing_rule_name=self.load_balancing_rule_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
-            self.log('Could not get facts for LoadBalancerLoadBalancingRules.')
+            self.log('Could not get facts for LoadBalancerLoadBalancingRules.', level='warning')
 
         if response is not None:
-            results[response.name] = response.as_dict()
+            results[response.name] = self.serialize_facts(response)
 
         return results
 
@@ -34,6 +34,15 @@ options:
         description:
             - The name of the probe.
         required: True
+    fields:
+        description:
+            - List of attributes to return for every item, nested attributes are separated by dots, e.g. C(sku.name).
+            - Only the listed attributes are read from the service response and serialized.
+        type: list
+    query:
+        description:
+            - JMESPath expression applied to every returned item, after I(fields). Requires the jmespath package.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -133,7 +142,8 @@ class AzureRMLoadBalancerProbesFacts(AzureRMModuleBase):
         self.resource_group = None
         self.load_balancer_name = None
         self.probe_name = None
-        super(AzureRMLoadBalancerProbesFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMLoadBalancerProbesFacts, self).__init__(self.module_arg_spec,
+                                                             supports_projection=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -159,12 +169,12 @@ class AzureRMLoadBalancerProbesFacts(AzureRMModuleBase):
             response = self.mgmt_client.load_balancer_probes.get(resource_group_name=self.resource_group,
                                                                  load_balancer_name=self.load_balancer_name,
                                                                  probe_name=self.probe_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
-            self.log('Could not get facts for LoadBalancerProbes.')
+            self.log('Could not get facts for LoadBalancerProbes.', level='warning')
 
         if response is not None:
-            results[response.name] = response.as_dict()
+            results[response.name] = self.serialize_facts(response)
 
         return results
 
@@ -74,6 +74,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -98,9 +105,22 @@ id:
     returned: always
     type: str
     sample: id
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Network/localNetworkGateways/myLocalNetworkGateway",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2017-11-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Network/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -169,7 +189,8 @@ class AzureRMLocalNetworkGateways(AzureRMModuleBase):
 
         super(AzureRMLocalNetworkGateways, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                           supports_check_mode=True,
-                                                          supports_tags=False)
+                                                          supports_tags=False,
+                                                          supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -199,9 +220,8 @@ class AzureRMLocalNetworkGateways(AzureRMModuleBase):
         self.mgmt_client = self.get_mgmt_svc_client(NetworkManagementClient,
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
         if "location" not in self.parameters:
+            resource_group = self.get_resource_group(self.resource_group)
             self.parameters["location"] = resource_group.location
 
         old_response = self.get_localnetworkgateway()
@@ -218,7 +238,8 @@ class AzureRMLocalNetworkGateways(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Local Network Gateway instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.parameters, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Local Network Gateway instance")
@@ -244,8 +265,7 @@ class AzureRMLocalNetworkGateways(AzureRMModuleBase):
             self.delete_localnetworkgateway()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_localnetworkgateway():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_localnetworkgateway)
         else:
             self.log("Local Network Gateway instance unchanged")
             self.results['changed'] = False
@@ -262,7 +282,7 @@ class AzureRMLocalNetworkGateways(AzureRMModuleBase):
 
         :return: deserialized Local Network Gateway instance state dictionary
         '''
-        self.log("Creating / Updating the Local Network Gateway instance {0}".format(self.local_network_gateway_name))
+        self.log("Creating / Updating the Local Network Gateway instance {0}", self.local_network_gateway_name)
 
         try:
             response = self.mgmt_client.local_network_gateways.create_or_update(resource_group_name=self.resource_group,
@@ -272,7 +292,7 @@ class AzureRMLocalNetworkGateways(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Local Network Gateway instance.')
+            self.log('Error attempting to create the Local Network Gateway instance.', level='error')
             self.fail("Error creating the Local Network Gateway instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -282,12 +302,14 @@ class AzureRMLocalNetworkGateways(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Local Network Gateway instance {0}".format(self.local_network_gateway_name))
+        self.log("Deleting the Local Network Gateway instance {0}", self.local_network_gateway_name)
         try:
             response = self.mgmt_client.local_network_gateways.delete(resource_group_name=self.resource_group,
                                                                       local_network_gateway_name=self.local_network_gateway_name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Local Network Gateway instance.')
+            self.log('Error attempting to delete the Local Network Gateway instance.', level='error')
             self.fail("Error deleting the Local Network Gateway instance: {0}".format(str(e)))
 
         return True
@@ -298,14 +320,14 @@ class AzureRMLocalNetworkGateways(AzureRMModuleBase):
 
         :return: deserialized Local Network Gateway instance state dictionary
         '''
-        self.log("Checking if the Local Network Gateway instance {0} is present".format(self.local_network_gateway_name))
+        self.log("Checking if the Local Network Gateway instance {0} is present", self.local_network_gateway_name)
         found = False
         try:
             response = self.mgmt_client.local_network_gateways.get(resource_group_name=self.resource_group,
                                                                    local_network_gateway_name=self.local_network_gateway_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Local Network Gateway instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Local Network Gateway instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Local Network Gateway instance.')
         if found is True:
@@ -1126,6 +1126,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -1150,9 +1157,22 @@ id:
     returned: always
     type: str
     sample: /subscriptions/subid/resourceGroups/rg1/providers/Microsoft.Network/networkInterfaces/test-nic
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Network/networkInterfaces/myNetworkInterface",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2017-11-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Network/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -1239,7 +1259,8 @@ class AzureRMNetworkInterfaces(AzureRMModuleBase):
 
         super(AzureRMNetworkInterfaces, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                        supports_check_mode=True,
-                                                       supports_tags=False)
+                                                       supports_tags=False,
+                                                       supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -1292,9 +1313,8 @@ class AzureRMNetworkInterfaces(AzureRMModuleBase):
         self.mgmt_client = self.get_mgmt_svc_client(NetworkManagementClient,
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
         if "location" not in self.parameters:
+            resource_group = self.get_resource_group(self.resource_group)
             self.parameters["location"] = resource_group.location
 
         old_response = self.get_networkinterface()
@@ -1311,7 +1331,8 @@ class AzureRMNetworkInterfaces(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Network Interface instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.parameters, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Network Interface instance")
@@ -1337,8 +1358,7 @@ class AzureRMNetworkInterfaces(AzureRMModuleBase):
             self.delete_networkinterface()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_networkinterface():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_networkinterface)
         else:
             self.log("Network Interface instance unchanged")
             self.results['changed'] = False
@@ -1355,7 +1375,7 @@ class AzureRMNetworkInterfaces(AzureRMModuleBase):
 
         :return: deserialized Network Interface instance state dictionary
         '''
-        self.log("Creating / Updating the Network Interface instance {0}".format(self.network_interface_name))
+        self.log("Creating / Updating the Network Interface instance {0}", self.network_interface_name)
 
         try:
             response = self.mgmt_client.network_interfaces.create_or_update(resource_group_name=self.resource_group,
@@ -1365,7 +1385,7 @@ class AzureRMNetworkInterfaces(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Network Interface instance.')
+            self.log('Error attempting to create the Network Interface instance.', level='error')
             self.fail("Error creating the Network Interface instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -1375,12 +1395,14 @@ class AzureRMNetworkInterfaces(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Network Interface instance {0}".format(self.network_interface_name))
+        self.log("Deleting the Network Interface instance {0}", self.network_interface_name)
         try:
             response = self.mgmt_client.network_interfaces.delete(resource_group_name=self.resource_group,
                                                                   network_interface_name=self.network_interface_name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Network Interface instance.')
+            self.log('Error attempting to delete the Network Interface instance.', level='error')
             self.fail("Error deleting the Network Interface instance: {0}".format(str(e)))
 
         return True
@@ -1391,14 +1413,14 @@ class AzureRMNetworkInterfaces(AzureRMModuleBase):
 
         :return: deserialized Network Interface instance state dictionary
         '''
-        self.log("Checking if the Network Interface instance {0} is present".format(self.network_interface_name))
+        self.log("Checking if the Network Interface instance {0} is present", self.network_interface_name)
         found = False
         try:
             response = self.mgmt_client.network_interfaces.get(resource_group_name=self.resource_group,
                                                                network_interface_name=self.network_interface_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Network Interface instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Network Interface instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Network Interface instance.')
         if found is True:
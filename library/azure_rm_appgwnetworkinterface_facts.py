@@ -33,6 +33,15 @@ options:
     expand:
         description:
             - Expands referenced resources.
+    fields:
+        description:
+            - List of attributes to return for every item, nested attributes are separated by dots, e.g. C(sku.name).
+            - Only the listed attributes are read from the service response and serialized.
+        type: list
+    query:
+        description:
+            - JMESPath expression applied to every returned item, after I(fields). Requires the jmespath package.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -48,6 +57,21 @@ EXAMPLES = '''
       resource_group: resource_group_name
       network_interface_name: network_interface_name
       expand: expand
+
+  - name: Get private IP addresses of Network Interface
+    azure_rm_appgwnetworkinterface_facts:
+      resource_group: resource_group_name
+      network_interface_name: network_interface_name
+      fields:
+        - id
+        - ip_configurations.name
+        - ip_configurations.private_ip_address
+
+  - name: Get private IP addresses of Network Interface as a flat list
+    azure_rm_appgwnetworkinterface_facts:
+      resource_group: resource_group_name
+      network_interface_name: network_interface_name
+      query: "ip_configurations[].private_ip_address"
 '''
 
 RETURN = '''
@@ -129,7 +153,8 @@ class AzureRMNetworkInterfacesFacts(AzureRMModuleBase):
         self.resource_group = None
         self.network_interface_name = None
         self.expand = None
-        super(AzureRMNetworkInterfacesFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMNetworkInterfacesFacts, self).__init__(self.module_arg_spec,
+                                                            supports_projection=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -153,12 +178,12 @@ class AzureRMNetworkInterfacesFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.network_interfaces.get(resource_group_name=self.resource_group,
                                                                network_interface_name=self.network_interface_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
-            self.log('Could not get facts for NetworkInterfaces.')
+            self.log('Could not get facts for NetworkInterfaces.', level='warning')
 
         if response is not None:
-            results[response.name] = response.as_dict()
+            results[response.name] = self.serialize_facts(response)
 
         return results
 
@@ -47,6 +47,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -71,9 +78,22 @@ id:
     returned: always
     type: str
     sample: id
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Network/networkWatchers/myNetworkWatcher",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2017-11-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Network/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -130,7 +150,8 @@ class AzureRMNetworkWatchers(AzureRMModuleBase):
 
         super(AzureRMNetworkWatchers, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                      supports_check_mode=True,
-                                                     supports_tags=False)
+                                                     supports_tags=False,
+                                                     supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -152,9 +173,8 @@ class AzureRMNetworkWatchers(AzureRMModuleBase):
         self.mgmt_client = self.get_mgmt_svc_client(NetworkManagementClient,
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
         if "location" not in self.parameters:
+            resource_group = self.get_resource_group(self.resource_group)
             self.parameters["location"] = resource_group.location
 
         old_response = self.get_networkwatcher()
@@ -171,7 +191,8 @@ class AzureRMNetworkWatchers(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Network Watcher instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.parameters, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Network Watcher instance")
@@ -197,8 +218,7 @@ class AzureRMNetworkWatchers(AzureRMModuleBase):
             self.delete_networkwatcher()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_networkwatcher():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_networkwatcher)
         else:
             self.log("Network Watcher instance unchanged")
             self.results['changed'] = False
@@ -215,7 +235,7 @@ class AzureRMNetworkWatchers(AzureRMModuleBase):
 
         :return: deserialized Network Watcher instance state dictionary
         '''
-        self.log("Creating / Updating the Network Watcher instance {0}".format(self.network_watcher_name))
+        self.log("Creating / Updating the Network Watcher instance {0}", self.network_watcher_name)
 
         try:
             response = self.mgmt_client.network_watchers.create_or_update(resource_group_name=self.resource_group,
@@ -225,7 +245,7 @@ class AzureRMNetworkWatchers(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Network Watcher instance.')
+            self.log('Error attempting to create the Network Watcher instance.', level='error')
             self.fail("Error creating the Network Watcher instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -235,12 +255,14 @@ class AzureRMNetworkWatchers(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Network Watcher instance {0}".format(self.network_watcher_name))
+        self.log("Deleting the Network Watcher instance {0}", self.network_watcher_name)
         try:
             response = self.mgmt_client.network_watchers.delete(resource_group_name=self.resource_group,
                                                                 network_watcher_name=self.network_watcher_name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Network Watcher instance.')
+            self.log('Error attempting to delete the Network Watcher instance.', level='error')
             self.fail("Error deleting the Network Watcher instance: {0}".format(str(e)))
 
         return True
@@ -251,14 +273,14 @@ class AzureRMNetworkWatchers(AzureRMModuleBase):
 
         :return: deserialized Network Watcher instance state dictionary
         '''
-        self.log("Checking if the Network Watcher instance {0} is present".format(self.network_watcher_name))
+        self.log("Checking if the Network Watcher instance {0} is present", self.network_watcher_name)
         found = False
         try:
             response = self.mgmt_client.network_watchers.get(resource_group_name=self.resource_group,
                                                              network_watcher_name=self.network_watcher_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Network Watcher instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Network Watcher instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Network Watcher instance.')
         if found is True:
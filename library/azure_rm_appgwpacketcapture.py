@@ -98,6 +98,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -122,9 +129,22 @@ id:
     returned: always
     type: str
     sample: id
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Network/networkWatchers/myNetworkWatcher/packetCaptures/myPacketCapture",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2017-11-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Network/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -197,7 +217,8 @@ class AzureRMPacketCaptures(AzureRMModuleBase):
 
         super(AzureRMPacketCaptures, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                     supports_check_mode=True,
-                                                    supports_tags=False)
+                                                    supports_tags=False,
+                                                    supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -249,7 +270,8 @@ class AzureRMPacketCaptures(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Packet Capture instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.parameters, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Packet Capture instance")
@@ -275,8 +297,7 @@ class AzureRMPacketCaptures(AzureRMModuleBase):
             self.delete_packetcapture()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_packetcapture():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_packetcapture)
         else:
             self.log("Packet Capture instance unchanged")
             self.results['changed'] = False
@@ -293,7 +314,7 @@ class AzureRMPacketCaptures(AzureRMModuleBase):
 
         :return: deserialized Packet Capture instance state dictionary
         '''
-        self.log("Creating / Updating the Packet Capture instance {0}".format(self.packet_capture_name))
+        self.log("Creating / Updating the Packet Capture instance {0}", self.packet_capture_name)
 
         try:
             if self.to_do == Actions.Create:
@@ -307,7 +328,7 @@ class AzureRMPacketCaptures(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Packet Capture instance.')
+            self.log('Error attempting to create the Packet Capture instance.', level='error')
             self.fail("Error creating the Packet Capture instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -317,13 +338,15 @@ class AzureRMPacketCaptures(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Packet Capture instance {0}".format(self.packet_capture_name))
+        self.log("Deleting the Packet Capture instance {0}", self.packet_capture_name)
         try:
             response = self.mgmt_client.packet_captures.delete(resource_group_name=self.resource_group,
                                                                network_watcher_name=self.network_watcher_name,
                                                                packet_capture_name=self.packet_capture_name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Packet Capture instance.')
+            self.log('Error attempting to delete the Packet Capture instance.', level='error')
             self.fail("Error deleting the Packet Capture instance: {0}".format(str(e)))
 
         return True
@@ -334,15 +357,15 @@ class AzureRMPacketCaptures(AzureRMModuleBase):
 
         :return: deserialized Packet Capture instance state dictionary
         '''
-        self.log("Checking if the Packet Capture instance {0} is present".format(self.packet_capture_name))
+        self.log("Checking if the Packet Capture instance {0} is present", self.packet_capture_name)
         found = False
         try:
             response = self.mgmt_client.packet_captures.get(resource_group_name=self.resource_group,
                                                             network_watcher_name=self.network_watcher_name,
                                                             packet_capture_name=self.packet_capture_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Packet Capture instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Packet Capture instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Packet Capture instance.')
         if found is True:
@@ -34,6 +34,15 @@ options:
         description:
             - The name of the packet capture session.
         required: True
+    fields:
+        description:
+            - List of attributes to return for every item, nested attributes are separated by dots, e.g. C(sku.name).
+            - Only the listed attributes are read from the service response and serialized.
+        type: list
+    query:
+        description:
+            - JMESPath expression applied to every returned item, after I(fields). Requires the jmespath package.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -107,7 +116,8 @@ class AzureRMPacketCapturesFacts(AzureRMModuleBase):
         self.resource_group = None
         self.network_watcher_name = None
         self.packet_capture_name = None
-        super(AzureRMPacketCapturesFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMPacketCapturesFacts, self).__init__(self.module_arg_spec,
+                                                         supports_projection=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -133,12 +143,12 @@ class AzureRMPacketCapturesFacts(AzureRMModuleBase):
             response = self.mgmt_client.packet_captures.get(resource_group_name=self.resource_group,
                                                             network_watcher_name=self.network_watcher_name,
                                                             packet_capture_name=self.packet_capture_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
-            self.log('Could not get facts for PacketCaptures.')
+            self.log('Could not get facts for PacketCaptures.', level='warning')
 
         if response is not None:
-            results[response.name] = response.as_dict()
+            results[response.name] = self.serialize_facts(response)
 
         return results
 
@@ -103,6 +103,24 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
+    items:
+      description:
+        - List of Public IP Addresses to manage in one task, each item takes the options of the module.
+        - Options set on an item override the options of the module, which apply to all items.
+        - Options required by the module must be set either on every item or on the module.
+      type: list
+    concurrency:
+      description:
+        - Maximum number of I(items) created, updated or deleted at the same time.
+      type: int
+      default: 8
 
 extends_documentation_fragment:
     - azure
@@ -118,6 +136,14 @@ EXAMPLES = '''
       resource_group: rg1
       public_ip_address_name: test-ip
       location: eastus
+
+  - name: Manage several Public IP Addresses at once
+    azure_rm_appgwpublicipaddresse:
+      resource_group: rg1
+      location: eastus
+      items:
+        - public_ip_address_name: test-ip1
+        - public_ip_address_name: test-ip2
 '''
 
 RETURN = '''
@@ -127,9 +153,45 @@ id:
     returned: always
     type: str
     sample: /subscriptions/subid/resourceGroups/rg1/providers/Microsoft.Network/publicIPAddresses/test-ip
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Network/publicIPAddresses/myPublicIPAddress",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2017-11-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Network/...",
+        "location": null,
+        "started": 1525248011
+    }
+items:
+    description:
+        - Outcome of every item of I(items), in the same order, with the results the module returns for a single resource.
+    returned: when I(items) is set
+    type: complex
+    contains:
+        item:
+            description:
+                - Options set on the item, without secrets.
+            returned: always
+            type: dict
+            sample: {"public_ip_address_name": "test-ip1"}
+        failed:
+            description:
+                - Whether the item failed, the task then fails once all items are done.
+            returned: when the item failed
+            type: bool
+            sample: true
+        msg:
+            description:
+                - Error message of the failed item.
+            returned: when the item failed
+            type: str
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -217,7 +279,9 @@ class AzureRMPublicIPAddresses(AzureRMModuleBase):
 
         super(AzureRMPublicIPAddresses, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                        supports_check_mode=True,
-                                                       supports_tags=False)
+                                                       supports_tags=False,
+                                                       supports_async=True,
+                                                       supports_items=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -268,9 +332,8 @@ class AzureRMPublicIPAddresses(AzureRMModuleBase):
         self.mgmt_client = self.get_mgmt_svc_client(NetworkManagementClient,
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
         if "location" not in self.parameters:
+            resource_group = self.get_resource_group(self.resource_group)
             self.parameters["location"] = resource_group.location
 
         old_response = self.get_publicipaddresse()
@@ -287,7 +350,8 @@ class AzureRMPublicIPAddresses(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Public I P Addresse instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.parameters, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Public I P Addresse instance")
@@ -313,8 +377,7 @@ class AzureRMPublicIPAddresses(AzureRMModuleBase):
             self.delete_publicipaddresse()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_publicipaddresse():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_publicipaddresse)
         else:
             self.log("Public I P Addresse instance unchanged")
             self.results['changed'] = False
@@ -331,7 +394,7 @@ class AzureRMPublicIPAddresses(AzureRMModuleBase):
 
         :return: deserialized Public I P Addresse instance state dictionary
         '''
-        self.log("Creating / Updating the Public I P Addresse instance {0}".format(self.public_ip_address_name))
+        self.log("Creating / Updating the Public I P Addresse instance {0}", self.public_ip_address_name)
 
         try:
             response = self.mgmt_client.public_ip_addresses.create_or_update(resource_group_name=self.resource_group,
@@ -341,7 +404,7 @@ class AzureRMPublicIPAddresses(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Public I P Addresse instance.')
+            self.log('Error attempting to create the Public I P Addresse instance.', level='error')
             self.fail("Error creating the Public I P Addresse instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -351,12 +414,14 @@ class AzureRMPublicIPAddresses(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Public I P Addresse instance {0}".format(self.public_ip_address_name))
+        self.log("Deleting the Public I P Addresse instance {0}", self.public_ip_address_name)
         try:
             response = self.mgmt_client.public_ip_addresses.delete(resource_group_name=self.resource_group,
                                                                    public_ip_address_name=self.public_ip_address_name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Public I P Addresse instance.')
+            self.log('Error attempting to delete the Public I P Addresse instance.', level='error')
             self.fail("Error deleting the Public I P Addresse instance: {0}".format(str(e)))
 
         return True
@@ -367,14 +432,14 @@ class AzureRMPublicIPAddresses(AzureRMModuleBase):
 
         :return: deserialized Public I P Addresse instance state dictionary
         '''
-        self.log("Checking if the Public I P Addresse instance {0} is present".format(self.public_ip_address_name))
+        self.log("Checking if the Public I P Addresse instance {0} is present", self.public_ip_address_name)
         found = False
         try:
             response = self.mgmt_client.public_ip_addresses.get(resource_group_name=self.resource_group,
                                                                 public_ip_address_name=self.public_ip_address_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Public I P Addresse instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Public I P Addresse instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Public I P Addresse instance.')
         if found is True:
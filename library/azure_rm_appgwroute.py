@@ -70,6 +70,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -94,9 +101,22 @@ id:
     returned: always
     type: str
     sample: /subscriptions/subid/resourceGroups/rg1/providers/Microsoft.Network/routeTables/testrt/routes/route1
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Network/routeTables/myRouteTable/routes/myRoute",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2017-11-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Network/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -175,7 +195,8 @@ class AzureRMRoutes(AzureRMModuleBase):
 
         super(AzureRMRoutes, self).__init__(derived_arg_spec=self.module_arg_spec,
                                             supports_check_mode=True,
-                                            supports_tags=False)
+                                            supports_tags=False,
+                                            supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -221,7 +242,8 @@ class AzureRMRoutes(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Route instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.parameters, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Route instance")
@@ -247,8 +269,7 @@ class AzureRMRoutes(AzureRMModuleBase):
             self.delete_route()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_route():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_route)
         else:
             self.log("Route instance unchanged")
             self.results['changed'] = False
@@ -265,7 +286,7 @@ class AzureRMRoutes(AzureRMModuleBase):
 
         :return: deserialized Route instance state dictionary
         '''
-        self.log("Creating / Updating the Route instance {0}".format(self.route_name))
+        self.log("Creating / Updating the Route instance {0}", self.route_name)
 
         try:
             response = self.mgmt_client.routes.create_or_update(resource_group_name=self.resource_group,
@@ -276,7 +297,7 @@ class AzureRMRoutes(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Route instance.')
+            self.log('Error attempting to create the Route instance.', level='error')
             self.fail("Error creating the Route instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -286,13 +307,15 @@ class AzureRMRoutes(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Route instance {0}".format(self.route_name))
+        self.log("Deleting the Route instance {0}", self.route_name)
         try:
             response = self.mgmt_client.routes.delete(resource_group_name=self.resource_group,
                                                       route_table_name=self.route_table_name,
                                                       route_name=self.route_name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Route instance.')
+            self.log('Error attempting to delete the Route instance.', level='error')
             self.fail("Error deleting the Route instance: {0}".format(str(e)))
 
         return True
@@ -303,15 +326,15 @@ class AzureRMRoutes(AzureRMModuleBase):
 
         :return: deserialized Route instance state dictionary
         '''
-        self.log("Checking if the Route instance {0} is present".format(self.route_name))
+        self.log("Checking if the Route instance {0} is present", self.route_name)
         found = False
         try:
             response = self.mgmt_client.routes.get(resource_group_name=self.resource_group,
                                                    route_table_name=self.route_table_name,
                                                    route_name=self.route_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Route instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Route instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Route instance.')
         if found is True:
@@ -34,6 +34,15 @@ options:
         description:
             - The name of the route.
         required: True
+    fields:
+        description:
+            - List of attributes to return for every item, nested attributes are separated by dots, e.g. C(sku.name).
+            - Only the listed attributes are read from the service response and serialized.
+        type: list
+    query:
+        description:
+            - JMESPath expression applied to every returned item, after I(fields). Requires the jmespath package.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -113,7 +122,8 @@ class AzureRMRoutesFacts(AzureRMModuleBase):
         self.resource_group = None
         self.route_table_name = None
         self.route_name = None
-        super(AzureRMRoutesFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMRoutesFacts, self).__init__(self.module_arg_spec,
+                                                 supports_projection=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -139,12 +149,12 @@ class AzureRMRoutesFacts(AzureRMModuleBase):
             response = self.mgmt_client.routes.get(resource_group_name=self.resource_group,
                                                    route_table_name=self.route_table_name,
                                                    route_name=self.route_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
-            self.log('Could not get facts for Routes.')
+            self.log('Could not get facts for Routes.', level='warning')
 
         if response is not None:
-            results[response.name] = response.as_dict()
+            results[response.name] = self.serialize_facts(response)
 
         return results
 
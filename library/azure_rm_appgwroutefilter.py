@@ -518,6 +518,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -542,9 +549,22 @@ id:
     returned: always
     type: str
     sample: /subscriptions/subid/resourceGroups/rg1/providers/Microsofot.Network/routeFilters/filterName
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Network/routeFilters/myRouteFilter",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2017-11-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Network/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -604,7 +624,8 @@ class AzureRMRouteFilters(AzureRMModuleBase):
 
         super(AzureRMRouteFilters, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                   supports_check_mode=True,
-                                                  supports_tags=False)
+                                                  supports_tags=False,
+                                                  supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -663,7 +684,8 @@ class AzureRMRouteFilters(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Route Filter instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.parameters, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Route Filter instance")
@@ -689,8 +711,7 @@ class AzureRMRouteFilters(AzureRMModuleBase):
             self.delete_routefilter()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_routefilter():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_routefilter)
         else:
             self.log("Route Filter instance unchanged")
             self.results['changed'] = False
@@ -707,7 +728,7 @@ class AzureRMRouteFilters(AzureRMModuleBase):
 
         :return: deserialized Route Filter instance state dictionary
         '''
-        self.log("Creating / Updating the Route Filter instance {0}".format(self.route_filter_name))
+        self.log("Creating / Updating the Route Filter instance {0}", self.route_filter_name)
 
         try:
             response = self.mgmt_client.route_filters.create_or_update(resource_group_name=self.resource_group,
@@ -717,7 +738,7 @@ class AzureRMRouteFilters(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Route Filter instance.')
+            self.log('Error attempting to create the Route Filter instance.', level='error')
             self.fail("Error creating the Route Filter instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -727,12 +748,14 @@ class AzureRMRouteFilters(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Route Filter instance {0}".format(self.route_filter_name))
+        self.log("Deleting the Route Filter instance {0}", self.route_filter_name)
         try:
             response = self.mgmt_client.route_filters.delete(resource_group_name=self.resource_group,
                                                              route_filter_name=self.route_filter_name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Route Filter instance.')
+            self.log('Error attempting to delete the Route Filter instance.', level='error')
             self.fail("Error deleting the Route Filter instance: {0}".format(str(e)))
 
         return True
@@ -743,14 +766,14 @@ class AzureRMRouteFilters(AzureRMModuleBase):
 
         :return: deserialized Route Filter instance state dictionary
         '''
-        self.log("Checking if the Route Filter instance {0} is present".format(self.route_filter_name))
+        self.log("Checking if the Route Filter instance {0} is present", self.route_filter_name)
         found = False
         try:
             response = self.mgmt_client.route_filters.get(resource_group_name=self.resource_group,
                                                           route_filter_name=self.route_filter_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Route Filter instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Route Filter instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Route Filter instance.')
         if found is True:
@@ -67,6 +67,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -92,9 +99,22 @@ id:
     returned: always
     type: str
     sample: /subscriptions/subid/resourceGroups/rg1/providers/Microsofot.Network/routeFilters/filterName/routeFilterRules/ruleName
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Network/routeFilters/myRouteFilter/routeFilterRules/myRouteFilterRule",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2017-11-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Network/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -170,7 +190,8 @@ class AzureRMRouteFilterRules(AzureRMModuleBase):
 
         super(AzureRMRouteFilterRules, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                       supports_check_mode=True,
-                                                      supports_tags=False)
+                                                      supports_tags=False,
+                                                      supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -214,7 +235,8 @@ class AzureRMRouteFilterRules(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Route Filter Rule instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.parameters, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Route Filter Rule instance")
@@ -240,8 +262,7 @@ class AzureRMRouteFilterRules(AzureRMModuleBase):
             self.delete_routefilterrule()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_routefilterrule():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_routefilterrule)
         else:
             self.log("Route Filter Rule instance unchanged")
             self.results['changed'] = False
@@ -258,7 +279,7 @@ class AzureRMRouteFilterRules(AzureRMModuleBase):
 
         :return: deserialized Route Filter Rule instance state dictionary
         '''
-        self.log("Creating / Updating the Route Filter Rule instance {0}".format(self.rule_name))
+        self.log("Creating / Updating the Route Filter Rule instance {0}", self.rule_name)
 
         try:
             response = self.mgmt_client.route_filter_rules.create_or_update(resource_group_name=self.resource_group,
@@ -269,7 +290,7 @@ class AzureRMRouteFilterRules(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Route Filter Rule instance.')
+            self.log('Error attempting to create the Route Filter Rule instance.', level='error')
             self.fail("Error creating the Route Filter Rule instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -279,13 +300,15 @@ class AzureRMRouteFilterRules(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Route Filter Rule instance {0}".format(self.rule_name))
+        self.log("Deleting the Route Filter Rule instance {0}", self.rule_name)
         try:
             response = self.mgmt_client.route_filter_rules.delete(resource_group_name=self.resource_group,
                                                                   route_filter_name=self.route_filter_name,
                                                                   rule_name=self.rule_name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Route Filter Rule instance.')
+            self.log('Error attempting to delete the Route Filter Rule instance.', level='error')
             self.fail("Error deleting the Route Filter Rule instance: {0}".format(str(e)))
 
         return True
@@ -296,15 +319,15 @@ class AzureRMRouteFilterRules(AzureRMModuleBase):
 
         :return: deserialized Route Filter Rule instance state dictionary
         '''
-        self.log("Checking if the Route Filter Rule instance {0} is present".format(self.rule_name))
+        self.log("Checking if the Route Filter Rule instance {0} is present", self.rule_name)
         found = False
         try:
             response = self.mgmt_client.route_filter_rules.get(resource_group_name=self.resource_group,
                                                                route_filter_name=self.route_filter_name,
                                                                rule_name=self.rule_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Route Filter Rule instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Route Filter Rule instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Route Filter Rule instance.')
         if found is True:
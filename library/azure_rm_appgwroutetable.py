@@ -87,6 +87,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -111,9 +118,22 @@ id:
     returned: always
     type: str
     sample: /subscriptions/subid/resourceGroups/rg1/providers/Microsoft.Network/routeTables/testrt
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Network/routeTables/myRouteTable",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2017-11-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Network/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -179,7 +199,8 @@ class AzureRMRouteTables(AzureRMModuleBase):
 
         super(AzureRMRouteTables, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                  supports_check_mode=True,
-                                                 supports_tags=False)
+                                                 supports_tags=False,
+                                                 supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -219,9 +240,8 @@ class AzureRMRouteTables(AzureRMModuleBase):
         self.mgmt_client = self.get_mgmt_svc_client(NetworkManagementClient,
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
         if "location" not in self.parameters:
+            resource_group = self.get_resource_group(self.resource_group)
             self.parameters["location"] = resource_group.location
 
         old_response = self.get_routetable()
@@ -238,7 +258,8 @@ class AzureRMRouteTables(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Route Table instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.parameters, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Route Table instance")
@@ -264,8 +285,7 @@ class AzureRMRouteTables(AzureRMModuleBase):
             self.delete_routetable()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_routetable():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_routetable)
         else:
             self.log("Route Table instance unchanged")
             self.results['changed'] = False
@@ -282,7 +302,7 @@ class AzureRMRouteTables(AzureRMModuleBase):
 
         :return: deserialized Route Table instance state dictionary
         '''
-        self.log("Creating / Updating the Route Table instance {0}".format(self.route_table_name))
+        self.log("Creating / Updating the Route Table instance {0}", self.route_table_name)
 
         try:
             response = self.mgmt_client.route_tables.create_or_update(resource_group_name=self.resource_group,
@@ -292,7 +312,7 @@ class AzureRMRouteTables(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Route Table instance.')
+            self.log('Error attempting to create the Route Table instance.', level='error')
             self.fail("Error creating the Route Table instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -302,12 +322,14 @@ class AzureRMRouteTables(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Route Table instance {0}".format(self.route_table_name))
+        self.log("Deleting the Route Table instance {0}", self.route_table_name)
         try:
             response = self.mgmt_client.route_tables.delete(resource_group_name=self.resource_group,
                                                             route_table_name=self.route_table_name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Route Table instance.')
+            self.log('Error attempting to delete the Route Table instance.', level='error')
             self.fail("Error deleting the Route Table instance: {0}".format(str(e)))
 
         return True
@@ -318,14 +340,14 @@ class AzureRMRouteTables(AzureRMModuleBase):
 
         :return: deserialized Route Table instance state dictionary
         '''
-        self.log("Checking if the Route Table instance {0} is present".format(self.route_table_name))
+        self.log("Checking if the Route Table instance {0} is present", self.route_table_name)
         found = False
         try:
             response = self.mgmt_client.route_tables.get(resource_group_name=self.resource_group,
                                                          route_table_name=self.route_table_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Route Table instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Route Table instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Route Table instance.')
         if found is True:
@@ -154,6 +154,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -178,9 +185,22 @@ id:
     returned: always
     type: str
     sample: /subscriptions/subid/resourceGroups/rg1/providers/Microsoft.Network/networkSecurityGroups/testnsg/securityRules/rule1
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Network/networkSecurityGroups/myNetworkSecurityGroup/securityRules/mySecurityRule",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2017-11-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Network/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -300,7 +320,8 @@ class AzureRMSecurityRules(AzureRMModuleBase):
 
         super(AzureRMSecurityRules, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                    supports_check_mode=True,
-                                                   supports_tags=False)
+                                                   supports_tags=False,
+                                                   supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -370,7 +391,8 @@ class AzureRMSecurityRules(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Security Rule instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.parameters, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Security Rule instance")
@@ -396,8 +418,7 @@ class AzureRMSecurityRules(AzureRMModuleBase):
             self.delete_securityrule()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_securityrule():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_securityrule)
         else:
             self.log("Security Rule instance unchanged")
             self.results['changed'] = False
@@ -414,7 +435,7 @@ class AzureRMSecurityRules(AzureRMModuleBase):
 
         :return: deserialized Security Rule instance state dictionary
         '''
-        self.log("Creating / Updating the Security Rule instance {0}".format(self.security_rule_name))
+        self.log("Creating / Updating the Security Rule instance {0}", self.security_rule_name)
 
         try:
             response = self.mgmt_client.security_rules.create_or_update(resource_group_name=self.resource_group,
@@ -425,7 +446,7 @@ class AzureRMSecurityRules(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Security Rule instance.')
+            self.log('Error attempting to create the Security Rule instance.', level='error')
             self.fail("Error creating the Security Rule instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -435,13 +456,15 @@ class AzureRMSecurityRules(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Security Rule instance {0}".format(self.security_rule_name))
+        self.log("Deleting the Security Rule instance {0}", self.security_rule_name)
         try:
             response = self.mgmt_client.security_rules.delete(resource_group_name=self.resource_group,
                                                               network_security_group_name=self.network_security_group_name,
                                                               security_rule_name=self.security_rule_name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Security Rule instance.')
+            self.log('Error attempting to delete the Security Rule instance.', level='error')
             self.fail("Error deleting the Security Rule instance: {0}".format(str(e)))
 
         return True
@@ -452,15 +475,15 @@ class AzureRMSecurityRules(AzureRMModuleBase):
 
         :return: deserialized Security Rule instance state dictionary
         '''
-        self.log("Checking if the Security Rule instance {0} is present".format(self.security_rule_name))
+        self.log("Checking if the Security Rule instance {0} is present", self.security_rule_name)
         found = False
         try:
             response = self.mgmt_client.security_rules.get(resource_group_name=self.resource_group,
                                                            network_security_group_name=self.network_security_group_name,
                                                            security_rule_name=self.security_rule_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Security Rule instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Security Rule instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Security Rule instance.')
         if found is True:
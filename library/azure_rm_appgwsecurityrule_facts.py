@@ -34,6 +34,15 @@ options:
         description:
             - The name of the security rule.
         required: True
+    fields:
+        description:
+            - List of attributes to return for every item, nested attributes are separated by dots, e.g. C(sku.name).
+            - Only the listed attributes are read from the service response and serialized.
+        type: list
+    query:
+        description:
+            - JMESPath expression applied to every returned item, after I(fields). Requires the jmespath package.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -139,7 +148,8 @@ class AzureRMSecurityRulesFacts(AzureRMModuleBase):
         self.resource_group = None
         self.network_security_group_name = None
         self.security_rule_name = None
-        super(AzureRMSecurityRulesFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMSecurityRulesFacts, self).__init__(self.module_arg_spec,
+                                                        supports_projection=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -165,12 +175,12 @@ class AzureRMSecurityRulesFacts(AzureRMModuleBase):
             response = self.mgmt_client.security_rules.get(resource_group_name=self.resource_group,
                                                            network_security_group_name=self.network_security_group_name,
                                                            security_rule_name=self.security_rule_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
-            self.log('Could not get facts for SecurityRules.')
+            self.log('Could not get facts for SecurityRules.', level='warning')
 
         if response is not None:
-            results[response.name] = response.as_dict()
+            results[response.name] = self.serialize_facts(response)
 
         return results
 
@@ -400,6 +400,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -424,9 +431,22 @@ id:
     returned: always
     type: str
     sample: /subscriptions/subid/resourceGroups/subnet-test/providers/Microsoft.Network/virtualNetworks/vnetname/subnets/subnet1
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Network/virtualNetworks/myVirtualNetwork/subnets/mySubnet",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2017-11-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Network/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -506,7 +526,8 @@ class AzureRMSubnets(AzureRMModuleBase):
 
         super(AzureRMSubnets, self).__init__(derived_arg_spec=self.module_arg_spec,
                                              supports_check_mode=True,
-                                             supports_tags=False)
+                                             supports_tags=False,
+                                             supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -556,7 +577,8 @@ class AzureRMSubnets(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Subnet instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.parameters, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Subnet instance")
@@ -582,8 +604,7 @@ class AzureRMSubnets(AzureRMModuleBase):
             self.delete_subnet()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_subnet():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_subnet)
         else:
             self.log("Subnet instance unchanged")
             self.results['changed'] = False
@@ -600,7 +621,7 @@ class AzureRMSubnets(AzureRMModuleBase):
 
         :return: deserialized Subnet instance state dictionary
         '''
-        self.log("Creating / Updating the Subnet instance {0}".format(self.subnet_name))
+        self.log("Creating / Updating the Subnet instance {0}", self.subnet_name)
 
         try:
             response = self.mgmt_client.subnets.create_or_update(resource_group_name=self.resource_group,
@@ -611,7 +632,7 @@ class AzureRMSubnets(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Subnet instance.')
+            self.log('Error attempting to create the Subnet instance.', level='error')
             self.fail("Error creating the Subnet instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -621,13 +642,15 @@ class AzureRMSubnets(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Subnet instance {0}".format(self.subnet_name))
+        self.log("Deleting the Subnet instance {0}", self.subnet_name)
         try:
             response = self.mgmt_client.subnets.delete(resource_group_name=self.resource_group,
                                                        virtual_network_name=self.virtual_network_name,
                                                        subnet_name=self.subnet_name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Subnet instance.')
+            self.log('Error attempting to delete the Subnet instance.', level='error')
             self.fail("Error deleting the Subnet instance: {0}".format(str(e)))
 
         return True
@@ -638,15 +661,15 @@ class AzureRMSubnets(AzureRMModuleBase):
 
         :return: deserialized Subnet instance state dictionary
         '''
-        self.log("Checking if the Subnet instance {0} is present".format(self.subnet_name))
+        self.log("Checking if the Subnet instance {0} is present", self.subnet_name)
         found = False
         try:
             response = self.mgmt_client.subnets.get(resource_group_name=self.resource_group,
                                                     virtual_network_name=self.virtual_network_name,
                                                     subnet_name=self.subnet_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Subnet instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Subnet instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Subnet instance.')
         if found is True:
@@ -37,6 +37,15 @@ options:
     expand:
         description:
             - Expands referenced resources.
+    fields:
+        description:
+            - List of attributes to return for every item, nested attributes are separated by dots, e.g. C(sku.name).
+            - Only the listed attributes are read from the service response and serialized.
+        type: list
+    query:
+        description:
+            - JMESPath expression applied to every returned item, after I(fields). Requires the jmespath package.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -121,7 +130,8 @@ class AzureRMSubnetsFacts(AzureRMModuleBase):
         self.virtual_network_name = None
         self.subnet_name = None
         self.expand = None
-        super(AzureRMSubnetsFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMSubnetsFacts, self).__init__(self.module_arg_spec,
+                                                  supports_projection=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -147,12 +157,12 @@ class AzureRMSubnetsFacts(AzureRMModuleBase):
             response = self.mgmt_client.subnets.get(resource_group_name=self.resource_group,
                                                     virtual_network_name=self.virtual_network_name,
                                                     subnet_name=self.subnet_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
-            self.log('Could not get facts for Subnets.')
+            self.log('Could not get facts for Subnets.', level='warning')
 
         if response is not None:
-            results[response.name] = response.as_dict()
+            results[response.name] = self.serialize_facts(response)
 
         return results
 
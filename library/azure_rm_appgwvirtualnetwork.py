@@ -500,6 +500,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -524,9 +531,22 @@ id:
     returned: always
     type: str
     sample: /subscriptions/subid/resourceGroups/rg1/providers/Microsoft.Network/virtualNetworks/test-vnet
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Network/virtualNetworks/myVirtualNetwork",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2017-11-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Network/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -607,7 +627,8 @@ class AzureRMVirtualNetworks(AzureRMModuleBase):
 
         super(AzureRMVirtualNetworks, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                      supports_check_mode=True,
-                                                     supports_tags=False)
+                                                     supports_tags=False,
+                                                     supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -653,9 +674,8 @@ class AzureRMVirtualNetworks(AzureRMModuleBase):
         self.mgmt_client = self.get_mgmt_svc_client(NetworkManagementClient,
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
         if "location" not in self.parameters:
+            resource_group = self.get_resource_group(self.resource_group)
             self.parameters["location"] = resource_group.location
 
         old_response = self.get_virtualnetwork()
@@ -672,7 +692,8 @@ class AzureRMVirtualNetworks(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Virtual Network instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.parameters, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Virtual Network instance")
@@ -698,8 +719,7 @@ class AzureRMVirtualNetworks(AzureRMModuleBase):
             self.delete_virtualnetwork()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_virtualnetwork():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_virtualnetwork)
         else:
             self.log("Virtual Network instance unchanged")
             self.results['changed'] = False
@@ -716,7 +736,7 @@ class AzureRMVirtualNetworks(AzureRMModuleBase):
 
         :return: deserialized Virtual Network instance state dictionary
         '''
-        self.log("Creating / Updating the Virtual Network instance {0}".format(self.virtual_network_name))
+        self.log("Creating / Updating the Virtual Network instance {0}", self.virtual_network_name)
 
         try:
             response = self.mgmt_client.virtual_networks.create_or_update(resource_group_name=self.resource_group,
@@ -726,7 +746,7 @@ class AzureRMVirtualNetworks(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Virtual Network instance.')
+            self.log('Error attempting to create the Virtual Network instance.', level='error')
             self.fail("Error creating the Virtual Network instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -736,12 +756,14 @@ class AzureRMVirtualNetworks(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Virtual Network instance {0}".format(self.virtual_network_name))
+        self.log("Deleting the Virtual Network instance {0}", self.virtual_network_name)
         try:
             response = self.mgmt_client.virtual_networks.delete(resource_group_name=self.resource_group,
                                                                 virtual_network_name=self.virtual_network_name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Virtual Network instance.')
+            self.log('Error attempting to delete the Virtual Network instance.', level='error')
             self.fail("Error deleting the Virtual Network instance: {0}".format(str(e)))
 
         return True
@@ -752,14 +774,14 @@ class AzureRMVirtualNetworks(AzureRMModuleBase):
 
         :return: deserialized Virtual Network instance state dictionary
         '''
-        self.log("Checking if the Virtual Network instance {0} is present".format(self.virtual_network_name))
+        self.log("Checking if the Virtual Network instance {0} is present", self.virtual_network_name)
         found = False
         try:
             response = self.mgmt_client.virtual_networks.get(resource_group_name=self.resource_group,
                                                              virtual_network_name=self.virtual_network_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Virtual Network instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Virtual Network instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Virtual Network instance.')
         if found is True:
@@ -33,6 +33,15 @@ options:
     expand:
         description:
             - Expands referenced resources.
+    fields:
+        description:
+            - List of attributes to return for every item, nested attributes are separated by dots, e.g. C(sku.name).
+            - Only the listed attributes are read from the service response and serialized.
+        type: list
+    query:
+        description:
+            - JMESPath expression applied to every returned item, after I(fields). Requires the jmespath package.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -130,7 +139,8 @@ class AzureRMVirtualNetworksFacts(AzureRMModuleBase):
         self.resource_group = None
         self.virtual_network_name = None
         self.expand = None
-        super(AzureRMVirtualNetworksFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMVirtualNetworksFacts, self).__init__(self.module_arg_spec,
+                                                          supports_projection=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -154,12 +164,12 @@ class AzureRMVirtualNetworksFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.virtual_networks.get(resource_group_name=self.resource_group,
                                                              virtual_network_name=self.virtual_network_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
-            self.log('Could not get facts for VirtualNetworks.')
+            self.log('Could not get facts for VirtualNetworks.', level='warning')
 
         if response is not None:
-            results[response.name] = response.as_dict()
+            results[response.name] = self.serialize_facts(response)
 
         return results
 
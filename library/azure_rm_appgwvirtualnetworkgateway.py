@@ -209,6 +209,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -233,9 +240,22 @@ id:
     returned: always
     type: str
     sample: id
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Network/virtualNetworkGateways/myVirtualNetworkGateway",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2017-11-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Network/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -326,7 +346,8 @@ class AzureRMVirtualNetworkGateways(AzureRMModuleBase):
 
         super(AzureRMVirtualNetworkGateways, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                             supports_check_mode=True,
-                                                            supports_tags=False)
+                                                            supports_tags=False,
+                                                            supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -405,9 +426,8 @@ class AzureRMVirtualNetworkGateways(AzureRMModuleBase):
         self.mgmt_client = self.get_mgmt_svc_client(NetworkManagementClient,
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
         if "location" not in self.parameters:
+            resource_group = self.get_resource_group(self.resource_group)
             self.parameters["location"] = resource_group.location
 
         old_response = self.get_virtualnetworkgateway()
@@ -424,7 +444,8 @@ class AzureRMVirtualNetworkGateways(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Virtual Network Gateway instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.parameters, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Virtual Network Gateway instance")
@@ -450,8 +471,7 @@ class AzureRMVirtualNetworkGateways(AzureRMModuleBase):
             self.delete_virtualnetworkgateway()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_virtualnetworkgateway():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_virtualnetworkgateway)
         else:
             self.log("Virtual Network Gateway instance unchanged")
             self.results['changed'] = False
@@ -468,7 +488,7 @@ class AzureRMVirtualNetworkGateways(AzureRMModuleBase):
 
         :return: deserialized Virtual Network Gateway instance state dictionary
         '''
-        self.log("Creating / Updating the Virtual Network Gateway instance {0}".format(self.virtual_network_gateway_name))
+        self.log("Creating / Updating the Virtual Network Gateway instance {0}", self.virtual_network_gateway_name)
 
         try:
             response = self.mgmt_client.virtual_network_gateways.create_or_update(resource_group_name=self.resource_group,
@@ -478,7 +498,7 @@ class AzureRMVirtualNetworkGateways(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Virtual Network Gateway instance.')
+            self.log('Error attempting to create the Virtual Network Gateway instance.', level='error')
             self.fail("Error creating the Virtual Network Gateway instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -488,12 +508,14 @@ class AzureRMVirtualNetworkGateways(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Virtual Network Gateway instance {0}".format(self.virtual_network_gateway_name))
+        self.log("Deleting the Virtual Network Gateway instance {0}", self.virtual_network_gateway_name)
         try:
             response = self.mgmt_client.virtual_network_gateways.delete(resource_group_name=self.resource_group,
                                                                         virtual_network_gateway_name=self.virtual_network_gateway_name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Virtual Network Gateway instance.')
+            self.log('Error attempting to delete the Virtual Network Gateway instance.', level='error')
             self.fail("Error deleting the Virtual Network Gateway instance: {0}".format(str(e)))
 
         return True
@@ -504,14 +526,14 @@ class AzureRMVirtualNetworkGateways(AzureRMModuleBase):
 
         :return: deserialized Virtual Network Gateway instance state dictionary
         '''
-        self.log("Checking if the Virtual Network Gateway instance {0} is present".format(self.virtual_network_gateway_name))
+        self.log("Checking if the Virtual Network Gateway instance {0} is present", self.virtual_network_gateway_name)
         found = False
         try:
             response = self.mgmt_client.virtual_network_gateways.get(resource_group_name=self.resource_group,
                                                                      virtual_network_gateway_name=self.virtual_network_gateway_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Virtual Network Gateway instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Virtual Network Gateway instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Virtual Network Gateway instance.')
         if found is True:
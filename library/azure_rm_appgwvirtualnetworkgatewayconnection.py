@@ -554,6 +554,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -578,9 +585,22 @@ id:
     returned: always
     type: str
     sample: id
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Network/connections/myConnection",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2017-11-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Network/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -679,7 +699,8 @@ class AzureRMVirtualNetworkGatewayConnections(AzureRMModuleBase):
 
         super(AzureRMVirtualNetworkGatewayConnections, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                                       supports_check_mode=True,
-                                                                      supports_tags=False)
+                                                                      supports_tags=False,
+                                                                      supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -837,9 +858,8 @@ class AzureRMVirtualNetworkGatewayConnections(AzureRMModuleBase):
         self.mgmt_client = self.get_mgmt_svc_client(NetworkManagementClient,
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
         if "location" not in self.parameters:
+            resource_group = self.get_resource_group(self.resource_group)
             self.parameters["location"] = resource_group.location
 
         old_response = self.get_virtualnetworkgatewayconnection()
@@ -856,7 +876,8 @@ class AzureRMVirtualNetworkGatewayConnections(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Virtual Network Gateway Connection instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.parameters, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Virtual Network Gateway Connection instance")
@@ -882,8 +903,7 @@ class AzureRMVirtualNetworkGatewayConnections(AzureRMModuleBase):
             self.delete_virtualnetworkgatewayconnection()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_virtualnetworkgatewayconnection():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_virtualnetworkgatewayconnection)
         else:
             self.log("Virtual Network Gateway Connection instance unchanged")
             self.results['changed'] = False
@@ -900,7 +920,7 @@ class AzureRMVirtualNetworkGatewayConnections(AzureRMModuleBase):
 
         :return: deserialized Virtual Network Gateway Connection instance state dictionary
         '''
-        self.log("Creating / Updating the Virtual Network Gateway Connection instance {0}".format(self.virtual_network_gateway_connection_name))
+        self.log("Creating / Updating the Virtual Network Gateway Connection instance {0}", self.virtual_network_gateway_connection_name)
 
         try:
             response = self.mgmt_client.virtual_network_gateway_connections.create_or_update(resource_group_name=self.resource_group,
@@ -910,7 +930,7 @@ class AzureRMVirtualNetworkGatewayConnections(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Virtual Network Gateway Connection instance.')
+            self.log('Error attempting to create the Virtual Network Gateway Connection instance.', level='error')
             self.fail("Error creating the Virtual Network Gateway Connection instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -920,12 +940,14 @@ class AzureRMVirtualNetworkGatewayConnections(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Virtual Network Gateway Connection instance {0}".format(self.virtual_network_gateway_connection_name))
+        self.log("Deleting the Virtual Network Gateway Connection instance {0}", self.virtual_network_gateway_connection_name)
         try:
             response = self.mgmt_client.virtual_network_gateway_connections.delete(resource_group_name=self.resource_group,
                                                                                    virtual_network_gateway_connection_name=self.virtual_network_gateway_connection_name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Virtual Network Gateway Connection instance.')
+            self.log('Error attempting to delete the Virtual Network Gateway Connection instance.', level='error')
             self.fail("Error deleting the Virtual Network Gateway Connection instance: {0}".format(str(e)))
 
         return True
@@ -936,14 +958,14 @@ class AzureRMVirtualNetworkGatewayConnections(AzureRMModuleBase):
 
         :return: deserialized Virtual Network Gateway Connection instance state dictionary
         '''
-        self.log("Checking if the Virtual Network Gateway Connection instance {0} is present".format(self.virtual_network_gateway_connection_name))
+        self.log("Checking if the Virtual Network Gateway Connection instance {0} is present", self.virtual_network_gateway_connection_name)
         found = False
         try:
             response = self.mgmt_client.virtual_network_gateway_connections.get(resource_group_name=self.resource_group,
                                                                                 virtual_network_gateway_connection_name=self.virtual_network_gateway_connection_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Virtual Network Gateway Connection instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Virtual Network Gateway Connection instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Virtual Network Gateway Connection instance.')
         if found is True:
@@ -30,6 +30,15 @@ options:
         description:
             - The name of the virtual network gateway connection.
         required: True
+    fields:
+        description:
+            - List of attributes to return for every item, nested attributes are separated by dots, e.g. C(sku.name).
+            - Only the listed attributes are read from the service response and serialized.
+        type: list
+    query:
+        description:
+            - JMESPath expression applied to every returned item, after I(fields). Requires the jmespath package.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -97,7 +106,8 @@ class AzureRMVirtualNetworkGatewayConnectionsFacts(AzureRMModuleBase):
         self.mgmt_client = None
         self.resource_group = None
         self.virtual_network_gateway_connection_name = None
-        super(AzureRMVirtualNetworkGatewayConnectionsFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMVirtualNetworkGatewayConnectionsFacts, self).__init__(self.module_arg_spec,
+                                                                           supports_projection=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -121,12 +131,12 @@ class AzureRMVirtualNetworkGatewayConnectionsFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.virtual_network_gateway_connections.get(resource_group_name=self.resource_group,
                                                                                 virtual_network_gateway_connection_name=self.virtual_network_gateway_connection_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
-            self.log('Could not get facts for VirtualNetworkGatewayConnections.')
+            self.log('Could not get facts for VirtualNetworkGatewayConnections.', level='warning')
 
         if response is not None:
-            results[response.name] = response.as_dict()
+            results[response.name] = self.serialize_facts(response)
 
         return results
 
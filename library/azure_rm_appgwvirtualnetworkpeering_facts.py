@@ -34,6 +34,15 @@ options:
         description:
             - The name of the virtual network peering.
         required: True
+    fields:
+        description:
+            - List of attributes to return for every item, nested attributes are separated by dots, e.g. C(sku.name).
+            - Only the listed attributes are read from the service response and serialized.
+        type: list
+    query:
+        description:
+            - JMESPath expression applied to every returned item, after I(fields). Requires the jmespath package.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -113,7 +122,8 @@ class AzureRMVirtualNetworkPeeringsFacts(AzureRMModuleBase):
         self.resource_group = None
         self.virtual_network_name = None
         self.virtual_network_peering_name = None
-        super(AzureRMVirtualNetworkPeeringsFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMVirtualNetworkPeeringsFacts, self).__init__(self.module_arg_spec,
+                                                                 supports_projection=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -139,12 +149,12 @@ class AzureRMVirtualNetworkPeeringsFacts(AzureRMModuleBase):
             response = self.mgmt_client.virtual_network_peerings.get(resource_group_name=self.resource_group,
                                                                      virtual_network_name=self.virtual_network_name,
                                                                      virtual_network_peering_name=self.virtual_network_peering_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
-            self.log('Could not get facts for VirtualNetworkPeerings.')
+            self.log('Could not get facts for VirtualNetworkPeerings.', level='warning')
 
         if response is not None:
-            results[response.name] = response.as_dict()
+            results[response.name] = self.serialize_facts(response)
 
         return results
 
@@ -29,6 +29,15 @@ options:
     expand:
         description:
             - Specifies whether to expand the values.
+    fields:
+        description:
+            - List of attributes to return for every item, nested attributes are separated by dots, e.g. C(sku.name).
+            - Only the listed attributes are read from the service response and serialized.
+        type: list
+    query:
+        description:
+            - JMESPath expression applied to every returned item, after I(fields). Requires the jmespath package.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -114,7 +123,8 @@ class AzureRMProviderOperationsMetadataFacts(AzureRMModuleBase):
         self.mgmt_client = None
         self.resource_provider_namespace = None
         self.expand = None
-        super(AzureRMProviderOperationsMetadataFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMProviderOperationsMetadataFacts, self).__init__(self.module_arg_spec,
+                                                                     supports_projection=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -136,12 +146,12 @@ class AzureRMProviderOperationsMetadataFacts(AzureRMModuleBase):
         results = {}
         try:
             response = self.mgmt_client.provider_operations_metadata.get(resource_provider_namespace=self.resource_provider_namespace)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
-            self.log('Could not get facts for ProviderOperationsMetadata.')
+            self.log('Could not get facts for ProviderOperationsMetadata.', level='warning')
 
         if response is not None:
-            results[response.name] = response.as_dict()
+            results[response.name] = self.serialize_facts(response)
 
         return results
 
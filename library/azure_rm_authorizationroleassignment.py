@@ -55,6 +55,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -82,9 +89,22 @@ id:
     returned: always
     type: str
     sample: id
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Authorization/roleAssignments/11111111-2222-3333-4444-555555555555",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2018-09-01-preview",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Authorization/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -138,7 +158,8 @@ class AzureRMRoleAssignments(AzureRMModuleBase):
 
         super(AzureRMRoleAssignments, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                      supports_check_mode=True,
-                                                     supports_tags=False)
+                                                     supports_tags=False,
+                                                     supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -167,7 +188,8 @@ class AzureRMRoleAssignments(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Role Assignment instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(dict(properties=self.properties), old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Role Assignment instance")
@@ -193,8 +215,7 @@ class AzureRMRoleAssignments(AzureRMModuleBase):
             self.delete_roleassignment()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_roleassignment():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_roleassignment)
         else:
             self.log("Role Assignment instance unchanged")
             self.results['changed'] = False
@@ -211,7 +232,7 @@ class AzureRMRoleAssignments(AzureRMModuleBase):
 
         :return: deserialized Role Assignment instance state dictionary
         '''
-        self.log("Creating / Updating the Role Assignment instance {0}".format(self.role_assignment_name))
+        self.log("Creating / Updating the Role Assignment instance {0}", self.role_assignment_name)
 
         try:
             if self.to_do == Actions.Create:
@@ -224,7 +245,7 @@ class AzureRMRoleAssignments(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Role Assignment instance.')
+            self.log('Error attempting to create the Role Assignment instance.', level='error')
             self.fail("Error creating the Role Assignment instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -234,12 +255,14 @@ class AzureRMRoleAssignments(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Role Assignment instance {0}".format(self.role_assignment_name))
+        self.log("Deleting the Role Assignment instance {0}", self.role_assignment_name)
         try:
             response = self.mgmt_client.role_assignments.delete(scope=self.scope,
                                                                 role_assignment_name=self.role_assignment_name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Role Assignment instance.')
+            self.log('Error attempting to delete the Role Assignment instance.', level='error')
             self.fail("Error deleting the Role Assignment instance: {0}".format(str(e)))
 
         return True
@@ -250,14 +273,14 @@ class AzureRMRoleAssignments(AzureRMModuleBase):
 
         :return: deserialized Role Assignment instance state dictionary
         '''
-        self.log("Checking if the Role Assignment instance {0} is present".format(self.role_assignment_name))
+        self.log("Checking if the Role Assignment instance {0} is present", self.role_assignment_name)
         found = False
         try:
             response = self.mgmt_client.role_assignments.get(scope=self.scope,
                                                              role_assignment_name=self.role_assignment_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Role Assignment instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Role Assignment instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Role Assignment instance.')
         if found is True:
@@ -29,7 +29,37 @@ options:
     role_assignment_name:
         description:
             - The name of the role assignment to get.
-        required: True
+            - When omitted, the role assignments at and above I(scope) are listed.
+    skip:
+        description:
+            - Number of items to skip before results are collected.
+        type: int
+        default: 0
+    max_items:
+        description:
+            - Maximum number of items to return. Pages are requested from the service only until this many items are collected.
+            - When more items are available, I(next_link) is returned to continue from where this run stopped.
+        type: int
+    next_link:
+        description:
+            - Continuation token returned as I(next_link) by a previous run with I(max_items), used to fetch the following items.
+        type: str
+    filters:
+        description:
+            - Only return items matching all of these filters.
+            - Keys are attribute names, nested attributes are separated by dots, e.g. C(tags.environment). A list of values matches any of them.
+            - Filters are passed to the service where it supports them, otherwise items are matched while the result pages are read.
+            - A single C(principal_id) is passed to the service.
+        type: dict
+    fields:
+        description:
+            - List of attributes to return for every item, nested attributes are separated by dots, e.g. C(sku.name).
+            - Only the listed attributes are read from the service response and serialized.
+        type: list
+    query:
+        description:
+            - JMESPath expression applied to every returned item, after I(fields). Requires the jmespath package.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -44,6 +74,12 @@ EXAMPLES = '''
     azure_rm_authorizationroleassignment_facts:
       scope: scope
       role_assignment_name: role_assignment_name
+
+  - name: List Role Assignments of a principal
+    azure_rm_authorizationroleassignment_facts:
+      scope: /subscriptions/00000000-0000-0000-0000-000000000000
+      filters:
+        principal_id: 11111111-1111-1111-1111-111111111111
 '''
 
 RETURN = '''
@@ -87,6 +123,11 @@ role_assignments:
                             returned: always
                             type: str
                             sample: /subscriptions/subId/resourcegroups/rgname
+next_link:
+    description:
+        - Continuation token to pass as I(next_link) to fetch the remaining items.
+    returned: when I(max_items) is set and more items are available
+    type: str
 '''
 
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
@@ -110,8 +151,7 @@ class AzureRMRoleAssignmentsFacts(AzureRMModuleBase):
                 required=True
             ),
             role_assignment_name=dict(
-                type='str',
-                required=True
+                type='str'
             )
         )
         # store the results of the module operation
@@ -122,7 +162,9 @@ class AzureRMRoleAssignmentsFacts(AzureRMModuleBase):
         self.mgmt_client = None
         self.scope = None
         self.role_assignment_name = None
-        super(AzureRMRoleAssignmentsFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMRoleAssignmentsFacts, self).__init__(self.module_arg_spec,
+                                                          supports_paging=True,
+                                                          supports_projection=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -133,6 +175,8 @@ class AzureRMRoleAssignmentsFacts(AzureRMModuleBase):
         if (self.scope is not None and
                 self.role_assignment_name is not None):
             self.results['role_assignments'] = self.get()
+        elif (self.scope is not None):
+            self.results['role_assignments'] = self.list_for_scope()
         return self.results
 
     def get(self):
@@ -146,12 +190,33 @@ class AzureRMRoleAssignmentsFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.role_assignments.get(scope=self.scope,
                                                              role_assignment_name=self.role_assignment_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
+        except CloudError as e:
+            self.log('Could not get facts for RoleAssignments: {0}', e, level='warning')
+
+        if response is not None:
+            results[response.name] = self.serialize_facts(response)
+
+        return results
+
+    def list_for_scope(self):
+        '''
+        Gets facts of the Role Assignments at the specified scope.
+
+        :return: deserialized Role Assignmentinstance state dictionary
+        '''
+        response = None
+        results = {}
+        try:
+            operation = self.mgmt_client.role_assignments.list_for_scope
+            response = operation(scope=self.scope,
+                                 filter=self.get_odata_filter(operation, dict(principal_id='principalId')))
+            self.log("Response : {0}", response)
         except CloudError as e:
-            self.log('Could not get facts for RoleAssignments.')
+            self.log('Could not get facts for RoleAssignments: {0}', e, level='warning')
 
         if response is not None:
-            results[response.name] = response.as_dict()
+            results = self.serialize_paged(response)
 
         return results
 
@@ -64,6 +64,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -87,9 +94,22 @@ id:
     returned: always
     type: str
     sample: id
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Authorization/roleDefinitions/11111111-2222-3333-4444-555555555555",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2018-01-01-preview",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Authorization/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -152,7 +172,8 @@ class AzureRMRoleDefinitions(AzureRMModuleBase):
 
         super(AzureRMRoleDefinitions, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                      supports_check_mode=True,
-                                                     supports_tags=False)
+                                                     supports_tags=False,
+                                                     supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -192,7 +213,8 @@ class AzureRMRoleDefinitions(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Role Definition instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.role_definition, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Role Definition instance")
@@ -218,8 +240,7 @@ class AzureRMRoleDefinitions(AzureRMModuleBase):
             self.delete_roledefinition()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_roledefinition():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_roledefinition)
         else:
             self.log("Role Definition instance unchanged")
             self.results['changed'] = False
@@ -236,7 +257,7 @@ class AzureRMRoleDefinitions(AzureRMModuleBase):
 
         :return: deserialized Role Definition instance state dictionary
         '''
-        self.log("Creating / Updating the Role Definition instance {0}".format(self.role_definition_id))
+        self.log("Creating / Updating the Role Definition instance {0}", self.role_definition_id)
 
         try:
             response = self.mgmt_client.role_definitions.create_or_update(scope=self.scope,
@@ -246,7 +267,7 @@ class AzureRMRoleDefinitions(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Role Definition instance.')
+            self.log('Error attempting to create the Role Definition instance.', level='error')
             self.fail("Error creating the Role Definition instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -256,12 +277,14 @@ class AzureRMRoleDefinitions(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Role Definition instance {0}".format(self.role_definition_id))
+        self.log("Deleting the Role Definition instance {0}", self.role_definition_id)
         try:
             response = self.mgmt_client.role_definitions.delete(scope=self.scope,
                                                                 role_definition_id=self.role_definition_id)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Role Definition instance.')
+            self.log('Error attempting to delete the Role Definition instance.', level='error')
             self.fail("Error deleting the Role Definition instance: {0}".format(str(e)))
 
         return True
@@ -272,14 +295,14 @@ class AzureRMRoleDefinitions(AzureRMModuleBase):
 
         :return: deserialized Role Definition instance state dictionary
         '''
-        self.log("Checking if the Role Definition instance {0} is present".format(self.role_definition_id))
+        self.log("Checking if the Role Definition instance {0} is present", self.role_definition_id)
         found = False
         try:
             response = self.mgmt_client.role_definitions.get(scope=self.scope,
                                                              role_definition_id=self.role_definition_id)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Role Definition instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Role Definition instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Role Definition instance.')
         if found is True:
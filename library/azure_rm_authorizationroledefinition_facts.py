@@ -30,6 +30,15 @@ options:
         description:
             - The ID of the role definition.
         required: True
+    fields:
+        description:
+            - List of attributes to return for every item, nested attributes are separated by dots, e.g. C(sku.name).
+            - Only the listed attributes are read from the service response and serialized.
+        type: list
+    query:
+        description:
+            - JMESPath expression applied to every returned item, after I(fields). Requires the jmespath package.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -135,7 +144,8 @@ class AzureRMRoleDefinitionsFacts(AzureRMModuleBase):
         self.mgmt_client = None
         self.scope = None
         self.role_definition_id = None
-        super(AzureRMRoleDefinitionsFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMRoleDefinitionsFacts, self).__init__(self.module_arg_spec,
+                                                          supports_projection=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -159,12 +169,12 @@ class AzureRMRoleDefinitionsFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.role_definitions.get(scope=self.scope,
                                                              role_definition_id=self.role_definition_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
-            self.log('Could not get facts for RoleDefinitions.')
+            self.log('Could not get facts for RoleDefinitions.', level='warning')
 
         if response is not None:
-            results[response.name] = response.as_dict()
+            results[response.name] = self.serialize_facts(response)
 
         return results
 
@@ -237,6 +237,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -261,9 +268,22 @@ id:
     returned: always
     type: str
     sample: /subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/demo_resource_group/providers/Microsoft.BatchAI/clusters/demo_cluster
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.BatchAI/clusters/myCluster",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2017-09-01-preview",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.BatchAI/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -339,7 +359,8 @@ class AzureRMClusters(AzureRMModuleBase):
 
         super(AzureRMClusters, self).__init__(derived_arg_spec=self.module_arg_spec,
                                               supports_check_mode=True,
-                                              supports_tags=False)
+                                              supports_tags=False,
+                                              supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -371,9 +392,8 @@ class AzureRMClusters(AzureRMModuleBase):
         self.mgmt_client = self.get_mgmt_svc_client(BatchAIManagementClient,
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
         if "location" not in self.parameters:
+            resource_group = self.get_resource_group(self.resource_group)
             self.parameters["location"] = resource_group.location
 
         old_response = self.get_cluster()
@@ -390,7 +410,8 @@ class AzureRMClusters(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Cluster instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.parameters, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Cluster instance")
@@ -416,8 +437,7 @@ class AzureRMClusters(AzureRMModuleBase):
             self.delete_cluster()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_cluster():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_cluster)
         else:
             self.log("Cluster instance unchanged")
             self.results['changed'] = False
@@ -436,25 +456,7 @@ class AzureRMClusters(AzureRMModuleBase):
             volumes = self.parameters['node_setup']['mount_volumes']
         except KeyError:
             return
-        for systems in volumes.values():
-            for s in systems:
-                if 'account_name' in s and 'credentials' not in s:
-                    s['credentials'] = {'account_key': self.get_key_for_storage_account(s['account_name'])}
-
-    def get_key_for_storage_account(self, name):
-        '''
-        Finds a storage account key for a storage account with given name.
-        :return str: the storage account key.
-        '''
-        try:
-            resource_id = next((acc.id for acc in self.storage_client.storage_accounts.list() if
-                                acc.name == name))
-        except StopIteration:
-            self.fail('Error finding {0} storage account under current subscription'.format(name))
-        resource_group = resource_id.split('/')[4]
-        keys = self.storage_client.storage_accounts.list_keys(resource_group, name)
-        return keys.keys[0].value
-
+        self.populate_mount_volume_keys(volumes)
 
     def create_update_cluster(self):
         '''
@@ -462,7 +464,7 @@ class AzureRMClusters(AzureRMModuleBase):
 
         :return: deserialized Cluster instance state dictionary
         '''
-        self.log("Creating / Updating the Cluster instance {0}".format(self.cluster_name))
+        self.log("Creating / Updating the Cluster instance {0}", self.cluster_name)
 
         try:
             if self.to_do == Actions.Create:
@@ -477,7 +479,7 @@ class AzureRMClusters(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Cluster instance.')
+            self.log('Error attempting to create the Cluster instance.', level='error')
             self.fail("Error creating the Cluster instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -487,12 +489,14 @@ class AzureRMClusters(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Cluster instance {0}".format(self.cluster_name))
+        self.log("Deleting the Cluster instance {0}", self.cluster_name)
         try:
             response = self.mgmt_client.clusters.delete(resource_group_name=self.resource_group,
                                                         cluster_name=self.cluster_name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Cluster instance.')
+            self.log('Error attempting to delete the Cluster instance.', level='error')
             self.fail("Error deleting the Cluster instance: {0}".format(str(e)))
 
         return True
@@ -503,14 +507,14 @@ class AzureRMClusters(AzureRMModuleBase):
 
         :return: deserialized Cluster instance state dictionary
         '''
-        self.log("Checking if the Cluster instance {0} is present".format(self.cluster_name))
+        self.log("Checking if the Cluster instance {0} is present", self.cluster_name)
         found = False
         try:
             response = self.mgmt_client.clusters.get(resource_group_name=self.resource_group,
                                                      cluster_name=self.cluster_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Cluster instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Cluster instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Cluster instance.')
         if found is True:
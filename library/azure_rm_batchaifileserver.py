@@ -89,6 +89,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -113,9 +120,22 @@ id:
     returned: always
     type: str
     sample: id
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.BatchAI/fileServers/myFileServer",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2017-09-01-preview",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.BatchAI/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -181,7 +201,8 @@ class AzureRMFileServers(AzureRMModuleBase):
 
         super(AzureRMFileServers, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                  supports_check_mode=True,
-                                                 supports_tags=False)
+                                                 supports_tags=False,
+                                                 supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -213,9 +234,8 @@ class AzureRMFileServers(AzureRMModuleBase):
         self.mgmt_client = self.get_mgmt_svc_client(BatchAIManagementClient,
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
         if "location" not in self.parameters:
+            resource_group = self.get_resource_group(self.resource_group)
             self.parameters["location"] = resource_group.location
 
         old_response = self.get_fileserver()
@@ -232,7 +252,8 @@ class AzureRMFileServers(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if File Server instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.parameters, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the File Server instance")
@@ -258,8 +279,7 @@ class AzureRMFileServers(AzureRMModuleBase):
             self.delete_fileserver()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_fileserver():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_fileserver)
         else:
             self.log("File Server instance unchanged")
             self.results['changed'] = False
@@ -276,7 +296,7 @@ class AzureRMFileServers(AzureRMModuleBase):
 
         :return: deserialized File Server instance state dictionary
         '''
-        self.log("Creating / Updating the File Server instance {0}".format(self.file_server_name))
+        self.log("Creating / Updating the File Server instance {0}", self.file_server_name)
 
         try:
             response = self.mgmt_client.file_servers.create(resource_group_name=self.resource_group,
@@ -286,7 +306,7 @@ class AzureRMFileServers(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the File Server instance.')
+            self.log('Error attempting to create the File Server instance.', level='error')
             self.fail("Error creating the File Server instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -296,12 +316,14 @@ class AzureRMFileServers(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the File Server instance {0}".format(self.file_server_name))
+        self.log("Deleting the File Server instance {0}", self.file_server_name)
         try:
             response = self.mgmt_client.file_servers.delete(resource_group_name=self.resource_group,
                                                             file_server_name=self.file_server_name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the File Server instance.')
+            self.log('Error attempting to delete the File Server instance.', level='error')
             self.fail("Error deleting the File Server instance: {0}".format(str(e)))
 
         return True
@@ -312,14 +334,14 @@ class AzureRMFileServers(AzureRMModuleBase):
 
         :return: deserialized File Server instance state dictionary
         '''
-        self.log("Checking if the File Server instance {0} is present".format(self.file_server_name))
+        self.log("Checking if the File Server instance {0} is present", self.file_server_name)
         found = False
         try:
             response = self.mgmt_client.file_servers.get(resource_group_name=self.resource_group,
                                                          file_server_name=self.file_server_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("File Server instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("File Server instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the File Server instance.')
         if found is True:
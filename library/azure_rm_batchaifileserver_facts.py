@@ -33,6 +33,35 @@ options:
     file_servers_list_by_resource_group_options:
         description:
             - Additional parameters for the operation
+    skip:
+        description:
+            - Number of items to skip before results are collected.
+        type: int
+        default: 0
+    max_items:
+        description:
+            - Maximum number of items to return. Pages are requested from the service only until this many items are collected.
+            - When more items are available, I(next_link) is returned to continue from where this run stopped.
+        type: int
+    next_link:
+        description:
+            - Continuation token returned as I(next_link) by a previous run with I(max_items), used to fetch the following items.
+        type: str
+    filters:
+        description:
+            - Only return items matching all of these filters.
+            - Keys are attribute names, nested attributes are separated by dots, e.g. C(tags.environment). A list of values matches any of them.
+            - Filters are passed to the service where it supports them, otherwise items are matched while the result pages are read.
+        type: dict
+    fields:
+        description:
+            - List of attributes to return for every item, nested attributes are separated by dots, e.g. C(sku.name).
+            - Only the listed attributes are read from the service response and serialized.
+        type: list
+    query:
+        description:
+            - JMESPath expression applied to every returned item, after I(fields). Requires the jmespath package.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -103,6 +132,11 @@ file_servers:
                             type: str
                             sample: "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/demo_resource_group/providers/Microsoft.Network/virtu
                                     alNetworks/7feb1976-8c31-4f1f-bea2-86cb1839a7bavnet/subnets/Subnet-1"
+next_link:
+    description:
+        - Continuation token to pass as I(next_link) to fetch the remaining items.
+    returned: when I(max_items) is set and more items are available
+    type: str
 '''
 
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
@@ -141,7 +175,9 @@ class AzureRMFileServersFacts(AzureRMModuleBase):
         self.resource_group = None
         self.file_server_name = None
         self.file_servers_list_by_resource_group_options = None
-        super(AzureRMFileServersFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMFileServersFacts, self).__init__(self.module_arg_spec,
+                                                      supports_paging=True,
+                                                      supports_projection=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -167,12 +203,12 @@ class AzureRMFileServersFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.file_servers.get(resource_group_name=self.resource_group,
                                                          file_server_name=self.file_server_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
-            self.log('Could not get facts for FileServers.')
+            self.log('Could not get facts for FileServers.', level='warning')
 
         if response is not None:
-            results[response.name] = response.as_dict()
+            results[response.name] = self.serialize_facts(response)
 
         return results
 
@@ -186,13 +222,12 @@ class AzureRMFileServersFacts(AzureRMModuleBase):
         results = {}
         try:
             response = self.mgmt_client.file_servers.list_by_resource_group(resource_group_name=self.resource_group)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
-            self.log('Could not get facts for FileServers.')
+            self.log('Could not get facts for FileServers.', level='warning')
 
         if response is not None:
-            for item in response:
-                results[item.name] = item.as_dict()
+            results = self.serialize_paged(response)
 
         return results
 
@@ -258,6 +258,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -282,9 +289,22 @@ id:
     returned: always
     type: str
     sample: /subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/demo_resource_group/providers/Microsoft.BatchAI/jobs/demo_job
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.BatchAI/jobs/myJob",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2017-09-01-preview",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.BatchAI/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -389,7 +409,8 @@ class AzureRMJobs(AzureRMModuleBase):
 
         super(AzureRMJobs, self).__init__(derived_arg_spec=self.module_arg_spec,
                                           supports_check_mode=True,
-                                          supports_tags=False)
+                                          supports_tags=False,
+                                          supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -441,9 +462,8 @@ class AzureRMJobs(AzureRMModuleBase):
         self.mgmt_client = self.get_mgmt_svc_client(BatchAIManagementClient,
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
         if "location" not in self.parameters:
+            resource_group = self.get_resource_group(self.resource_group)
             self.parameters["location"] = resource_group.location
 
         old_response = self.get_job()
@@ -460,7 +480,8 @@ class AzureRMJobs(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Job instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.parameters, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Job instance")
@@ -486,8 +507,7 @@ class AzureRMJobs(AzureRMModuleBase):
             self.delete_job()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_job():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_job)
         else:
             self.log("Job instance unchanged")
             self.results['changed'] = False
@@ -504,7 +524,7 @@ class AzureRMJobs(AzureRMModuleBase):
 
         :return: deserialized Job instance state dictionary
         '''
-        self.log("Creating / Updating the Job instance {0}".format(self.job_name))
+        self.log("Creating / Updating the Job instance {0}", self.job_name)
 
         try:
             if self.to_do == Actions.Create:
@@ -517,7 +537,7 @@ class AzureRMJobs(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Job instance.')
+            self.log('Error attempting to create the Job instance.', level='error')
             self.fail("Error creating the Job instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -527,12 +547,14 @@ class AzureRMJobs(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Job instance {0}".format(self.job_name))
+        self.log("Deleting the Job instance {0}", self.job_name)
         try:
             response = self.mgmt_client.jobs.delete(resource_group_name=self.resource_group,
                                                     job_name=self.job_name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Job instance.')
+            self.log('Error attempting to delete the Job instance.', level='error')
             self.fail("Error deleting the Job instance: {0}".format(str(e)))
 
         return True
@@ -543,14 +565,14 @@ class AzureRMJobs(AzureRMModuleBase):
 
         :return: deserialized Job instance state dictionary
         '''
-        self.log("Checking if the Job instance {0} is present".format(self.job_name))
+        self.log("Checking if the Job instance {0} is present", self.job_name)
         found = False
         try:
             response = self.mgmt_client.jobs.get(resource_group_name=self.resource_group,
                                                  job_name=self.job_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Job instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Job instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Job instance.')
         if found is True:
@@ -48,6 +48,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -66,9 +73,22 @@ EXAMPLES = '''
 '''
 
 RETURN = '''
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Batch/batchAccounts/myBatchAccount/applications/myApplication",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2017-09-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Batch/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -127,7 +147,8 @@ class AzureRMApplication(AzureRMModuleBase):
 
         super(AzureRMApplication, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                  supports_check_mode=True,
-                                                 supports_tags=False)
+                                                 supports_tags=False,
+                                                 supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -163,7 +184,8 @@ class AzureRMApplication(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Application instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.parameters, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Application instance")
@@ -177,7 +199,7 @@ class AzureRMApplication(AzureRMModuleBase):
             if not old_response:
                 self.results['changed'] = True
             else:
-                self.results['changed'] = False
+                self.results['changed'] = old_response.__ne__(response)
             self.log("Creation / Update done")
         elif self.to_do == Actions.Delete:
             self.log("Application instance deleted")
@@ -189,8 +211,7 @@ class AzureRMApplication(AzureRMModuleBase):
             self.delete_application()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_application():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_application)
         else:
             self.log("Application instance unchanged")
             self.results['changed'] = False
@@ -205,7 +226,7 @@ class AzureRMApplication(AzureRMModuleBase):
 
         :return: deserialized Application instance state dictionary
         '''
-        self.log("Creating / Updating the Application instance {0}".format(self.application_id))
+        self.log("Creating / Updating the Application instance {0}", self.application_id)
 
         try:
             if self.to_do == Actions.Create:
@@ -221,7 +242,7 @@ class AzureRMApplication(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Application instance.')
+            self.log('Error attempting to create the Application instance.', level='error')
             self.fail("Error creating the Application instance: {0}".format(str(exc)))
         if response is not None:
             return response.as_dict()
@@ -234,13 +255,15 @@ class AzureRMApplication(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Application instance {0}".format(self.application_id))
+        self.log("Deleting the Application instance {0}", self.application_id)
         try:
             response = self.mgmt_client.application.delete(resource_group_name=self.resource_group,
                                                            account_name=self.account_name,
                                                            application_id=self.application_id)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Application instance.')
+            self.log('Error attempting to delete the Application instance.', level='error')
             self.fail("Error deleting the Application instance: {0}".format(str(e)))
 
         return True
@@ -251,15 +274,15 @@ class AzureRMApplication(AzureRMModuleBase):
 
         :return: deserialized Application instance state dictionary
         '''
-        self.log("Checking if the Application instance {0} is present".format(self.application_id))
+        self.log("Checking if the Application instance {0} is present", self.application_id)
         found = False
         try:
             response = self.mgmt_client.application.get(resource_group_name=self.resource_group,
                                                         account_name=self.account_name,
                                                         application_id=self.application_id)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Application instance : {0} found".format(response.id))
+            self.log("Response : {0}", response)
+            self.log("Application instance : {0} found", response.id)
         except CloudError as e:
             self.log('Did not find the Application instance.')
         if found is True:
@@ -34,6 +34,15 @@ options:
         description:
             - The ID of the application.
         required: True
+    fields:
+        description:
+            - List of attributes to return for every item, nested attributes are separated by dots, e.g. C(sku.name).
+            - Only the listed attributes are read from the service response and serialized.
+        type: list
+    query:
+        description:
+            - JMESPath expression applied to every returned item, after I(fields). Requires the jmespath package.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -107,7 +116,8 @@ class AzureRMApplicationFacts(AzureRMModuleBase):
         self.resource_group = None
         self.account_name = None
         self.application_id = None
-        super(AzureRMApplicationFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMApplicationFacts, self).__init__(self.module_arg_spec,
+                                                      supports_projection=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -133,12 +143,12 @@ class AzureRMApplicationFacts(AzureRMModuleBase):
             response = self.mgmt_client.application.get(resource_group_name=self.resource_group,
                                                         account_name=self.account_name,
                                                         application_id=self.application_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
-            self.log('Could not get facts for Application.')
+            self.log('Could not get facts for Application.', level='warning')
 
         if response is not None:
-            results[response.id] = response.as_dict()
+            results[response.id] = self.serialize_facts(response)
 
         return results
 
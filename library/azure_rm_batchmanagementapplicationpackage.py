@@ -46,6 +46,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -83,9 +90,22 @@ state:
     returned: always
     type: str
     sample: state
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Batch/batchAccounts/myBatchAccount/applications/myApplication/versions/1.0",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2017-09-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Batch/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -142,7 +162,8 @@ class AzureRMApplicationPackage(AzureRMModuleBase):
 
         super(AzureRMApplicationPackage, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                         supports_check_mode=True,
-                                                        supports_tags=False)
+                                                        supports_tags=False,
+                                                        supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -173,7 +194,8 @@ class AzureRMApplicationPackage(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Application Package instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(dict(), old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create):
             self.log("Need to Create / Update the Application Package instance")
@@ -199,8 +221,7 @@ class AzureRMApplicationPackage(AzureRMModuleBase):
             self.delete_applicationpackage()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_applicationpackage():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_applicationpackage)
         else:
             self.log("Application Package instance unchanged")
             self.results['changed'] = False
@@ -219,7 +240,7 @@ class AzureRMApplicationPackage(AzureRMModuleBase):
 
         :return: deserialized Application Package instance state dictionary
         '''
-        self.log("Creating / Updating the Application Package instance {0}".format(self.version))
+        self.log("Creating / Updating the Application Package instance {0}", self.version)
 
         try:
             if self.to_do == Actions.Create:
@@ -231,7 +252,7 @@ class AzureRMApplicationPackage(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Application Package instance.')
+            self.log('Error attempting to create the Application Package instance.', level='error')
             self.fail("Error creating the Application Package instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -241,14 +262,16 @@ class AzureRMApplicationPackage(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Application Package instance {0}".format(self.version))
+        self.log("Deleting the Application Package instance {0}", self.version)
         try:
             response = self.mgmt_client.application_package.delete(resource_group_name=self.resource_group,
                                                                    account_name=self.account_name,
                                                                    application_id=self.application_id,
                                                                    version=self.version)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Application Package instance.')
+            self.log('Error attempting to delete the Application Package instance.', level='error')
             self.fail("Error deleting the Application Package instance: {0}".format(str(e)))
 
         return True
@@ -259,7 +282,7 @@ class AzureRMApplicationPackage(AzureRMModuleBase):
 
         :return: deserialized Application Package instance state dictionary
         '''
-        self.log("Checking if the Application Package instance {0} is present".format(self.version))
+        self.log("Checking if the Application Package instance {0} is present", self.version)
         found = False
         try:
             response = self.mgmt_client.application_package.get(resource_group_name=self.resource_group,
@@ -267,8 +290,8 @@ class AzureRMApplicationPackage(AzureRMModuleBase):
                                                                 application_id=self.application_id,
                                                                 version=self.version)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Application Package instance : {0} found".format(response.version))
+            self.log("Response : {0}", response)
+            self.log("Application Package instance : {0} found", response.version)
         except CloudError as e:
             self.log('Did not find the Application Package instance.')
         if found is True:
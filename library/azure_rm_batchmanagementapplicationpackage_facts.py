@@ -38,6 +38,15 @@ options:
         description:
             - The version of the application.
         required: True
+    fields:
+        description:
+            - List of attributes to return for every item, nested attributes are separated by dots, e.g. C(sku.name).
+            - Only the listed attributes are read from the service response and serialized.
+        type: list
+    query:
+        description:
+            - JMESPath expression applied to every returned item, after I(fields). Requires the jmespath package.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -129,7 +138,8 @@ class AzureRMApplicationPackageFacts(AzureRMModuleBase):
         self.account_name = None
         self.application_id = None
         self.version = None
-        super(AzureRMApplicationPackageFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMApplicationPackageFacts, self).__init__(self.module_arg_spec,
+                                                             supports_projection=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -157,12 +167,12 @@ class AzureRMApplicationPackageFacts(AzureRMModuleBase):
                                                                 account_name=self.account_name,
                                                                 application_id=self.application_id,
                                                                 version=self.version)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
-            self.log('Could not get facts for ApplicationPackage.')
+            self.log('Could not get facts for ApplicationPackage.', level='warning')
 
         if response is not None:
-            results[response.version] = response.as_dict()
+            results[response.version] = self.serialize_facts(response)
 
         return results
 
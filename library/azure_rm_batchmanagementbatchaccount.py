@@ -71,6 +71,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -95,9 +102,22 @@ id:
     returned: always
     type: str
     sample: /subscriptions/subid/resourceGroups/default-azurebatch-japaneast/providers/Microsoft.Batch/batchAccounts/sampleacct
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Batch/batchAccounts/myBatchAccount",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2017-09-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Batch/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -159,7 +179,8 @@ class AzureRMBatchAccount(AzureRMModuleBase):
 
         super(AzureRMBatchAccount, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                   supports_check_mode=True,
-                                                  supports_tags=False)
+                                                  supports_tags=False,
+                                                  supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -183,9 +204,8 @@ class AzureRMBatchAccount(AzureRMModuleBase):
         self.mgmt_client = self.get_mgmt_svc_client(BatchManagementClient,
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
         if "location" not in self.parameters:
+            resource_group = self.get_resource_group(self.resource_group)
             self.parameters["location"] = resource_group.location
 
         old_response = self.get_batchaccount()
@@ -202,7 +222,8 @@ class AzureRMBatchAccount(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Batch Account instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.parameters, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Batch Account instance")
@@ -228,8 +249,7 @@ class AzureRMBatchAccount(AzureRMModuleBase):
             self.delete_batchaccount()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_batchaccount():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_batchaccount)
         else:
             self.log("Batch Account instance unchanged")
             self.results['changed'] = False
@@ -246,7 +266,7 @@ class AzureRMBatchAccount(AzureRMModuleBase):
 
         :return: deserialized Batch Account instance state dictionary
         '''
-        self.log("Creating / Updating the Batch Account instance {0}".format(self.account_name))
+        self.log("Creating / Updating the Batch Account instance {0}", self.account_name)
 
         try:
             if self.to_do == Actions.Create:
@@ -261,7 +281,7 @@ class AzureRMBatchAccount(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Batch Account instance.')
+            self.log('Error attempting to create the Batch Account instance.', level='error')
             self.fail("Error creating the Batch Account instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -271,12 +291,14 @@ class AzureRMBatchAccount(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Batch Account instance {0}".format(self.account_name))
+        self.log("Deleting the Batch Account instance {0}", self.account_name)
         try:
             response = self.mgmt_client.batch_account.delete(resource_group_name=self.resource_group,
                                                              account_name=self.account_name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Batch Account instance.')
+            self.log('Error attempting to delete the Batch Account instance.', level='error')
             self.fail("Error deleting the Batch Account instance: {0}".format(str(e)))
 
         return True
@@ -287,14 +309,14 @@ class AzureRMBatchAccount(AzureRMModuleBase):
 
         :return: deserialized Batch Account instance state dictionary
         '''
-        self.log("Checking if the Batch Account instance {0} is present".format(self.account_name))
+        self.log("Checking if the Batch Account instance {0} is present", self.account_name)
         found = False
         try:
             response = self.mgmt_client.batch_account.get(resource_group_name=self.resource_group,
                                                           account_name=self.account_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Batch Account instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Batch Account instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Batch Account instance.')
         if found is True:
@@ -29,6 +29,35 @@ options:
     account_name:
         description:
             - The name of the Batch account.
+    skip:
+        description:
+            - Number of items to skip before results are collected.
+        type: int
+        default: 0
+    max_items:
+        description:
+            - Maximum number of items to return. Pages are requested from the service only until this many items are collected.
+            - When more items are available, I(next_link) is returned to continue from where this run stopped.
+        type: int
+    next_link:
+        description:
+            - Continuation token returned as I(next_link) by a previous run with I(max_items), used to fetch the following items.
+        type: str
+    filters:
+        description:
+            - Only return items matching all of these filters.
+            - Keys are attribute names, nested attributes are separated by dots, e.g. C(tags.environment). A list of values matches any of them.
+            - Filters are passed to the service where it supports them, otherwise items are matched while the result pages are read.
+        type: dict
+    fields:
+        description:
+            - List of attributes to return for every item, nested attributes are separated by dots, e.g. C(sku.name).
+            - Only the listed attributes are read from the service response and serialized.
+        type: list
+    query:
+        description:
+            - JMESPath expression applied to every returned item, after I(fields). Requires the jmespath package.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -83,6 +112,11 @@ batch_account:
                     returned: always
                     type: str
                     sample: japaneast
+next_link:
+    description:
+        - Continuation token to pass as I(next_link) to fetch the remaining items.
+    returned: when I(max_items) is set and more items are available
+    type: str
 '''
 
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
@@ -117,7 +151,9 @@ class AzureRMBatchAccountFacts(AzureRMModuleBase):
         self.mgmt_client = None
         self.resource_group = None
         self.account_name = None
-        super(AzureRMBatchAccountFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMBatchAccountFacts, self).__init__(self.module_arg_spec,
+                                                       supports_paging=True,
+                                                       supports_projection=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -143,12 +179,12 @@ class AzureRMBatchAccountFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.batch_account.get(resource_group_name=self.resource_group,
                                                           account_name=self.account_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
-            self.log('Could not get facts for BatchAccount.')
+            self.log('Could not get facts for BatchAccount.', level='warning')
 
         if response is not None:
-            results[response.name] = response.as_dict()
+            results[response.name] = self.serialize_facts(response)
 
         return results
 
@@ -162,13 +198,12 @@ class AzureRMBatchAccountFacts(AzureRMModuleBase):
         results = {}
         try:
             response = self.mgmt_client.batch_account.list_by_resource_group(resource_group_name=self.resource_group)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
-            self.log('Could not get facts for BatchAccount.')
+            self.log('Could not get facts for BatchAccount.', level='warning')
 
         if response is not None:
-            for item in response:
-                results[item.name] = item.as_dict()
+            results = self.serialize_paged(response)
 
         return results
 
@@ -68,6 +68,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -95,9 +102,22 @@ id:
     type: str
     sample: "/subscriptions/subid/resourceGroups/default-azurebatch-japaneast/providers/Microsoft.Batch/batchAccounts/samplecct/certificates/SHA1-0A0E4F50D51
             BEADEAC1D35AFC5116098E7902E6E"
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Batch/batchAccounts/myBatchAccount/certificates/myCertificate",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2017-09-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Batch/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -176,7 +196,8 @@ class AzureRMCertificate(AzureRMModuleBase):
 
         super(AzureRMCertificate, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                  supports_check_mode=True,
-                                                 supports_tags=False)
+                                                 supports_tags=False,
+                                                 supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -218,7 +239,8 @@ class AzureRMCertificate(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Certificate instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.parameters, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Certificate instance")
@@ -244,8 +266,7 @@ class AzureRMCertificate(AzureRMModuleBase):
             self.delete_certificate()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_certificate():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_certificate)
         else:
             self.log("Certificate instance unchanged")
             self.results['changed'] = False
@@ -262,7 +283,7 @@ class AzureRMCertificate(AzureRMModuleBase):
 
         :return: deserialized Certificate instance state dictionary
         '''
-        self.log("Creating / Updating the Certificate instance {0}".format(self.certificate_name))
+        self.log("Creating / Updating the Certificate instance {0}", self.certificate_name)
 
         try:
             if self.to_do == Actions.Create:
@@ -279,7 +300,7 @@ class AzureRMCertificate(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Certificate instance.')
+            self.log('Error attempting to create the Certificate instance.', level='error')
             self.fail("Error creating the Certificate instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -289,13 +310,15 @@ class AzureRMCertificate(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Certificate instance {0}".format(self.certificate_name))
+        self.log("Deleting the Certificate instance {0}", self.certificate_name)
         try:
             response = self.mgmt_client.certificate.delete(resource_group_name=self.resource_group,
                                                            account_name=self.account_name,
                                                            certificate_name=self.certificate_name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Certificate instance.')
+            self.log('Error attempting to delete the Certificate instance.', level='error')
             self.fail("Error deleting the Certificate instance: {0}".format(str(e)))
 
         return True
@@ -306,15 +329,15 @@ class AzureRMCertificate(AzureRMModuleBase):
 
         :return: deserialized Certificate instance state dictionary
         '''
-        self.log("Checking if the Certificate instance {0} is present".format(self.certificate_name))
+        self.log("Checking if the Certificate instance {0} is present", self.certificate_name)
         found = False
         try:
             response = self.mgmt_client.certificate.get(resource_group_name=self.resource_group,
                                                         account_name=self.account_name,
                                                         certificate_name=self.certificate_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Certificate instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Certificate instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Certificate instance.')
         if found is True:
@@ -491,6 +491,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -517,9 +524,22 @@ id:
     returned: always
     type: str
     sample: /subscriptions/subid/resourceGroups/default-azurebatch-japaneast/providers/Microsoft.Batch/batchAccounts/sampleacct/pools/testpool
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Batch/batchAccounts/myBatchAccount/pools/myPool",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2017-09-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Batch/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -624,7 +644,8 @@ class AzureRMPool(AzureRMModuleBase):
 
         super(AzureRMPool, self).__init__(derived_arg_spec=self.module_arg_spec,
                                           supports_check_mode=True,
-                                          supports_tags=False)
+                                          supports_tags=False,
+                                          supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -702,7 +723,8 @@ class AzureRMPool(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Pool instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.parameters, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Pool instance")
@@ -728,8 +750,7 @@ class AzureRMPool(AzureRMModuleBase):
             self.delete_pool()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_pool():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_pool)
         else:
             self.log("Pool instance unchanged")
             self.results['changed'] = False
@@ -746,7 +767,7 @@ class AzureRMPool(AzureRMModuleBase):
 
         :return: deserialized Pool instance state dictionary
         '''
-        self.log("Creating / Updating the Pool instance {0}".format(self.pool_name))
+        self.log("Creating / Updating the Pool instance {0}", self.pool_name)
 
         try:
             if self.to_do == Actions.Create:
@@ -763,7 +784,7 @@ class AzureRMPool(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Pool instance.')
+            self.log('Error attempting to create the Pool instance.', level='error')
             self.fail("Error creating the Pool instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -773,13 +794,15 @@ class AzureRMPool(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Pool instance {0}".format(self.pool_name))
+        self.log("Deleting the Pool instance {0}", self.pool_name)
         try:
             response = self.mgmt_client.pool.delete(resource_group_name=self.resource_group,
                                                     account_name=self.account_name,
                                                     pool_name=self.pool_name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Pool instance.')
+            self.log('Error attempting to delete the Pool instance.', level='error')
             self.fail("Error deleting the Pool instance: {0}".format(str(e)))
 
         return True
@@ -790,15 +813,15 @@ class AzureRMPool(AzureRMModuleBase):
 
         :return: deserialized Pool instance state dictionary
         '''
-        self.log("Checking if the Pool instance {0} is present".format(self.pool_name))
+        self.log("Checking if the Pool instance {0} is present", self.pool_name)
         found = False
         try:
             response = self.mgmt_client.pool.get(resource_group_name=self.resource_group,
                                                  account_name=self.account_name,
                                                  pool_name=self.pool_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Pool instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Pool instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Pool instance.')
         if found is True:
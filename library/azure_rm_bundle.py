@@ -0,0 +1,415 @@
+#!/usr/bin/python
+#
+# Copyright (c) 2026 agent, <agent@local>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+ANSIBLE_METADATA = {'metadata_version': '1.1',
+                    'status': ['preview'],
+                    'supported_by': 'community'}
+
+
+DOCUMENTATION = '''
+---
+module: azure_rm_bundle
+version_added: "2.5"
+short_description: Create or update several resources with one ARM template deployment.
+description:
+    - Run azure_rm modules of this role in template mode, where the resources they would create or update are collected
+      instead, and deploy all of them with a single Azure Resource Manager template deployment per resource group.
+    - Azure Resource Manager then creates the resources in parallel, following the dependencies between them, in place
+      of one create or update request and one long running operation per module.
+    - Every module still reads the current state of its resource, so resources which are up to date are left out of the template.
+    - Modules deleting resources can not be bundled, and neither can modules writing through data plane clients, such as C(azure_rm_storageshare).
+    - In check mode the modules run in check mode, they report whether they would change their resource and no template is built.
+    - The template, including secrets such as passwords passed to the modules, is kept in the deployment history of the resource group.
+
+options:
+    resources:
+        description:
+            - List of resources to create or update.
+        required: True
+        type: list
+        suboptions:
+            name:
+                description:
+                    - Unique name of the resource in the bundle.
+                required: True
+            module:
+                description:
+                    - Name of the module managing the resource, for example C(azure_rm_appgwsubnet).
+                required: True
+            args:
+                description:
+                    - Arguments of the module.
+                    - Authentication options of this module are passed to the module unless set in I(args).
+                type: dict
+    library_path:
+        description:
+            - Directory holding the modules named in I(resources), usually the C(library) directory of this role.
+        required: True
+        type: path
+    deployment_name:
+        description:
+            - Name of the template deployment.
+        default: ansible-bundle
+    concurrency:
+        description:
+            - Maximum number of modules run in template mode at the same time.
+        type: int
+        default: 8
+
+extends_documentation_fragment:
+    - azure
+
+author:
+    - "agent"
+
+'''
+
+EXAMPLES = '''
+  - name: Create a virtual network with its subnet and a public IP address in one deployment
+    azure_rm_bundle:
+      library_path: "{{ role_path }}/library"
+      deployment_name: gateway-network
+      resources:
+        - name: vnet
+          module: azure_rm_appgwvirtualnetwork
+          args:
+            resource_group: myResourceGroup
+            virtual_network_name: myVirtualNetwork
+            location: eastus
+            address_space:
+              address_prefixes:
+                - 10.0.0.0/16
+        - name: subnet
+          module: azure_rm_appgwsubnet
+          args:
+            resource_group: myResourceGroup
+            virtual_network_name: myVirtualNetwork
+            subnet_name: mySubnet
+            address_prefix: 10.0.0.0/24
+        - name: ip
+          module: azure_rm_appgwpublicipaddresse
+          args:
+            resource_group: myResourceGroup
+            public_ip_address_name: myPublicIp
+            location: eastus
+'''
+
+RETURN = '''
+resources:
+    description:
+        - Outcome of every resource, in the order of I(resources).
+    returned: always
+    type: complex
+    contains:
+        name:
+            description:
+                - Name of the resource in the bundle.
+            returned: always
+            type: str
+            sample: subnet
+        module:
+            description:
+                - Name of the module managing the resource.
+            returned: always
+            type: str
+            sample: azure_rm_appgwsubnet
+        changed:
+            description:
+                - Whether the module created or updated resources.
+            returned: always
+            type: bool
+            sample: True
+        resources:
+            description:
+                - Template resources created or updated for the module.
+            returned: always
+            type: complex
+            contains:
+                id:
+                    description:
+                        - Resource ID.
+                    returned: always
+                    type: str
+                    sample: /subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Network/virtualNetworks/myVirtualNetwork/subnets/mySubnet
+                type:
+                    description:
+                        - Resource type.
+                    returned: always
+                    type: str
+                    sample: Microsoft.Network/virtualNetworks/subnets
+                state:
+                    description:
+                        - State of the resource once deployed, as returned by the service.
+                    returned: when the template was deployed
+                    type: dict
+deployments:
+    description:
+        - Template deployments, one per resource group.
+    returned: always
+    type: complex
+    contains:
+        resource_group:
+            description:
+                - Name of the resource group.
+            returned: always
+            type: str
+            sample: myResourceGroup
+        id:
+            description:
+                - Resource ID of the deployment.
+            returned: when the template was deployed
+            type: str
+            sample: /subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Resources/deployments/ansible-bundle
+        template:
+            description:
+                - Deployed template.
+            returned: always
+            type: dict
+'''
+
+import json
+import os
+import re
+import shutil
+import tempfile
+from ansible.module_utils.six.moves.urllib.parse import urlparse, parse_qs, unquote
+from ansible.module_utils.azure_rm_common import AzureRMModuleBase, AZURE_ITEMS_CONCURRENCY, AZURE_TEMPLATE_ENV, run_module
+
+try:
+    from msrestazure.azure_exceptions import CloudError
+except ImportError:
+    # This is handled in azure_rm_common
+    pass
+
+TEMPLATE_SCHEMA = 'https://schema.management.azure.com/schemas/2015-01-01/deploymentTemplate.json#'
+
+# Keys of a request body which describe the resource rather than its desired state
+TEMPLATE_IGNORED_KEYS = ['id', 'name', 'type', 'etag']
+
+
+class AzureRMBundle(AzureRMModuleBase):
+    """Creates or updates resources of several modules with one template deployment"""
+
+    def __init__(self):
+        self.module_arg_spec = dict(
+            resources=dict(
+                type='list',
+                elements='dict',
+                required=True,
+                options=dict(
+                    name=dict(type='str', required=True),
+                    module=dict(type='str', required=True),
+                    args=dict(type='dict')
+                )
+            ),
+            library_path=dict(
+                type='path',
+                required=True
+            ),
+            deployment_name=dict(
+                type='str',
+                default='ansible-bundle'
+            ),
+            concurrency=dict(
+                type='int',
+                default=AZURE_ITEMS_CONCURRENCY
+            )
+        )
+
+        self.resources = None
+        self.library_path = None
+        self.deployment_name = None
+        self.concurrency = None
+
+        self.results = dict(changed=False)
+
+        super(AzureRMBundle, self).__init__(derived_arg_spec=self.module_arg_spec,
+                                            supports_check_mode=True,
+                                            supports_tags=False)
+
+    def exec_module(self, **kwargs):
+        """Main module execution method"""
+
+        for key in list(self.module_arg_spec.keys()):
+            setattr(self, key, kwargs[key])
+
+        names = [x['name'] for x in self.resources]
+        duplicates = sorted(set(x for x in names if names.count(x) > 1))
+        if duplicates:
+            self.fail("Resource names used more than once: {0}".format(', '.join(duplicates)))
+
+        directory = tempfile.mkdtemp(prefix='ansible-bundle-')
+        try:
+            outcomes = self.fan_out(lambda x: self.capture(x[0], x[1], directory), list(enumerate(self.resources)), self.concurrency)
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
+        deployments = self.get_deployments(outcomes)
+        if not self.check_mode:
+            for deployment in deployments:
+                self.deploy(deployment)
+
+        for outcome in outcomes:
+            for resource in outcome['resources']:
+                resource.pop('api_version')
+                output = resource.pop('output')
+                if output in outcome.get('outputs', {}):
+                    resource['state'] = outcome['outputs'][output]
+            outcome.pop('outputs', None)
+            self.results['changed'] = self.results['changed'] or outcome['changed']
+        self.results['resources'] = outcomes
+        self.results['deployments'] = [dict((key, value) for key, value in x.items() if key in ['resource_group', 'id', 'template'])
+                                       for x in deployments]
+        return self.results
+
+    def capture(self, index, resource, directory):
+        '''
+        Run the module of a resource in template mode.
+
+        :return: outcome of the resource, with the requests the module recorded
+        '''
+        path = self.get_library_module_path(self.library_path, resource['module'])
+        template = os.path.join(directory, '{0}.json'.format(index))
+        env = dict(os.environ)
+        env[AZURE_TEMPLATE_ENV] = template
+        # in check mode the modules run in check mode too, and record nothing
+        args = self.get_module_args(resource['module'], resource['args'] or dict())
+
+        self.log("Running {0} for resource {1} in template mode", resource['module'], resource['name'])
+        rc, result, stdout, stderr = run_module(path, args, env)
+        if result is None:
+            self.fail("Module {0} of resource {1} returned no result".format(resource['module'], resource['name']),
+                      stdout=stdout, stderr=stderr)
+        result.pop('invocation', None)
+        if rc != 0 or result.get('failed'):
+            self.fail("Resource {0}: {1}".format(resource['name'], result.get('msg') or "module {0} failed".format(resource['module'])),
+                      result=result)
+
+        requests = []
+        if os.path.exists(template):
+            with open(template) as recorded:
+                requests = [json.loads(line) for line in recorded if line.strip()]
+        return dict(name=resource['name'],
+                    module=resource['module'],
+                    changed=bool(requests) or bool(self.check_mode and result.get('changed')),
+                    requests=requests,
+                    resources=[])
+
+    def get_deployments(self, outcomes):
+        '''
+        Turn the recorded requests into one template per resource group, ordered so that every
+        template comes after the templates of the resources it refers to.
+        '''
+        groups = dict()
+        order = []
+        outputs = dict()
+        for outcome in outcomes:
+            for request in outcome.pop('requests'):
+                resource = self.get_template_resource(request['url'], request['body'])
+                group = resource.pop('resource_group')
+                if group.lower() not in groups:
+                    groups[group.lower()] = dict(resource_group=group, resources=dict(), outcomes=dict())
+                    order.append(group.lower())
+                key = resource['id'].lower()
+                if key not in outputs:
+                    outputs[key] = 'resource{0}'.format(len(outputs))
+                    outcome['resources'].append(dict(id=resource['id'], type=resource['type'],
+                                                     api_version=resource['apiVersion'], output=outputs[key]))
+                # when a resource is written more than once, the last state wins
+                resource['output'] = outputs[key]
+                groups[group.lower()]['resources'][key] = resource
+                groups[group.lower()]['outcomes'][outputs[key]] = outcome
+
+        for group in groups.values():
+            group['template'] = self.get_template(group['resources'])
+            group['depends_on'] = set()
+            text = json.dumps(group['template']).lower()
+            for other in order:
+                if other != group['resource_group'].lower() and '/resourcegroups/{0}/'.format(other) in text:
+                    group['depends_on'].add(other)
+
+        deployments = []
+        while order:
+            ready = [x for x in order if not groups[x]['depends_on'].intersection(order)]
+            if not ready:
+                self.fail("Resource groups refer to each other's resources: {0}".format(', '.join(order)))
+            for name in ready:
+                order.remove(name)
+                deployments.append(groups[name])
+        return deployments
+
+    def get_template_resource(self, url, body):
+        parsed = urlparse(url)
+        match = re.match(r'^/subscriptions/([^/]+)/resourceGroups/([^/]+)/providers/([^/]+)/(.+)$', parsed.path, re.IGNORECASE)
+        pieces = match.group(4).strip('/').split('/') if match else []
+        if not pieces or len(pieces) % 2:
+            self.fail("{0} can not be created with a template deployment".format(parsed.path))
+        if match.group(1).lower() != self.subscription_id.lower():
+            self.fail("{0} is not in subscription {1}".format(parsed.path, self.subscription_id))
+
+        resource = dict((key, value) for key, value in body.items() if key not in TEMPLATE_IGNORED_KEYS)
+        resource.update(id=unquote(parsed.path),
+                        resource_group=unquote(match.group(2)),
+                        type='/'.join([match.group(3)] + pieces[0::2]),
+                        name='/'.join(unquote(x) for x in pieces[1::2]),
+                        apiVersion=parse_qs(parsed.query).get('api-version', [None])[0])
+        return resource
+
+    @staticmethod
+    def get_template(resources):
+        '''
+        Template deploying resources, keyed by lower case resource ID. A resource depends on the resources
+        of the template it is a child of or it refers to, and is returned as an output.
+        '''
+        template = {
+            '$schema': TEMPLATE_SCHEMA,
+            'contentVersion': '1.0.0.0',
+            'resources': [],
+            'outputs': dict()
+        }
+        for key, resource in resources.items():
+            body = json.dumps(dict((name, value) for name, value in resource.items() if name not in ['id', 'output'])).lower()
+            depends_on = sorted(other['id'] for other_key, other in resources.items()
+                                if other_key != key and (key.startswith(other_key + '/') or other_key in body))
+            entry = dict((name, value) for name, value in resource.items() if name not in ['id', 'output'])
+            if depends_on:
+                entry['dependsOn'] = depends_on
+            template['resources'].append(entry)
+            template['outputs'][resource['output']] = dict(
+                type='object',
+                value="[reference('{0}', '{1}', 'Full')]".format(resource['id'], resource['apiVersion'])
+            )
+        return template
+
+    def deploy(self, deployment):
+        '''
+        Deploy the template of a resource group and hand the outputs to the outcomes of the resources.
+        '''
+        self.log("Deploying {0} resources to resource group {1}", len(deployment['template']['resources']),
+                 deployment['resource_group'])
+        properties = self.rm_models.DeploymentProperties(mode='Incremental', template=deployment['template'])
+        try:
+            poller = self.rm_client.deployments.create_or_update(deployment['resource_group'], self.deployment_name, properties)
+            response = self.get_poller_result(poller)
+        except CloudError as exc:
+            self.fail("Error deploying resources to resource group {0}: {1}".format(deployment['resource_group'], str(exc)))
+        deployment['id'] = response.id
+        for output, value in (response.properties.outputs or dict()).items():
+            outcome = deployment['outcomes'].get(output)
+            if outcome is not None:
+                outcome.setdefault('outputs', dict())[output] = value.get('value')
+
+
+def main():
+    """Main execution"""
+    AzureRMBundle()
+
+if __name__ == '__main__':
+    main()
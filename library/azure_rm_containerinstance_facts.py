@@ -29,6 +29,35 @@ options:
     container_group_name:
         description:
             - The name of the container group.
+    skip:
+        description:
+            - Number of items to skip before results are collected.
+        type: int
+        default: 0
+    max_items:
+        description:
+            - Maximum number of items to return. Pages are requested from the service only until this many items are collected.
+            - When more items are available, I(next_link) is returned to continue from where this run stopped.
+        type: int
+    next_link:
+        description:
+            - Continuation token returned as I(next_link) by a previous run with I(max_items), used to fetch the following items.
+        type: str
+    filters:
+        description:
+            - Only return items matching all of these filters.
+            - Keys are attribute names, nested attributes are separated by dots, e.g. C(tags.environment). A list of values matches any of them.
+            - Filters are passed to the service where it supports them, otherwise items are matched while the result pages are read.
+        type: dict
+    fields:
+        description:
+            - List of attributes to return for every item, nested attributes are separated by dots, e.g. C(sku.name).
+            - Only the listed attributes are read from the service response and serialized.
+        type: list
+    query:
+        description:
+            - JMESPath expression applied to every returned item, after I(fields). Requires the jmespath package.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -91,6 +120,11 @@ container_groups:
                     type: complex
                     sample: containers
                     contains:
+next_link:
+    description:
+        - Continuation token to pass as I(next_link) to fetch the remaining items.
+    returned: when I(max_items) is set and more items are available
+    type: str
 '''
 
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
@@ -125,7 +159,9 @@ class AzureRMContainerGroupsFacts(AzureRMModuleBase):
         self.mgmt_client = None
         self.resource_group = None
         self.container_group_name = None
-        super(AzureRMContainerGroupsFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMContainerGroupsFacts, self).__init__(self.module_arg_spec,
+                                                          supports_paging=True,
+                                                          supports_projection=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -151,12 +187,12 @@ class AzureRMContainerGroupsFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.container_groups.get(resource_group_name=self.resource_group,
                                                              container_group_name=self.container_group_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
-            self.log('Could not get facts for ContainerGroups.')
+            self.log('Could not get facts for ContainerGroups.', level='warning')
 
         if response is not None:
-            results[response.name] = response.as_dict()
+            results[response.name] = self.serialize_facts(response)
 
         return results
 
@@ -170,13 +206,12 @@ class AzureRMContainerGroupsFacts(AzureRMModuleBase):
         results = {}
         try:
             response = self.mgmt_client.container_groups.list_by_resource_group(resource_group_name=self.resource_group)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
-            self.log('Could not get facts for ContainerGroups.')
+            self.log('Could not get facts for ContainerGroups.', level='warning')
 
         if response is not None:
-            for item in response:
-                results[item.name] = item.as_dict()
+            results = self.serialize_paged(response)
 
         return results
 
@@ -220,6 +220,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -244,9 +251,22 @@ id:
     returned: always
     type: str
     sample: /subscriptions/ae43b1e3-c35d-4c8c-bc0d-f148b4c52b78/resourceGroups/demo/providers/Microsoft.ContainerInstance/containerGroups/mycontainers
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.ContainerInstance/containerGroups/myContainerGroup",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2018-02-01-preview",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.ContainerInstance/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -320,7 +340,8 @@ class AzureRMContainerGroups(AzureRMModuleBase):
 
         super(AzureRMContainerGroups, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                      supports_check_mode=True,
-                                                     supports_tags=False)
+                                                     supports_tags=False,
+                                                     supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -366,7 +387,8 @@ class AzureRMContainerGroups(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Container Group instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.container_group, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Container Group instance")
@@ -392,8 +414,7 @@ class AzureRMContainerGroups(AzureRMModuleBase):
             self.delete_containergroup()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_containergroup():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_containergroup)
         else:
             self.log("Container Group instance unchanged")
             self.results['changed'] = False
@@ -410,7 +431,7 @@ class AzureRMContainerGroups(AzureRMModuleBase):
 
         :return: deserialized Container Group instance state dictionary
         '''
-        self.log("Creating / Updating the Container Group instance {0}".format(self.container_group_name))
+        self.log("Creating / Updating the Container Group instance {0}", self.container_group_name)
 
         try:
             response = self.mgmt_client.container_groups.create_or_update(resource_group_name=self.resource_group,
@@ -420,7 +441,7 @@ class AzureRMContainerGroups(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Container Group instance.')
+            self.log('Error attempting to create the Container Group instance.', level='error')
             self.fail("Error creating the Container Group instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -430,12 +451,14 @@ class AzureRMContainerGroups(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Container Group instance {0}".format(self.container_group_name))
+        self.log("Deleting the Container Group instance {0}", self.container_group_name)
         try:
             response = self.mgmt_client.container_groups.delete(resource_group_name=self.resource_group,
                                                                 container_group_name=self.container_group_name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Container Group instance.')
+            self.log('Error attempting to delete the Container Group instance.', level='error')
             self.fail("Error deleting the Container Group instance: {0}".format(str(e)))
 
         return True
@@ -446,14 +469,14 @@ class AzureRMContainerGroups(AzureRMModuleBase):
 
         :return: deserialized Container Group instance state dictionary
         '''
-        self.log("Checking if the Container Group instance {0} is present".format(self.container_group_name))
+        self.log("Checking if the Container Group instance {0} is present", self.container_group_name)
         found = False
         try:
             response = self.mgmt_client.container_groups.get(resource_group_name=self.resource_group,
                                                              container_group_name=self.container_group_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Container Group instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Container Group instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Container Group instance.')
         if found is True:
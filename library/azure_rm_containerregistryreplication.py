@@ -48,6 +48,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -82,9 +89,22 @@ status:
     type: complex
     sample: status
     contains:
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.ContainerRegistry/registries/myRegistry/replications/myReplication",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2017-10-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.ContainerRegistry/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -143,7 +163,8 @@ class AzureRMReplications(AzureRMModuleBase):
 
         super(AzureRMReplications, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                   supports_check_mode=True,
-                                                  supports_tags=False)
+                                                  supports_tags=False,
+                                                  supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -158,9 +179,8 @@ class AzureRMReplications(AzureRMModuleBase):
         self.mgmt_client = self.get_mgmt_svc_client(ContainerRegistryManagementClient,
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
         if self.location is None:
+            resource_group = self.get_resource_group(self.resource_group)
             self.location = resource_group.location
 
         old_response = self.get_replication()
@@ -177,7 +197,8 @@ class AzureRMReplications(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Replication instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(dict(location=self.location), old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Replication instance")
@@ -203,8 +224,7 @@ class AzureRMReplications(AzureRMModuleBase):
             self.delete_replication()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_replication():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_replication)
         else:
             self.log("Replication instance unchanged")
             self.results['changed'] = False
@@ -222,7 +242,7 @@ class AzureRMReplications(AzureRMModuleBase):
 
         :return: deserialized Replication instance state dictionary
         '''
-        self.log("Creating / Updating the Replication instance {0}".format(self.replication_name))
+        self.log("Creating / Updating the Replication instance {0}", self.replication_name)
 
         try:
             if self.to_do == Actions.Create:
@@ -239,7 +259,7 @@ class AzureRMReplications(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Replication instance.')
+            self.log('Error attempting to create the Replication instance.', level='error')
             self.fail("Error creating the Replication instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -249,13 +269,15 @@ class AzureRMReplications(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Replication instance {0}".format(self.replication_name))
+        self.log("Deleting the Replication instance {0}", self.replication_name)
         try:
             response = self.mgmt_client.replications.delete(resource_group_name=self.resource_group,
                                                             registry_name=self.registry_name,
                                                             replication_name=self.replication_name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Replication instance.')
+            self.log('Error attempting to delete the Replication instance.', level='error')
             self.fail("Error deleting the Replication instance: {0}".format(str(e)))
 
         return True
@@ -266,15 +288,15 @@ class AzureRMReplications(AzureRMModuleBase):
 
         :return: deserialized Replication instance state dictionary
         '''
-        self.log("Checking if the Replication instance {0} is present".format(self.replication_name))
+        self.log("Checking if the Replication instance {0} is present", self.replication_name)
         found = False
         try:
             response = self.mgmt_client.replications.get(resource_group_name=self.resource_group,
                                                          registry_name=self.registry_name,
                                                          replication_name=self.replication_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Replication instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Replication instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Replication instance.')
         if found is True:
@@ -65,6 +65,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -97,9 +104,22 @@ status:
     returned: always
     type: str
     sample: enabled
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.ContainerRegistry/registries/myRegistry/webhooks/myWebhook",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2017-10-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.ContainerRegistry/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -172,7 +192,8 @@ class AzureRMWebhooks(AzureRMModuleBase):
 
         super(AzureRMWebhooks, self).__init__(derived_arg_spec=self.module_arg_spec,
                                               supports_check_mode=True,
-                                              supports_tags=False)
+                                              supports_tags=False,
+                                              supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -216,7 +237,8 @@ class AzureRMWebhooks(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Webhook instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.parameters, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Webhook instance")
@@ -242,8 +264,7 @@ class AzureRMWebhooks(AzureRMModuleBase):
             self.delete_webhook()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_webhook():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_webhook)
         else:
             self.log("Webhook instance unchanged")
             self.results['changed'] = False
@@ -261,7 +282,7 @@ class AzureRMWebhooks(AzureRMModuleBase):
 
         :return: deserialized Webhook instance state dictionary
         '''
-        self.log("Creating / Updating the Webhook instance {0}".format(self.webhook_name))
+        self.log("Creating / Updating the Webhook instance {0}", self.webhook_name)
 
         try:
             if self.to_do == Actions.Create:
@@ -278,7 +299,7 @@ class AzureRMWebhooks(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Webhook instance.')
+            self.log('Error attempting to create the Webhook instance.', level='error')
             self.fail("Error creating the Webhook instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -288,13 +309,15 @@ class AzureRMWebhooks(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Webhook instance {0}".format(self.webhook_name))
+        self.log("Deleting the Webhook instance {0}", self.webhook_name)
         try:
             response = self.mgmt_client.webhooks.delete(resource_group_name=self.resource_group,
                                                         registry_name=self.registry_name,
                                                         webhook_name=self.webhook_name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Webhook instance.')
+            self.log('Error attempting to delete the Webhook instance.', level='error')
             self.fail("Error deleting the Webhook instance: {0}".format(str(e)))
 
         return True
@@ -305,15 +328,15 @@ class AzureRMWebhooks(AzureRMModuleBase):
 
         :return: deserialized Webhook instance state dictionary
         '''
-        self.log("Checking if the Webhook instance {0} is present".format(self.webhook_name))
+        self.log("Checking if the Webhook instance {0} is present", self.webhook_name)
         found = False
         try:
             response = self.mgmt_client.webhooks.get(resource_group_name=self.resource_group,
                                                      registry_name=self.registry_name,
                                                      webhook_name=self.webhook_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Webhook instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Webhook instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Webhook instance.')
         if found is True:
@@ -34,6 +34,15 @@ options:
         description:
             - The name of the webhook.
         required: True
+    fields:
+        description:
+            - List of attributes to return for every item, nested attributes are separated by dots, e.g. C(sku.name).
+            - Only the listed attributes are read from the service response and serialized.
+        type: list
+    query:
+        description:
+            - JMESPath expression applied to every returned item, after I(fields). Requires the jmespath package.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -145,7 +154,8 @@ class AzureRMWebhooksFacts(AzureRMModuleBase):
         self.resource_group = None
         self.registry_name = None
         self.webhook_name = None
-        super(AzureRMWebhooksFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMWebhooksFacts, self).__init__(self.module_arg_spec,
+                                                   supports_projection=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -171,12 +181,12 @@ class AzureRMWebhooksFacts(AzureRMModuleBase):
             response = self.mgmt_client.webhooks.get(resource_group_name=self.resource_group,
                                                      registry_name=self.registry_name,
                                                      webhook_name=self.webhook_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
-            self.log('Could not get facts for Webhooks.')
+            self.log('Could not get facts for Webhooks.', level='warning')
 
         if response is not None:
-            results[response.name] = response.as_dict()
+            results[response.name] = self.serialize_facts(response)
 
         return results
 
@@ -66,6 +66,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -99,9 +106,22 @@ status:
     type: complex
     sample: status
     contains:
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.ContainerRegistry/registries/myRegistry",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2017-10-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.ContainerRegistry/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -162,7 +182,8 @@ class AzureRMRegistries(AzureRMModuleBase):
 
         super(AzureRMRegistries, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                 supports_check_mode=True,
-                                                supports_tags=False)
+                                                supports_tags=False,
+                                                supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -212,7 +233,8 @@ class AzureRMRegistries(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Registry instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.registry, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Registry instance")
@@ -238,8 +260,7 @@ class AzureRMRegistries(AzureRMModuleBase):
             self.delete_registry()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_registry():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_registry)
         else:
             self.log("Registry instance unchanged")
             self.results['changed'] = False
@@ -257,7 +278,7 @@ class AzureRMRegistries(AzureRMModuleBase):
 
         :return: deserialized Registry instance state dictionary
         '''
-        self.log("Creating / Updating the Registry instance {0}".format(self.registry_name))
+        self.log("Creating / Updating the Registry instance {0}", self.registry_name)
 
         try:
             if self.to_do == Actions.Create:
@@ -272,7 +293,7 @@ class AzureRMRegistries(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Registry instance.')
+            self.log('Error attempting to create the Registry instance.', level='error')
             self.fail("Error creating the Registry instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -282,12 +303,14 @@ class AzureRMRegistries(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Registry instance {0}".format(self.registry_name))
+        self.log("Deleting the Registry instance {0}", self.registry_name)
         try:
             response = self.mgmt_client.registries.delete(resource_group_name=self.resource_group,
                                                           registry_name=self.registry_name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Registry instance.')
+            self.log('Error attempting to delete the Registry instance.', level='error')
             self.fail("Error deleting the Registry instance: {0}".format(str(e)))
 
         return True
@@ -298,14 +321,14 @@ class AzureRMRegistries(AzureRMModuleBase):
 
         :return: deserialized Registry instance state dictionary
         '''
-        self.log("Checking if the Registry instance {0} is present".format(self.registry_name))
+        self.log("Checking if the Registry instance {0} is present", self.registry_name)
         found = False
         try:
             response = self.mgmt_client.registries.get(resource_group_name=self.resource_group,
                                                        registry_name=self.registry_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Registry instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Registry instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Registry instance.')
         if found is True:
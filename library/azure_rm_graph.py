@@ -0,0 +1,443 @@
+#!/usr/bin/python
+#
+# Copyright (c) 2026 agent, <agent@local>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+ANSIBLE_METADATA = {'metadata_version': '1.1',
+                    'status': ['preview'],
+                    'supported_by': 'community'}
+
+
+DOCUMENTATION = '''
+---
+module: azure_rm_graph
+version_added: "2.5"
+short_description: Apply a graph of resources, running independent resources in parallel.
+description:
+    - Create, update or delete a set of resources, each of them managed by one of the azure_rm modules of this role.
+    - A resource is run as soon as all the resources it depends on are done, up to I(concurrency) resources at the same time.
+    - Dependencies are listed in I(depends_on) or inferred from the arguments of the resources, see I(resources).
+    - Resources depending on a resource which failed are skipped.
+
+options:
+    resources:
+        description:
+            - List of resources to apply.
+            - "A resource depends on another resource when one of its C(*_name) arguments, such as I(server_name), is the I(name) of the other
+               resource in the same resource group, or when one of its arguments is a resource ID naming the other resource."
+        required: True
+        type: list
+        suboptions:
+            name:
+                description:
+                    - Unique name of the resource in the graph.
+                required: True
+            module:
+                description:
+                    - Name of the module managing the resource, for example C(azure_rm_sqlserver).
+                required: True
+            args:
+                description:
+                    - Arguments of the module.
+                    - Authentication options of this module are passed to the module unless set in I(args).
+                type: dict
+            depends_on:
+                description:
+                    - Names of resources of the graph which have to be applied before this resource.
+                type: list
+    library_path:
+        description:
+            - Directory holding the modules named in I(resources), usually the C(library) directory of this role.
+        required: True
+        type: path
+    concurrency:
+        description:
+            - Maximum number of resources applied at the same time.
+        type: int
+        default: 8
+
+extends_documentation_fragment:
+    - azure
+
+author:
+    - "agent"
+
+'''
+
+EXAMPLES = '''
+  - name: Create SQL servers with their databases and firewall rules
+    azure_rm_graph:
+      library_path: "{{ role_path }}/library"
+      concurrency: 4
+      resources:
+        - name: server
+          module: azure_rm_sqlserver
+          args:
+            resource_group: myResourceGroup
+            name: sqlcrudtest-5961
+            location: eastus
+            admin_username: mylogin
+            admin_password: Testpasswordxyz12!
+        - name: database
+          module: azure_rm_sqldatabase
+          args:
+            resource_group: myResourceGroup
+            server_name: sqlcrudtest-5961
+            name: testdb
+            location: eastus
+        - name: firewall
+          module: azure_rm_sqlfirewallrule
+          args:
+            resource_group: myResourceGroup
+            server_name: sqlcrudtest-5961
+            name: firewallrulecrudtest-5370
+            start_ip_address: 172.28.10.136
+            end_ip_address: 172.28.10.138
+        - name: webapp
+          module: azure_rm_webapp
+          args:
+            resource_group: myResourceGroup
+            name: mywebapp
+            location: eastus
+          depends_on:
+            - database
+'''
+
+RETURN = '''
+resources:
+    description:
+        - Outcome of every resource, in the order of I(resources).
+    returned: always
+    type: complex
+    contains:
+        name:
+            description:
+                - Name of the resource in the graph.
+            returned: always
+            type: str
+            sample: database
+        module:
+            description:
+                - Name of the module managing the resource.
+            returned: always
+            type: str
+            sample: azure_rm_sqldatabase
+        status:
+            description:
+                - One of C(ok), C(changed), C(failed) or C(skipped).
+            returned: always
+            type: str
+            sample: changed
+        depends_on:
+            description:
+                - Names of the resources this resource waited for, listed or inferred.
+            returned: always
+            type: list
+            sample: [ server ]
+        started:
+            description:
+                - Number of seconds between the start of the graph and the start of the resource.
+            returned: when the resource was applied
+            type: float
+            sample: 35.2
+        elapsed:
+            description:
+                - Number of seconds spent applying the resource.
+            returned: when the resource was applied
+            type: float
+            sample: 41.8
+        result:
+            description:
+                - Result returned by the module.
+            returned: when the resource was applied
+            type: dict
+        msg:
+            description:
+                - Reason of the failure or of the skip.
+            returned: when the resource failed or was skipped
+            type: str
+critical_path:
+    description:
+        - Names of the chain of resources, each one waiting for the previous one, which ended last.
+        - Shortening any of them shortens the run of the graph.
+    returned: always
+    type: list
+    sample: [ server, database, webapp ]
+elapsed:
+    description:
+        - Number of seconds spent applying the graph.
+    returned: always
+    type: float
+    sample: 118.4
+'''
+
+import re
+import time
+from multiprocessing.pool import ThreadPool
+from ansible.module_utils.six import string_types
+from ansible.module_utils.six.moves import queue
+from ansible.module_utils.azure_rm_common import AzureRMModuleBase, AZURE_ITEMS_CONCURRENCY, run_module
+
+# resource IDs, the resource group and the path below the provider namespace
+RESOURCE_ID_PATTERN = re.compile(r'/subscriptions/[^/]+/resourceGroups/([^/]+)(?:/providers/[^/]+((?:/[^/]+/[^/]+)+))?',
+                                 re.IGNORECASE)
+
+
+def get_resource_id_references(value, references=None):
+    '''
+    Collect the resources named by the resource IDs found in value.
+
+    :return: list of (resource group, names of the resource and its parents) tuples, in lower case
+    '''
+    references = [] if references is None else references
+    if isinstance(value, dict):
+        for item in value.values():
+            get_resource_id_references(item, references)
+    elif isinstance(value, list):
+        for item in value:
+            get_resource_id_references(item, references)
+    elif isinstance(value, string_types):
+        for match in RESOURCE_ID_PATTERN.finditer(value):
+            pieces = (match.group(2) or '').strip('/').split('/')
+            references.append((match.group(1).lower(), set(x.lower() for x in pieces[1::2])))
+    return references
+
+
+def get_name_references(value, references=None):
+    '''
+    Collect the values of the *_name arguments found in value, in lower case.
+    '''
+    references = set() if references is None else references
+    if isinstance(value, dict):
+        for key, item in value.items():
+            if key.endswith('_name') and isinstance(item, string_types):
+                references.add(item.lower())
+            else:
+                get_name_references(item, references)
+    elif isinstance(value, list):
+        for item in value:
+            get_name_references(item, references)
+    return references
+
+
+class AzureRMGraph(AzureRMModuleBase):
+    """Applies a graph of resources with azure_rm modules"""
+
+    def __init__(self):
+        self.module_arg_spec = dict(
+            resources=dict(
+                type='list',
+                elements='dict',
+                required=True,
+                options=dict(
+                    name=dict(type='str', required=True),
+                    module=dict(type='str', required=True),
+                    args=dict(type='dict'),
+                    depends_on=dict(type='list')
+                )
+            ),
+            library_path=dict(
+                type='path',
+                required=True
+            ),
+            concurrency=dict(
+                type='int',
+                default=AZURE_ITEMS_CONCURRENCY
+            )
+        )
+
+        self.resources = None
+        self.library_path = None
+        self.concurrency = None
+
+        self.results = dict(changed=False)
+        self.start = None
+
+        super(AzureRMGraph, self).__init__(derived_arg_spec=self.module_arg_spec,
+                                           supports_check_mode=True,
+                                           supports_tags=False)
+
+    def exec_module(self, **kwargs):
+        """Main module execution method"""
+
+        for key in list(self.module_arg_spec.keys()):
+            setattr(self, key, kwargs[key])
+
+        nodes = self.get_nodes()
+        order = self.get_order(nodes)
+        self.log("Applying resources {0}", ', '.join(order))
+
+        outcomes = self.apply(nodes)
+
+        self.results['resources'] = []
+        for name in [x['name'] for x in self.resources]:
+            outcome = dict(name=name, module=nodes[name]['module'], depends_on=sorted(nodes[name]['depends_on']))
+            outcome.update(outcomes[name])
+            outcome.pop('end', None)
+            self.results['resources'].append(outcome)
+            self.results['changed'] = self.results['changed'] or outcome['status'] == 'changed'
+        self.results['critical_path'] = self.get_critical_path(nodes, outcomes)
+        self.results['elapsed'] = round(time.time() - self.start, 3)
+
+        failed = [x for x in self.results['resources'] if x['status'] == 'failed']
+        if failed:
+            self.fail("{0} of {1} resources failed".format(len(failed), len(self.resources)), **self.results)
+        return self.results
+
+    def get_nodes(self):
+        '''
+        Validate the resources and find out what every one of them depends on.
+
+        :return: dict of nodes by name
+        '''
+        nodes = dict()
+        for resource in self.resources:
+            name = resource['name']
+            if name in nodes:
+                self.fail("Resource name {0} is used more than once".format(name))
+            path = self.get_library_module_path(self.library_path, resource['module'])
+            args = resource['args'] or dict()
+            resource_name = args.get('name')
+            nodes[name] = dict(name=name,
+                               module=resource['module'],
+                               path=path,
+                               args=args,
+                               resource_group=(args.get('resource_group') or '').lower(),
+                               resource_name=resource_name.lower() if isinstance(resource_name, string_types) else '',
+                               depends_on=set(resource['depends_on'] or []))
+
+        for node in nodes.values():
+            unknown = [x for x in node['depends_on'] if x not in nodes]
+            if unknown:
+                self.fail("Resource {0} depends on unknown resources: {1}".format(node['name'], ', '.join(sorted(unknown))))
+            node['depends_on'].update(self.get_inferred_dependencies(node, nodes))
+            node['depends_on'].discard(node['name'])
+        return nodes
+
+    def get_inferred_dependencies(self, node, nodes):
+        names = get_name_references(node['args'])
+        ids = get_resource_id_references(node['args'])
+        dependencies = set()
+        for other in nodes.values():
+            if other is node or not other['resource_name']:
+                continue
+            if other['resource_group'] == node['resource_group'] and other['resource_name'] in names:
+                dependencies.add(other['name'])
+            elif any(group == other['resource_group'] and other['resource_name'] in path for group, path in ids):
+                dependencies.add(other['name'])
+        return dependencies
+
+    def get_order(self, nodes):
+        '''
+        Sort the nodes so that every node comes after the nodes it depends on, fails on dependency cycles.
+        '''
+        remaining = dict((name, set(node['depends_on'])) for name, node in nodes.items())
+        order = []
+        while remaining:
+            ready = sorted(name for name, dependencies in remaining.items() if not dependencies)
+            if not ready:
+                self.fail("Dependency cycle, unable to order resources: {0}".format(', '.join(sorted(remaining))))
+            for name in ready:
+                del remaining[name]
+                for dependencies in remaining.values():
+                    dependencies.discard(name)
+            order += ready
+        return order
+
+    def apply(self, nodes):
+        '''
+        Apply every node once the nodes it depends on are done, on a bounded pool of threads.
+
+        :return: dict of outcomes by node name
+        '''
+        remaining = dict((name, set(node['depends_on'])) for name, node in nodes.items())
+        outcomes = dict()
+        finished = queue.Queue()
+        running = 0
+        pool = ThreadPool(max(1, min(self.concurrency, len(nodes))))
+        self.start = time.time()
+        try:
+            while remaining or running:
+                ready = sorted(name for name, dependencies in remaining.items() if not dependencies)
+                skipped = False
+                for name in ready:
+                    del remaining[name]
+                    blocking = sorted(x for x in nodes[name]['depends_on'] if outcomes[x]['status'] in ['failed', 'skipped'])
+                    if blocking:
+                        outcomes[name] = dict(status='skipped', msg="Skipped as {0} did not apply".format(', '.join(blocking)))
+                        for dependencies in remaining.values():
+                            dependencies.discard(name)
+                        skipped = True
+                    else:
+                        pool.apply_async(self.apply_node, (nodes[name],), callback=finished.put)
+                        running += 1
+                if skipped:
+                    # dependents of the skipped nodes may be ready now
+                    continue
+                name, outcome = finished.get()
+                running -= 1
+                outcomes[name] = outcome
+                for dependencies in remaining.values():
+                    dependencies.discard(name)
+        finally:
+            pool.close()
+            pool.join()
+        return outcomes
+
+    def apply_node(self, node):
+        '''
+        Run the module of a node in a new interpreter. Never raises, errors are reported in the outcome.
+
+        :return: tuple of node name and outcome
+        '''
+        start = time.time()
+        outcome = dict(started=round(start - self.start, 3))
+        try:
+            rc, result, stdout, stderr = run_module(node['path'], self.get_module_args(node['module'], node['args']))
+            if result is None:
+                outcome.update(status='failed',
+                               msg="Module {0} returned no result".format(node['module']),
+                               result=dict(rc=rc, stdout=stdout, stderr=stderr))
+            else:
+                result.pop('invocation', None)
+                outcome['result'] = result
+                if rc != 0 or result.get('failed'):
+                    outcome.update(status='failed', msg=result.get('msg') or "Module {0} failed".format(node['module']))
+                elif result.get('skipped'):
+                    outcome.update(status='skipped', msg=result.get('msg'))
+                else:
+                    outcome['status'] = 'changed' if result.get('changed') else 'ok'
+        except Exception as exc:
+            outcome.update(status='failed', msg="Error applying {0}: {1}".format(node['name'], str(exc)))
+        end = time.time()
+        outcome['elapsed'] = round(end - start, 3)
+        outcome['end'] = end
+        self.log("Applied {0} in {1:.3f}s: {2}", node['name'], end - start, outcome['status'])
+        return node['name'], outcome
+
+    @staticmethod
+    def get_critical_path(nodes, outcomes):
+        '''
+        Walk back from the node which ended last, through the dependency which ended last.
+        '''
+        ended = dict((name, outcome['end']) for name, outcome in outcomes.items() if 'end' in outcome)
+        path = []
+        name = max(ended, key=lambda x: ended[x]) if ended else None
+        while name is not None:
+            path.insert(0, name)
+            dependencies = [x for x in nodes[name]['depends_on'] if x in ended]
+            name = max(dependencies, key=lambda x: ended[x]) if dependencies else None
+        return path
+
+
+def main():
+    """Main execution"""
+    AzureRMGraph()
+
+if __name__ == '__main__':
+    main()
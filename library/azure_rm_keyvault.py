@@ -151,6 +151,13 @@ options:
         choices:
             - absent
             - present
+    wait:
+        description:
+            - Wait for the long running create, update or delete operation to complete.
+            - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+            - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+        type: bool
+        default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -184,9 +191,28 @@ id:
     returned: always
     type: str
     sample: id
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.KeyVault/vaults/myVault",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2018-02-14",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.KeyVault/...",
+        "location": null,
+        "started": 1525248011
+    }
+patched_fields:
+    description:
+        - Values that differed and were sent with a PATCH request instead of replacing the whole resource.
+    returned: when an existing resource was updated with a PATCH request
+    type: list
+    sample: ["properties.access_policies"]
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -261,7 +287,8 @@ class AzureRMVaults(AzureRMModuleBase):
 
         super(AzureRMVaults, self).__init__(derived_arg_spec=self.module_arg_spec,
                                             supports_check_mode=True,
-                                            supports_tags=False)
+                                            supports_tags=False,
+                                            supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -314,9 +341,8 @@ class AzureRMVaults(AzureRMModuleBase):
         self.mgmt_client = self.get_mgmt_svc_client(KeyVaultManagementClient,
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
         if "location" not in self.parameters:
+            resource_group = self.get_resource_group(self.resource_group)
             self.parameters["location"] = resource_group.location
 
         old_response = self.get_keyvault()
@@ -333,50 +359,8 @@ class AzureRMVaults(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Key Vault instance has to be deleted or may be updated")
-                if ('location' in self.parameters) and (self.parameters['location'] != old_response['location']):
-                    self.to_do = Actions.Update
-                elif ('tenant_id' in self.parameters) and (self.parameters['tenant_id'] != old_response['tenant_id']):
-                    self.to_do = Actions.Update
-                elif ('enabled_for_deployment' in self.parameters) and (self.parameters['enabled_for_deployment'] != old_response['enabled_for_deployment']):
+                if self.is_update_needed(self.parameters, old_response):
                     self.to_do = Actions.Update
-                elif (('enabled_for_disk_encryption' in self.parameters) and
-                        (self.parameters['enabled_for_deployment'] != old_response['enabled_for_deployment'])):
-                    self.to_do = Actions.Update
-                elif (('enabled_for_template_deployment' in self.parameters) and
-                        (self.parameters['enabled_for_template_deployment'] != old_response['enabled_for_template_deployment'])):
-                    self.to_do = Actions.Update
-                elif ('enable_soft_delete' in self.parameters) and (self.parameters['enabled_soft_delete'] != old_response['enable_soft_delete']):
-                    self.to_do = Actions.Update
-                elif ('create_mode' in self.parameters) and (self.parameters['create_mode'] != old_response['create_mode']):
-                    self.to_do = Actions.Update
-                elif 'access_policies' in self.parameters:
-                    if len(self.parameters['access_policies']) != len(old_response['access_policies']):
-                        self.to_do = Actions.Update
-                    else:
-                        for i in range(len(old_response['access_policies'])):
-                            n = self.parameters['access_policies'][i]
-                            o = old_response['access_policies'][i]
-                            if n.get('tenant_id', False) != o.get('tenant_id', False):
-                                self.to_do = Actions.Update
-                                break
-                            if n.get('object_id', False) != o.get('object_id', False):
-                                self.to_do = Actions.Update
-                                break
-                            if n.get('application_id', False) != o.get('application_id', False):
-                                self.to_do = Actions.Update
-                                break
-                            if sorted(n.get('keys', [])).cmp(sorted(o.get('keys', []))) != 0:
-                                self.to_do = Actions.Update
-                                break
-                            if sorted(n.get('secrets', [])).cmp(sorted(o.get('secrets', []))) != 0:
-                                self.to_do = Actions.Update
-                                break
-                            if sorted(n.get('certificates', [])).cmp(sorted(o.get('certificates', []))) != 0:
-                                self.to_do = Actions.Update
-                                break
-                            if sorted(n.get('storage', [])).cmp(sorted(o.get('storage', []))) != 0:
-                                self.to_do = Actions.Update
-                                break
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Key Vault instance")
@@ -402,8 +386,7 @@ class AzureRMVaults(AzureRMModuleBase):
             self.delete_keyvault()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_keyvault():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_keyvault)
         else:
             self.log("Key Vault instance unchanged")
             self.results['changed'] = False
@@ -420,17 +403,25 @@ class AzureRMVaults(AzureRMModuleBase):
 
         :return: deserialized Key Vault instance state dictionary
         '''
-        self.log("Creating / Updating the Key Vault instance {0}".format(self.vault_name))
+        self.log("Creating / Updating the Key Vault instance {0}", self.vault_name)
 
         try:
-            response = self.mgmt_client.vaults.create_or_update(resource_group_name=self.resource_group,
-                                                                vault_name=self.vault_name,
-                                                                parameters=self.parameters)
+            patch = None
+            if self.to_do == Actions.Update and hasattr(self.mgmt_client.vaults, 'update'):
+                patch = self.get_patch_parameters(self.parameters, ['properties'])
+            if patch is not None:
+                response = self.mgmt_client.vaults.update(resource_group_name=self.resource_group,
+                                                          vault_name=self.vault_name,
+                                                          properties=patch['properties'])
+            else:
+                response = self.mgmt_client.vaults.create_or_update(resource_group_name=self.resource_group,
+                                                                    vault_name=self.vault_name,
+                                                                    parameters=self.parameters)
             if isinstance(response, AzureOperationPoller):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Key Vault instance.')
+            self.log('Error attempting to create the Key Vault instance.', level='error')
             self.fail("Error creating the Key Vault instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -440,12 +431,14 @@ class AzureRMVaults(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Key Vault instance {0}".format(self.vault_name))
+        self.log("Deleting the Key Vault instance {0}", self.vault_name)
         try:
             response = self.mgmt_client.vaults.delete(resource_group_name=self.resource_group,
                                                       vault_name=self.vault_name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Key Vault instance.')
+            self.log('Error attempting to delete the Key Vault instance.', level='error')
             self.fail("Error deleting the Key Vault instance: {0}".format(str(e)))
 
         return True
@@ -456,14 +449,14 @@ class AzureRMVaults(AzureRMModuleBase):
 
         :return: deserialized Key Vault instance state dictionary
         '''
-        self.log("Checking if the Key Vault instance {0} is present".format(self.vault_name))
+        self.log("Checking if the Key Vault instance {0} is present", self.vault_name)
         found = False
         try:
             response = self.mgmt_client.vaults.get(resource_group_name=self.resource_group,
                                                    vault_name=self.vault_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Key Vault instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Key Vault instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Key Vault instance.')
         if found is True:
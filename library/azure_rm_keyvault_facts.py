@@ -25,13 +25,53 @@ options:
     resource_group:
         description:
             - The name of the Resource Group to which the vault belongs.
-        required: True
+            - Use C(*) to query all resource groups of the subscription.
+            - Either I(resource_group) or I(resource_groups) is required.
+    resource_groups:
+        description:
+            - List of resource groups to query in a single run, C(*) stands for all resource groups of the subscription.
+            - Results from several resource groups are keyed by resource ID.
+        type: list
+    concurrency:
+        description:
+            - Maximum number of resource groups queried at the same time when several resource groups are queried.
+        type: int
+        default: 8
     vault_name:
         description:
             - The name of the vault.
     top:
         description:
             - Maximum number of results to return.
+    skip:
+        description:
+            - Number of items to skip before results are collected.
+        type: int
+        default: 0
+    max_items:
+        description:
+            - Maximum number of items to return. Pages are requested from the service only until this many items are collected.
+            - When more items are available, I(next_link) is returned to continue from where this run stopped.
+        type: int
+    next_link:
+        description:
+            - Continuation token returned as I(next_link) by a previous run with I(max_items), used to fetch the following items.
+        type: str
+    filters:
+        description:
+            - Only return items matching all of these filters.
+            - Keys are attribute names, nested attributes are separated by dots, e.g. C(tags.environment). A list of values matches any of them.
+            - Filters are passed to the service where it supports them, otherwise items are matched while the result pages are read.
+        type: dict
+    fields:
+        description:
+            - List of attributes to return for every item, nested attributes are separated by dots, e.g. C(sku.name).
+            - Only the listed attributes are read from the service response and serialized.
+        type: list
+    query:
+        description:
+            - JMESPath expression applied to every returned item, after I(fields). Requires the jmespath package.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -51,6 +91,17 @@ EXAMPLES = '''
     azure_rm_keyvault_facts:
       resource_group: resource_group_name
       top: top
+
+  - name: List Vaults in several resource groups
+    azure_rm_keyvault_facts:
+      resource_groups:
+        - resource_group_name
+        - other_resource_group_name
+
+  - name: List Vaults in all resource groups of the subscription
+    azure_rm_keyvault_facts:
+      resource_group: '*'
+      concurrency: 4
 '''
 
 RETURN = '''
@@ -69,6 +120,11 @@ vaults:
                     returned: always
                     type: str
                     sample: id
+next_link:
+    description:
+        - Continuation token to pass as I(next_link) to fetch the remaining items.
+    returned: when I(max_items) is set and more items are available
+    type: str
 '''
 
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
@@ -88,8 +144,14 @@ class AzureRMVaultsFacts(AzureRMModuleBase):
         # define user inputs into argument
         self.module_arg_spec = dict(
             resource_group=dict(
-                type='str',
-                required=True
+                type='str'
+            ),
+            resource_groups=dict(
+                type='list'
+            ),
+            concurrency=dict(
+                type='int',
+                default=8
             ),
             vault_name=dict(
                 type='str'
@@ -105,9 +167,14 @@ class AzureRMVaultsFacts(AzureRMModuleBase):
         )
         self.mgmt_client = None
         self.resource_group = None
+        self.resource_groups = None
+        self.concurrency = None
         self.vault_name = None
         self.top = None
-        super(AzureRMVaultsFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMVaultsFacts, self).__init__(self.module_arg_spec,
+                                                 required_one_of=[['resource_group', 'resource_groups']],
+                                                 supports_paging=True,
+                                                 supports_projection=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -115,7 +182,11 @@ class AzureRMVaultsFacts(AzureRMModuleBase):
         self.mgmt_client = self.get_mgmt_svc_client(KeyVaultManagementClient,
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        if (self.resource_group is not None and
+        if self.resource_groups or self.resource_group == '*':
+            self.results['vaults'] = self.collect_from_resource_groups(self.list_by_resource_group,
+                                                                       self.resource_groups or ['*'],
+                                                                       self.concurrency)
+        elif (self.resource_group is not None and
                 self.vault_name is not None):
             self.results['vaults'] = self.get()
         elif (self.resource_group is not None):
@@ -133,32 +204,33 @@ class AzureRMVaultsFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.vaults.get(resource_group_name=self.resource_group,
                                                    vault_name=self.vault_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
-            self.log('Could not get facts for Vaults.')
+            self.log('Could not get facts for Vaults.', level='warning')
 
         if response is not None:
-            results[response.name] = response.as_dict()
+            results[response.name] = self.serialize_facts(response)
 
         return results
 
-    def list_by_resource_group(self):
+    def list_by_resource_group(self, resource_group=None):
         '''
         Gets facts of the specified Vault.
 
+        :param resource_group: resource group to list, I(resource_group) by default
         :return: deserialized Vaultinstance state dictionary
         '''
         response = None
         results = {}
         try:
-            response = self.mgmt_client.vaults.list_by_resource_group(resource_group_name=self.resource_group)
-            self.log("Response : {0}".format(response))
+            response = self.mgmt_client.vaults.list_by_resource_group(resource_group_name=resource_group or self.resource_group,
+                                                                      top=self.top)
+            self.log("Response : {0}", response)
         except CloudError as e:
-            self.log('Could not get facts for Vaults.')
+            self.log('Could not get facts for Vaults.', level='warning')
 
         if response is not None:
-            for item in response:
-                results[item.name] = item.as_dict()
+            results = self.serialize_paged(response)
 
         return results
 
@@ -51,6 +51,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -77,9 +84,22 @@ id:
     type: str
     sample: "/subscriptions/ffffffff-ffff-ffff-ffff-ffffffffffff/resourceGroups/TestGroup/providers/Microsoft.DBforMySQL/servers/testserver/configurations/ev
             ent_scheduler"
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.DBforMySQL/servers/myServer/configurations/myConfiguration",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2017-12-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.DBforMySQL/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -142,7 +162,8 @@ class AzureRMConfigurations(AzureRMModuleBase):
 
         super(AzureRMConfigurations, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                     supports_check_mode=True,
-                                                    supports_tags=False)
+                                                    supports_tags=False,
+                                                    supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -173,7 +194,8 @@ class AzureRMConfigurations(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Configuration instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(dict(value=self.value, source=self.source), old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Configuration instance")
@@ -199,8 +221,7 @@ class AzureRMConfigurations(AzureRMModuleBase):
             self.delete_configuration()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_configuration():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_configuration)
         else:
             self.log("Configuration instance unchanged")
             self.results['changed'] = False
@@ -217,7 +238,7 @@ class AzureRMConfigurations(AzureRMModuleBase):
 
         :return: deserialized Configuration instance state dictionary
         '''
-        self.log("Creating / Updating the Configuration instance {0}".format(self.name))
+        self.log("Creating / Updating the Configuration instance {0}", self.name)
 
         try:
             response = self.mgmt_client.configurations.create_or_update(resource_group_name=self.resource_group,
@@ -229,7 +250,7 @@ class AzureRMConfigurations(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Configuration instance.')
+            self.log('Error attempting to create the Configuration instance.', level='error')
             self.fail("Error creating the Configuration instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -239,11 +260,13 @@ class AzureRMConfigurations(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Configuration instance {0}".format(self.name))
+        self.log("Deleting the Configuration instance {0}", self.name)
         try:
             response = self.mgmt_client.configurations.delete()
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Configuration instance.')
+            self.log('Error attempting to delete the Configuration instance.', level='error')
             self.fail("Error deleting the Configuration instance: {0}".format(str(e)))
 
         return True
@@ -254,15 +277,15 @@ class AzureRMConfigurations(AzureRMModuleBase):
 
         :return: deserialized Configuration instance state dictionary
         '''
-        self.log("Checking if the Configuration instance {0} is present".format(self.name))
+        self.log("Checking if the Configuration instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.configurations.get(resource_group_name=self.resource_group,
                                                            server_name=self.server_name,
                                                            configuration_name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Configuration instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Configuration instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Configuration instance.')
         if found is True:
@@ -51,6 +51,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -76,9 +83,22 @@ id:
     returned: always
     type: str
     sample: /subscriptions/ffffffff-ffff-ffff-ffff-ffffffffffff/resourceGroups/TestGroup/providers/Microsoft.DBforMySQL/servers/testserver/firewallRules/rule1
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.DBforMySQL/servers/myServer/firewallRules/myFirewallRule",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2017-12-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.DBforMySQL/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -141,7 +161,8 @@ class AzureRMFirewallRules(AzureRMModuleBase):
 
         super(AzureRMFirewallRules, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                    supports_check_mode=True,
-                                                   supports_tags=False)
+                                                   supports_tags=False,
+                                                   supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -172,9 +193,7 @@ class AzureRMFirewallRules(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Firewall Rule instance has to be deleted or may be updated")
-                if (self.start_ip_address is not None) and (self.start_ip_address != old_response['start_ip_address']):
-                    self.to_do = Actions.Update
-                if (self.end_ip_address is not None) and (self.end_ip_address != old_response['end_ip_address']):
+                if self.is_update_needed(dict(start_ip_address=self.start_ip_address, end_ip_address=self.end_ip_address), old_response):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
@@ -201,8 +220,7 @@ class AzureRMFirewallRules(AzureRMModuleBase):
             self.delete_firewallrule()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_firewallrule():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_firewallrule)
         else:
             self.log("Firewall Rule instance unchanged")
             self.results['changed'] = False
@@ -219,7 +237,7 @@ class AzureRMFirewallRules(AzureRMModuleBase):
 
         :return: deserialized Firewall Rule instance state dictionary
         '''
-        self.log("Creating / Updating the Firewall Rule instance {0}".format(self.name))
+        self.log("Creating / Updating the Firewall Rule instance {0}", self.name)
 
         try:
             response = self.mgmt_client.firewall_rules.create_or_update(resource_group_name=self.resource_group,
@@ -231,7 +249,7 @@ class AzureRMFirewallRules(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Firewall Rule instance.')
+            self.log('Error attempting to create the Firewall Rule instance.', level='error')
             self.fail("Error creating the Firewall Rule instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -241,13 +259,15 @@ class AzureRMFirewallRules(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Firewall Rule instance {0}".format(self.name))
+        self.log("Deleting the Firewall Rule instance {0}", self.name)
         try:
             response = self.mgmt_client.firewall_rules.delete(resource_group_name=self.resource_group,
                                                               server_name=self.server_name,
                                                               firewall_rule_name=self.name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Firewall Rule instance.')
+            self.log('Error attempting to delete the Firewall Rule instance.', level='error')
             self.fail("Error deleting the Firewall Rule instance: {0}".format(str(e)))
 
         return True
@@ -258,15 +278,15 @@ class AzureRMFirewallRules(AzureRMModuleBase):
 
         :return: deserialized Firewall Rule instance state dictionary
         '''
-        self.log("Checking if the Firewall Rule instance {0} is present".format(self.name))
+        self.log("Checking if the Firewall Rule instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.firewall_rules.get(resource_group_name=self.resource_group,
                                                            server_name=self.server_name,
                                                            firewall_rule_name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Firewall Rule instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Firewall Rule instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Firewall Rule instance.')
         if found is True:
@@ -79,6 +79,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -129,9 +136,22 @@ fully_qualified_domain_name:
     returned: always
     type: str
     sample: mysqlsrv1b6dd89593.mysql.database.azure.com
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.DBforMySQL/servers/myServer",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2017-12-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.DBforMySQL/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -207,7 +227,8 @@ class AzureRMServers(AzureRMModuleBase):
 
         super(AzureRMServers, self).__init__(derived_arg_spec=self.module_arg_spec,
                                              supports_check_mode=True,
-                                             supports_tags=False)
+                                             supports_tags=False,
+                                             supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -245,9 +266,8 @@ class AzureRMServers(AzureRMModuleBase):
         self.mgmt_client = self.get_mgmt_svc_client(MySQLManagementClient,
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
         if "location" not in self.parameters:
+            resource_group = self.get_resource_group(self.resource_group)
             self.parameters["location"] = resource_group.location
 
         old_response = self.get_mysqlserver()
@@ -264,7 +284,8 @@ class AzureRMServers(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if MySQL Server instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.parameters, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the MySQL Server instance")
@@ -290,8 +311,7 @@ class AzureRMServers(AzureRMModuleBase):
             self.delete_mysqlserver()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_mysqlserver():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_mysqlserver)
         else:
             self.log("MySQL Server instance unchanged")
             self.results['changed'] = False
@@ -311,7 +331,7 @@ class AzureRMServers(AzureRMModuleBase):
 
         :return: deserialized MySQL Server instance state dictionary
         '''
-        self.log("Creating / Updating the MySQL Server instance {0}".format(self.name))
+        self.log("Creating / Updating the MySQL Server instance {0}", self.name)
 
         try:
             response = self.mgmt_client.servers.create_or_update(resource_group_name=self.resource_group,
@@ -321,7 +341,7 @@ class AzureRMServers(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the MySQL Server instance.')
+            self.log('Error attempting to create the MySQL Server instance.', level='error')
             self.fail("Error creating the MySQL Server instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -331,12 +351,14 @@ class AzureRMServers(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the MySQL Server instance {0}".format(self.name))
+        self.log("Deleting the MySQL Server instance {0}", self.name)
         try:
             response = self.mgmt_client.servers.delete(resource_group_name=self.resource_group,
                                                        server_name=self.name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the MySQL Server instance.')
+            self.log('Error attempting to delete the MySQL Server instance.', level='error')
             self.fail("Error deleting the MySQL Server instance: {0}".format(str(e)))
 
         return True
@@ -347,14 +369,14 @@ class AzureRMServers(AzureRMModuleBase):
 
         :return: deserialized MySQL Server instance state dictionary
         '''
-        self.log("Checking if the MySQL Server instance {0} is present".format(self.name))
+        self.log("Checking if the MySQL Server instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.servers.get(resource_group_name=self.resource_group,
                                                     server_name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("MySQL Server instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("MySQL Server instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the MySQL Server instance.')
         if found is True:
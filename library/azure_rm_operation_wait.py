@@ -0,0 +1,250 @@
+#!/usr/bin/python
+#
+# Copyright (c) 2026 agent, <agent@local>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+
+ANSIBLE_METADATA = {'metadata_version': '1.1',
+                    'status': ['preview'],
+                    'supported_by': 'community'}
+
+
+DOCUMENTATION = '''
+---
+module: azure_rm_operation_wait
+version_added: "2.5"
+short_description: Wait for long running operations started with I(wait=no).
+description:
+    - Wait for one or more long running Azure Resource Manager operations to complete.
+    - The operations are started by other azure_rm modules running with I(wait=no), which return an operation handle instead of waiting.
+    - The operations are checked one after another in a single loop, each on its own backoff schedule, so resources started in parallel can be joined by a single task.
+
+options:
+    operations:
+        description:
+            - List of operation handles, as returned in I(operation) by modules running with I(wait=no).
+        required: True
+        type: list
+    timeout:
+        description:
+            - Number of seconds to wait for all operations to complete.
+        default: 3600
+        type: int
+    fail_on_error:
+        description:
+            - Fail the task when any of the operations failed.
+            - When C(no), failed operations are only reported in I(operations).
+        type: bool
+        default: 'yes'
+
+extends_documentation_fragment:
+    - azure
+
+author:
+    - "agent"
+
+'''
+
+EXAMPLES = '''
+  - name: Start creation of virtual network gateways
+    azure_rm_appgwvirtualnetworkgateway:
+      resource_group: myResourceGroup
+      name: "gateway{{ item }}"
+      wait: no
+      ...
+    with_sequence: count=30
+    register: started
+
+  - name: Wait for all gateways
+    azure_rm_operation_wait:
+      operations: "{{ started.results | map(attribute='operation') | list }}"
+      timeout: 3600
+'''
+
+RETURN = '''
+operations:
+    description:
+        - Outcome of every operation, in the order of I(operations).
+    returned: always
+    type: complex
+    contains:
+        id:
+            description:
+                - Resource ID.
+            returned: always
+            type: str
+            sample: /subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Sql/servers/myserver
+        status:
+            description:
+                - Final status of the operation, one of C(Succeeded), C(Failed), C(Canceled) or C(TimedOut).
+            returned: always
+            type: str
+            sample: Succeeded
+        resource:
+            description:
+                - State of the resource after a successful create or update.
+            returned: when the operation created or updated a resource
+            type: dict
+        error:
+            description:
+                - Error returned by the service.
+            returned: when the operation failed
+            type: dict
+elapsed:
+    description:
+        - Number of seconds spent waiting.
+    returned: always
+    type: float
+    sample: 312.5
+'''
+
+import time
+from ansible.module_utils.azure_rm_common import AzureRMModuleBase, AzureRMHTTPAdapter, get_env_number, \
+    AZURE_POLL_INITIAL_DELAY, AZURE_POLL_MAX_DELAY, AZURE_POLL_MAX_DELAY_ENV
+
+TERMINAL_STATES = ['Succeeded', 'Failed', 'Canceled']
+
+
+class AzureRMOperationWait(AzureRMModuleBase):
+    """Waits for long running operations started with wait=no"""
+
+    def __init__(self):
+        self.module_arg_spec = dict(
+            operations=dict(
+                type='list',
+                required=True
+            ),
+            timeout=dict(
+                type='int',
+                default=3600
+            ),
+            fail_on_error=dict(
+                type='bool',
+                default=True
+            )
+        )
+
+        self.operations = None
+        self.timeout = None
+        self.fail_on_error = None
+
+        self.results = dict(changed=False)
+        self.session = None
+
+        super(AzureRMOperationWait, self).__init__(derived_arg_spec=self.module_arg_spec,
+                                                   supports_check_mode=True,
+                                                   supports_tags=False)
+
+    def exec_module(self, **kwargs):
+        """Main module execution method"""
+
+        for key in list(self.module_arg_spec.keys()):
+            setattr(self, key, kwargs[key])
+
+        # status checks go through the throttle governor and timings like the requests of management clients
+        self.session = self.azure_credentials.signed_session()
+        self.session.verify = self._cert_validation_mode == 'validate'
+        AzureRMHTTPAdapter.mount(self.session)
+
+        max_delay = get_env_number(AZURE_POLL_MAX_DELAY_ENV, AZURE_POLL_MAX_DELAY)
+        start = time.time()
+        pending = []
+        outcomes = []
+        for handle in self.operations:
+            if not isinstance(handle, dict) or not handle.get('id'):
+                self.fail("Every operation must be a handle returned by a module running with wait=no, got {0}".format(handle))
+            outcome = dict(id=handle['id'])
+            outcomes.append(outcome)
+            pending.append(dict(handle=handle, outcome=outcome, next_check=start, delay=AZURE_POLL_INITIAL_DELAY))
+
+        while pending:
+            now = time.time()
+            if now - start >= self.timeout:
+                for item in pending:
+                    item['outcome']['status'] = 'TimedOut'
+                break
+            for item in [x for x in pending if x['next_check'] <= now]:
+                retry_after = self.check_operation(item['handle'], item['outcome'])
+                if item['outcome'].get('status') in TERMINAL_STATES:
+                    pending.remove(item)
+                else:
+                    item['next_check'] = time.time() + max(item['delay'], retry_after)
+                    item['delay'] = min(item['delay'] * 2, max_delay)
+            if pending:
+                next_check = min(min(x['next_check'] for x in pending), start + self.timeout)
+                time.sleep(max(0, next_check - time.time()))
+
+        self.results['operations'] = outcomes
+        self.results['elapsed'] = round(time.time() - start, 3)
+
+        failed = [x for x in outcomes if x.get('status') != 'Succeeded']
+        if failed and self.fail_on_error:
+            self.fail("{0} of {1} operations did not succeed".format(len(failed), len(outcomes)), **self.results)
+        return self.results
+
+    def check_operation(self, handle, outcome):
+        '''
+        Checks the status of a single operation and updates its outcome.
+
+        :return: number of seconds the service asked to wait before the next check
+        '''
+        status_url = handle.get('azure_async_operation') or handle.get('location')
+        if not status_url:
+            # the operation completed synchronously, only the resource itself is left to look at
+            self.complete_operation(handle, outcome)
+            return 0
+
+        self.log("Checking status of operation on {0}", handle['id'])
+        response = self.session.get(status_url)
+        if handle.get('azure_async_operation'):
+            body = self.parse_body(response)
+            status = body.get('status') if response.status_code < 400 else 'Failed'
+            if status == 'Succeeded':
+                self.complete_operation(handle, outcome)
+            elif status in ['Failed', 'Canceled']:
+                outcome['status'] = status
+                outcome['error'] = body.get('error') or body
+        elif response.status_code in [200, 201, 204]:
+            self.complete_operation(handle, outcome)
+        elif response.status_code != 202:
+            outcome['status'] = 'Failed'
+            outcome['error'] = self.parse_body(response)
+
+        try:
+            return int(response.headers.get('retry-after', 0))
+        except ValueError:
+            return 0
+
+    def complete_operation(self, handle, outcome):
+        outcome['status'] = 'Succeeded'
+        if handle.get('method') in ['PUT', 'PATCH'] and handle.get('endpoint') and handle.get('api_version'):
+            response = self.session.get(handle['endpoint'] + handle['id'], params={'api-version': handle['api_version']})
+            body = self.parse_body(response)
+            if response.status_code >= 400:
+                outcome['status'] = 'Failed'
+                outcome['error'] = body
+            else:
+                outcome['resource'] = body
+                provisioning_state = (body.get('properties') or {}).get('provisioningState') or body.get('provisioningState')
+                if provisioning_state in ['Failed', 'Canceled']:
+                    outcome['status'] = provisioning_state
+
+    @staticmethod
+    def parse_body(response):
+        try:
+            body = response.json()
+        except ValueError:
+            body = dict(message=response.text)
+        return body if isinstance(body, dict) else dict(value=body)
+
+
+def main():
+    """Main execution"""
+    AzureRMOperationWait()
+
+if __name__ == '__main__':
+    main()
@@ -53,6 +53,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -83,9 +90,22 @@ name:
     returned: always
     type: str
     sample: db1
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.DBforPostgreSQL/servers/myServer/databases/myDatabase",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2017-12-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.DBforPostgreSQL/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -147,7 +167,8 @@ class AzureRMDatabases(AzureRMModuleBase):
 
         super(AzureRMDatabases, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                supports_check_mode=True,
-                                               supports_tags=False)
+                                               supports_tags=False,
+                                               supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -183,9 +204,7 @@ class AzureRMDatabases(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if PostgreSQL Database instance has to be deleted or may be updated")
-                if ('collation' in self.parameters) and (self.parameters['collation'] != old_response['collation']):
-                    self.to_do = Actions.Update
-                if ('charset' in self.parameters) and (self.parameters['charset'] != old_response['charset']):
+                if self.is_update_needed(self.parameters, old_response):
                     self.to_do = Actions.Update
         if self.to_do == Actions.Update:
             if self.force_update:
@@ -218,8 +237,7 @@ class AzureRMDatabases(AzureRMModuleBase):
             self.delete_postgresqldatabase()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_postgresqldatabase():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_postgresqldatabase)
         else:
             self.log("PostgreSQL Database instance unchanged")
             self.results['changed'] = False
@@ -237,7 +255,7 @@ class AzureRMDatabases(AzureRMModuleBase):
 
         :return: deserialized PostgreSQL Database instance state dictionary
         '''
-        self.log("Creating / Updating the PostgreSQL Database instance {0}".format(self.name))
+        self.log("Creating / Updating the PostgreSQL Database instance {0}", self.name)
 
         try:
             response = self.mgmt_client.databases.create_or_update(resource_group_name=self.resource_group,
@@ -248,7 +266,7 @@ class AzureRMDatabases(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the PostgreSQL Database instance.')
+            self.log('Error attempting to create the PostgreSQL Database instance.', level='error')
             self.fail("Error creating the PostgreSQL Database instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -258,13 +276,15 @@ class AzureRMDatabases(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the PostgreSQL Database instance {0}".format(self.name))
+        self.log("Deleting the PostgreSQL Database instance {0}", self.name)
         try:
             response = self.mgmt_client.databases.delete(resource_group_name=self.resource_group,
                                                          server_name=self.server_name,
                                                          database_name=self.name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the PostgreSQL Database instance.')
+            self.log('Error attempting to delete the PostgreSQL Database instance.', level='error')
             self.fail("Error deleting the PostgreSQL Database instance: {0}".format(str(e)))
 
         return True
@@ -275,15 +295,15 @@ class AzureRMDatabases(AzureRMModuleBase):
 
         :return: deserialized PostgreSQL Database instance state dictionary
         '''
-        self.log("Checking if the PostgreSQL Database instance {0} is present".format(self.name))
+        self.log("Checking if the PostgreSQL Database instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.databases.get(resource_group_name=self.resource_group,
                                                       server_name=self.server_name,
                                                       database_name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("PostgreSQL Database instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("PostgreSQL Database instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the PostgreSQL Database instance.')
         if found is True:
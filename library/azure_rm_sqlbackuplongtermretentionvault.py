@@ -46,6 +46,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -72,9 +79,22 @@ id:
     type: str
     sample: "/subscriptions/00000000-1111-2222-3333-444444444444/resourceGroups/longtermretentiontest-1234/providers/Microsoft.Sql/servers/longtermretentiont
             est-5678/backupLongTermRetentionVaults/RegisteredVault"
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Sql/servers/myServer/backupLongTermRetentionVaults/RegisteredVault",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2014-04-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Sql/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -131,7 +151,8 @@ class AzureRMBackupLongTermRetentionVaults(AzureRMModuleBase):
 
         super(AzureRMBackupLongTermRetentionVaults, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                                    supports_check_mode=True,
-                                                                   supports_tags=False)
+                                                                   supports_tags=False,
+                                                                   supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -162,7 +183,8 @@ class AzureRMBackupLongTermRetentionVaults(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Backup Long Term Retention Vault instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(dict(recovery_services_vault_resource_id=self.recovery_services_vault_resource_id), old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Backup Long Term Retention Vault instance")
@@ -188,8 +210,7 @@ class AzureRMBackupLongTermRetentionVaults(AzureRMModuleBase):
             self.delete_backuplongtermretentionvault()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_backuplongtermretentionvault():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_backuplongtermretentionvault)
         else:
             self.log("Backup Long Term Retention Vault instance unchanged")
             self.results['changed'] = False
@@ -206,7 +227,7 @@ class AzureRMBackupLongTermRetentionVaults(AzureRMModuleBase):
 
         :return: deserialized Backup Long Term Retention Vault instance state dictionary
         '''
-        self.log("Creating / Updating the Backup Long Term Retention Vault instance {0}".format(self.backup_long_term_retention_vault_name))
+        self.log("Creating / Updating the Backup Long Term Retention Vault instance {0}", self.backup_long_term_retention_vault_name)
 
         try:
             response = self.mgmt_client.backup_long_term_retention_vaults.create_or_update(resource_group_name=self.resource_group,
@@ -217,7 +238,7 @@ class AzureRMBackupLongTermRetentionVaults(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Backup Long Term Retention Vault instance.')
+            self.log('Error attempting to create the Backup Long Term Retention Vault instance.', level='error')
             self.fail("Error creating the Backup Long Term Retention Vault instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -227,11 +248,13 @@ class AzureRMBackupLongTermRetentionVaults(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Backup Long Term Retention Vault instance {0}".format(self.backup_long_term_retention_vault_name))
+        self.log("Deleting the Backup Long Term Retention Vault instance {0}", self.backup_long_term_retention_vault_name)
         try:
             response = self.mgmt_client.backup_long_term_retention_vaults.delete()
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Backup Long Term Retention Vault instance.')
+            self.log('Error attempting to delete the Backup Long Term Retention Vault instance.', level='error')
             self.fail("Error deleting the Backup Long Term Retention Vault instance: {0}".format(str(e)))
 
         return True
@@ -242,15 +265,15 @@ class AzureRMBackupLongTermRetentionVaults(AzureRMModuleBase):
 
         :return: deserialized Backup Long Term Retention Vault instance state dictionary
         '''
-        self.log("Checking if the Backup Long Term Retention Vault instance {0} is present".format(self.backup_long_term_retention_vault_name))
+        self.log("Checking if the Backup Long Term Retention Vault instance {0} is present", self.backup_long_term_retention_vault_name)
         found = False
         try:
             response = self.mgmt_client.backup_long_term_retention_vaults.get(resource_group_name=self.resource_group,
                                                                               server_name=self.server_name,
                                                                               backup_long_term_retention_vault_name=self.backup_long_term_retention_vault_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Backup Long Term Retention Vault instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Backup Long Term Retention Vault instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Backup Long Term Retention Vault instance.')
         if found is True:
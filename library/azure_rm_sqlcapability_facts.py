@@ -26,6 +26,35 @@ options:
         description:
             - The location id whose capabilities are retrieved.
         required: True
+    skip:
+        description:
+            - Number of items to skip before results are collected.
+        type: int
+        default: 0
+    max_items:
+        description:
+            - Maximum number of items to return. Pages are requested from the service only until this many items are collected.
+            - When more items are available, I(next_link) is returned to continue from where this run stopped.
+        type: int
+    next_link:
+        description:
+            - Continuation token returned as I(next_link) by a previous run with I(max_items), used to fetch the following items.
+        type: str
+    filters:
+        description:
+            - Only return items matching all of these filters.
+            - Keys are attribute names, nested attributes are separated by dots, e.g. C(tags.environment). A list of values matches any of them.
+            - Filters are passed to the service where it supports them, otherwise items are matched while the result pages are read.
+        type: dict
+    fields:
+        description:
+            - List of attributes to return for every item, nested attributes are separated by dots, e.g. C(sku.name).
+            - Only the listed attributes are read from the service response and serialized.
+        type: list
+    query:
+        description:
+            - JMESPath expression applied to every returned item, after I(fields). Requires the jmespath package.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -51,6 +80,11 @@ capabilities:
             description: The key is the name of the server that the values relate to.
             type: complex
             contains:
+next_link:
+    description:
+        - Continuation token to pass as I(next_link) to fetch the remaining items.
+    returned: when I(max_items) is set and more items are available
+    type: str
 '''
 
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
@@ -81,7 +115,9 @@ class AzureRMCapabilitiesFacts(AzureRMModuleBase):
         )
         self.mgmt_client = None
         self.location_id = None
-        super(AzureRMCapabilitiesFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMCapabilitiesFacts, self).__init__(self.module_arg_spec,
+                                                       supports_paging=True,
+                                                       supports_projection=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -103,13 +139,12 @@ class AzureRMCapabilitiesFacts(AzureRMModuleBase):
         results = {}
         try:
             response = self.mgmt_client.capabilities.list_by_location(location_id=self.location_id)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
-            self.log('Could not get facts for Capabilities.')
+            self.log('Could not get facts for Capabilities.', level='warning')
 
         if response is not None:
-            for item in response:
-                results[item.name] = item.as_dict()
+            results = self.serialize_paged(response)
 
         return results
 
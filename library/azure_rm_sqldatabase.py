@@ -130,6 +130,24 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
+    items:
+      description:
+        - List of SQL Databases to manage in one task, each item takes the options of the module.
+        - Options set on an item override the options of the module, which apply to all items.
+        - Options required by the module must be set either on every item or on the module.
+      type: list
+    concurrency:
+      description:
+        - Maximum number of I(items) created, updated or deleted at the same time.
+      type: int
+      default: 8
 
 extends_documentation_fragment:
     - azure
@@ -167,6 +185,17 @@ EXAMPLES = '''
       source_database_id: "/subscriptions/00000000-1111-2222-3333-444444444444/resourceGroups/Default-SQL-SouthEastAsia/providers/Microsoft.Sql/servers/tests
                           vr/databases/testdb"
 
+  - name: Manage several SQL Databases at once
+    azure_rm_sqldatabase:
+      resource_group: sqlcrudtest-4799
+      server_name: sqlcrudtest-5961
+      location: eastus
+      items:
+        - name: testdb1
+        - name: testdb2
+          edition: premium
+        - name: olddb
+          state: absent
 '''
 
 RETURN = '''
@@ -189,9 +218,51 @@ status:
     returned: always
     type: str
     sample: Online
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Sql/servers/myServer/databases/myDatabase",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2017-10-01-preview",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Sql/...",
+        "location": null,
+        "started": 1525248011
+    }
+patched_fields:
+    description:
+        - Values that differed and were sent with a PATCH request instead of replacing the whole resource.
+    returned: when an existing resource was updated with a PATCH request
+    type: list
+    sample: ["max_size_bytes", "read_scale"]
+items:
+    description:
+        - Outcome of every item of I(items), in the same order, with the results the module returns for a single resource.
+    returned: when I(items) is set
+    type: complex
+    contains:
+        item:
+            description:
+                - Options set on the item, without secrets.
+            returned: always
+            type: dict
+            sample: {"name": "db1"}
+        failed:
+            description:
+                - Whether the item failed, the task then fails once all items are done.
+            returned: when the item failed
+            type: bool
+            sample: true
+        msg:
+            description:
+                - Error message of the failed item.
+            returned: when the item failed
+            type: str
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -305,7 +376,9 @@ class AzureRMDatabases(AzureRMModuleBase):
 
         super(AzureRMDatabases, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                supports_check_mode=True,
-                                               supports_tags=False)
+                                               supports_tags=False,
+                                               supports_async=True,
+                                               supports_items=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -350,9 +423,8 @@ class AzureRMDatabases(AzureRMModuleBase):
         self.mgmt_client = self.get_mgmt_svc_client(SqlManagementClient,
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
         if "location" not in self.parameters:
+            resource_group = self.get_resource_group(self.resource_group)
             self.parameters["location"] = resource_group.location
 
         old_response = self.get_sqldatabase()
@@ -369,13 +441,7 @@ class AzureRMDatabases(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if SQL Database instance has to be deleted or may be updated")
-                if ('location' in self.parameters) and (self.parameters['location'] != old_response['location']):
-                    self.to_do = Actions.Update
-                if ('read_scale' in self.parameters) and (self.parameters['read_scale'] != old_response['read_scale']):
-                    self.to_do = Actions.Update
-                if ('max_size_bytes' in self.parameters) and (self.parameters['max_size_bytes'] != old_response['max_size_bytes']):
-                    self.to_do = Actions.Update
-                if ('edition' in self.parameters) and (self.parameters['edition'] != old_response['edition']):
+                if self.is_update_needed(self.parameters, old_response):
                     self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
@@ -402,8 +468,7 @@ class AzureRMDatabases(AzureRMModuleBase):
             self.delete_sqldatabase()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_sqldatabase():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_sqldatabase)
         else:
             self.log("SQL Database instance unchanged")
             self.results['changed'] = False
@@ -422,18 +487,28 @@ class AzureRMDatabases(AzureRMModuleBase):
 
         :return: deserialized SQL Database instance state dictionary
         '''
-        self.log("Creating / Updating the SQL Database instance {0}".format(self.name))
+        self.log("Creating / Updating the SQL Database instance {0}", self.name)
 
         try:
-            response = self.mgmt_client.databases.create_or_update(resource_group_name=self.resource_group,
-                                                                   server_name=self.server_name,
-                                                                   database_name=self.name,
-                                                                   parameters=self.parameters)
+            patch = None
+            if self.to_do == Actions.Update and hasattr(self.mgmt_client.databases, 'update'):
+                patch = self.get_patch_parameters(self.parameters, ['edition', 'max_size_bytes', 'elastic_pool_name',
+                                                                    'read_scale', 'zone_redundant'])
+            if patch is not None:
+                response = self.mgmt_client.databases.update(resource_group_name=self.resource_group,
+                                                             server_name=self.server_name,
+                                                             database_name=self.name,
+                                                             parameters=patch)
+            else:
+                response = self.mgmt_client.databases.create_or_update(resource_group_name=self.resource_group,
+                                                                       server_name=self.server_name,
+                                                                       database_name=self.name,
+                                                                       parameters=self.parameters)
             if isinstance(response, AzureOperationPoller):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the SQL Database instance.')
+            self.log('Error attempting to create the SQL Database instance.', level='error')
             self.fail("Error creating the SQL Database instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -443,13 +518,15 @@ class AzureRMDatabases(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the SQL Database instance {0}".format(self.name))
+        self.log("Deleting the SQL Database instance {0}", self.name)
         try:
             response = self.mgmt_client.databases.delete(resource_group_name=self.resource_group,
                                                          server_name=self.server_name,
                                                          database_name=self.name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the SQL Database instance.')
+            self.log('Error attempting to delete the SQL Database instance.', level='error')
             self.fail("Error deleting the SQL Database instance: {0}".format(str(e)))
 
         return True
@@ -460,15 +537,15 @@ class AzureRMDatabases(AzureRMModuleBase):
 
         :return: deserialized SQL Database instance state dictionary
         '''
-        self.log("Checking if the SQL Database instance {0} is present".format(self.name))
+        self.log("Checking if the SQL Database instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.databases.get(resource_group_name=self.resource_group,
                                                       server_name=self.server_name,
                                                       database_name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("SQL Database instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("SQL Database instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the SQL Database instance.')
         if found is True:
@@ -25,11 +25,22 @@ options:
     resource_group:
         description:
             - The name of the resource group that contains the resource. You can obtain this value from the Azure Resource Manager API or the portal.
-        required: True
+            - Use C(*) to query all resource groups of the subscription.
+            - Either I(resource_group) or I(resource_groups) is required.
+    resource_groups:
+        description:
+            - List of resource groups to query in a single run, C(*) stands for all resource groups of the subscription.
+            - Databases of all servers in these resource groups are returned, keyed by resource ID, unless I(server_name) is set.
+        type: list
+    concurrency:
+        description:
+            - Maximum number of resource groups queried at the same time when several resource groups are queried.
+        type: int
+        default: 8
     server_name:
         description:
             - The name of the server.
-        required: True
+            - Required unless several resource groups are queried.
     database_name:
         description:
             - The name of the database to be retrieved.
@@ -45,6 +56,36 @@ options:
     recommended_elastic_pool_name:
         description:
             - The name of the recommended elastic pool to be retrieved.
+    skip:
+        description:
+            - Number of items to skip before results are collected.
+        type: int
+        default: 0
+    max_items:
+        description:
+            - Maximum number of items to return. Pages are requested from the service only until this many items are collected.
+            - When more items are available, I(next_link) is returned to continue from where this run stopped.
+        type: int
+    next_link:
+        description:
+            - Continuation token returned as I(next_link) by a previous run with I(max_items), used to fetch the following items.
+        type: str
+    filters:
+        description:
+            - Only return items matching all of these filters.
+            - Keys are attribute names, nested attributes are separated by dots, e.g. C(tags.environment). A list of values matches any of them.
+            - Filters are passed to the service where it supports them, otherwise items are matched while the result pages are read.
+            - C(edition), C(service_level_objective) and C(elastic_pool_name) are passed to the service, combined with I(filter).
+        type: dict
+    fields:
+        description:
+            - List of attributes to return for every item, nested attributes are separated by dots, e.g. C(sku.name).
+            - Only the listed attributes are read from the service response and serialized.
+        type: list
+    query:
+        description:
+            - JMESPath expression applied to every returned item, after I(fields). Requires the jmespath package.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -80,6 +121,23 @@ EXAMPLES = '''
       resource_group: resource_group_name
       server_name: server_name
       recommended_elastic_pool_name: recommended_elastic_pool_name
+  - name: List databases of all servers in several resource groups
+    azure_rm_sqldatabase_facts:
+      resource_groups:
+        - resource_group_name
+        - other_resource_group_name
+      concurrency: 4
+
+  - name: List databases of all servers in the subscription
+    azure_rm_sqldatabase_facts:
+      resource_group: '*'
+
+  - name: List Premium databases of a server
+    azure_rm_sqldatabase_facts:
+      resource_group: resource_group_name
+      server_name: server_name
+      filters:
+        edition: Premium
 '''
 
 RETURN = '''
@@ -145,6 +203,11 @@ databases:
                     returned: always
                     type: str
                     sample: Online
+next_link:
+    description:
+        - Continuation token to pass as I(next_link) to fetch the remaining items.
+    returned: when I(max_items) is set and more items are available
+    type: str
 '''
 
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
@@ -164,12 +227,17 @@ class AzureRMDatabasesFacts(AzureRMModuleBase):
         # define user inputs into argument
         self.module_arg_spec = dict(
             resource_group=dict(
-                type='str',
-                required=True
+                type='str'
+            ),
+            resource_groups=dict(
+                type='list'
+            ),
+            concurrency=dict(
+                type='int',
+                default=8
             ),
             server_name=dict(
-                type='str',
-                required=True
+                type='str'
             ),
             database_name=dict(
                 type='str'
@@ -194,13 +262,18 @@ class AzureRMDatabasesFacts(AzureRMModuleBase):
         )
         self.mgmt_client = None
         self.resource_group = None
+        self.resource_groups = None
+        self.concurrency = None
         self.server_name = None
         self.database_name = None
         self.expand = None
         self.filter = None
         self.elastic_pool_name = None
         self.recommended_elastic_pool_name = None
-        super(AzureRMDatabasesFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMDatabasesFacts, self).__init__(self.module_arg_spec,
+                                                    required_one_of=[['resource_group', 'resource_groups']],
+                                                    supports_paging=True,
+                                                    supports_projection=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -208,7 +281,13 @@ class AzureRMDatabasesFacts(AzureRMModuleBase):
         self.mgmt_client = self.get_mgmt_svc_client(SqlManagementClient,
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        if (self.resource_group is not None and
+        if self.resource_groups or self.resource_group == '*':
+            self.results['databases'] = self.collect_from_resource_groups(self.list_by_resource_group,
+                                                                          self.resource_groups or ['*'],
+                                                                          self.concurrency)
+        elif self.server_name is None:
+            self.fail("server_name is required when a single resource group is queried")
+        elif (self.resource_group is not None and
                 self.server_name is not None and
                 self.database_name is not None):
             self.results['databases'] = self.get()
@@ -237,33 +316,63 @@ class AzureRMDatabasesFacts(AzureRMModuleBase):
             response = self.mgmt_client.databases.get(resource_group_name=self.resource_group,
                                                       server_name=self.server_name,
                                                       database_name=self.database_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
-            self.log('Could not get facts for Databases.')
+            self.log('Could not get facts for Databases: {0}', e, level='warning')
 
         if response is not None:
-            results[response.name] = response.as_dict()
+            results[response.name] = self.serialize_facts(response)
 
         return results
 
-    def list_by_server(self):
+    def list_by_resource_group(self, resource_group):
+        '''
+        Gets facts of the SQL Databases of all servers in a resource group, or of I(server_name) only.
+
+        :param resource_group: resource group to list
+        :return: deserialized SQL Databaseinstance state dictionaries keyed by resource ID
+        '''
+        server_names = [self.server_name]
+        if self.server_name is None:
+            try:
+                server_names = [server.name for server in self.mgmt_client.servers.list_by_resource_group(resource_group_name=resource_group)]
+            except CloudError as e:
+                self.log('Could not get servers in resource group {0}: {1}', resource_group, e, level='warning')
+                server_names = []
+
+        results = {}
+        for server_name in server_names:
+            for item in self.list_by_server(resource_group, server_name).values():
+                results[item['id']] = item
+        return results
+
+    def list_by_server(self, resource_group=None, server_name=None):
         '''
         Gets facts of the specified SQL Database.
 
+        :param resource_group: resource group to list, I(resource_group) by default
+        :param server_name: server to list, I(server_name) by default
         :return: deserialized SQL Databaseinstance state dictionary
         '''
         response = None
         results = {}
         try:
-            response = self.mgmt_client.databases.list_by_server(resource_group_name=self.resource_group,
-                                                                 server_name=self.server_name)
-            self.log("Response : {0}".format(response))
+            operation = self.mgmt_client.databases.list_by_server
+            odata_filter = self.get_odata_filter(operation,
+                                                 dict(edition='properties/edition',
+                                                      service_level_objective='properties/serviceLevelObjective',
+                                                      elastic_pool_name='properties/elasticPoolName'),
+                                                 self.filter)
+            kwargs = dict(filter=odata_filter) if odata_filter else dict()
+            response = operation(resource_group_name=resource_group or self.resource_group,
+                                 server_name=server_name or self.server_name,
+                                 **kwargs)
+            self.log("Response : {0}", response)
         except CloudError as e:
-            self.log('Could not get facts for Databases.')
+            self.log('Could not get facts for Databases: {0}', e, level='warning')
 
         if response is not None:
-            for item in response:
-                results[item.name] = item.as_dict()
+            results = self.serialize_paged(response)
 
         return results
 
@@ -279,13 +388,12 @@ class AzureRMDatabasesFacts(AzureRMModuleBase):
             response = self.mgmt_client.databases.list_by_elastic_pool(resource_group_name=self.resource_group,
                                                                        server_name=self.server_name,
                                                                        elastic_pool_name=self.elastic_pool_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
-            self.log('Could not get facts for Databases.')
+            self.log('Could not get facts for Databases: {0}', e, level='warning')
 
         if response is not None:
-            for item in response:
-                results[item.name] = item.as_dict()
+            results = self.serialize_paged(response)
 
         return results
 
@@ -301,13 +409,12 @@ class AzureRMDatabasesFacts(AzureRMModuleBase):
             response = self.mgmt_client.databases.list_by_recommended_elastic_pool(resource_group_name=self.resource_group,
                                                                                    server_name=self.server_name,
                                                                                    recommended_elastic_pool_name=self.recommended_elastic_pool_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
-            self.log('Could not get facts for Databases.')
+            self.log('Could not get facts for Databases: {0}', e, level='warning')
 
         if response is not None:
-            for item in response:
-                results[item.name] = item.as_dict()
+            results = self.serialize_paged(response)
 
         return results
 
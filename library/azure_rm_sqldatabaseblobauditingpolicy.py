@@ -72,6 +72,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+        description:
+            - Wait for the long running create, update or delete operation to complete.
+            - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+            - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+        type: bool
+        default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -105,9 +112,22 @@ state:
     returned: always
     type: str
     sample: Enabled
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Sql/servers/myServer/databases/myDatabase/auditingSettings/default",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2015-05-01-preview",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Sql/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -189,7 +209,8 @@ class AzureRMDatabaseBlobAuditingPolicies(AzureRMModuleBase):
 
         super(AzureRMDatabaseBlobAuditingPolicies, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                                   supports_check_mode=True,
-                                                                  supports_tags=False)
+                                                                  supports_tags=False,
+                                                                  supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -235,7 +256,8 @@ class AzureRMDatabaseBlobAuditingPolicies(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Database Blob Auditing Policy instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.parameters, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Database Blob Auditing Policy instance")
@@ -261,8 +283,7 @@ class AzureRMDatabaseBlobAuditingPolicies(AzureRMModuleBase):
             self.delete_databaseblobauditingpolicy()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_databaseblobauditingpolicy():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_databaseblobauditingpolicy)
         else:
             self.log("Database Blob Auditing Policy instance unchanged")
             self.results['changed'] = False
@@ -280,7 +301,7 @@ class AzureRMDatabaseBlobAuditingPolicies(AzureRMModuleBase):
 
         :return: deserialized Database Blob Auditing Policy instance state dictionary
         '''
-        self.log("Creating / Updating the Database Blob Auditing Policy instance {0}".format(self.blob_auditing_policy_name))
+        self.log("Creating / Updating the Database Blob Auditing Policy instance {0}", self.blob_auditing_policy_name)
 
         try:
             response = self.mgmt_client.database_blob_auditing_policies.create_or_update(resource_group_name=self.resource_group,
@@ -292,7 +313,7 @@ class AzureRMDatabaseBlobAuditingPolicies(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Database Blob Auditing Policy instance.')
+            self.log('Error attempting to create the Database Blob Auditing Policy instance.', level='error')
             self.fail("Error creating the Database Blob Auditing Policy instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -302,11 +323,13 @@ class AzureRMDatabaseBlobAuditingPolicies(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Database Blob Auditing Policy instance {0}".format(self.blob_auditing_policy_name))
+        self.log("Deleting the Database Blob Auditing Policy instance {0}", self.blob_auditing_policy_name)
         try:
             response = self.mgmt_client.database_blob_auditing_policies.delete()
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Database Blob Auditing Policy instance.')
+            self.log('Error attempting to delete the Database Blob Auditing Policy instance.', level='error')
             self.fail("Error deleting the Database Blob Auditing Policy instance: {0}".format(str(e)))
 
         return True
@@ -317,7 +340,7 @@ class AzureRMDatabaseBlobAuditingPolicies(AzureRMModuleBase):
 
         :return: deserialized Database Blob Auditing Policy instance state dictionary
         '''
-        self.log("Checking if the Database Blob Auditing Policy instance {0} is present".format(self.blob_auditing_policy_name))
+        self.log("Checking if the Database Blob Auditing Policy instance {0} is present", self.blob_auditing_policy_name)
         found = False
         try:
             response = self.mgmt_client.database_blob_auditing_policies.get(resource_group_name=self.resource_group,
@@ -325,8 +348,8 @@ class AzureRMDatabaseBlobAuditingPolicies(AzureRMModuleBase):
                                                                             database_name=self.database_name,
                                                                             blob_auditing_policy_name=self.blob_auditing_policy_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Database Blob Auditing Policy instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Database Blob Auditing Policy instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Database Blob Auditing Policy instance.')
         if found is True:
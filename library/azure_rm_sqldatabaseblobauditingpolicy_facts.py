@@ -38,6 +38,15 @@ options:
         description:
             - The name of the blob auditing policy.
         required: True
+    fields:
+        description:
+            - List of attributes to return for every item, nested attributes are separated by dots, e.g. C(sku.name).
+            - Only the listed attributes are read from the service response and serialized.
+        type: list
+    query:
+        description:
+            - JMESPath expression applied to every returned item, after I(fields). Requires the jmespath package.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -143,7 +152,8 @@ class AzureRMDatabaseBlobAuditingPoliciesFacts(AzureRMModuleBase):
         self.server_name = None
         self.database_name = None
         self.blob_auditing_policy_name = None
-        super(AzureRMDatabaseBlobAuditingPoliciesFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMDatabaseBlobAuditingPoliciesFacts, self).__init__(self.module_arg_spec,
+                                                                       supports_projection=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -171,12 +181,12 @@ class AzureRMDatabaseBlobAuditingPoliciesFacts(AzureRMModuleBase):
                                                                             server_name=self.server_name,
                                                                             database_name=self.database_name,
                                                                             blob_auditing_policy_name=self.blob_auditing_policy_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
-            self.log('Could not get facts for DatabaseBlobAuditingPolicies.')
+            self.log('Could not get facts for DatabaseBlobAuditingPolicies.', level='warning')
 
         if response is not None:
-            results[response.name] = response.as_dict()
+            results[response.name] = self.serialize_facts(response)
 
         return results
 
@@ -86,6 +86,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+        description:
+            - Wait for the long running create, update or delete operation to complete.
+            - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+            - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+        type: bool
+        default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -120,9 +127,22 @@ state:
     returned: always
     type: str
     sample: Enabled
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Sql/servers/myServer/databases/myDatabase/securityAlertPolicies/default",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2014-04-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Sql/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -215,7 +235,8 @@ class AzureRMDatabaseThreatDetectionPolicies(AzureRMModuleBase):
 
         super(AzureRMDatabaseThreatDetectionPolicies, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                                      supports_check_mode=True,
-                                                                     supports_tags=False)
+                                                                     supports_tags=False,
+                                                                     supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -249,9 +270,8 @@ class AzureRMDatabaseThreatDetectionPolicies(AzureRMModuleBase):
         self.mgmt_client = self.get_mgmt_svc_client(SqlManagementClient,
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
         if "location" not in self.parameters:
+            resource_group = self.get_resource_group(self.resource_group)
             self.parameters["location"] = resource_group.location
 
         old_response = self.get_databasethreatdetectionpolicy()
@@ -268,7 +288,8 @@ class AzureRMDatabaseThreatDetectionPolicies(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Database Threat Detection Policy instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.parameters, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Database Threat Detection Policy instance")
@@ -294,8 +315,7 @@ class AzureRMDatabaseThreatDetectionPolicies(AzureRMModuleBase):
             self.delete_databasethreatdetectionpolicy()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_databasethreatdetectionpolicy():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_databasethreatdetectionpolicy)
         else:
             self.log("Database Threat Detection Policy instance unchanged")
             self.results['changed'] = False
@@ -313,7 +333,7 @@ class AzureRMDatabaseThreatDetectionPolicies(AzureRMModuleBase):
 
         :return: deserialized Database Threat Detection Policy instance state dictionary
         '''
-        self.log("Creating / Updating the Database Threat Detection Policy instance {0}".format(self.security_alert_policy_name))
+        self.log("Creating / Updating the Database Threat Detection Policy instance {0}", self.security_alert_policy_name)
 
         try:
             response = self.mgmt_client.database_threat_detection_policies.create_or_update(resource_group_name=self.resource_group,
@@ -325,7 +345,7 @@ class AzureRMDatabaseThreatDetectionPolicies(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Database Threat Detection Policy instance.')
+            self.log('Error attempting to create the Database Threat Detection Policy instance.', level='error')
             self.fail("Error creating the Database Threat Detection Policy instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -335,11 +355,13 @@ class AzureRMDatabaseThreatDetectionPolicies(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Database Threat Detection Policy instance {0}".format(self.security_alert_policy_name))
+        self.log("Deleting the Database Threat Detection Policy instance {0}", self.security_alert_policy_name)
         try:
             response = self.mgmt_client.database_threat_detection_policies.delete()
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Database Threat Detection Policy instance.')
+            self.log('Error attempting to delete the Database Threat Detection Policy instance.', level='error')
             self.fail("Error deleting the Database Threat Detection Policy instance: {0}".format(str(e)))
 
         return True
@@ -350,7 +372,7 @@ class AzureRMDatabaseThreatDetectionPolicies(AzureRMModuleBase):
 
         :return: deserialized Database Threat Detection Policy instance state dictionary
         '''
-        self.log("Checking if the Database Threat Detection Policy instance {0} is present".format(self.security_alert_policy_name))
+        self.log("Checking if the Database Threat Detection Policy instance {0} is present", self.security_alert_policy_name)
         found = False
         try:
             response = self.mgmt_client.database_threat_detection_policies.get(resource_group_name=self.resource_group,
@@ -358,8 +380,8 @@ class AzureRMDatabaseThreatDetectionPolicies(AzureRMModuleBase):
                                                                                database_name=self.database_name,
                                                                                security_alert_policy_name=self.security_alert_policy_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Database Threat Detection Policy instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Database Threat Detection Policy instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Database Threat Detection Policy instance.')
         if found is True:
@@ -38,6 +38,15 @@ options:
         description:
             - The name of the security alert policy.
         required: True
+    fields:
+        description:
+            - List of attributes to return for every item, nested attributes are separated by dots, e.g. C(sku.name).
+            - Only the listed attributes are read from the service response and serialized.
+        type: list
+    query:
+        description:
+            - JMESPath expression applied to every returned item, after I(fields). Requires the jmespath package.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -149,7 +158,8 @@ class AzureRMDatabaseThreatDetectionPoliciesFacts(AzureRMModuleBase):
         self.server_name = None
         self.database_name = None
         self.security_alert_policy_name = None
-        super(AzureRMDatabaseThreatDetectionPoliciesFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMDatabaseThreatDetectionPoliciesFacts, self).__init__(self.module_arg_spec,
+                                                                          supports_projection=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -177,12 +187,12 @@ class AzureRMDatabaseThreatDetectionPoliciesFacts(AzureRMModuleBase):
                                                                                server_name=self.server_name,
                                                                                database_name=self.database_name,
                                                                                security_alert_policy_name=self.security_alert_policy_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
-            self.log('Could not get facts for DatabaseThreatDetectionPolicies.')
+            self.log('Could not get facts for DatabaseThreatDetectionPolicies.', level='warning')
 
         if response is not None:
-            results[response.name] = response.as_dict()
+            results[response.name] = self.serialize_facts(response)
 
         return results
 
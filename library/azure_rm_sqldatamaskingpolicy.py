@@ -57,6 +57,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -85,9 +92,22 @@ id:
     type: str
     sample: "/subscriptions/00000000-1111-2222-3333-444444444444/resourceGroups/sqlcrudtest-6852/providers/Microsoft.Sql/servers/sqlcrudtest-2080/databases/s
             qlcrudtest-331/dataMaskingPolicies/Default"
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Sql/servers/myServer/databases/myDatabase/dataMaskingPolicies/Default",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2014-04-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Sql/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -155,7 +175,8 @@ class AzureRMDataMaskingPolicies(AzureRMModuleBase):
 
         super(AzureRMDataMaskingPolicies, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                          supports_check_mode=True,
-                                                         supports_tags=False)
+                                                         supports_tags=False,
+                                                         supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -186,7 +207,8 @@ class AzureRMDataMaskingPolicies(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Data Masking Policy instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(dict(data_masking_state=self.data_masking_state), old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Data Masking Policy instance")
@@ -212,8 +234,7 @@ class AzureRMDataMaskingPolicies(AzureRMModuleBase):
             self.delete_datamaskingpolicy()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_datamaskingpolicy():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_datamaskingpolicy)
         else:
             self.log("Data Masking Policy instance unchanged")
             self.results['changed'] = False
@@ -230,7 +251,7 @@ class AzureRMDataMaskingPolicies(AzureRMModuleBase):
 
         :return: deserialized Data Masking Policy instance state dictionary
         '''
-        self.log("Creating / Updating the Data Masking Policy instance {0}".format(self.data_masking_policy_name))
+        self.log("Creating / Updating the Data Masking Policy instance {0}", self.data_masking_policy_name)
 
         try:
             response = self.mgmt_client.data_masking_policies.create_or_update(resource_group_name=self.resource_group,
@@ -242,7 +263,7 @@ class AzureRMDataMaskingPolicies(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Data Masking Policy instance.')
+            self.log('Error attempting to create the Data Masking Policy instance.', level='error')
             self.fail("Error creating the Data Masking Policy instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -252,11 +273,13 @@ class AzureRMDataMaskingPolicies(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Data Masking Policy instance {0}".format(self.data_masking_policy_name))
+        self.log("Deleting the Data Masking Policy instance {0}", self.data_masking_policy_name)
         try:
             response = self.mgmt_client.data_masking_policies.delete()
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Data Masking Policy instance.')
+            self.log('Error attempting to delete the Data Masking Policy instance.', level='error')
             self.fail("Error deleting the Data Masking Policy instance: {0}".format(str(e)))
 
         return True
@@ -267,7 +290,7 @@ class AzureRMDataMaskingPolicies(AzureRMModuleBase):
 
         :return: deserialized Data Masking Policy instance state dictionary
         '''
-        self.log("Checking if the Data Masking Policy instance {0} is present".format(self.data_masking_policy_name))
+        self.log("Checking if the Data Masking Policy instance {0} is present", self.data_masking_policy_name)
         found = False
         try:
             response = self.mgmt_client.data_masking_policies.get(resource_group_name=self.resource_group,
@@ -275,8 +298,8 @@ class AzureRMDataMaskingPolicies(AzureRMModuleBase):
                                                                   database_name=self.database_name,
                                                                   data_masking_policy_name=self.data_masking_policy_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Data Masking Policy instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Data Masking Policy instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Data Masking Policy instance.')
         if found is True:
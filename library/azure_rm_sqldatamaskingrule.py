@@ -102,6 +102,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -129,9 +136,22 @@ id:
     type: str
     sample: "/subscriptions/00000000-1111-2222-3333-444444444444/resourceGroups/sqlcrudtest-6852/providers/Microsoft.Sql/servers/sqlcrudtest-6852/databases/s
             qlcrudtest-331/dataMaskingPolicies/Default/rules/"
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Sql/servers/myServer/databases/myDatabase/dataMaskingPolicies/Default/rules/myRule",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2014-04-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Sql/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -239,7 +259,8 @@ class AzureRMDataMaskingRules(AzureRMModuleBase):
 
         super(AzureRMDataMaskingRules, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                       supports_check_mode=True,
-                                                      supports_tags=False)
+                                                      supports_tags=False,
+                                                      supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -298,7 +319,8 @@ class AzureRMDataMaskingRules(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Data Masking Rule instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.parameters, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Data Masking Rule instance")
@@ -324,8 +346,7 @@ class AzureRMDataMaskingRules(AzureRMModuleBase):
             self.delete_datamaskingrule()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_datamaskingrule():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_datamaskingrule)
         else:
             self.log("Data Masking Rule instance unchanged")
             self.results['changed'] = False
@@ -342,7 +363,7 @@ class AzureRMDataMaskingRules(AzureRMModuleBase):
 
         :return: deserialized Data Masking Rule instance state dictionary
         '''
-        self.log("Creating / Updating the Data Masking Rule instance {0}".format(self.))
+        self.log("Creating / Updating the Data Masking Rule instance {0}", self.)
 
         try:
             response = self.mgmt_client.data_masking_rules.create_or_update(resource_group_name=self.resource_group,
@@ -355,7 +376,7 @@ class AzureRMDataMaskingRules(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Data Masking Rule instance.')
+            self.log('Error attempting to create the Data Masking Rule instance.', level='error')
             self.fail("Error creating the Data Masking Rule instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -365,11 +386,13 @@ class AzureRMDataMaskingRules(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Data Masking Rule instance {0}".format(self.))
+        self.log("Deleting the Data Masking Rule instance {0}", self.)
         try:
             response = self.mgmt_client.data_masking_rules.delete()
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Data Masking Rule instance.')
+            self.log('Error attempting to delete the Data Masking Rule instance.', level='error')
             self.fail("Error deleting the Data Masking Rule instance: {0}".format(str(e)))
 
         return True
@@ -380,13 +403,13 @@ class AzureRMDataMaskingRules(AzureRMModuleBase):
 
         :return: deserialized Data Masking Rule instance state dictionary
         '''
-        self.log("Checking if the Data Masking Rule instance {0} is present".format(self.))
+        self.log("Checking if the Data Masking Rule instance {0} is present", self.)
         found = False
         try:
             response = self.mgmt_client.data_masking_rules.get()
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Data Masking Rule instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Data Masking Rule instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Data Masking Rule instance.')
         if found is True:
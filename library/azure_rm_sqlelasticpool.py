@@ -68,6 +68,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -100,9 +107,22 @@ state:
     returned: always
     type: str
     sample: Ready
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Sql/servers/myServer/elasticPools/myElasticPool",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2017-10-01-preview",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Sql/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -179,7 +199,8 @@ class AzureRMElasticPools(AzureRMModuleBase):
 
         super(AzureRMElasticPools, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                   supports_check_mode=True,
-                                                  supports_tags=False)
+                                                  supports_tags=False,
+                                                  supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -209,9 +230,8 @@ class AzureRMElasticPools(AzureRMModuleBase):
         self.mgmt_client = self.get_mgmt_svc_client(SqlManagementClient,
                                                     base_url=self._cloud_environment.endpoints.resource_manager)
 
-        resource_group = self.get_resource_group(self.resource_group)
-
         if "location" not in self.parameters:
+            resource_group = self.get_resource_group(self.resource_group)
             self.parameters["location"] = resource_group.location
 
         old_response = self.get_elasticpool()
@@ -228,7 +248,8 @@ class AzureRMElasticPools(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if ElasticPool instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.parameters, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the ElasticPool instance")
@@ -254,8 +275,7 @@ class AzureRMElasticPools(AzureRMModuleBase):
             self.delete_elasticpool()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_elasticpool():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_elasticpool)
         else:
             self.log("ElasticPool instance unchanged")
             self.results['changed'] = False
@@ -273,7 +293,7 @@ class AzureRMElasticPools(AzureRMModuleBase):
 
         :return: deserialized ElasticPool instance state dictionary
         '''
-        self.log("Creating / Updating the ElasticPool instance {0}".format(self.name))
+        self.log("Creating / Updating the ElasticPool instance {0}", self.name)
 
         try:
             response = self.mgmt_client.elastic_pools.create_or_update(resource_group_name=self.resource_group,
@@ -284,7 +304,7 @@ class AzureRMElasticPools(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the ElasticPool instance.')
+            self.log('Error attempting to create the ElasticPool instance.', level='error')
             self.fail("Error creating the ElasticPool instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -294,13 +314,15 @@ class AzureRMElasticPools(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the ElasticPool instance {0}".format(self.name))
+        self.log("Deleting the ElasticPool instance {0}", self.name)
         try:
             response = self.mgmt_client.elastic_pools.delete(resource_group_name=self.resource_group,
                                                              server_name=self.server_name,
                                                              elastic_pool_name=self.name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the ElasticPool instance.')
+            self.log('Error attempting to delete the ElasticPool instance.', level='error')
             self.fail("Error deleting the ElasticPool instance: {0}".format(str(e)))
 
         return True
@@ -311,15 +333,15 @@ class AzureRMElasticPools(AzureRMModuleBase):
 
         :return: deserialized ElasticPool instance state dictionary
         '''
-        self.log("Checking if the ElasticPool instance {0} is present".format(self.name))
+        self.log("Checking if the ElasticPool instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.elastic_pools.get(resource_group_name=self.resource_group,
                                                           server_name=self.server_name,
                                                           elastic_pool_name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("ElasticPool instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("ElasticPool instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the ElasticPool instance.')
         if found is True:
@@ -55,6 +55,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -80,9 +87,22 @@ id:
     type: str
     sample: "/subscriptions/00000000-1111-2222-3333-444444444444/resourceGroups/sqlcrudtest-7398/providers/Microsoft.Sql/servers/sqlcrudtest-4645/encryptionP
             rotector/current"
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Sql/servers/myServer/encryptionProtector/current",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2015-05-01-preview",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Sql/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -147,7 +167,8 @@ class AzureRMEncryptionProtectors(AzureRMModuleBase):
 
         super(AzureRMEncryptionProtectors, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                           supports_check_mode=True,
-                                                          supports_tags=False)
+                                                          supports_tags=False,
+                                                          supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -185,7 +206,8 @@ class AzureRMEncryptionProtectors(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Encryption Protector instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.parameters, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Encryption Protector instance")
@@ -211,8 +233,7 @@ class AzureRMEncryptionProtectors(AzureRMModuleBase):
             self.delete_encryptionprotector()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_encryptionprotector():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_encryptionprotector)
         else:
             self.log("Encryption Protector instance unchanged")
             self.results['changed'] = False
@@ -229,7 +250,7 @@ class AzureRMEncryptionProtectors(AzureRMModuleBase):
 
         :return: deserialized Encryption Protector instance state dictionary
         '''
-        self.log("Creating / Updating the Encryption Protector instance {0}".format(self.encryption_protector_name))
+        self.log("Creating / Updating the Encryption Protector instance {0}", self.encryption_protector_name)
 
         try:
             response = self.mgmt_client.encryption_protectors.create_or_update(resource_group_name=self.resource_group,
@@ -240,7 +261,7 @@ class AzureRMEncryptionProtectors(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Encryption Protector instance.')
+            self.log('Error attempting to create the Encryption Protector instance.', level='error')
             self.fail("Error creating the Encryption Protector instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -250,11 +271,13 @@ class AzureRMEncryptionProtectors(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Encryption Protector instance {0}".format(self.encryption_protector_name))
+        self.log("Deleting the Encryption Protector instance {0}", self.encryption_protector_name)
         try:
             response = self.mgmt_client.encryption_protectors.delete()
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Encryption Protector instance.')
+            self.log('Error attempting to delete the Encryption Protector instance.', level='error')
             self.fail("Error deleting the Encryption Protector instance: {0}".format(str(e)))
 
         return True
@@ -265,15 +288,15 @@ class AzureRMEncryptionProtectors(AzureRMModuleBase):
 
         :return: deserialized Encryption Protector instance state dictionary
         '''
-        self.log("Checking if the Encryption Protector instance {0} is present".format(self.encryption_protector_name))
+        self.log("Checking if the Encryption Protector instance {0} is present", self.encryption_protector_name)
         found = False
         try:
             response = self.mgmt_client.encryption_protectors.get(resource_group_name=self.resource_group,
                                                                   server_name=self.server_name,
                                                                   encryption_protector_name=self.encryption_protector_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Encryption Protector instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Encryption Protector instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Encryption Protector instance.')
         if found is True:
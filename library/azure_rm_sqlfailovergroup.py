@@ -83,6 +83,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -108,9 +115,22 @@ id:
     type: str
     sample: "/subscriptions/00000000-1111-2222-3333-444444444444/resourceGroups/Default/providers/Microsoft.Sql/servers/failover-group-primary-server/failove
             rGroups/failover-group-test-3"
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Sql/servers/myServer/failoverGroups/myFailoverGroup",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2015-05-01-preview",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Sql/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -177,7 +197,8 @@ class AzureRMFailoverGroups(AzureRMModuleBase):
 
         super(AzureRMFailoverGroups, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                     supports_check_mode=True,
-                                                    supports_tags=False)
+                                                    supports_tags=False,
+                                                    supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -229,7 +250,8 @@ class AzureRMFailoverGroups(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Failover Group instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.parameters, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Failover Group instance")
@@ -255,8 +277,7 @@ class AzureRMFailoverGroups(AzureRMModuleBase):
             self.delete_failovergroup()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_failovergroup():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_failovergroup)
         else:
             self.log("Failover Group instance unchanged")
             self.results['changed'] = False
@@ -273,7 +294,7 @@ class AzureRMFailoverGroups(AzureRMModuleBase):
 
         :return: deserialized Failover Group instance state dictionary
         '''
-        self.log("Creating / Updating the Failover Group instance {0}".format(self.failover_group_name))
+        self.log("Creating / Updating the Failover Group instance {0}", self.failover_group_name)
 
         try:
             response = self.mgmt_client.failover_groups.create_or_update(resource_group_name=self.resource_group,
@@ -284,7 +305,7 @@ class AzureRMFailoverGroups(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Failover Group instance.')
+            self.log('Error attempting to create the Failover Group instance.', level='error')
             self.fail("Error creating the Failover Group instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -294,13 +315,15 @@ class AzureRMFailoverGroups(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Failover Group instance {0}".format(self.failover_group_name))
+        self.log("Deleting the Failover Group instance {0}", self.failover_group_name)
         try:
             response = self.mgmt_client.failover_groups.delete(resource_group_name=self.resource_group,
                                                                server_name=self.server_name,
                                                                failover_group_name=self.failover_group_name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Failover Group instance.')
+            self.log('Error attempting to delete the Failover Group instance.', level='error')
             self.fail("Error deleting the Failover Group instance: {0}".format(str(e)))
 
         return True
@@ -311,15 +334,15 @@ class AzureRMFailoverGroups(AzureRMModuleBase):
 
         :return: deserialized Failover Group instance state dictionary
         '''
-        self.log("Checking if the Failover Group instance {0} is present".format(self.failover_group_name))
+        self.log("Checking if the Failover Group instance {0} is present", self.failover_group_name)
         found = False
         try:
             response = self.mgmt_client.failover_groups.get(resource_group_name=self.resource_group,
                                                             server_name=self.server_name,
                                                             failover_group_name=self.failover_group_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Failover Group instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Failover Group instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Failover Group instance.')
         if found is True:
@@ -53,6 +53,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -86,9 +93,22 @@ state:
     returned: always
     type: str
     sample: Enabled
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Sql/servers/myServer/databases/myDatabase/geoBackupPolicies/Default",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2014-04-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Sql/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -152,7 +172,8 @@ class AzureRMGeoBackupPolicies(AzureRMModuleBase):
 
         super(AzureRMGeoBackupPolicies, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                        supports_check_mode=True,
-                                                       supports_tags=False)
+                                                       supports_tags=False,
+                                                       supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -183,7 +204,8 @@ class AzureRMGeoBackupPolicies(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Geo Backup Policy instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(dict(state=self.policy_state), old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Geo Backup Policy instance")
@@ -209,8 +231,7 @@ class AzureRMGeoBackupPolicies(AzureRMModuleBase):
             self.delete_geobackuppolicy()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_geobackuppolicy():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_geobackuppolicy)
         else:
             self.log("Geo Backup Policy instance unchanged")
             self.results['changed'] = False
@@ -228,7 +249,7 @@ class AzureRMGeoBackupPolicies(AzureRMModuleBase):
 
         :return: deserialized Geo Backup Policy instance state dictionary
         '''
-        self.log("Creating / Updating the Geo Backup Policy instance {0}".format(self.geo_backup_policy_name))
+        self.log("Creating / Updating the Geo Backup Policy instance {0}", self.geo_backup_policy_name)
 
         try:
             response = self.mgmt_client.geo_backup_policies.create_or_update(resource_group_name=self.resource_group,
@@ -240,7 +261,7 @@ class AzureRMGeoBackupPolicies(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Geo Backup Policy instance.')
+            self.log('Error attempting to create the Geo Backup Policy instance.', level='error')
             self.fail("Error creating the Geo Backup Policy instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -250,11 +271,13 @@ class AzureRMGeoBackupPolicies(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Geo Backup Policy instance {0}".format(self.geo_backup_policy_name))
+        self.log("Deleting the Geo Backup Policy instance {0}", self.geo_backup_policy_name)
         try:
             response = self.mgmt_client.geo_backup_policies.delete()
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Geo Backup Policy instance.')
+            self.log('Error attempting to delete the Geo Backup Policy instance.', level='error')
             self.fail("Error deleting the Geo Backup Policy instance: {0}".format(str(e)))
 
         return True
@@ -265,7 +288,7 @@ class AzureRMGeoBackupPolicies(AzureRMModuleBase):
 
         :return: deserialized Geo Backup Policy instance state dictionary
         '''
-        self.log("Checking if the Geo Backup Policy instance {0} is present".format(self.geo_backup_policy_name))
+        self.log("Checking if the Geo Backup Policy instance {0} is present", self.geo_backup_policy_name)
         found = False
         try:
             response = self.mgmt_client.geo_backup_policies.get(resource_group_name=self.resource_group,
@@ -273,8 +296,8 @@ class AzureRMGeoBackupPolicies(AzureRMModuleBase):
                                                                 database_name=self.database_name,
                                                                 geo_backup_policy_name=self.geo_backup_policy_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Geo Backup Policy instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Geo Backup Policy instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Geo Backup Policy instance.')
         if found is True:
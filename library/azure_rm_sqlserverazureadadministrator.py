@@ -58,6 +58,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -83,9 +90,22 @@ id:
     type: str
     sample: "/subscriptions/00000000-1111-2222-3333-444444444444/resourceGroups/sqlcrudtest-4799/providers/Microsoft.Sql/servers/sqlcrudtest-6440/administrat
             ors/activeDirectory"
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Sql/servers/myServer/administrators/activeDirectory",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2014-04-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Sql/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -154,7 +174,8 @@ class AzureRMServerAzureADAdministrators(AzureRMModuleBase):
 
         super(AzureRMServerAzureADAdministrators, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                                  supports_check_mode=True,
-                                                                 supports_tags=False)
+                                                                 supports_tags=False,
+                                                                 supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -194,7 +215,8 @@ class AzureRMServerAzureADAdministrators(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Server Azure A D Administrator instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.properties, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Server Azure A D Administrator instance")
@@ -220,8 +242,7 @@ class AzureRMServerAzureADAdministrators(AzureRMModuleBase):
             self.delete_serverazureadadministrator()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_serverazureadadministrator():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_serverazureadadministrator)
         else:
             self.log("Server Azure A D Administrator instance unchanged")
             self.results['changed'] = False
@@ -238,7 +259,7 @@ class AzureRMServerAzureADAdministrators(AzureRMModuleBase):
 
         :return: deserialized Server Azure A D Administrator instance state dictionary
         '''
-        self.log("Creating / Updating the Server Azure A D Administrator instance {0}".format(self.administrator_name))
+        self.log("Creating / Updating the Server Azure A D Administrator instance {0}", self.administrator_name)
 
         try:
             response = self.mgmt_client.server_azure_ad_administrators.create_or_update(resource_group_name=self.resource_group,
@@ -249,7 +270,7 @@ class AzureRMServerAzureADAdministrators(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Server Azure A D Administrator instance.')
+            self.log('Error attempting to create the Server Azure A D Administrator instance.', level='error')
             self.fail("Error creating the Server Azure A D Administrator instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -259,13 +280,15 @@ class AzureRMServerAzureADAdministrators(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Server Azure A D Administrator instance {0}".format(self.administrator_name))
+        self.log("Deleting the Server Azure A D Administrator instance {0}", self.administrator_name)
         try:
             response = self.mgmt_client.server_azure_ad_administrators.delete(resource_group_name=self.resource_group,
                                                                               server_name=self.server_name,
                                                                               administrator_name=self.administrator_name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Server Azure A D Administrator instance.')
+            self.log('Error attempting to delete the Server Azure A D Administrator instance.', level='error')
             self.fail("Error deleting the Server Azure A D Administrator instance: {0}".format(str(e)))
 
         return True
@@ -276,15 +299,15 @@ class AzureRMServerAzureADAdministrators(AzureRMModuleBase):
 
         :return: deserialized Server Azure A D Administrator instance state dictionary
         '''
-        self.log("Checking if the Server Azure A D Administrator instance {0} is present".format(self.administrator_name))
+        self.log("Checking if the Server Azure A D Administrator instance {0} is present", self.administrator_name)
         found = False
         try:
             response = self.mgmt_client.server_azure_ad_administrators.get(resource_group_name=self.resource_group,
                                                                            server_name=self.server_name,
                                                                            administrator_name=self.administrator_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Server Azure A D Administrator instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Server Azure A D Administrator instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Server Azure A D Administrator instance.')
         if found is True:
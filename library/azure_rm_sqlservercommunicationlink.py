@@ -46,6 +46,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -77,9 +84,22 @@ state:
     returned: always
     type: str
     sample: state
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Sql/servers/myServer/communicationLinks/myCommunicationLink",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2014-04-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Sql/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -136,7 +156,8 @@ class AzureRMServerCommunicationLinks(AzureRMModuleBase):
 
         super(AzureRMServerCommunicationLinks, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                               supports_check_mode=True,
-                                                              supports_tags=False)
+                                                              supports_tags=False,
+                                                              supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -167,7 +188,8 @@ class AzureRMServerCommunicationLinks(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Server Communication Link instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(dict(partner_server=self.partner_server), old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Server Communication Link instance")
@@ -193,8 +215,7 @@ class AzureRMServerCommunicationLinks(AzureRMModuleBase):
             self.delete_servercommunicationlink()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_servercommunicationlink():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_servercommunicationlink)
         else:
             self.log("Server Communication Link instance unchanged")
             self.results['changed'] = False
@@ -212,7 +233,7 @@ class AzureRMServerCommunicationLinks(AzureRMModuleBase):
 
         :return: deserialized Server Communication Link instance state dictionary
         '''
-        self.log("Creating / Updating the Server Communication Link instance {0}".format(self.communication_link_name))
+        self.log("Creating / Updating the Server Communication Link instance {0}", self.communication_link_name)
 
         try:
             response = self.mgmt_client.server_communication_links.create_or_update(resource_group_name=self.resource_group,
@@ -223,7 +244,7 @@ class AzureRMServerCommunicationLinks(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Server Communication Link instance.')
+            self.log('Error attempting to create the Server Communication Link instance.', level='error')
             self.fail("Error creating the Server Communication Link instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -233,13 +254,15 @@ class AzureRMServerCommunicationLinks(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Server Communication Link instance {0}".format(self.communication_link_name))
+        self.log("Deleting the Server Communication Link instance {0}", self.communication_link_name)
         try:
             response = self.mgmt_client.server_communication_links.delete(resource_group_name=self.resource_group,
                                                                           server_name=self.server_name,
                                                                           communication_link_name=self.communication_link_name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Server Communication Link instance.')
+            self.log('Error attempting to delete the Server Communication Link instance.', level='error')
             self.fail("Error deleting the Server Communication Link instance: {0}".format(str(e)))
 
         return True
@@ -250,15 +273,15 @@ class AzureRMServerCommunicationLinks(AzureRMModuleBase):
 
         :return: deserialized Server Communication Link instance state dictionary
         '''
-        self.log("Checking if the Server Communication Link instance {0} is present".format(self.communication_link_name))
+        self.log("Checking if the Server Communication Link instance {0} is present", self.communication_link_name)
         found = False
         try:
             response = self.mgmt_client.server_communication_links.get(resource_group_name=self.resource_group,
                                                                        server_name=self.server_name,
                                                                        communication_link_name=self.communication_link_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Server Communication Link instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Server Communication Link instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Server Communication Link instance.')
         if found is True:
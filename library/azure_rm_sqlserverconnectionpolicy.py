@@ -50,6 +50,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -75,9 +82,22 @@ id:
     returned: always
     type: str
     sample: /subscriptions/00000000-1111-2222-3333-444444444444/resourceGroups/test-1234/providers/Microsoft.Sql/servers/test-5678/connectionPolicies/default
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Sql/servers/myServer/connectionPolicies/default",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2014-04-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Sql/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -137,7 +157,8 @@ class AzureRMServerConnectionPolicies(AzureRMModuleBase):
 
         super(AzureRMServerConnectionPolicies, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                               supports_check_mode=True,
-                                                              supports_tags=False)
+                                                              supports_tags=False,
+                                                              supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -168,7 +189,8 @@ class AzureRMServerConnectionPolicies(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Server Connection Policy instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(dict(connection_type=self.connection_type), old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Server Connection Policy instance")
@@ -194,8 +216,7 @@ class AzureRMServerConnectionPolicies(AzureRMModuleBase):
             self.delete_serverconnectionpolicy()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_serverconnectionpolicy():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_serverconnectionpolicy)
         else:
             self.log("Server Connection Policy instance unchanged")
             self.results['changed'] = False
@@ -212,7 +233,7 @@ class AzureRMServerConnectionPolicies(AzureRMModuleBase):
 
         :return: deserialized Server Connection Policy instance state dictionary
         '''
-        self.log("Creating / Updating the Server Connection Policy instance {0}".format(self.connection_policy_name))
+        self.log("Creating / Updating the Server Connection Policy instance {0}", self.connection_policy_name)
 
         try:
             response = self.mgmt_client.server_connection_policies.create_or_update(resource_group_name=self.resource_group,
@@ -223,7 +244,7 @@ class AzureRMServerConnectionPolicies(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Server Connection Policy instance.')
+            self.log('Error attempting to create the Server Connection Policy instance.', level='error')
             self.fail("Error creating the Server Connection Policy instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -233,11 +254,13 @@ class AzureRMServerConnectionPolicies(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Server Connection Policy instance {0}".format(self.connection_policy_name))
+        self.log("Deleting the Server Connection Policy instance {0}", self.connection_policy_name)
         try:
             response = self.mgmt_client.server_connection_policies.delete()
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Server Connection Policy instance.')
+            self.log('Error attempting to delete the Server Connection Policy instance.', level='error')
             self.fail("Error deleting the Server Connection Policy instance: {0}".format(str(e)))
 
         return True
@@ -248,15 +271,15 @@ class AzureRMServerConnectionPolicies(AzureRMModuleBase):
 
         :return: deserialized Server Connection Policy instance state dictionary
         '''
-        self.log("Checking if the Server Connection Policy instance {0} is present".format(self.connection_policy_name))
+        self.log("Checking if the Server Connection Policy instance {0} is present", self.connection_policy_name)
         found = False
         try:
             response = self.mgmt_client.server_connection_policies.get(resource_group_name=self.resource_group,
                                                                        server_name=self.server_name,
                                                                        connection_policy_name=self.connection_policy_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Server Connection Policy instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Server Connection Policy instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Server Connection Policy instance.')
         if found is True:
@@ -34,6 +34,15 @@ options:
         description:
             - The name of the connection policy.
         required: True
+    fields:
+        description:
+            - List of attributes to return for every item, nested attributes are separated by dots, e.g. C(sku.name).
+            - Only the listed attributes are read from the service response and serialized.
+        type: list
+    query:
+        description:
+            - JMESPath expression applied to every returned item, after I(fields). Requires the jmespath package.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -132,7 +141,8 @@ class AzureRMServerConnectionPoliciesFacts(AzureRMModuleBase):
         self.resource_group = None
         self.server_name = None
         self.connection_policy_name = None
-        super(AzureRMServerConnectionPoliciesFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMServerConnectionPoliciesFacts, self).__init__(self.module_arg_spec,
+                                                                   supports_projection=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -158,12 +168,12 @@ class AzureRMServerConnectionPoliciesFacts(AzureRMModuleBase):
             response = self.mgmt_client.server_connection_policies.get(resource_group_name=self.resource_group,
                                                                        server_name=self.server_name,
                                                                        connection_policy_name=self.connection_policy_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
-            self.log('Could not get facts for ServerConnectionPolicies.')
+            self.log('Could not get facts for ServerConnectionPolicies.', level='warning')
 
         if response is not None:
-            results[response.name] = response.as_dict()
+            results[response.name] = self.serialize_facts(response)
 
         return results
 
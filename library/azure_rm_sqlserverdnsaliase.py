@@ -42,6 +42,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -67,9 +74,22 @@ id:
     type: str
     sample: "/subscriptions/00000000-1111-2222-3333-444444444444/resourceGroups/Default/providers/Microsoft.Sql/servers/dns-alias-server/dnsAliases/dns-alias
             -name-1"
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Sql/servers/myServer/dnsAliases/myDnsAlias",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2017-03-01-preview",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Sql/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -121,7 +141,8 @@ class AzureRMServerDnsAliases(AzureRMModuleBase):
 
         super(AzureRMServerDnsAliases, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                       supports_check_mode=True,
-                                                      supports_tags=False)
+                                                      supports_tags=False,
+                                                      supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -152,7 +173,8 @@ class AzureRMServerDnsAliases(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Server Dns Aliase instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(dict(), old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Server Dns Aliase instance")
@@ -178,8 +200,7 @@ class AzureRMServerDnsAliases(AzureRMModuleBase):
             self.delete_serverdnsaliase()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_serverdnsaliase():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_serverdnsaliase)
         else:
             self.log("Server Dns Aliase instance unchanged")
             self.results['changed'] = False
@@ -196,7 +217,7 @@ class AzureRMServerDnsAliases(AzureRMModuleBase):
 
         :return: deserialized Server Dns Aliase instance state dictionary
         '''
-        self.log("Creating / Updating the Server Dns Aliase instance {0}".format(self.dns_alias_name))
+        self.log("Creating / Updating the Server Dns Aliase instance {0}", self.dns_alias_name)
 
         try:
             response = self.mgmt_client.server_dns_aliases.create_or_update(resource_group_name=self.resource_group,
@@ -206,7 +227,7 @@ class AzureRMServerDnsAliases(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Server Dns Aliase instance.')
+            self.log('Error attempting to create the Server Dns Aliase instance.', level='error')
             self.fail("Error creating the Server Dns Aliase instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -216,13 +237,15 @@ class AzureRMServerDnsAliases(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Server Dns Aliase instance {0}".format(self.dns_alias_name))
+        self.log("Deleting the Server Dns Aliase instance {0}", self.dns_alias_name)
         try:
             response = self.mgmt_client.server_dns_aliases.delete(resource_group_name=self.resource_group,
                                                                   server_name=self.server_name,
                                                                   dns_alias_name=self.dns_alias_name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Server Dns Aliase instance.')
+            self.log('Error attempting to delete the Server Dns Aliase instance.', level='error')
             self.fail("Error deleting the Server Dns Aliase instance: {0}".format(str(e)))
 
         return True
@@ -233,15 +256,15 @@ class AzureRMServerDnsAliases(AzureRMModuleBase):
 
         :return: deserialized Server Dns Aliase instance state dictionary
         '''
-        self.log("Checking if the Server Dns Aliase instance {0} is present".format(self.dns_alias_name))
+        self.log("Checking if the Server Dns Aliase instance {0} is present", self.dns_alias_name)
         found = False
         try:
             response = self.mgmt_client.server_dns_aliases.get(resource_group_name=self.resource_group,
                                                                server_name=self.server_name,
                                                                dns_alias_name=self.dns_alias_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Server Dns Aliase instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Server Dns Aliase instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Server Dns Aliase instance.')
         if found is True:
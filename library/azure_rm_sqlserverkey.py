@@ -63,6 +63,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -88,9 +95,22 @@ id:
     type: str
     sample: "/subscriptions/00000000-1111-2222-3333-444444444444/resourceGroups/sqlcrudtest-7398/providers/Microsoft.Sql/servers/sqlcrudtest-4645/keys/someVa
             ult_someKey_01234567890123456789012345678901"
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Sql/servers/myServer/keys/myKey",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2015-05-01-preview",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Sql/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -161,7 +181,8 @@ class AzureRMServerKeys(AzureRMModuleBase):
 
         super(AzureRMServerKeys, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                 supports_check_mode=True,
-                                                supports_tags=False)
+                                                supports_tags=False,
+                                                supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -203,7 +224,8 @@ class AzureRMServerKeys(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Server Key instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.parameters, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Server Key instance")
@@ -229,8 +251,7 @@ class AzureRMServerKeys(AzureRMModuleBase):
             self.delete_serverkey()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_serverkey():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_serverkey)
         else:
             self.log("Server Key instance unchanged")
             self.results['changed'] = False
@@ -247,7 +268,7 @@ class AzureRMServerKeys(AzureRMModuleBase):
 
         :return: deserialized Server Key instance state dictionary
         '''
-        self.log("Creating / Updating the Server Key instance {0}".format(self.key_name))
+        self.log("Creating / Updating the Server Key instance {0}", self.key_name)
 
         try:
             response = self.mgmt_client.server_keys.create_or_update(resource_group_name=self.resource_group,
@@ -258,7 +279,7 @@ class AzureRMServerKeys(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Server Key instance.')
+            self.log('Error attempting to create the Server Key instance.', level='error')
             self.fail("Error creating the Server Key instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -268,13 +289,15 @@ class AzureRMServerKeys(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Server Key instance {0}".format(self.key_name))
+        self.log("Deleting the Server Key instance {0}", self.key_name)
         try:
             response = self.mgmt_client.server_keys.delete(resource_group_name=self.resource_group,
                                                            server_name=self.server_name,
                                                            key_name=self.key_name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Server Key instance.')
+            self.log('Error attempting to delete the Server Key instance.', level='error')
             self.fail("Error deleting the Server Key instance: {0}".format(str(e)))
 
         return True
@@ -285,15 +308,15 @@ class AzureRMServerKeys(AzureRMModuleBase):
 
         :return: deserialized Server Key instance state dictionary
         '''
-        self.log("Checking if the Server Key instance {0} is present".format(self.key_name))
+        self.log("Checking if the Server Key instance {0} is present", self.key_name)
         found = False
         try:
             response = self.mgmt_client.server_keys.get(resource_group_name=self.resource_group,
                                                         server_name=self.server_name,
                                                         key_name=self.key_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Server Key instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Server Key instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Server Key instance.')
         if found is True:
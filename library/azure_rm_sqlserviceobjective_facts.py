@@ -33,6 +33,35 @@ options:
     service_objective_name:
         description:
             - The name of the service objective to retrieve.
+    skip:
+        description:
+            - Number of items to skip before results are collected.
+        type: int
+        default: 0
+    max_items:
+        description:
+            - Maximum number of items to return. Pages are requested from the service only until this many items are collected.
+            - When more items are available, I(next_link) is returned to continue from where this run stopped.
+        type: int
+    next_link:
+        description:
+            - Continuation token returned as I(next_link) by a previous run with I(max_items), used to fetch the following items.
+        type: str
+    filters:
+        description:
+            - Only return items matching all of these filters.
+            - Keys are attribute names, nested attributes are separated by dots, e.g. C(tags.environment). A list of values matches any of them.
+            - Filters are passed to the service where it supports them, otherwise items are matched while the result pages are read.
+        type: dict
+    fields:
+        description:
+            - List of attributes to return for every item, nested attributes are separated by dots, e.g. C(sku.name).
+            - Only the listed attributes are read from the service response and serialized.
+        type: list
+    query:
+        description:
+            - JMESPath expression applied to every returned item, after I(fields). Requires the jmespath package.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -71,6 +100,11 @@ service_objectives:
                     returned: always
                     type: str
                     sample: id
+next_link:
+    description:
+        - Continuation token to pass as I(next_link) to fetch the remaining items.
+    returned: when I(max_items) is set and more items are available
+    type: str
 '''
 
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
@@ -110,7 +144,9 @@ class AzureRMServiceObjectivesFacts(AzureRMModuleBase):
         self.resource_group = None
         self.server_name = None
         self.service_objective_name = None
-        super(AzureRMServiceObjectivesFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMServiceObjectivesFacts, self).__init__(self.module_arg_spec,
+                                                            supports_paging=True,
+                                                            supports_projection=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -139,12 +175,12 @@ class AzureRMServiceObjectivesFacts(AzureRMModuleBase):
             response = self.mgmt_client.service_objectives.get(resource_group_name=self.resource_group,
                                                                server_name=self.server_name,
                                                                service_objective_name=self.service_objective_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
-            self.log('Could not get facts for ServiceObjectives.')
+            self.log('Could not get facts for ServiceObjectives.', level='warning')
 
         if response is not None:
-            results[response.name] = response.as_dict()
+            results[response.name] = self.serialize_facts(response)
 
         return results
 
@@ -159,13 +195,12 @@ class AzureRMServiceObjectivesFacts(AzureRMModuleBase):
         try:
             response = self.mgmt_client.service_objectives.list_by_server(resource_group_name=self.resource_group,
                                                                           server_name=self.server_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
-            self.log('Could not get facts for ServiceObjectives.')
+            self.log('Could not get facts for ServiceObjectives.', level='warning')
 
         if response is not None:
-            for item in response:
-                results[item.name] = item.as_dict()
+            results = self.serialize_paged(response)
 
         return results
 
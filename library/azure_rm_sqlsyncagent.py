@@ -45,6 +45,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -83,9 +90,22 @@ version:
     returned: always
     type: str
     sample: 4.2.0.0
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Sql/servers/myServer/syncAgents/mySyncAgent",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2015-05-01-preview",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Sql/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -141,7 +161,8 @@ class AzureRMSyncAgents(AzureRMModuleBase):
 
         super(AzureRMSyncAgents, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                 supports_check_mode=True,
-                                                supports_tags=False)
+                                                supports_tags=False,
+                                                supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -172,7 +193,8 @@ class AzureRMSyncAgents(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Sync Agent instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(dict(), old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Sync Agent instance")
@@ -198,8 +220,7 @@ class AzureRMSyncAgents(AzureRMModuleBase):
             self.delete_syncagent()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_syncagent():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_syncagent)
         else:
             self.log("Sync Agent instance unchanged")
             self.results['changed'] = False
@@ -218,7 +239,7 @@ class AzureRMSyncAgents(AzureRMModuleBase):
 
         :return: deserialized Sync Agent instance state dictionary
         '''
-        self.log("Creating / Updating the Sync Agent instance {0}".format(self.sync_agent_name))
+        self.log("Creating / Updating the Sync Agent instance {0}", self.sync_agent_name)
 
         try:
             response = self.mgmt_client.sync_agents.create_or_update(resource_group_name=self.resource_group,
@@ -228,7 +249,7 @@ class AzureRMSyncAgents(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Sync Agent instance.')
+            self.log('Error attempting to create the Sync Agent instance.', level='error')
             self.fail("Error creating the Sync Agent instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -238,13 +259,15 @@ class AzureRMSyncAgents(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Sync Agent instance {0}".format(self.sync_agent_name))
+        self.log("Deleting the Sync Agent instance {0}", self.sync_agent_name)
         try:
             response = self.mgmt_client.sync_agents.delete(resource_group_name=self.resource_group,
                                                            server_name=self.server_name,
                                                            sync_agent_name=self.sync_agent_name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Sync Agent instance.')
+            self.log('Error attempting to delete the Sync Agent instance.', level='error')
             self.fail("Error deleting the Sync Agent instance: {0}".format(str(e)))
 
         return True
@@ -255,15 +278,15 @@ class AzureRMSyncAgents(AzureRMModuleBase):
 
         :return: deserialized Sync Agent instance state dictionary
         '''
-        self.log("Checking if the Sync Agent instance {0} is present".format(self.sync_agent_name))
+        self.log("Checking if the Sync Agent instance {0} is present", self.sync_agent_name)
         found = False
         try:
             response = self.mgmt_client.sync_agents.get(resource_group_name=self.resource_group,
                                                         server_name=self.server_name,
                                                         sync_agent_name=self.sync_agent_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Sync Agent instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Sync Agent instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Sync Agent instance.')
         if found is True:
@@ -93,6 +93,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -119,9 +126,22 @@ id:
     type: str
     sample: "/subscriptions/00000000-1111-2222-3333-444444444444/resourceGroups/syncgroupcrud-3521/providers/Microsoft.Sql/servers/syncgroupcrud-8475/databas
             es/syncgroupcrud-4328/syncGroups/syncgroupcrud-3187"
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Sql/servers/myServer/databases/myDatabase/syncGroups/mySyncGroup",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2015-05-01-preview",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Sql/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -200,7 +220,8 @@ class AzureRMSyncGroups(AzureRMModuleBase):
 
         super(AzureRMSyncGroups, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                 supports_check_mode=True,
-                                                supports_tags=False)
+                                                supports_tags=False,
+                                                supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -244,7 +265,8 @@ class AzureRMSyncGroups(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Sync Group instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.parameters, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Sync Group instance")
@@ -270,8 +292,7 @@ class AzureRMSyncGroups(AzureRMModuleBase):
             self.delete_syncgroup()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_syncgroup():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_syncgroup)
         else:
             self.log("Sync Group instance unchanged")
             self.results['changed'] = False
@@ -288,7 +309,7 @@ class AzureRMSyncGroups(AzureRMModuleBase):
 
         :return: deserialized Sync Group instance state dictionary
         '''
-        self.log("Creating / Updating the Sync Group instance {0}".format(self.sync_group_name))
+        self.log("Creating / Updating the Sync Group instance {0}", self.sync_group_name)
 
         try:
             response = self.mgmt_client.sync_groups.create_or_update(resource_group_name=self.resource_group,
@@ -300,7 +321,7 @@ class AzureRMSyncGroups(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Sync Group instance.')
+            self.log('Error attempting to create the Sync Group instance.', level='error')
             self.fail("Error creating the Sync Group instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -310,14 +331,16 @@ class AzureRMSyncGroups(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Sync Group instance {0}".format(self.sync_group_name))
+        self.log("Deleting the Sync Group instance {0}", self.sync_group_name)
         try:
             response = self.mgmt_client.sync_groups.delete(resource_group_name=self.resource_group,
                                                            server_name=self.server_name,
                                                            database_name=self.database_name,
                                                            sync_group_name=self.sync_group_name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Sync Group instance.')
+            self.log('Error attempting to delete the Sync Group instance.', level='error')
             self.fail("Error deleting the Sync Group instance: {0}".format(str(e)))
 
         return True
@@ -328,7 +351,7 @@ class AzureRMSyncGroups(AzureRMModuleBase):
 
         :return: deserialized Sync Group instance state dictionary
         '''
-        self.log("Checking if the Sync Group instance {0} is present".format(self.sync_group_name))
+        self.log("Checking if the Sync Group instance {0} is present", self.sync_group_name)
         found = False
         try:
             response = self.mgmt_client.sync_groups.get(resource_group_name=self.resource_group,
@@ -336,8 +359,8 @@ class AzureRMSyncGroups(AzureRMModuleBase):
                                                         database_name=self.database_name,
                                                         sync_group_name=self.sync_group_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Sync Group instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Sync Group instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Sync Group instance.')
         if found is True:
@@ -81,6 +81,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -108,9 +115,22 @@ id:
     type: str
     sample: "/subscriptions/00000000-1111-2222-3333-444444444444/resourceGroups/syncgroupcrud-65440/providers/Microsoft.Sql/servers/syncgroupcrud-8475/databa
             ses/syncgroupcrud-4328/syncGroups/syncgroupcrud-3187/syncMembers/syncgroupcrud-4879"
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Sql/servers/myServer/databases/myDatabase/syncGroups/mySyncGroup/syncMembers/mySyncMember",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2015-05-01-preview",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Sql/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -203,7 +223,8 @@ class AzureRMSyncMembers(AzureRMModuleBase):
 
         super(AzureRMSyncMembers, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                  supports_check_mode=True,
-                                                 supports_tags=False)
+                                                 supports_tags=False,
+                                                 supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -251,7 +272,8 @@ class AzureRMSyncMembers(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Sync Member instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.parameters, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Sync Member instance")
@@ -277,8 +299,7 @@ class AzureRMSyncMembers(AzureRMModuleBase):
             self.delete_syncmember()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_syncmember():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_syncmember)
         else:
             self.log("Sync Member instance unchanged")
             self.results['changed'] = False
@@ -295,7 +316,7 @@ class AzureRMSyncMembers(AzureRMModuleBase):
 
         :return: deserialized Sync Member instance state dictionary
         '''
-        self.log("Creating / Updating the Sync Member instance {0}".format(self.sync_member_name))
+        self.log("Creating / Updating the Sync Member instance {0}", self.sync_member_name)
 
         try:
             response = self.mgmt_client.sync_members.create_or_update(resource_group_name=self.resource_group,
@@ -308,7 +329,7 @@ class AzureRMSyncMembers(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Sync Member instance.')
+            self.log('Error attempting to create the Sync Member instance.', level='error')
             self.fail("Error creating the Sync Member instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -318,15 +339,17 @@ class AzureRMSyncMembers(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Sync Member instance {0}".format(self.sync_member_name))
+        self.log("Deleting the Sync Member instance {0}", self.sync_member_name)
         try:
             response = self.mgmt_client.sync_members.delete(resource_group_name=self.resource_group,
                                                             server_name=self.server_name,
                                                             database_name=self.database_name,
                                                             sync_group_name=self.sync_group_name,
                                                             sync_member_name=self.sync_member_name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Sync Member instance.')
+            self.log('Error attempting to delete the Sync Member instance.', level='error')
             self.fail("Error deleting the Sync Member instance: {0}".format(str(e)))
 
         return True
@@ -337,7 +360,7 @@ class AzureRMSyncMembers(AzureRMModuleBase):
 
         :return: deserialized Sync Member instance state dictionary
         '''
-        self.log("Checking if the Sync Member instance {0} is present".format(self.sync_member_name))
+        self.log("Checking if the Sync Member instance {0} is present", self.sync_member_name)
         found = False
         try:
             response = self.mgmt_client.sync_members.get(resource_group_name=self.resource_group,
@@ -346,8 +369,8 @@ class AzureRMSyncMembers(AzureRMModuleBase):
                                                          sync_group_name=self.sync_group_name,
                                                          sync_member_name=self.sync_member_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Sync Member instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Sync Member instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Sync Member instance.')
         if found is True:
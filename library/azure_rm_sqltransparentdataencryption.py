@@ -52,6 +52,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -85,9 +92,22 @@ status:
     returned: always
     type: str
     sample: Enabled
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Sql/servers/myServer/databases/myDatabase/transparentDataEncryption/current",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2014-04-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Sql/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -150,7 +170,8 @@ class AzureRMTransparentDataEncryptions(AzureRMModuleBase):
 
         super(AzureRMTransparentDataEncryptions, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                                 supports_check_mode=True,
-                                                                supports_tags=False)
+                                                                supports_tags=False,
+                                                                supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -181,7 +202,8 @@ class AzureRMTransparentDataEncryptions(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Transparent Data Encryption instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(dict(), old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Transparent Data Encryption instance")
@@ -207,8 +229,7 @@ class AzureRMTransparentDataEncryptions(AzureRMModuleBase):
             self.delete_transparentdataencryption()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_transparentdataencryption():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_transparentdataencryption)
         else:
             self.log("Transparent Data Encryption instance unchanged")
             self.results['changed'] = False
@@ -226,7 +247,7 @@ class AzureRMTransparentDataEncryptions(AzureRMModuleBase):
 
         :return: deserialized Transparent Data Encryption instance state dictionary
         '''
-        self.log("Creating / Updating the Transparent Data Encryption instance {0}".format(self.transparent_data_encryption_name))
+        self.log("Creating / Updating the Transparent Data Encryption instance {0}", self.transparent_data_encryption_name)
 
         try:
             response = self.mgmt_client.transparent_data_encryptions.create_or_update(resource_group_name=self.resource_group,
@@ -237,7 +258,7 @@ class AzureRMTransparentDataEncryptions(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Transparent Data Encryption instance.')
+            self.log('Error attempting to create the Transparent Data Encryption instance.', level='error')
             self.fail("Error creating the Transparent Data Encryption instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -247,11 +268,13 @@ class AzureRMTransparentDataEncryptions(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Transparent Data Encryption instance {0}".format(self.transparent_data_encryption_name))
+        self.log("Deleting the Transparent Data Encryption instance {0}", self.transparent_data_encryption_name)
         try:
             response = self.mgmt_client.transparent_data_encryptions.delete()
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Transparent Data Encryption instance.')
+            self.log('Error attempting to delete the Transparent Data Encryption instance.', level='error')
             self.fail("Error deleting the Transparent Data Encryption instance: {0}".format(str(e)))
 
         return True
@@ -262,7 +285,7 @@ class AzureRMTransparentDataEncryptions(AzureRMModuleBase):
 
         :return: deserialized Transparent Data Encryption instance state dictionary
         '''
-        self.log("Checking if the Transparent Data Encryption instance {0} is present".format(self.transparent_data_encryption_name))
+        self.log("Checking if the Transparent Data Encryption instance {0} is present", self.transparent_data_encryption_name)
         found = False
         try:
             response = self.mgmt_client.transparent_data_encryptions.get(resource_group_name=self.resource_group,
@@ -270,8 +293,8 @@ class AzureRMTransparentDataEncryptions(AzureRMModuleBase):
                                                                          database_name=self.database_name,
                                                                          transparent_data_encryption_name=self.transparent_data_encryption_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Transparent Data Encryption instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Transparent Data Encryption instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Transparent Data Encryption instance.')
         if found is True:
@@ -38,6 +38,15 @@ options:
         description:
             - The name of the transparent data encryption configuration.
         required: True
+    fields:
+        description:
+            - List of attributes to return for every item, nested attributes are separated by dots, e.g. C(sku.name).
+            - Only the listed attributes are read from the service response and serialized.
+        type: list
+    query:
+        description:
+            - JMESPath expression applied to every returned item, after I(fields). Requires the jmespath package.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -142,7 +151,8 @@ class AzureRMTransparentDataEncryptionsFacts(AzureRMModuleBase):
         self.server_name = None
         self.database_name = None
         self.transparent_data_encryption_name = None
-        super(AzureRMTransparentDataEncryptionsFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMTransparentDataEncryptionsFacts, self).__init__(self.module_arg_spec,
+                                                                     supports_projection=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -170,12 +180,12 @@ class AzureRMTransparentDataEncryptionsFacts(AzureRMModuleBase):
                                                                          server_name=self.server_name,
                                                                          database_name=self.database_name,
                                                                          transparent_data_encryption_name=self.transparent_data_encryption_name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
-            self.log('Could not get facts for TransparentDataEncryptions.')
+            self.log('Could not get facts for TransparentDataEncryptions.', level='warning')
 
         if response is not None:
-            results[response.name] = response.as_dict()
+            results[response.name] = self.serialize_facts(response)
 
         return results
 
@@ -49,6 +49,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -82,9 +89,22 @@ state:
     returned: always
     type: str
     sample: state
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Sql/servers/myServer/virtualNetworkRules/myVirtualNetworkRule",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2015-05-01-preview",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Sql/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -145,7 +165,8 @@ class AzureRMVirtualNetworkRules(AzureRMModuleBase):
 
         super(AzureRMVirtualNetworkRules, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                          supports_check_mode=True,
-                                                         supports_tags=False)
+                                                         supports_tags=False,
+                                                         supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -176,7 +197,8 @@ class AzureRMVirtualNetworkRules(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Virtual Network Rule instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(dict(virtual_network_subnet_id=self.virtual_network_subnet_id), old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Virtual Network Rule instance")
@@ -202,8 +224,7 @@ class AzureRMVirtualNetworkRules(AzureRMModuleBase):
             self.delete_virtualnetworkrule()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_virtualnetworkrule():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_virtualnetworkrule)
         else:
             self.log("Virtual Network Rule instance unchanged")
             self.results['changed'] = False
@@ -221,7 +242,7 @@ class AzureRMVirtualNetworkRules(AzureRMModuleBase):
 
         :return: deserialized Virtual Network Rule instance state dictionary
         '''
-        self.log("Creating / Updating the Virtual Network Rule instance {0}".format(self.virtual_network_rule_name))
+        self.log("Creating / Updating the Virtual Network Rule instance {0}", self.virtual_network_rule_name)
 
         try:
             response = self.mgmt_client.virtual_network_rules.create_or_update(resource_group_name=self.resource_group,
@@ -232,7 +253,7 @@ class AzureRMVirtualNetworkRules(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Virtual Network Rule instance.')
+            self.log('Error attempting to create the Virtual Network Rule instance.', level='error')
             self.fail("Error creating the Virtual Network Rule instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -242,13 +263,15 @@ class AzureRMVirtualNetworkRules(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Virtual Network Rule instance {0}".format(self.virtual_network_rule_name))
+        self.log("Deleting the Virtual Network Rule instance {0}", self.virtual_network_rule_name)
         try:
             response = self.mgmt_client.virtual_network_rules.delete(resource_group_name=self.resource_group,
                                                                      server_name=self.server_name,
                                                                      virtual_network_rule_name=self.virtual_network_rule_name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Virtual Network Rule instance.')
+            self.log('Error attempting to delete the Virtual Network Rule instance.', level='error')
             self.fail("Error deleting the Virtual Network Rule instance: {0}".format(str(e)))
 
         return True
@@ -259,15 +282,15 @@ class AzureRMVirtualNetworkRules(AzureRMModuleBase):
 
         :return: deserialized Virtual Network Rule instance state dictionary
         '''
-        self.log("Checking if the Virtual Network Rule instance {0} is present".format(self.virtual_network_rule_name))
+        self.log("Checking if the Virtual Network Rule instance {0} is present", self.virtual_network_rule_name)
         found = False
         try:
             response = self.mgmt_client.virtual_network_rules.get(resource_group_name=self.resource_group,
                                                                   server_name=self.server_name,
                                                                   virtual_network_rule_name=self.virtual_network_rule_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Virtual Network Rule instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Virtual Network Rule instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Virtual Network Rule instance.')
         if found is True:
@@ -132,6 +132,7 @@ class AzureRMStorageShare(AzureRMModuleBase):
         return None
 
     def get_file_service(self, resource_group_name, storage_account_name):
+        self.check_data_plane_client('file storage')
         try:
             # Get keys from the storage account
             self.log('Getting keys')
@@ -592,6 +592,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -626,9 +633,28 @@ state:
     returned: always
     type: str
     sample: state
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Web/sites/myWebApp",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2016-08-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Web/...",
+        "location": null,
+        "started": 1525248011
+    }
+patched_fields:
+    description:
+        - Values that differed and were sent with a PATCH request instead of replacing the whole resource.
+    returned: when an existing resource was updated with a PATCH request
+    type: list
+    sample: ["site_config.always_on", "https_only"]
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -746,7 +772,8 @@ class AzureRMWebApps(AzureRMModuleBase):
 
         super(AzureRMWebApps, self).__init__(derived_arg_spec=self.module_arg_spec,
                                              supports_check_mode=True,
-                                             supports_tags=False)
+                                             supports_tags=False,
+                                             supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -871,7 +898,8 @@ class AzureRMWebApps(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Web App instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.site_envelope, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Web App instance")
@@ -897,8 +925,7 @@ class AzureRMWebApps(AzureRMModuleBase):
             self.delete_webapp()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_webapp():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_webapp)
         else:
             self.log("Web App instance unchanged")
             self.results['changed'] = False
@@ -916,17 +943,31 @@ class AzureRMWebApps(AzureRMModuleBase):
 
         :return: deserialized Web App instance state dictionary
         '''
-        self.log("Creating / Updating the Web App instance {0}".format(self.name))
+        self.log("Creating / Updating the Web App instance {0}", self.name)
 
         try:
-            response = self.mgmt_client.web_apps.create_or_update(resource_group_name=self.resource_group,
-                                                                  name=self.name,
-                                                                  site_envelope=self.site_envelope)
+            patch = None
+            if self.to_do == Actions.Update and hasattr(self.mgmt_client.web_apps, 'update'):
+                # location, kind and the cloning or snapshot source can only be set when the app is created
+                patch = self.get_patch_parameters(self.site_envelope, ['enabled', 'host_name_ssl_states', 'server_farm_id',
+                                                                       'reserved', 'site_config', 'scm_site_also_stopped',
+                                                                       'hosting_environment_profile', 'client_affinity_enabled',
+                                                                       'client_cert_enabled', 'host_names_disabled',
+                                                                       'container_size', 'daily_memory_time_quota',
+                                                                       'https_only', 'identity'])
+            if patch is not None:
+                response = self.mgmt_client.web_apps.update(resource_group_name=self.resource_group,
+                                                            name=self.name,
+                                                            site_envelope=patch)
+            else:
+                response = self.mgmt_client.web_apps.create_or_update(resource_group_name=self.resource_group,
+                                                                      name=self.name,
+                                                                      site_envelope=self.site_envelope)
             if isinstance(response, AzureOperationPoller):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Web App instance.')
+            self.log('Error attempting to create the Web App instance.', level='error')
             self.fail("Error creating the Web App instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -936,12 +977,14 @@ class AzureRMWebApps(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Web App instance {0}".format(self.name))
+        self.log("Deleting the Web App instance {0}", self.name)
         try:
             response = self.mgmt_client.web_apps.delete(resource_group_name=self.resource_group,
                                                         name=self.name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Web App instance.')
+            self.log('Error attempting to delete the Web App instance.', level='error')
             self.fail("Error deleting the Web App instance: {0}".format(str(e)))
 
         return True
@@ -952,14 +995,14 @@ class AzureRMWebApps(AzureRMModuleBase):
 
         :return: deserialized Web App instance state dictionary
         '''
-        self.log("Checking if the Web App instance {0} is present".format(self.name))
+        self.log("Checking if the Web App instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.web_apps.get(resource_group_name=self.resource_group,
                                                      name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Web App instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Web App instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Web App instance.')
         if found is True:
@@ -68,6 +68,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -99,9 +106,22 @@ status:
     returned: always
     type: str
     sample: status
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.CertificateRegistration/certificateOrders/myCertificateOrder",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2015-08-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.CertificateRegistration/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -178,7 +198,8 @@ class AzureRMAppServiceCertificateOrders(AzureRMModuleBase):
 
         super(AzureRMAppServiceCertificateOrders, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                                  supports_check_mode=True,
-                                                                 supports_tags=False)
+                                                                 supports_tags=False,
+                                                                 supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -228,7 +249,8 @@ class AzureRMAppServiceCertificateOrders(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if App Service Certificate Order instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.certificate_distinguished_name, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the App Service Certificate Order instance")
@@ -254,8 +276,7 @@ class AzureRMAppServiceCertificateOrders(AzureRMModuleBase):
             self.delete_appservicecertificateorder()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_appservicecertificateorder():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_appservicecertificateorder)
         else:
             self.log("App Service Certificate Order instance unchanged")
             self.results['changed'] = False
@@ -273,7 +294,7 @@ class AzureRMAppServiceCertificateOrders(AzureRMModuleBase):
 
         :return: deserialized App Service Certificate Order instance state dictionary
         '''
-        self.log("Creating / Updating the App Service Certificate Order instance {0}".format(self.certificate_order_name))
+        self.log("Creating / Updating the App Service Certificate Order instance {0}", self.certificate_order_name)
 
         try:
             response = self.mgmt_client.app_service_certificate_orders.create_or_update(resource_group_name=self.resource_group,
@@ -283,7 +304,7 @@ class AzureRMAppServiceCertificateOrders(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the App Service Certificate Order instance.')
+            self.log('Error attempting to create the App Service Certificate Order instance.', level='error')
             self.fail("Error creating the App Service Certificate Order instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -293,12 +314,14 @@ class AzureRMAppServiceCertificateOrders(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the App Service Certificate Order instance {0}".format(self.certificate_order_name))
+        self.log("Deleting the App Service Certificate Order instance {0}", self.certificate_order_name)
         try:
             response = self.mgmt_client.app_service_certificate_orders.delete(resource_group_name=self.resource_group,
                                                                               certificate_order_name=self.certificate_order_name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the App Service Certificate Order instance.')
+            self.log('Error attempting to delete the App Service Certificate Order instance.', level='error')
             self.fail("Error deleting the App Service Certificate Order instance: {0}".format(str(e)))
 
         return True
@@ -309,14 +332,14 @@ class AzureRMAppServiceCertificateOrders(AzureRMModuleBase):
 
         :return: deserialized App Service Certificate Order instance state dictionary
         '''
-        self.log("Checking if the App Service Certificate Order instance {0} is present".format(self.certificate_order_name))
+        self.log("Checking if the App Service Certificate Order instance {0} is present", self.certificate_order_name)
         found = False
         try:
             response = self.mgmt_client.app_service_certificate_orders.get(resource_group_name=self.resource_group,
                                                                            certificate_order_name=self.certificate_order_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("App Service Certificate Order instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("App Service Certificate Order instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the App Service Certificate Order instance.')
         if found is True:
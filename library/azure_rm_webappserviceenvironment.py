@@ -164,6 +164,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -194,9 +201,22 @@ status:
     returned: always
     type: str
     sample: status
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Web/hostingEnvironments/myAppServiceEnvironment",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2016-09-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Web/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -314,7 +334,8 @@ class AzureRMAppServiceEnvironments(AzureRMModuleBase):
 
         super(AzureRMAppServiceEnvironments, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                             supports_check_mode=True,
-                                                            supports_tags=False)
+                                                            supports_tags=False,
+                                                            supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -347,13 +368,14 @@ class AzureRMAppServiceEnvironments(AzureRMModuleBase):
                     self.hosting_environment_envelope["multi_role_count"] = kwargs[key]
                 elif key == "worker_pools":
                     ev = kwargs[key]
-                    if 'compute_mode' in ev:
-                        if ev['compute_mode'] == 'shared':
-                            ev['compute_mode'] = 'Shared'
-                        elif ev['compute_mode'] == 'dedicated':
-                            ev['compute_mode'] = 'Dedicated'
-                        elif ev['compute_mode'] == 'dynamic':
-                            ev['compute_mode'] = 'Dynamic'
+                    for pool in ev:
+                        if 'compute_mode' in pool:
+                            if pool['compute_mode'] == 'shared':
+                                pool['compute_mode'] = 'Shared'
+                            elif pool['compute_mode'] == 'dedicated':
+                                pool['compute_mode'] = 'Dedicated'
+                            elif pool['compute_mode'] == 'dynamic':
+                                pool['compute_mode'] = 'Dynamic'
                     self.hosting_environment_envelope["worker_pools"] = ev
                 elif key == "ipssl_address_count":
                     self.hosting_environment_envelope["ipssl_address_count"] = kwargs[key]
@@ -402,7 +424,8 @@ class AzureRMAppServiceEnvironments(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if App Service Environment instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.hosting_environment_envelope, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the App Service Environment instance")
@@ -428,8 +451,7 @@ class AzureRMAppServiceEnvironments(AzureRMModuleBase):
             self.delete_appserviceenvironment()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_appserviceenvironment():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_appserviceenvironment)
         else:
             self.log("App Service Environment instance unchanged")
             self.results['changed'] = False
@@ -447,7 +469,7 @@ class AzureRMAppServiceEnvironments(AzureRMModuleBase):
 
         :return: deserialized App Service Environment instance state dictionary
         '''
-        self.log("Creating / Updating the App Service Environment instance {0}".format(self.name))
+        self.log("Creating / Updating the App Service Environment instance {0}", self.name)
 
         try:
             response = self.mgmt_client.app_service_environments.create_or_update(resource_group_name=self.resource_group,
@@ -457,7 +479,7 @@ class AzureRMAppServiceEnvironments(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the App Service Environment instance.')
+            self.log('Error attempting to create the App Service Environment instance.', level='error')
             self.fail("Error creating the App Service Environment instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -467,12 +489,14 @@ class AzureRMAppServiceEnvironments(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the App Service Environment instance {0}".format(self.name))
+        self.log("Deleting the App Service Environment instance {0}", self.name)
         try:
             response = self.mgmt_client.app_service_environments.delete(resource_group_name=self.resource_group,
                                                                         name=self.name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the App Service Environment instance.')
+            self.log('Error attempting to delete the App Service Environment instance.', level='error')
             self.fail("Error deleting the App Service Environment instance: {0}".format(str(e)))
 
         return True
@@ -483,14 +507,14 @@ class AzureRMAppServiceEnvironments(AzureRMModuleBase):
 
         :return: deserialized App Service Environment instance state dictionary
         '''
-        self.log("Checking if the App Service Environment instance {0} is present".format(self.name))
+        self.log("Checking if the App Service Environment instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.app_service_environments.get(resource_group_name=self.resource_group,
                                                                      name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("App Service Environment instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("App Service Environment instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the App Service Environment instance.')
         if found is True:
@@ -131,6 +131,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -169,9 +176,22 @@ status:
     returned: always
     type: str
     sample: Ready
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Web/serverfarms/myAppServicePlan",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2016-09-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Web/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -258,7 +278,8 @@ class AzureRMAppServicePlans(AzureRMModuleBase):
 
         super(AzureRMAppServicePlans, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                      supports_check_mode=True,
-                                                     supports_tags=False)
+                                                     supports_tags=False,
+                                                     supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -316,7 +337,8 @@ class AzureRMAppServicePlans(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if App Service Plan instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.app_service_plan, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the App Service Plan instance")
@@ -342,8 +364,7 @@ class AzureRMAppServicePlans(AzureRMModuleBase):
             self.delete_appserviceplan()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_appserviceplan():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_appserviceplan)
         else:
             self.log("App Service Plan instance unchanged")
             self.results['changed'] = False
@@ -361,7 +382,7 @@ class AzureRMAppServicePlans(AzureRMModuleBase):
 
         :return: deserialized App Service Plan instance state dictionary
         '''
-        self.log("Creating / Updating the App Service Plan instance {0}".format(self.name))
+        self.log("Creating / Updating the App Service Plan instance {0}", self.name)
 
         try:
             response = self.mgmt_client.app_service_plans.create_or_update(resource_group_name=self.resource_group,
@@ -371,7 +392,7 @@ class AzureRMAppServicePlans(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the App Service Plan instance.')
+            self.log('Error attempting to create the App Service Plan instance.', level='error')
             self.fail("Error creating the App Service Plan instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -381,12 +402,14 @@ class AzureRMAppServicePlans(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the App Service Plan instance {0}".format(self.name))
+        self.log("Deleting the App Service Plan instance {0}", self.name)
         try:
             response = self.mgmt_client.app_service_plans.delete(resource_group_name=self.resource_group,
                                                                  name=self.name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the App Service Plan instance.')
+            self.log('Error attempting to delete the App Service Plan instance.', level='error')
             self.fail("Error deleting the App Service Plan instance: {0}".format(str(e)))
 
         return True
@@ -397,14 +420,14 @@ class AzureRMAppServicePlans(AzureRMModuleBase):
 
         :return: deserialized App Service Plan instance state dictionary
         '''
-        self.log("Checking if the App Service Plan instance {0} is present".format(self.name))
+        self.log("Checking if the App Service Plan instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.app_service_plans.get(resource_group_name=self.resource_group,
                                                               name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("App Service Plan instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("App Service Plan instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the App Service Plan instance.')
         if found is True:
@@ -64,6 +64,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -88,9 +95,22 @@ id:
     returned: always
     type: str
     sample: /subscriptions/34adfa4f-cedf-4dc0-ba29-b6d1a69ab345/resourceGroups/testrg123/providers/Microsoft.Web/certificates/testc6282
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.Web/certificates/myCertificate",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2016-03-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.Web/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -163,7 +183,8 @@ class AzureRMCertificates(AzureRMModuleBase):
 
         super(AzureRMCertificates, self).__init__(derived_arg_spec=self.module_arg_spec,
                                                   supports_check_mode=True,
-                                                  supports_tags=False)
+                                                  supports_tags=False,
+                                                  supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -211,7 +232,8 @@ class AzureRMCertificates(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Certificate instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.certificate_envelope, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Certificate instance")
@@ -237,8 +259,7 @@ class AzureRMCertificates(AzureRMModuleBase):
             self.delete_certificate()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_certificate():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_certificate)
         else:
             self.log("Certificate instance unchanged")
             self.results['changed'] = False
@@ -255,7 +276,7 @@ class AzureRMCertificates(AzureRMModuleBase):
 
         :return: deserialized Certificate instance state dictionary
         '''
-        self.log("Creating / Updating the Certificate instance {0}".format(self.name))
+        self.log("Creating / Updating the Certificate instance {0}", self.name)
 
         try:
             response = self.mgmt_client.certificates.create_or_update(resource_group_name=self.resource_group,
@@ -265,7 +286,7 @@ class AzureRMCertificates(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Certificate instance.')
+            self.log('Error attempting to create the Certificate instance.', level='error')
             self.fail("Error creating the Certificate instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -275,12 +296,14 @@ class AzureRMCertificates(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Certificate instance {0}".format(self.name))
+        self.log("Deleting the Certificate instance {0}", self.name)
         try:
             response = self.mgmt_client.certificates.delete(resource_group_name=self.resource_group,
                                                             name=self.name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Certificate instance.')
+            self.log('Error attempting to delete the Certificate instance.', level='error')
             self.fail("Error deleting the Certificate instance: {0}".format(str(e)))
 
         return True
@@ -291,14 +314,14 @@ class AzureRMCertificates(AzureRMModuleBase):
 
         :return: deserialized Certificate instance state dictionary
         '''
-        self.log("Checking if the Certificate instance {0} is present".format(self.name))
+        self.log("Checking if the Certificate instance {0} is present", self.name)
         found = False
         try:
             response = self.mgmt_client.certificates.get(resource_group_name=self.resource_group,
                                                          name=self.name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Certificate instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Certificate instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Certificate instance.')
         if found is True:
@@ -318,6 +318,13 @@ options:
       choices:
         - absent
         - present
+    wait:
+      description:
+        - Wait for the long running create, update or delete operation to complete.
+        - When C(no), the module returns as soon as the operation has been accepted and returns its handle in I(operation).
+        - Pass the handles to M(azure_rm_operation_wait) to wait for them later.
+      type: bool
+      default: 'yes'
 
 extends_documentation_fragment:
     - azure
@@ -342,9 +349,22 @@ id:
     returned: always
     type: str
     sample: id
+operation:
+    description:
+        - Handle of the long running operation which was started, see M(azure_rm_operation_wait).
+    returned: when I(wait=no) and an operation was started
+    type: dict
+    sample: {
+        "id": "/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/myResourceGroup/providers/Microsoft.DomainRegistration/domains/myDomain",
+        "method": "PUT",
+        "endpoint": "https://management.azure.com",
+        "api_version": "2015-04-01",
+        "azure_async_operation": "https://management.azure.com/subscriptions/00000000-0000-0000-0000-000000000000/providers/Microsoft.DomainRegistration/...",
+        "location": null,
+        "started": 1525248011
+    }
 '''
 
-import time
 from ansible.module_utils.azure_rm_common import AzureRMModuleBase
 
 try:
@@ -435,7 +455,8 @@ class AzureRMDomains(AzureRMModuleBase):
 
         super(AzureRMDomains, self).__init__(derived_arg_spec=self.module_arg_spec,
                                              supports_check_mode=True,
-                                             supports_tags=False)
+                                             supports_tags=False,
+                                             supports_async=True)
 
     def exec_module(self, **kwargs):
         """Main module execution method"""
@@ -493,7 +514,8 @@ class AzureRMDomains(AzureRMModuleBase):
                 self.to_do = Actions.Delete
             elif self.state == 'present':
                 self.log("Need to check if Domain instance has to be deleted or may be updated")
-                self.to_do = Actions.Update
+                if self.is_update_needed(self.domain, old_response):
+                    self.to_do = Actions.Update
 
         if (self.to_do == Actions.Create) or (self.to_do == Actions.Update):
             self.log("Need to Create / Update the Domain instance")
@@ -519,8 +541,7 @@ class AzureRMDomains(AzureRMModuleBase):
             self.delete_domain()
             # make sure instance is actually deleted, for some Azure resources, instance is hanging around
             # for some time after deletion -- this should be really fixed in Azure
-            while self.get_domain():
-                time.sleep(20)
+            self.wait_for_deletion(self.get_domain)
         else:
             self.log("Domain instance unchanged")
             self.results['changed'] = False
@@ -537,7 +558,7 @@ class AzureRMDomains(AzureRMModuleBase):
 
         :return: deserialized Domain instance state dictionary
         '''
-        self.log("Creating / Updating the Domain instance {0}".format(self.domain_name))
+        self.log("Creating / Updating the Domain instance {0}", self.domain_name)
 
         try:
             response = self.mgmt_client.domains.create_or_update(resource_group_name=self.resource_group,
@@ -547,7 +568,7 @@ class AzureRMDomains(AzureRMModuleBase):
                 response = self.get_poller_result(response)
 
         except CloudError as exc:
-            self.log('Error attempting to create the Domain instance.')
+            self.log('Error attempting to create the Domain instance.', level='error')
             self.fail("Error creating the Domain instance: {0}".format(str(exc)))
         return response.as_dict()
 
@@ -557,12 +578,14 @@ class AzureRMDomains(AzureRMModuleBase):
 
         :return: True
         '''
-        self.log("Deleting the Domain instance {0}".format(self.domain_name))
+        self.log("Deleting the Domain instance {0}", self.domain_name)
         try:
             response = self.mgmt_client.domains.delete(resource_group_name=self.resource_group,
                                                        domain_name=self.domain_name)
+            if isinstance(response, AzureOperationPoller):
+                response = self.get_poller_result(response)
         except CloudError as e:
-            self.log('Error attempting to delete the Domain instance.')
+            self.log('Error attempting to delete the Domain instance.', level='error')
             self.fail("Error deleting the Domain instance: {0}".format(str(e)))
 
         return True
@@ -573,14 +596,14 @@ class AzureRMDomains(AzureRMModuleBase):
 
         :return: deserialized Domain instance state dictionary
         '''
-        self.log("Checking if the Domain instance {0} is present".format(self.domain_name))
+        self.log("Checking if the Domain instance {0} is present", self.domain_name)
         found = False
         try:
             response = self.mgmt_client.domains.get(resource_group_name=self.resource_group,
                                                     domain_name=self.domain_name)
             found = True
-            self.log("Response : {0}".format(response))
-            self.log("Domain instance : {0} found".format(response.name))
+            self.log("Response : {0}", response)
+            self.log("Domain instance : {0} found", response.name)
         except CloudError as e:
             self.log('Did not find the Domain instance.')
         if found is True:
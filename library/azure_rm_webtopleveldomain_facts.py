@@ -26,6 +26,15 @@ options:
         description:
             - Name of the top-level domain.
         required: True
+    fields:
+        description:
+            - List of attributes to return for every item, nested attributes are separated by dots, e.g. C(sku.name).
+            - Only the listed attributes are read from the service response and serialized.
+        type: list
+    query:
+        description:
+            - JMESPath expression applied to every returned item, after I(fields). Requires the jmespath package.
+        type: str
 
 extends_documentation_fragment:
     - azure
@@ -105,7 +114,8 @@ class AzureRMTopLevelDomainsFacts(AzureRMModuleBase):
         )
         self.mgmt_client = None
         self.name = None
-        super(AzureRMTopLevelDomainsFacts, self).__init__(self.module_arg_spec)
+        super(AzureRMTopLevelDomainsFacts, self).__init__(self.module_arg_spec,
+                                                          supports_projection=True)
 
     def exec_module(self, **kwargs):
         for key in self.module_arg_spec:
@@ -127,12 +137,12 @@ class AzureRMTopLevelDomainsFacts(AzureRMModuleBase):
         results = {}
         try:
             response = self.mgmt_client.top_level_domains.get(name=self.name)
-            self.log("Response : {0}".format(response))
+            self.log("Response : {0}", response)
         except CloudError as e:
-            self.log('Could not get facts for TopLevelDomains.')
+            self.log('Could not get facts for TopLevelDomains.', level='warning')
 
         if response is not None:
-            results[response.name] = response.as_dict()
+            results[response.name] = self.serialize_facts(response)
 
         return results
 
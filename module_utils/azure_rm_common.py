@@ -18,15 +18,27 @@
 
 import json
 import os
+import base64
+import datetime
 import re
 import sys
 import copy
+import time
+import random
+import hashlib
 import inspect
+import tempfile
+import threading
 import traceback
+import cProfile
 
+from contextlib import contextmanager
+from multiprocessing.pool import ThreadPool
 from os.path import expanduser
 
 from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils import basic
+from ansible.module_utils._text import to_bytes, to_text
 from ansible.module_utils.six.moves import configparser
 import ansible.module_utils.six.moves.urllib.parse as urlparse
 try:
@@ -34,6 +46,12 @@ try:
 except ImportError:
     ANSIBLE_VERSION = 'unknown'
 
+try:
+    import fcntl
+except ImportError:
+    # no advisory locking available (Windows), cache files are used without locks
+    fcntl = None
+
 AZURE_COMMON_ARGS = dict(
     auth_source=dict(
         type='str',
@@ -47,8 +65,10 @@ AZURE_COMMON_ARGS = dict(
     ad_user=dict(type='str', no_log=True),
     password=dict(type='str', no_log=True),
     cloud_environment=dict(type='str'),
-    cert_validation_mode=dict(type='str', choices=['validate', 'ignore'])
-    # debug=dict(type='bool', default=False),
+    cert_validation_mode=dict(type='str', choices=['validate', 'ignore']),
+    log_mode=dict(type='str', choices=['file']),
+    log_path=dict(type='path'),
+    log_level=dict(type='str', choices=['debug', 'info', 'warning', 'error'], default='debug'),
 )
 
 AZURE_CREDENTIAL_ENV_MAPPING = dict(
@@ -68,6 +88,29 @@ AZURE_TAG_ARGS = dict(
     append_tags=dict(type='bool', default=True),
 )
 
+AZURE_ASYNC_ARGS = dict(
+    wait=dict(type='bool', default=True),
+)
+
+AZURE_PAGING_ARGS = dict(
+    skip=dict(type='int', default=0),
+    max_items=dict(type='int'),
+    next_link=dict(type='str'),
+)
+
+AZURE_FILTER_ARGS = dict(
+    filters=dict(type='dict'),
+)
+
+AZURE_PROJECTION_ARGS = dict(
+    fields=dict(type='list'),
+    query=dict(type='str'),
+)
+
+AZURE_ITEMS_ARGS = dict(
+    concurrency=dict(type='int'),
+)
+
 AZURE_COMMON_REQUIRED_IF = [
     ('log_mode', 'file', ['log_path'])
 ]
@@ -82,6 +125,140 @@ CIDR_PATTERN = re.compile(r"(([0-9]|[1-9][0-9]|1[0-9]{2}|2[0-4][0-9]|25[0-5])\.)
 AZURE_SUCCESS_STATE = "Succeeded"
 AZURE_FAILED_STATE = "Failed"
 
+# AAD tokens are cached on disk so consecutive module runs can skip the token round-trip.
+# Set ANSIBLE_AZURE_TOKEN_CACHE to another path to relocate the cache, or to 'off' to disable it.
+AZURE_TOKEN_CACHE_ENV = 'ANSIBLE_AZURE_TOKEN_CACHE'
+AZURE_TOKEN_CACHE_PATH = '~/.azure/ansible_token_cache.json'
+# a cached token is only reused while it stays valid for at least this many seconds
+AZURE_TOKEN_REFRESH_MARGIN = 300
+
+AZURE_DISABLED_VALUES = ['off', 'false', 'no', '0', 'none']
+
+# Long running operations are polled with exponential backoff: the first status check happens after
+# AZURE_POLL_INITIAL_DELAY seconds and the delay doubles up to ANSIBLE_AZURE_POLL_MAX_DELAY.
+# ANSIBLE_AZURE_POLL_TIMEOUT bounds the overall wait, there is no limit by default.
+AZURE_POLL_INITIAL_DELAY = 1
+AZURE_POLL_MAX_DELAY_ENV = 'ANSIBLE_AZURE_POLL_MAX_DELAY'
+AZURE_POLL_MAX_DELAY = 30
+AZURE_POLL_TIMEOUT_ENV = 'ANSIBLE_AZURE_POLL_TIMEOUT'
+AZURE_POLL_JITTER = 0.2
+
+# After a delete, the resource is looked up again after AZURE_DELETE_INITIAL_DELAY seconds, then with
+# doubling delays up to AZURE_DELETE_MAX_DELAY, for at most ANSIBLE_AZURE_DELETE_TIMEOUT seconds.
+AZURE_DELETE_INITIAL_DELAY = 0.5
+AZURE_DELETE_MAX_DELAY = 20
+AZURE_DELETE_TIMEOUT_ENV = 'ANSIBLE_AZURE_DELETE_TIMEOUT'
+AZURE_DELETE_TIMEOUT = 1800
+
+# Management clients are shared by all module instances of a process (persistent workers, threads).
+# ANSIBLE_AZURE_CLIENT_POOL=off disables sharing, the connection pool of every client session is
+# sized with ANSIBLE_AZURE_POOL_CONNECTIONS hosts of ANSIBLE_AZURE_POOL_MAXSIZE connections each.
+AZURE_CLIENT_POOL_ENV = 'ANSIBLE_AZURE_CLIENT_POOL'
+AZURE_POOL_CONNECTIONS_ENV = 'ANSIBLE_AZURE_POOL_CONNECTIONS'
+AZURE_POOL_CONNECTIONS = 10
+AZURE_POOL_MAXSIZE_ENV = 'ANSIBLE_AZURE_POOL_MAXSIZE'
+AZURE_POOL_MAXSIZE = 10
+
+# ARM allows 12000 reads, 1200 writes and 15000 deletes per subscription and hour. All module processes record
+# the x-ms-ratelimit-remaining-subscription-* headers in the ANSIBLE_AZURE_THROTTLE state file, and once the
+# remaining budget falls below AZURE_THROTTLE_LOW_WATER they space their requests so that the budget refills
+# faster than it is consumed. ANSIBLE_AZURE_THROTTLE=off disables the governor.
+AZURE_THROTTLE_ENV = 'ANSIBLE_AZURE_THROTTLE'
+AZURE_THROTTLE_PATH = '~/.azure/ansible_throttle.json'
+AZURE_THROTTLE_QUOTAS = dict(reads=12000, writes=1200, deletes=15000)
+AZURE_THROTTLE_LOW_WATER = dict(reads=1200, writes=120, deletes=1500)
+AZURE_THROTTLE_MAX_DELAY = 60
+# requests rejected with 429 are sent again, after Retry-After, this many times
+AZURE_THROTTLE_RETRIES = 3
+
+# Resource groups fetched by get_resource_group are cached in ANSIBLE_AZURE_RESOURCE_GROUP_CACHE for
+# ANSIBLE_AZURE_RESOURCE_GROUP_CACHE_TTL seconds, 'off' disables the cache. The entry of a resource group is
+# dropped whenever a management client creates, updates or deletes it.
+AZURE_RESOURCE_GROUP_CACHE_ENV = 'ANSIBLE_AZURE_RESOURCE_GROUP_CACHE'
+AZURE_RESOURCE_GROUP_CACHE_PATH = '~/.azure/ansible_resource_groups.json'
+AZURE_RESOURCE_GROUP_CACHE_TTL_ENV = 'ANSIBLE_AZURE_RESOURCE_GROUP_CACHE_TTL'
+AZURE_RESOURCE_GROUP_CACHE_TTL = 300
+
+# ANSIBLE_AZURE_TIMINGS=on adds a _timings block to the module result: seconds spent authenticating, looking up
+# resource groups, waiting for long running operations and in exec_module, and every request sent by the management
+# clients. ANSIBLE_AZURE_TRACE_FILE appends the same records to a file as OpenTelemetry (OTLP JSON) spans, one line
+# per module run, under the trace ANSIBLE_AZURE_TRACE_ID when it is set so that all tasks of a play share one trace.
+AZURE_TIMINGS_ENV = 'ANSIBLE_AZURE_TIMINGS'
+AZURE_TRACE_FILE_ENV = 'ANSIBLE_AZURE_TRACE_FILE'
+AZURE_TRACE_ID_ENV = 'ANSIBLE_AZURE_TRACE_ID'
+# throttle waits shorter than this are not worth a phase record
+AZURE_TIMINGS_MIN_WAIT = 0.01
+
+# ANSIBLE_AZURE_PROFILE=<directory> runs exec_module under cProfile and tracemalloc and writes
+# <module>-<arguments hash>-<time>-<pid>.pstats and a summary of the ANSIBLE_AZURE_PROFILE_TOP lines allocating
+# the most memory (.alloc.txt) to the directory. ANSIBLE_AZURE_PROFILE_MODE=cpu or memory keeps one profiler only.
+AZURE_PROFILE_ENV = 'ANSIBLE_AZURE_PROFILE'
+AZURE_PROFILE_MODE_ENV = 'ANSIBLE_AZURE_PROFILE_MODE'
+AZURE_PROFILE_TOP_ENV = 'ANSIBLE_AZURE_PROFILE_TOP'
+AZURE_PROFILE_TOP = 25
+
+# ANSIBLE_AZURE_WORKER=on runs modules in persistent worker processes listening on Unix sockets in
+# ANSIBLE_AZURE_WORKER_DIR, see azure_rm_worker. A worker runs up to ANSIBLE_AZURE_WORKER_PROCESSES modules at a
+# time, each process is replaced after ANSIBLE_AZURE_WORKER_MAX_REQUESTS modules, and it exits after
+# ANSIBLE_AZURE_WORKER_IDLE_TIMEOUT seconds without work.
+AZURE_WORKER_ENV = 'ANSIBLE_AZURE_WORKER'
+AZURE_WORKER_DIR_ENV = 'ANSIBLE_AZURE_WORKER_DIR'
+AZURE_WORKER_DIR = '~/.azure/ansible_workers'
+AZURE_WORKER_PROCESSES_ENV = 'ANSIBLE_AZURE_WORKER_PROCESSES'
+AZURE_WORKER_PROCESSES = 8
+AZURE_WORKER_IDLE_TIMEOUT_ENV = 'ANSIBLE_AZURE_WORKER_IDLE_TIMEOUT'
+AZURE_WORKER_IDLE_TIMEOUT = 300
+AZURE_WORKER_MAX_REQUESTS_ENV = 'ANSIBLE_AZURE_WORKER_MAX_REQUESTS'
+AZURE_WORKER_MAX_REQUESTS = 200
+
+# When ANSIBLE_AZURE_TEMPLATE names a file, PUT requests are appended to it as JSON lines instead of being sent
+# and answered as if the resource was created, other writes are rejected, and so are modules using data plane
+# clients, which bypass AzureRMHTTPAdapter. azure_rm_bundle runs modules this way to turn them into ARM
+# template resources.
+AZURE_TEMPLATE_ENV = 'ANSIBLE_AZURE_TEMPLATE'
+
+# Executed by the interpreter started by run_module: import modules from the same places as the calling
+# module, then run the module file with the arguments read from stdin. When usage is requested, the peak
+# resident set size is written to stderr on exit.
+AZURE_MODULE_BOOTSTRAP = """
+import json, runpy, sys
+config = json.loads(sys.argv[1])
+sys.argv = [config['path']]
+sys.path[:] = config['sys_path']
+import ansible.module_utils
+ansible.module_utils.__path__[:] = config['module_utils_path']
+from ansible.module_utils import basic
+basic._ANSIBLE_ARGS = getattr(sys.stdin, 'buffer', sys.stdin).read()
+if config.get('usage'):
+    import atexit, resource
+    atexit.register(lambda: sys.stderr.write('\\nmax_rss_kb=%d\\n' % resource.getrusage(resource.RUSAGE_SELF).ru_maxrss))
+runpy.run_path(config['path'], run_name='__main__')
+"""
+
+# log() records at or above log_level are appended as JSON lines to log_path when log_mode is 'file'
+AZURE_LOG_LEVELS = dict(debug=10, info=20, warning=30, error=40)
+AZURE_LOG_LOCK = threading.Lock()
+
+# msrest Serializers used by serialize_obj, keyed by the tuple of enum modules their dependencies come from
+AZURE_SERIALIZERS = dict()
+AZURE_SERIALIZERS_LOCK = threading.Lock()
+
+# Top level keys describing the resource rather than its desired state, never compared by resource_differences().
+AZURE_COMPARE_IGNORED_KEYS = ['id', 'name', 'type', 'etag', 'provisioning_state', 'resource_guid']
+# Write-only or create-time values the service does not return, compared only when they are returned.
+AZURE_COMPARE_WRITE_ONLY_KEYS = ['password', 'admin_password', 'administrator_login_password', 'hub_database_password',
+                                 'create_mode', 'source_database_id', 'source_database_deletion_date',
+                                 'restore_point_in_time', 'recovery_services_recovery_point_resource_id', 'service_uri',
+                                 'consent', 'data']
+# ISO 8601 date and time, with optional fraction of seconds and UTC offset, compared as the instant it denotes.
+AZURE_COMPARE_DATETIME = re.compile(r'^(\d{4})-(\d{2})-(\d{2})[T ](\d{2}):(\d{2}):(\d{2})(?:\.(\d+))?'
+                                    r'(Z|[+-]\d{2}:?\d{2})?$', re.IGNORECASE)
+
+# default number of resource groups queried at the same time by facts modules
+AZURE_FACTS_CONCURRENCY = 8
+# default number of items created, updated or deleted at the same time by modules run with items
+AZURE_ITEMS_CONCURRENCY = 8
+
 HAS_AZURE = True
 HAS_AZURE_EXC = None
 HAS_AZURE_CLI_CORE = True
@@ -112,26 +289,20 @@ except ImportError as exc:
     HAS_MSRESTAZURE_EXC = exc
     HAS_MSRESTAZURE = False
 
+try:
+    from requests.adapters import HTTPAdapter
+    from requests.models import Response
+except ImportError:
+    # requests comes with msrest, its absence is reported as missing msrestazure
+    HTTPAdapter = object
+    Response = None
+
 try:
     from enum import Enum
     from msrestazure.azure_exceptions import CloudError
     from msrestazure.tools import resource_id, is_valid_resource_id
     from msrestazure import azure_cloud
     from azure.common.credentials import ServicePrincipalCredentials, UserPassCredentials
-    from azure.mgmt.network.version import VERSION as network_client_version
-    from azure.mgmt.storage.version import VERSION as storage_client_version
-    from azure.mgmt.compute.version import VERSION as compute_client_version
-    from azure.mgmt.resource.version import VERSION as resource_client_version
-    from azure.mgmt.dns.version import VERSION as dns_client_version
-    from azure.mgmt.web.version import VERSION as web_client_version
-    from azure.mgmt.network import NetworkManagementClient
-    from azure.mgmt.resource.resources import ResourceManagementClient
-    from azure.mgmt.storage import StorageManagementClient
-    from azure.mgmt.compute import ComputeManagementClient
-    from azure.mgmt.dns import DnsManagementClient
-    from azure.mgmt.web import WebSiteManagementClient
-    from azure.mgmt.containerservice import ContainerServiceClient
-    from azure.storage.cloudstorageaccount import CloudStorageAccount
 except ImportError as exc:
     HAS_AZURE_EXC = exc
     HAS_AZURE = False
@@ -144,6 +315,18 @@ except ImportError:
     HAS_AZURE_CLI_CORE = False
     CLIError = Exception
 
+try:
+    import jmespath
+    HAS_JMESPATH = True
+except ImportError:
+    HAS_JMESPATH = False
+
+try:
+    import tracemalloc
+except ImportError:
+    # Python 2, memory profiles are not available
+    tracemalloc = None
+
 
 def azure_id_to_dict(id):
     pieces = re.sub(r'^\/', '', id).split('/')
@@ -162,56 +345,883 @@ def format_resource_id(val, subscription_id, namespace, types, resource_group):
                        type=types,
                        subscription=subscription_id) if not is_valid_resource_id(val) else val
 
+
+def resource_differences(desired, actual, enum_values=None):
+    '''
+    Compare the desired state of a resource, as sent to create_or_update, with its actual state, as returned
+    by as_dict(), and list the differences.
+
+    Only values present in desired are compared, so read-only and server-defaulted values never count as
+    differences, and empty desired lists, dicts and strings match values the service omits. Strings compare
+    exactly, except enum members, locations and resource ids which compare case insensitively, locations also
+    ignoring spaces, and dates and times which compare as the instant they denote. Lists of dicts with a name are matched by name and other lists are compared regardless
+    of order.
+
+    :param desired: dict of desired values
+    :param actual: dict of actual values
+    :param enum_values: set of enum members, as returned by enum_key(), compared case insensitively
+    :return: list of dotted paths of the values that differ
+    '''
+    differences = []
+    for key, value in desired.items():
+        if key not in AZURE_COMPARE_IGNORED_KEYS:
+            _collect_differences(value, actual, key, key, differences, enum_values or set())
+    return differences
+
+
+def enum_key(value):
+    '''
+    Normalized enum member, 'Standard_LRS', 'standard_lrs' and 'StandardLRS' giving the same key.
+    '''
+    return re.sub(r'[\s_-]', '', to_text(value)).lower()
+
+
+def get_enum_values(argument_spec):
+    '''
+    Choices of the options and suboptions of an argument spec, the enum members modules send.
+
+    :param argument_spec: module argument spec
+    :return: set of enum_key() of the choices
+    '''
+    values = set()
+    for option in (argument_spec or dict()).values():
+        values.update(enum_key(choice) for choice in option.get('choices') or [])
+        values.update(get_enum_values(option.get('options')))
+    return values
+
+
+def _collect_differences(desired, parent, key, path, differences, enum_values):
+    actual = parent.get(key) if isinstance(parent, dict) else None
+    if desired is None or (actual is None and key in AZURE_COMPARE_WRITE_ONLY_KEYS):
+        return
+    if actual is None and desired in ([], dict(), ''):
+        # the service omits empty values
+        return
+    if isinstance(desired, dict):
+        if not isinstance(actual, dict):
+            differences.append(path)
+            return
+        for child in desired:
+            if key == 'tags':
+                if to_text(desired[child]) != to_text(actual.get(child)):
+                    differences.append('{0}.{1}'.format(path, child))
+            else:
+                _collect_differences(desired[child], actual, child, '{0}.{1}'.format(path, child), differences, enum_values)
+    elif isinstance(desired, list):
+        if not isinstance(actual, list) or len(desired) != len(actual):
+            differences.append(path)
+        elif all(isinstance(item, dict) and item.get('name') for item in desired):
+            actual_by_name = dict((to_text(item.get('name')).lower(), item) for item in actual if isinstance(item, dict))
+            for item in desired:
+                name = to_text(item['name'])
+                if name.lower() not in actual_by_name:
+                    differences.append('{0}[{1}]'.format(path, name))
+                    continue
+                for child in [x for x in item if x != 'name']:
+                    _collect_differences(item[child], actual_by_name[name.lower()], child,
+                                         '{0}[{1}].{2}'.format(path, name, child), differences, enum_values)
+        else:
+            remaining = list(actual)
+            for item in desired:
+                match = None
+                for index, candidate in enumerate(remaining):
+                    found = []
+                    _collect_differences(item, dict(item=candidate), 'item', path, found, enum_values)
+                    if not found:
+                        match = index
+                        break
+                if match is None:
+                    differences.append(path)
+                    break
+                remaining.pop(match)
+    elif not _values_equal(desired, actual, key, enum_values):
+        differences.append(path)
+
+
+def _values_equal(desired, actual, key, enum_values):
+    if actual is None:
+        return False
+    if isinstance(actual, Enum):
+        return enum_key(desired) == enum_key(actual.value)
+    desired_time, actual_time = _to_utc_datetime(desired), _to_utc_datetime(actual)
+    if desired_time is not None and actual_time is not None:
+        return desired_time == actual_time
+    if isinstance(desired, bool) or isinstance(actual, bool):
+        return to_text(desired).lower() == to_text(actual).lower()
+    if isinstance(desired, (int, float)) or isinstance(actual, (int, float)):
+        try:
+            return float(desired) == float(actual)
+        except (TypeError, ValueError):
+            return False
+    desired, actual = to_text(desired), to_text(actual)
+    if key == 'location':
+        return desired.replace(' ', '').lower() == actual.replace(' ', '').lower()
+    if enum_key(desired) in enum_values:
+        return enum_key(desired) == enum_key(actual)
+    if desired.startswith('/subscriptions/'):
+        return desired.lower() == actual.lower()
+    return desired == actual
+
+
+
+def _to_utc_datetime(value):
+    '''
+    Naive UTC datetime of a datetime or of an ISO 8601 string, None for other values.
+    '''
+    if isinstance(value, datetime.datetime):
+        return value.replace(tzinfo=None) - (value.utcoffset() or datetime.timedelta(0))
+    if not isinstance(value, (str, type(u''))):
+        return None
+    match = AZURE_COMPARE_DATETIME.match(value.strip())
+    if not match:
+        return None
+    fields = [int(x) for x in match.groups()[:6]]
+    result = datetime.datetime(*fields, microsecond=int(((match.group(7) or '') + '000000')[:6]))
+    offset = (match.group(8) or 'Z').replace(':', '')
+    if offset.upper() != 'Z':
+        minutes = int(offset[1:3]) * 60 + int(offset[3:5])
+        result -= datetime.timedelta(minutes=minutes if offset[0] == '+' else -minutes)
+    return result
+
+
+# Management SDK packages are imported the first time their client is requested, so a module
+# pays only for the SDK packages it actually uses.
 AZURE_PKG_VERSIONS = {
-    StorageManagementClient.__name__: {
+    'StorageManagementClient': {
         'package_name': 'storage',
         'expected_version': '1.5.0',
-        'installed_version': storage_client_version
+        'version_module': 'azure.mgmt.storage.version'
     },
-    ComputeManagementClient.__name__: {
+    'ComputeManagementClient': {
         'package_name': 'compute',
         'expected_version': '2.0.0',
-        'installed_version': compute_client_version
+        'version_module': 'azure.mgmt.compute.version'
     },
-    NetworkManagementClient.__name__: {
+    'NetworkManagementClient': {
         'package_name': 'network',
         'expected_version': '1.3.0',
-        'installed_version': network_client_version
+        'version_module': 'azure.mgmt.network.version'
     },
-    ResourceManagementClient.__name__: {
+    'ResourceManagementClient': {
         'package_name': 'resource',
         'expected_version': '1.1.0',
-        'installed_version': resource_client_version
+        'version_module': 'azure.mgmt.resource.version'
     },
-    DnsManagementClient.__name__: {
+    'DnsManagementClient': {
         'package_name': 'dns',
         'expected_version': '1.0.1',
-        'installed_version': dns_client_version
+        'version_module': 'azure.mgmt.dns.version'
     },
-    WebSiteManagementClient.__name__: {
+    'WebSiteManagementClient': {
         'package_name': 'web',
         'expected_version': '0.32.0',
-        'installed_version': web_client_version
+        'version_module': 'azure.mgmt.web.version'
     },
-} if HAS_AZURE else {}
+}
+
+
+def get_env_number(name, default=None):
+    '''
+    Read a numeric setting from the environment, falling back to default when unset or invalid.
+    '''
+    try:
+        return float(os.environ[name])
+    except (KeyError, ValueError):
+        return default
+
+
+def import_azure_sdk(module_name, attribute=None):
+    '''
+    Import an Azure SDK module on demand.
+
+    :param module_name: dotted module name, e.g. azure.mgmt.network
+    :param attribute: optional attribute to return from the module
+    :return: module or attribute
+    '''
+    mod = sys.modules.get(module_name) or importlib.import_module(module_name)
+    return getattr(mod, attribute) if attribute else mod
 
 
 AZURE_MIN_RELEASE = '2.0.0'
 
 
+def run_module(path, args, env=None, usage=None):
+    '''
+    Run a module file in a new interpreter, importing from the same places as this process.
+
+    :param path: path of the module file
+    :param args: module arguments, including the internal _ansible_* arguments
+    :param env: environment of the module, the environment of this process by default
+    :param usage: dict to fill with the wall time in seconds and the peak resident set size in KB
+                  (max_rss_kb) of the module, for benchmarks
+    :return: tuple of return code, result or None when the module printed none, stdout and stderr
+    '''
+    import ansible.module_utils
+    import subprocess
+    config = dict(path=path,
+                  sys_path=list(sys.path),
+                  module_utils_path=list(ansible.module_utils.__path__),
+                  usage=usage is not None)
+    start = time.time()
+    process = subprocess.Popen([sys.executable, '-c', AZURE_MODULE_BOOTSTRAP, json.dumps(config)],
+                               stdin=subprocess.PIPE,
+                               stdout=subprocess.PIPE,
+                               stderr=subprocess.PIPE,
+                               env=env)
+    stdout, stderr = process.communicate(to_bytes(json.dumps(dict(ANSIBLE_MODULE_ARGS=args))))
+    stdout = to_text(stdout, errors='surrogate_or_replace')
+    stderr = to_text(stderr, errors='surrogate_or_replace')
+    if usage is not None:
+        max_rss = re.findall(r'^max_rss_kb=(\d+)$', stderr, re.MULTILINE)
+        usage.update(seconds=time.time() - start, max_rss_kb=int(max_rss[-1]) if max_rss else None)
+        stderr = re.sub(r'\s*max_rss_kb=\d+\s*$', '', stderr)
+    # modules print their result as one JSON document, possibly after unrelated output
+    for index in [x.start() for x in re.finditer(r'^\{', stdout, re.MULTILINE)]:
+        try:
+            result = json.loads(stdout[index:])
+        except ValueError:
+            continue
+        if isinstance(result, dict):
+            return process.returncode, result, stdout, stderr
+    return process.returncode, None, stdout, stderr
+
+
+class AzureRMFileCache(object):
+    '''
+    JSON document on disk shared by concurrently running module processes.
+
+    Every access holds an exclusive lock on a sibling ".lock" file and writes replace the
+    document atomically, so readers never observe a partially written file. Any I/O error
+    makes the cache behave as empty - a cache must never fail a module.
+    '''
+
+    def __init__(self, path):
+        self.path = expanduser(path)
+        self.lock_path = self.path + '.lock'
+
+    @contextmanager
+    def _locked(self):
+        lock_file = None
+        try:
+            directory = os.path.dirname(self.path)
+            if directory and not os.path.isdir(directory):
+                os.makedirs(directory, 0o700)
+            lock_file = open(self.lock_path, 'a')
+            if fcntl is not None:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            yield
+        finally:
+            if lock_file is not None:
+                if fcntl is not None:
+                    fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+                lock_file.close()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r') as cache_file:
+                data = json.load(cache_file)
+            return data if isinstance(data, dict) else dict()
+        except (IOError, OSError, ValueError):
+            return dict()
+
+    def _store(self, data):
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.path) or '.', prefix='.ansible_azure')
+        try:
+            with os.fdopen(fd, 'w') as tmp_file:
+                json.dump(data, tmp_file, default=str)
+            if os.name == 'nt' and os.path.exists(self.path):
+                os.remove(self.path)
+            os.rename(tmp_path, self.path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def read(self):
+        '''
+        Return the cached document.
+
+        :return: dict
+        '''
+        try:
+            with self._locked():
+                return self._load()
+        except (IOError, OSError):
+            return dict()
+
+    def update(self, callback):
+        '''
+        Read, modify and write back the document while holding the lock.
+
+        :param callback: function receiving the current document and returning the new one
+        :return: the new document
+        '''
+        try:
+            with self._locked():
+                data = callback(self._load())
+                self._store(data)
+                return data
+        except (IOError, OSError):
+            return dict()
+
+
+class AzureRMTokenCache(AzureRMFileCache):
+    '''
+    On-disk cache of AAD access tokens keyed by authority, resource, tenant and principal.
+    '''
+
+    def __init__(self, path, refresh_margin=AZURE_TOKEN_REFRESH_MARGIN):
+        super(AzureRMTokenCache, self).__init__(path)
+        self.refresh_margin = refresh_margin
+
+    @staticmethod
+    def make_key(*parts):
+        # secrets take part in the key, so it is hashed rather than stored
+        return hashlib.sha256(b'\x00'.join([to_bytes(part or '') for part in parts])).hexdigest()
+
+    @staticmethod
+    def token_expiry(token):
+        '''
+        Absolute expiry (epoch seconds) of a token as returned by adal/oauthlib, or None.
+        '''
+        for key in ('expires_at', 'expires_on'):
+            try:
+                return float(token[key])
+            except (KeyError, TypeError, ValueError):
+                pass
+        try:
+            return time.time() + float(token['expires_in'])
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def get(self, key):
+        '''
+        Return a cached token which is valid for at least refresh_margin seconds, or None.
+        '''
+        entry = self.read().get(key)
+        if not entry or entry.get('expires_at', 0) - time.time() < self.refresh_margin:
+            return None
+        token = dict(entry['token'])
+        token['expires_at'] = entry['expires_at']
+        token['expires_in'] = int(entry['expires_at'] - time.time())
+        return token
+
+    def put(self, key, token):
+        expires_at = self.token_expiry(token)
+        if not expires_at:
+            return
+
+        def add_token(data):
+            now = time.time()
+            data = dict((k, v) for k, v in data.items() if v.get('expires_at', 0) > now)
+            data[key] = dict(token=token, expires_at=expires_at)
+            return data
+
+        self.update(add_token)
+
+
+class AzureRMResourceGroupCache(AzureRMFileCache):
+    '''
+    On-disk cache of resource group id, name, location and tags keyed by subscription and name.
+    '''
+
+    RESOURCE_GROUP_PATTERN = re.compile(r'^/subscriptions/([^/]+)/resourcegroups/([^/]+)/?$', re.IGNORECASE)
+
+    def __init__(self, path, ttl=AZURE_RESOURCE_GROUP_CACHE_TTL):
+        super(AzureRMResourceGroupCache, self).__init__(path)
+        self.ttl = ttl
+
+    @staticmethod
+    def make_key(subscription_id, name):
+        return '{0}/{1}'.format(subscription_id, name).lower()
+
+    @classmethod
+    def changed_resource_group(cls, method, url):
+        '''
+        Subscription and name of the resource group a request creates, updates or deletes, or None.
+        '''
+        if method in ('GET', 'HEAD'):
+            return None
+        match = cls.RESOURCE_GROUP_PATTERN.match(urlparse.urlparse(url or '').path)
+        if not match:
+            return None
+        return urlparse.unquote(match.group(1)), urlparse.unquote(match.group(2))
+
+    def get(self, subscription_id, name):
+        '''
+        Return the cached resource group if it was stored less than ttl seconds ago, or None.
+        '''
+        entry = self.read().get(self.make_key(subscription_id, name))
+        if not entry or entry.get('cached_at', 0) + self.ttl < time.time():
+            return None
+        return entry['resource_group']
+
+    def put(self, subscription_id, name, resource_group):
+        key = self.make_key(subscription_id, name)
+
+        def add_resource_group(data):
+            now = time.time()
+            data = dict((k, v) for k, v in data.items() if v.get('cached_at', 0) + self.ttl > now)
+            data[key] = dict(resource_group=resource_group, cached_at=now)
+            return data
+
+        self.update(add_resource_group)
+
+    def invalidate(self, subscription_id, name):
+        key = self.make_key(subscription_id, name)
+        if key not in self.read():
+            return
+
+        def remove_resource_group(data):
+            data.pop(key, None)
+            return data
+
+        self.update(remove_resource_group)
+
+
+class AzureRMThrottle(AzureRMFileCache):
+    '''
+    Subscription-wide request governor shared by concurrently running module processes.
+
+    The state file holds, per subscription and kind of request (reads, writes, deletes), the remaining
+    budget last reported by ARM, the time of the next free request slot and the end of any 429 back off.
+    '''
+
+    SUBSCRIPTION_PATTERN = re.compile(r'/subscriptions/([^/?]+)', re.IGNORECASE)
+
+    @staticmethod
+    def request_kind(method):
+        if method in ('GET', 'HEAD'):
+            return 'reads'
+        if method == 'DELETE':
+            return 'deletes'
+        return 'writes'
+
+    def subscription(self, url):
+        match = self.SUBSCRIPTION_PATTERN.search(url or '')
+        return match.group(1).lower() if match else None
+
+    @staticmethod
+    def _is_limited(data, subscription, kind):
+        state = data.get(subscription, dict()).get(kind, dict())
+        remaining = state.get('remaining')
+        return (remaining is not None and remaining < AZURE_THROTTLE_LOW_WATER[kind]) or \
+            state.get('blocked_until', 0) > time.time()
+
+    def acquire(self, method, url):
+        '''
+        Reserve a slot for a request and sleep until it is due.
+
+        :return: number of seconds slept
+        '''
+        subscription = self.subscription(url)
+        if not subscription:
+            return 0
+        kind = self.request_kind(method)
+        if not self._is_limited(self.read(), subscription, kind):
+            # plenty of budget left, the state file is only read
+            return 0
+        reserved = dict(at=0)
+
+        def reserve(data):
+            now = time.time()
+            state = data.setdefault(subscription, dict()).setdefault(kind, dict())
+            remaining = state.get('remaining')
+            at = max(now, state.get('blocked_until', 0))
+            if remaining is not None and remaining < AZURE_THROTTLE_LOW_WATER[kind]:
+                # the budget refills at quota/hour, the fewer requests are left the slower they are sent
+                interval = 3600.0 / AZURE_THROTTLE_QUOTAS[kind] * AZURE_THROTTLE_LOW_WATER[kind] / max(remaining, 1)
+                at = max(at, state.get('next_slot', 0))
+                state['next_slot'] = at + min(interval, AZURE_THROTTLE_MAX_DELAY)
+            reserved['at'] = at
+            return data
+
+        self.update(reserve)
+        delay = reserved['at'] - time.time()
+        if delay > 0:
+            time.sleep(delay)
+            return delay
+        return 0
+
+    def observe(self, method, url, response):
+        '''
+        Record the budget reported by a response, and the back off requested by a 429.
+
+        :return: seconds to wait before sending the request again when it was throttled, None otherwise
+        '''
+        subscription = self.subscription(url)
+        if not subscription:
+            return None
+        kind = self.request_kind(method)
+        remaining = response.headers.get('x-ms-ratelimit-remaining-subscription-' + kind)
+        if remaining is not None and not remaining.isdigit():
+            remaining = None
+        retry_after = None
+        if response.status_code == 429:
+            try:
+                retry_after = float(response.headers.get('retry-after', AZURE_POLL_INITIAL_DELAY))
+            except ValueError:
+                retry_after = AZURE_POLL_INITIAL_DELAY
+        if retry_after is None and (remaining is None or (int(remaining) >= AZURE_THROTTLE_LOW_WATER[kind] and
+                                                          not self._is_limited(self.read(), subscription, kind))):
+            return None
+
+        def record(data):
+            state = data.setdefault(subscription, dict()).setdefault(kind, dict())
+            if remaining is not None:
+                state['remaining'] = int(remaining)
+            if retry_after is not None:
+                state['blocked_until'] = max(state.get('blocked_until', 0), time.time() + retry_after)
+            return data
+
+        self.update(record)
+        return retry_after
+
+
+class AzureRMTimings(object):
+    '''
+    Timing records of a module run, kept when ANSIBLE_AZURE_TIMINGS or ANSIBLE_AZURE_TRACE_FILE is set.
+
+    Requests are recorded by AzureRMHTTPAdapter into the current recorder, whatever thread sends them,
+    phases by AzureRMModuleBase.timer.
+    '''
+
+    # recorder of the module running in this process
+    current = None
+
+    def __init__(self, name):
+        self.name = name
+        self.start = time.time()
+        self.requests = []
+        self.phases = dict()
+        self.spans = []
+        self.trace_id = self._get_trace_id()
+        self.span_id = self._new_id(8)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def enabled():
+        if os.environ.get(AZURE_TRACE_FILE_ENV):
+            return True
+        return os.environ.get(AZURE_TIMINGS_ENV, 'off').lower() not in AZURE_DISABLED_VALUES
+
+    @staticmethod
+    def _new_id(size):
+        return ''.join('{0:02x}'.format(x) for x in bytearray(os.urandom(size)))
+
+    @classmethod
+    def _get_trace_id(cls):
+        trace_id = os.environ.get(AZURE_TRACE_ID_ENV, '').lower()
+        if re.match(r'^[0-9a-f]{32}$', trace_id):
+            return trace_id
+        return cls._new_id(16)
+
+    @staticmethod
+    def url_template(url):
+        '''
+        Reduce a request URL to its path, with names and ids replaced by the collection they belong to,
+        e.g. /subscriptions/{subscriptions}/resourceGroups/{resourceGroups}/providers/Microsoft.Sql/servers/{servers}
+
+        :param url: request URL
+        :return: URL template
+        '''
+        segments = [x for x in urlparse.urlparse(url).path.split('/') if x]
+        template = []
+        for i in range(0, len(segments), 2):
+            template.append(segments[i])
+            if i + 1 < len(segments):
+                # ARM paths alternate collections and names, except for the provider namespace
+                template.append(segments[i + 1] if segments[i].lower() == 'providers' else '{' + segments[i] + '}')
+        return '/' + '/'.join(template)
+
+    def add_phase(self, name, start, end):
+        with self._lock:
+            self.phases[name] = self.phases.get(name, 0) + end - start
+            self.spans.append(self._span(name, start, end, {'azure.phase': name}))
+
+    def add_request(self, request, response, start, end):
+        content_length = response.headers.get('content-length') if response is not None else None
+        record = dict(method=request.method,
+                      url=self.url_template(request.url),
+                      status=response.status_code if response is not None else None,
+                      request_bytes=len(request.body) if hasattr(request.body, '__len__') else 0,
+                      response_bytes=int(content_length) if content_length and content_length.isdigit() else None,
+                      latency=round(end - start, 3))
+        attributes = {'http.method': record['method'], 'http.route': record['url']}
+        if record['status'] is not None:
+            attributes['http.status_code'] = record['status']
+        span = self._span('{0} {1}'.format(record['method'], record['url']), start, end, attributes,
+                          kind=3, error=record['status'] is None or record['status'] >= 400)
+        with self._lock:
+            self.requests.append(record)
+            self.spans.append(span)
+
+    def result(self):
+        with self._lock:
+            return dict(total=round(time.time() - self.start, 3),
+                        phases=dict((name, round(seconds, 3)) for name, seconds in self.phases.items()),
+                        requests=list(self.requests),
+                        client_pool=AZURE_CLIENT_POOL.stats())
+
+    def _span(self, name, start, end, attributes, kind=1, error=False, root=False):
+        span = dict(traceId=self.trace_id,
+                    spanId=self.span_id if root else self._new_id(8),
+                    name=name,
+                    kind=kind,
+                    startTimeUnixNano=str(int(start * 1e9)),
+                    endTimeUnixNano=str(int(end * 1e9)),
+                    attributes=[self._attribute(key, value) for key, value in sorted(attributes.items())],
+                    status=dict(code=2 if error else 1))
+        if not root:
+            span['parentSpanId'] = self.span_id
+        return span
+
+    @staticmethod
+    def _attribute(key, value):
+        if isinstance(value, bool):
+            return dict(key=key, value=dict(boolValue=value))
+        if isinstance(value, int):
+            return dict(key=key, value=dict(intValue=str(value)))
+        return dict(key=key, value=dict(stringValue=to_text(value)))
+
+    def write_spans(self, path, error=None):
+        '''
+        Append the spans of the module run, below a span covering the whole run, to path as one
+        OTLP JSON trace export request.
+
+        :param path: trace file
+        :param error: failure message, marks the run as failed
+        :return: None
+        '''
+        root = self._span(self.name, self.start, time.time(), {'ansible.module': self.name}, error=bool(error), root=True)
+        if error:
+            root['status']['message'] = to_text(error)
+        with self._lock:
+            spans = [root] + self.spans
+        export = dict(resourceSpans=[dict(resource=dict(attributes=[self._attribute('service.name', 'ansible-azure')]),
+                                          scopeSpans=[dict(scope=dict(name='azure_rm_common'), spans=spans)])])
+        line = json.dumps(export, sort_keys=True) + '\n'
+        try:
+            with AZURE_LOG_LOCK:
+                with open(os.path.expanduser(path), 'a') as trace_file:
+                    trace_file.write(line)
+        except (IOError, OSError):
+            # traces are diagnostics, they never fail the module
+            pass
+
+
+class AzureRMHTTPAdapter(HTTPAdapter):
+    '''
+    Transport adapter mounted on the sessions of all management clients.
+
+    Requests go through the subscription-wide throttle governor unless ANSIBLE_AZURE_THROTTLE is off,
+    and are timed when AzureRMTimings are enabled. Creating, updating or deleting a resource group drops
+    it from the resource group cache. In template mode writes are recorded instead of being sent.
+    '''
+
+    def send(self, request, **kwargs):
+        template = os.environ.get(AZURE_TEMPLATE_ENV)
+        if template and request.method in ['PUT', 'PATCH', 'DELETE']:
+            return self._capture(template, request)
+        response = self._send_throttled(request, **kwargs)
+        changed = AzureRMResourceGroupCache.changed_resource_group(request.method, request.url)
+        if changed:
+            cache = self.get_resource_group_cache()
+            if cache is not None:
+                cache.invalidate(*changed)
+        return response
+
+    def _send_throttled(self, request, **kwargs):
+        throttle = self.get_throttle()
+        attempt = 0
+        while True:
+            if throttle is not None:
+                start = time.time()
+                throttle.acquire(request.method, request.url)
+                timings = AzureRMTimings.current
+                if timings is not None and time.time() - start >= AZURE_TIMINGS_MIN_WAIT:
+                    timings.add_phase('throttle', start, time.time())
+            response = self._send(request, **kwargs)
+            if throttle is None:
+                return response
+            retry_after = throttle.observe(request.method, request.url, response)
+            if retry_after is None or attempt >= AZURE_THROTTLE_RETRIES:
+                return response
+            attempt += 1
+            response.close()
+
+    def _send(self, request, **kwargs):
+        timings = AzureRMTimings.current
+        if timings is None:
+            return super(AzureRMHTTPAdapter, self).send(request, **kwargs)
+        start = time.time()
+        response = None
+        try:
+            response = super(AzureRMHTTPAdapter, self).send(request, **kwargs)
+            return response
+        finally:
+            timings.add_request(request, response, start, time.time())
+
+    @staticmethod
+    def _capture(path, request):
+        '''
+        Append a PUT to the template file and answer it as the service does once the resource is created,
+        reject other writes, which have no template equivalent.
+        '''
+        response = Response()
+        response.request = request
+        response.url = request.url
+        response.encoding = 'utf-8'
+        response.headers['Content-Type'] = 'application/json; charset=utf-8'
+        if request.method == 'PUT':
+            body = json.loads(to_text(request.body or '{}'))
+            with open(path, 'a') as template:
+                template.write(json.dumps(dict(url=request.url, body=body)) + '\n')
+            resource_path = urlparse.urlparse(request.url).path
+            body.update(id=resource_path, name=resource_path.rstrip('/').split('/')[-1])
+            if isinstance(body.get('properties'), dict):
+                body['properties']['provisioningState'] = 'Succeeded'
+            response.status_code = 200
+        else:
+            body = dict(error=dict(code='TemplateModeNotSupported',
+                                   message="{0} requests can not be part of a template deployment".format(request.method)))
+            response.status_code = 400
+        response._content = to_bytes(json.dumps(body))
+        return response
+
+    @staticmethod
+    def get_throttle():
+        path = os.environ.get(AZURE_THROTTLE_ENV, AZURE_THROTTLE_PATH)
+        if path.lower() in AZURE_DISABLED_VALUES:
+            return None
+        return AzureRMThrottle(path)
+
+    @staticmethod
+    def get_resource_group_cache():
+        path = os.environ.get(AZURE_RESOURCE_GROUP_CACHE_ENV, AZURE_RESOURCE_GROUP_CACHE_PATH)
+        if path.lower() in AZURE_DISABLED_VALUES:
+            return None
+        return AzureRMResourceGroupCache(path, get_env_number(AZURE_RESOURCE_GROUP_CACHE_TTL_ENV, AZURE_RESOURCE_GROUP_CACHE_TTL))
+
+    @classmethod
+    def mount(cls, session):
+        '''
+        Mount the adapter on a session unless it is already there, keeping the retry policy
+        msrest configured on the default adapters.
+
+        :param session: requests.Session
+        :return: None
+        '''
+        for prefix in ('https://', 'http://'):
+            current = session.adapters.get(prefix)
+            if isinstance(current, cls):
+                continue
+            adapter = cls(pool_connections=int(get_env_number(AZURE_POOL_CONNECTIONS_ENV, AZURE_POOL_CONNECTIONS)),
+                          pool_maxsize=int(get_env_number(AZURE_POOL_MAXSIZE_ENV, AZURE_POOL_MAXSIZE)),
+                          max_retries=getattr(current, 'max_retries', 0))
+            session.mount(prefix, adapter)
+
+
+class AzureRMClientPool(object):
+    '''
+    Process-wide registry of management clients.
+
+    Clients are keyed by client type, subscription, endpoint, api version and credential identity,
+    so module instances living in the same process reuse clients and their keep-alive sessions.
+    '''
+
+    def __init__(self):
+        self._clients = dict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, factory, expires_at=None):
+        '''
+        Return the client registered under key, creating it with factory() when missing or when
+        the credentials it was created with are about to expire.
+
+        :param key: hashable client identity
+        :param factory: function creating the client
+        :param expires_at: expiry (epoch seconds) of the credentials used by factory, if known
+        :return: management client
+        '''
+        with self._lock:
+            entry = self._clients.get(key)
+            if entry and (entry['expires_at'] is None or entry['expires_at'] - time.time() > AZURE_TOKEN_REFRESH_MARGIN):
+                self.hits += 1
+                return entry['client']
+            self.misses += 1
+            client = factory()
+            self._clients[key] = dict(client=client, expires_at=expires_at)
+            return client
+
+    def stats(self):
+        with self._lock:
+            return dict(hits=self.hits, misses=self.misses, clients=len(self._clients))
+
+    def clear(self):
+        with self._lock:
+            self._clients.clear()
+
+
+AZURE_CLIENT_POOL = AzureRMClientPool()
+
+
+class AzureRMModuleError(Exception):
+    '''
+    Raised instead of failing the module by AzureRMModuleBase.fail while running on a worker
+    thread of AzureRMModuleBase.fan_out, the failure is reported from the main thread.
+    '''
+
+    def __init__(self, msg, **kwargs):
+        super(AzureRMModuleError, self).__init__(msg)
+        self.msg = msg
+        self.kwargs = kwargs
+
+
+class AzureRMAsyncOperation(Exception):
+    '''
+    Raised by get_poller_result when the module runs with wait=no. Carries the handle of the
+    long running operation which was started, see AzureRMModuleBase.get_operation_handle.
+    '''
+
+    def __init__(self, handle):
+        super(AzureRMAsyncOperation, self).__init__("Long running operation started on {0}".format(handle.get('id')))
+        self.handle = handle
+
+
 class AzureRMModuleBase(object):
     def __init__(self, derived_arg_spec, bypass_checks=False, no_log=False,
                  check_invalid_arguments=None, mutually_exclusive=None, required_together=None,
                  required_one_of=None, add_file_common_args=False, supports_check_mode=False,
-                 required_if=None, supports_tags=True, facts_module=False, skip_exec=False):
+                 required_if=None, supports_tags=True, facts_module=False, skip_exec=False,
+                 supports_async=False, supports_paging=False, supports_projection=False, supports_items=False):
+
+        # state of the derived module before it runs, items are run by copies of the module starting from it
+        self._item_state = copy.deepcopy(self.__dict__) if supports_items else None
+        self._items_required = []
+        self._items_no_log = []
 
         merged_arg_spec = dict()
         merged_arg_spec.update(AZURE_COMMON_ARGS)
         if supports_tags:
             merged_arg_spec.update(AZURE_TAG_ARGS)
+        if supports_async:
+            merged_arg_spec.update(AZURE_ASYNC_ARGS)
+        if supports_paging:
+            merged_arg_spec.update(AZURE_PAGING_ARGS)
+            merged_arg_spec.update(AZURE_FILTER_ARGS)
+        if supports_projection:
+            merged_arg_spec.update(AZURE_PROJECTION_ARGS)
+
+        if supports_items:
+            merged_arg_spec.update(AZURE_ITEMS_ARGS)
 
         if derived_arg_spec:
             merged_arg_spec.update(derived_arg_spec)
+            if supports_items:
+                merged_arg_spec.update(self._get_items_arg_spec(derived_arg_spec))
 
         merged_required_if = list(AZURE_COMMON_REQUIRED_IF)
         if required_if:
@@ -228,6 +1238,23 @@ class AzureRMModuleBase(object):
                                     supports_check_mode=supports_check_mode,
                                     required_if=merged_required_if)
 
+        self._log_level = None
+        if self.module.params.get('log_mode') == 'file':
+            self._log_level = AZURE_LOG_LEVELS[self.module.params['log_level']]
+
+        if not skip_exec:
+            self._run_in_worker()
+
+        if supports_items and not self.module.params.get('items'):
+            missing = [key for key in self._items_required if self.module.params.get(key) is None]
+            if missing:
+                self.fail("missing required arguments: {0}".format(', '.join(missing)))
+
+        self._timings = None
+        if AzureRMTimings.enabled():
+            self._timings = AzureRMTimings(self.module._name)
+            AzureRMTimings.current = self._timings
+
         if not HAS_PACKAGING_VERSION:
             self.fail("Do you have packaging installed? Try `pip install packaging`"
                       "- {0}".format(HAS_PACKAGING_VERSION_EXC))
@@ -251,10 +1278,29 @@ class AzureRMModuleBase(object):
 
         self.check_mode = self.module.check_mode
         self.facts_module = facts_module
+        self._poller_stats = None
+        self.resource_differences = []
+        self._thread_state = threading.local()
+        self._pushed_filters = set()
+        self._storage_account_ids = None
+        self._storage_account_keys = dict()
+        self._storage_account_lock = threading.Lock()
+        self._field_tree = None
+        self._query = None
+        if self.module.params.get('fields'):
+            self._field_tree = self._get_field_tree(self.module.params['fields'])
+        if self.module.params.get('query'):
+            if not HAS_JMESPATH:
+                self.fail("query requires jmespath. Try `pip install jmespath`")
+            try:
+                self._query = jmespath.compile(self.module.params['query'])
+            except jmespath.exceptions.JMESPathError as exc:
+                self.fail("Invalid query {0} - {1}".format(self.module.params['query'], str(exc)))
         # self.debug = self.module.params.get('debug')
 
         # authenticate
-        self.credentials = self._get_credentials(self.module.params)
+        with self.timer('auth'):
+            self.credentials = self._get_credentials(self.module.params)
         if not self.credentials:
             if HAS_AZURE_CLI_CORE:
                 self.fail("Failed to get credentials. Either pass as parameters, set environment variables, "
@@ -303,22 +1349,32 @@ class AzureRMModuleBase(object):
         elif self.credentials.get('client_id') is not None and \
                 self.credentials.get('secret') is not None and \
                 self.credentials.get('tenant') is not None:
-                self.azure_credentials = ServicePrincipalCredentials(client_id=self.credentials['client_id'],
+                self.azure_credentials = self._get_cached_credentials(
+                    lambda cached=False: ServicePrincipalCredentials(client_id=self.credentials['client_id'],
                                                                      secret=self.credentials['secret'],
                                                                      tenant=self.credentials['tenant'],
                                                                      cloud_environment=self._cloud_environment,
-                                                                     verify=self._cert_validation_mode == 'validate')
+                                                                     verify=self._cert_validation_mode == 'validate',
+                                                                     cached=cached),
+                    tenant=self.credentials['tenant'],
+                    principal=self.credentials['client_id'],
+                    secret=self.credentials['secret'])
 
         elif self.credentials.get('ad_user') is not None and self.credentials.get('password') is not None:
             tenant = self.credentials.get('tenant')
             if not tenant:
                 tenant = 'common'  # SDK default
 
-            self.azure_credentials = UserPassCredentials(self.credentials['ad_user'],
+            self.azure_credentials = self._get_cached_credentials(
+                lambda cached=False: UserPassCredentials(self.credentials['ad_user'],
                                                          self.credentials['password'],
                                                          tenant=tenant,
                                                          cloud_environment=self._cloud_environment,
-                                                         verify=self._cert_validation_mode == 'validate')
+                                                         verify=self._cert_validation_mode == 'validate',
+                                                         cached=cached),
+                tenant=tenant,
+                principal=self.credentials['ad_user'],
+                secret=self.credentials['password'])
         else:
             self.fail("Failed to authenticate with provided credentials. Some attributes were missing. "
                       "Credentials must include client_id, secret and tenant or ad_user and password or "
@@ -329,7 +1385,16 @@ class AzureRMModuleBase(object):
             self.validate_tags(self.module.params['tags'])
 
         if not skip_exec:
-            res = self.exec_module(**self.module.params)
+            try:
+                with self.timer('exec_module'):
+                    res = self._run_exec_module(**self.module.params)
+            except AzureRMAsyncOperation as operation:
+                res = dict(changed=True, id=operation.handle['id'], operation=operation.handle)
+            if self._poller_stats and isinstance(res, dict):
+                res['poller_stats'] = self._poller_stats
+            if self._timings and isinstance(res, dict):
+                res['_timings'] = self._timings.result()
+            self._finish_timings()
             self.module.exit_json(**res)
 
     def check_client_version(self, client_type):
@@ -337,12 +1402,26 @@ class AzureRMModuleBase(object):
         package_version = AZURE_PKG_VERSIONS.get(client_type.__name__, None)
         if package_version is not None:
             client_name = package_version.get('package_name')
-            client_version = package_version.get('installed_version')
+            client_version = self.import_sdk(package_version.get('version_module'), 'VERSION')
             expected_version = package_version.get('expected_version')
             if Version(client_version) < Version(expected_version):
                 self.fail("Installed {0} client version is {1}. The supported version is {2}. Try "
                           "`pip install ansible[azure]`".format(client_name, client_version, expected_version))
 
+    def import_sdk(self, module_name, attribute=None):
+        '''
+        Import an Azure SDK module on demand, failing the module if it is not installed.
+
+        :param module_name: dotted module name
+        :param attribute: optional attribute to return from the module
+        :return: module or attribute
+        '''
+        try:
+            return import_azure_sdk(module_name, attribute)
+        except ImportError as exc:
+            self.fail("Do you have azure>={1} installed? Try `pip install ansible[azure]`"
+                      "- {0}".format(exc, AZURE_MIN_RELEASE))
+
     def exec_module(self, **kwargs):
         self.fail("Error: {0} failed to implement exec_module method.".format(self.__class__.__name__))
 
@@ -354,20 +1433,185 @@ class AzureRMModuleBase(object):
         :param kwargs: Any key=value pairs
         :return: None
         '''
+        thread_state = getattr(self, '_thread_state', None)
+        if getattr(thread_state, 'raise_on_fail', False):
+            raise AzureRMModuleError(msg, **kwargs)
+        self._finish_timings(error=msg)
         self.module.fail_json(msg=msg, **kwargs)
 
+    def _run_in_worker(self):
+        '''
+        Hand the module over to a persistent worker when ANSIBLE_AZURE_WORKER is on, and exit with its result.
+        Returns when the module has to run in this process.
+        '''
+        if os.environ.get(AZURE_WORKER_ENV, 'off').lower() in AZURE_DISABLED_VALUES:
+            return
+        from ansible.module_utils.azure_rm_worker import run_in_worker
+        outcome = run_in_worker(self)
+        if outcome is None:
+            return
+        rc, output = outcome
+        sys.stdout.write(output)
+        sys.stdout.flush()
+        sys.exit(rc)
+
+    @contextmanager
+    def timer(self, phase):
+        '''
+        Time the enclosed block as a phase of the module run, reported in _timings when enabled.
+
+        :param phase: phase name, time of phases with the same name adds up
+        '''
+        timings = getattr(self, '_timings', None)
+        start = time.time()
+        try:
+            yield
+        finally:
+            if timings is not None:
+                timings.add_phase(phase, start, time.time())
+
+    def _run_exec_module(self, **kwargs):
+        '''
+        Call exec_module, profiled when ANSIBLE_AZURE_PROFILE names a directory.
+        '''
+        exec_module = self.exec_items if self._item_state is not None and kwargs.get('items') else self.exec_module
+        directory = os.environ.get(AZURE_PROFILE_ENV)
+        if not directory or directory.lower() in AZURE_DISABLED_VALUES:
+            return exec_module(**kwargs)
+
+        mode = os.environ.get(AZURE_PROFILE_MODE_ENV, 'all').lower()
+        profiler = cProfile.Profile() if mode in ['cpu', 'all'] else None
+        trace_memory = mode in ['memory', 'all'] and tracemalloc is not None
+        started_tracing = trace_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        if profiler is not None:
+            profiler.enable()
+        try:
+            return exec_module(**kwargs)
+        finally:
+            # also reached when the module fails, fail_json exits through SystemExit
+            if profiler is not None:
+                profiler.disable()
+            snapshot = None
+            peak = None
+            if trace_memory:
+                snapshot = tracemalloc.take_snapshot()
+                peak = tracemalloc.get_traced_memory()[1]
+            if started_tracing:
+                tracemalloc.stop()
+            self._write_profile(os.path.expanduser(directory), profiler, snapshot, peak)
+
+    def _get_arguments_hash(self):
+        # connection and credential arguments are left out, they do not change what the module does
+        arguments = dict((key, value) for key, value in self.module.params.items() if key not in AZURE_COMMON_ARGS)
+        return hashlib.sha1(to_bytes(json.dumps(arguments, sort_keys=True, default=str))).hexdigest()[:12]
+
+    def _write_profile(self, directory, profiler, snapshot, peak):
+        prefix = os.path.join(directory, '{0}-{1}-{2}-{3}'.format(self.module._name, self._get_arguments_hash(),
+                                                                int(time.time()), os.getpid()))
+        try:
+            if not os.path.isdir(directory):
+                os.makedirs(directory)
+            if profiler is not None:
+                profiler.dump_stats(prefix + '.pstats')
+            if snapshot is not None:
+                top = int(get_env_number(AZURE_PROFILE_TOP_ENV, AZURE_PROFILE_TOP))
+                statistics = snapshot.filter_traces([tracemalloc.Filter(False, tracemalloc.__file__)]).statistics('lineno')
+                lines = ['module: {0}'.format(self.module._name),
+                         'arguments hash: {0}'.format(self._get_arguments_hash()),
+                         'traced: {0:.1f} KiB in {1} blocks'.format(sum(x.size for x in statistics) / 1024.0,
+                                                                   sum(x.count for x in statistics)),
+                         'peak: {0:.1f} KiB'.format(peak / 1024.0),
+                         '']
+                for index, statistic in enumerate(statistics[:top], 1):
+                    frame = statistic.traceback[0]
+                    lines.append('#{0} {1}:{2}: {3:.1f} KiB in {4} blocks'.format(index, frame.filename, frame.lineno,
+                                                                                 statistic.size / 1024.0, statistic.count))
+                with open(prefix + '.alloc.txt', 'w') as summary:
+                    summary.write('\n'.join(lines) + '\n')
+            self.log('Profile written to {0}', prefix, level='info')
+        except (IOError, OSError) as exc:
+            self.log('Could not write profile {0} - {1}', prefix, exc, level='warning')
+
+    def _finish_timings(self, error=None):
+        timings = getattr(self, '_timings', None)
+        if timings is None:
+            return
+        trace_file = os.environ.get(AZURE_TRACE_FILE_ENV)
+        if trace_file:
+            timings.write_spans(trace_file, error=error)
+        if AzureRMTimings.current is timings:
+            AzureRMTimings.current = None
+        self._timings = None
+
     def deprecate(self, msg, version=None):
         self.module.deprecate(msg, version)
 
-    def log(self, msg, pretty_print=False):
-        pass
-        # Use only during module development
-        # if self.debug:
-        #     log_file = open('azure_rm.log', 'a')
-        #     if pretty_print:
-        #         log_file.write(json.dumps(msg, indent=4, sort_keys=True))
-        #     else:
-        #         log_file.write(msg + u'\n')
+    def log(self, msg, *args, **kwargs):
+        '''
+        Log a message when log_mode is set. Formatting is deferred: msg.format(*args) is only evaluated
+        when the level is enabled, so pass arguments instead of formatting the message upfront.
+
+        :param msg: message, or any JSON serializable object with pretty_print
+        :param args: arguments for msg.format()
+        :param level: one of debug, info, warning, error, debug by default
+        :param pretty_print: record msg as a structured object rather than as text
+        :return: None
+        '''
+        level = kwargs.get('level', 'debug')
+        log_level = getattr(self, '_log_level', None)
+        if log_level is None or AZURE_LOG_LEVELS[level] < log_level:
+            return
+        if kwargs.get('pretty_print'):
+            message = json.loads(json.dumps(msg, default=str))
+        else:
+            message = msg.format(*args) if args else msg
+        record = dict(time=round(time.time(), 3),
+                      level=level,
+                      module=self.module._name,
+                      pid=os.getpid(),
+                      thread=threading.current_thread().name,
+                      msg=message)
+        line = json.dumps(record, default=str) + '\n'
+        try:
+            with AZURE_LOG_LOCK:
+                with open(self.module.params['log_path'], 'a') as log_file:
+                    log_file.write(line)
+        except (IOError, OSError):
+            # logging must never break the module
+            pass
+
+    def is_update_needed(self, desired, actual):
+        '''
+        Used by CRUD modules to decide whether an existing resource has to be updated. The differences
+        found are kept in self.resource_differences.
+
+        :param desired: dict of desired values, as sent to create_or_update
+        :param actual: dict of actual values, as returned by get
+        :return: bool
+        '''
+        self.resource_differences = resource_differences(desired or dict(), actual or dict(),
+                                                         get_enum_values(self.module.argument_spec))
+        if self.resource_differences:
+            self.log("Resource differs in {0}", self.resource_differences)
+        return len(self.resource_differences) > 0
+
+    def get_patch_parameters(self, desired, patchable):
+        '''
+        Used by CRUD modules to send only the changed values of an existing resource with a PATCH
+        operation. The values to send are the top level values of desired in which is_update_needed
+        found differences. The differences are reported in results['patched_fields'].
+
+        :param desired: dict of desired values
+        :param patchable: list of top level keys the update operation accepts
+        :return: dict of values to patch, or None when the change needs a full create_or_update
+        '''
+        fields = set(re.split(r'[.\[]', path)[0] for path in self.resource_differences)
+        if not fields or not fields.issubset(patchable):
+            return None
+        self.results['patched_fields'] = list(self.resource_differences)
+        return dict((key, desired[key]) for key in fields)
 
     def validate_tags(self, tags):
         '''
@@ -439,17 +1683,389 @@ class AzureRMModuleBase(object):
 
     def get_resource_group(self, resource_group):
         '''
-        Fetch a resource group.
+        Fetch a resource group, from the resource group cache when it was fetched recently.
 
         :param resource_group: name of a resource group
         :return: resource group object
         '''
+        cache = AzureRMHTTPAdapter.get_resource_group_cache()
+        if cache is not None:
+            cached = cache.get(self.subscription_id, resource_group)
+            if cached:
+                self.log('Using cached resource group {0}', resource_group)
+                response = self.rm_models.ResourceGroup(location=cached['location'], tags=cached.get('tags'))
+                response.id = cached.get('id')
+                response.name = cached.get('name')
+                return response
         try:
-            return self.rm_client.resource_groups.get(resource_group)
+            with self.timer('resource_group'):
+                response = self.rm_client.resource_groups.get(resource_group)
         except CloudError as cloud_error:
             self.fail("Error retrieving resource group {0} - {1}".format(resource_group, cloud_error.message))
         except Exception as exc:
             self.fail("Error retrieving resource group {0} - {1}".format(resource_group, str(exc)))
+        if cache is not None:
+            cache.put(self.subscription_id, resource_group,
+                      dict(id=response.id, name=response.name, location=response.location, tags=response.tags))
+        return response
+
+    def get_library_module_path(self, library_path, module_name):
+        '''
+        Path of an azure_rm module of the role library, fails when there is no such module.
+        '''
+        if not re.match(r'^azure_rm_\w+$', module_name or ''):
+            self.fail("{0} is not an azure_rm module".format(module_name))
+        path = os.path.join(library_path, module_name + '.py')
+        if not os.path.isfile(path):
+            self.fail("Module {0} not found in {1}".format(module_name, library_path))
+        return path
+
+    def get_module_args(self, module_name, args):
+        '''
+        Arguments to run another module with, see run_module: args, the authentication options of this
+        module args does not set, and the internal arguments Ansible passed to this module.
+        '''
+        module_args = dict((key, value) for key, value in self.module.params.items()
+                           if key in AZURE_COMMON_ARGS and value is not None)
+        module_args.update(args)
+        try:
+            internal = json.loads(to_text(basic._ANSIBLE_ARGS or '{}')).get('ANSIBLE_MODULE_ARGS', {})
+        except ValueError:
+            internal = dict()
+        module_args.update((key, value) for key, value in internal.items() if key.startswith('_ansible_'))
+        module_args['_ansible_module_name'] = module_name
+        module_args['_ansible_check_mode'] = self.check_mode
+        return module_args
+
+    def fan_out(self, func, items, concurrency=None, return_errors=False):
+        '''
+        Call func(item) for every item on a bounded pool of threads.
+
+        Calls to fail() made by func raise AzureRMModuleError on the worker thread, the first
+        failure is reported once all calls are done.
+
+        :param func: function of one argument
+        :param items: list of arguments
+        :param concurrency: maximum number of concurrent calls
+        :param return_errors: return the AzureRMModuleError of failed calls in place of their result
+        :return: list of results, in the order of items
+        '''
+        items = list(items)
+        if not items:
+            return []
+
+        def call(item):
+            self._thread_state.raise_on_fail = True
+            try:
+                return True, func(item)
+            except AzureRMModuleError as exc:
+                return False, exc
+            except Exception as exc:
+                return False, AzureRMModuleError(str(exc), exception=traceback.format_exc())
+
+        pool = ThreadPool(max(1, min(concurrency or AZURE_FACTS_CONCURRENCY, len(items))))
+        try:
+            outcomes = pool.map(call, items)
+        finally:
+            pool.close()
+            pool.join()
+
+        if return_errors:
+            return [value for succeeded, value in outcomes]
+        for succeeded, value in outcomes:
+            if not succeeded:
+                self.fail(value.msg, **value.kwargs)
+        return [value for succeeded, value in outcomes]
+
+    def _get_items_arg_spec(self, derived_arg_spec):
+        # options of the module may be set per item, options required by the module are then
+        # only required once the item and module options are merged
+        item_options = dict()
+        relaxed = dict()
+        for key, spec in derived_arg_spec.items():
+            item_options[key] = dict((name, value) for name, value in spec.items() if name not in ['required', 'default'])
+            if spec.get('required'):
+                self._items_required.append(key)
+                relaxed[key] = dict(spec, required=False)
+            if spec.get('no_log'):
+                self._items_no_log.append(key)
+        relaxed['items'] = dict(type='list', elements='dict', options=item_options)
+        return relaxed
+
+    def exec_items(self, **kwargs):
+        '''
+        Run exec_module once for every entry of items, on a bounded pool of threads. Each item is run by
+        a fresh copy of the module, with the options it sets overriding the options of the module.
+        Clients are shared by the copies through the client pool.
+
+        :return: combined results, with the outcome of every item in items
+        '''
+        items = kwargs['items']
+        copies = []
+
+        def run(item):
+            arguments = dict(kwargs, items=None)
+            arguments.update((key, value) for key, value in item.items() if value is not None)
+            missing = [key for key in self._items_required if arguments.get(key) is None]
+            if missing:
+                self.fail("missing required arguments: {0}".format(', '.join(missing)))
+            module = copy.copy(self)
+            module.__dict__.update(copy.deepcopy(self._item_state))
+            module._poller_stats = None
+            module.resource_differences = []
+            copies.append(module)
+            try:
+                return module.exec_module(**arguments)
+            except AzureRMAsyncOperation as operation:
+                return dict(changed=True, id=operation.handle['id'], operation=operation.handle)
+
+        outcomes = self.fan_out(run, items, kwargs.get('concurrency') or AZURE_ITEMS_CONCURRENCY, return_errors=True)
+
+        for module in copies:
+            if module._poller_stats:
+                stats = self._poller_stats or dict(operations=0, polls=0, elapsed=0.0)
+                for key in stats:
+                    stats[key] += module._poller_stats[key]
+                self._poller_stats = stats
+
+        results = dict(changed=False, items=[])
+        failed = 0
+        for item, outcome in zip(items, outcomes):
+            if isinstance(outcome, AzureRMModuleError):
+                failed += 1
+                result = dict(outcome.kwargs, failed=True, msg=outcome.msg)
+            else:
+                result = dict(outcome)
+            result['item'] = dict((key, value) for key, value in item.items()
+                                  if value is not None and key not in self._items_no_log)
+            results['changed'] = results['changed'] or bool(result.get('changed'))
+            results['items'].append(result)
+        if failed:
+            self.fail("{0} of {1} items failed".format(failed, len(items)), **results)
+        return results
+
+    def get_resource_group_names(self, resource_groups):
+        '''
+        Expand a list of resource group names, where '*' stands for every resource group
+        of the subscription.
+
+        :param resource_groups: list of names
+        :return: list of names
+        '''
+        if '*' not in resource_groups:
+            return list(resource_groups)
+        try:
+            return [group.name for group in self.rm_client.resource_groups.list()]
+        except CloudError as cloud_error:
+            self.fail("Error listing resource groups - {0}".format(cloud_error.message))
+
+    def collect_from_resource_groups(self, collect, resource_groups, concurrency=None):
+        '''
+        Used by facts modules to gather facts from many resource groups in one run. Every
+        resource group is queried on its own thread and the results are merged.
+
+        :param collect: function taking a resource group name and returning a dict of serialized
+                        resources keyed by name
+        :param resource_groups: list of resource group names, '*' stands for all resource groups
+        :param concurrency: maximum number of resource groups queried at the same time
+        :return: dict of serialized resources keyed by resource ID
+        '''
+        if self.module.params.get('skip') or self.module.params.get('max_items') is not None or \
+                self.module.params.get('next_link'):
+            self.fail("skip, max_items and next_link can only be used with a single resource group")
+        merged = dict()
+        for results in self.fan_out(collect, self.get_resource_group_names(resource_groups), concurrency):
+            for name, item in results.items():
+                merged[item.get('id') or name] = item
+        return merged
+
+    def serialize_paged(self, response):
+        '''
+        Used by facts modules to serialize the items of a list response, honouring the skip, max_items
+        and next_link options. Pages are requested one at a time and only the items that are returned
+        get serialized, so a run stops after max_items items instead of walking the whole collection.
+
+        When items are left over, results['next_link'] holds a token to pass as next_link to the next run.
+
+        :param response: msrest Paged iterator, or any iterable of models
+        :return: dict of serialized items keyed by name
+        '''
+        skip = self.module.params.get('skip') or 0
+        max_items = self.module.params.get('max_items')
+        token = self.module.params.get('next_link')
+        results = dict()
+
+        if not hasattr(response, 'advance_page'):
+            if token:
+                self.fail("next_link is not supported, the service returns all items at once")
+            for item in response:
+                if not self.match_filters(item):
+                    continue
+                if skip > 0:
+                    skip -= 1
+                    continue
+                if max_items is not None and len(results) >= max_items:
+                    break
+                results[item.name] = self.serialize_facts(item)
+            return results
+
+        offset = 0
+        if token:
+            page_link, offset = self._parse_next_link(token)
+            response.reset()
+            response.next_link = page_link
+
+        while response.next_link is not None:
+            if max_items is not None and len(results) >= max_items:
+                self.results['next_link'] = self._format_next_link(response.next_link, 0)
+                return results
+            page_link = response.next_link
+            page = response.advance_page()
+            for index in range(offset, len(page)):
+                if not self.match_filters(page[index]):
+                    continue
+                if skip > 0:
+                    skip -= 1
+                    continue
+                if max_items is not None and len(results) >= max_items:
+                    self.results['next_link'] = self._format_next_link(page_link, index)
+                    return results
+                results[page[index].name] = self.serialize_facts(page[index])
+            offset = 0
+        return results
+
+    def get_odata_filter(self, operation, properties, odata_filter=None):
+        '''
+        Used by facts modules to push filters down to the service. Filters on the given properties are
+        turned into an OData $filter expression, and no longer matched client side, when operation
+        accepts a filter. Lists of values are always matched client side.
+
+        :param operation: SDK operation the expression is passed to as filter
+        :param properties: dict mapping filter names to OData property names
+        :param odata_filter: expression given by the user, combined with the generated one
+        :return: OData expression, or None when there is nothing to pass
+        '''
+        if not self._accepts_argument(operation, 'filter'):
+            self.log("{0} does not accept a filter, filters are matched client side", operation.__name__)
+            return None
+
+        clauses = [odata_filter] if odata_filter else []
+        for name, value in sorted((self.module.params.get('filters') or dict()).items()):
+            if name not in properties or isinstance(value, list):
+                continue
+            if isinstance(value, bool):
+                value = str(value).lower()
+            elif not isinstance(value, (int, float)):
+                value = u"'{0}'".format(to_text(value).replace(u"'", u"''"))
+            clauses.append(u"{0} eq {1}".format(properties[name], value))
+            self._pushed_filters.add(name)
+        return ' and '.join(clauses) or None
+
+    def match_filters(self, model):
+        '''
+        Check a model against the filters that were not pushed down to the service. Filter names are
+        attribute paths separated by dots, a list of values matches any of them. Strings are compared
+        case insensitively.
+
+        :param model: msrest model
+        :return: bool
+        '''
+        for name, expected in (self.module.params.get('filters') or dict()).items():
+            if name in self._pushed_filters:
+                continue
+            value = model
+            for part in name.split('.'):
+                value = value.get(part) if isinstance(value, dict) else getattr(value, part, None)
+                if value is None:
+                    break
+            values = value if isinstance(value, list) else [value]
+            candidates = expected if isinstance(expected, list) else [expected]
+            if not any(self._filter_value_equals(x, y) for x in values for y in candidates):
+                return False
+        return True
+
+    @staticmethod
+    def _filter_value_equals(value, expected):
+        if isinstance(value, Enum):
+            value = value.value
+        if value is None or expected is None:
+            return value is expected
+        if isinstance(value, bool) or isinstance(expected, bool):
+            return to_text(value).lower() == to_text(expected).lower()
+        if isinstance(value, (int, float)) and not isinstance(expected, (int, float)):
+            try:
+                return value == float(expected)
+            except ValueError:
+                return False
+        return to_text(value).lower() == to_text(expected).lower()
+
+    @staticmethod
+    def _accepts_argument(operation, name):
+        try:
+            spec = inspect.getfullargspec(operation)
+        except AttributeError:
+            # Python 2
+            spec = inspect.getargspec(operation)
+        return name in spec.args
+
+    def serialize_facts(self, model):
+        '''
+        Used by facts modules to serialize a model. When fields is set, only the listed attributes are
+        read from the model and serialized, then query, a JMESPath expression, is applied to the result.
+
+        :param model: msrest model
+        :return: serialized model
+        '''
+        if self._field_tree:
+            result = self._project(model, self._field_tree)
+        else:
+            result = model.as_dict()
+        if self._query:
+            result = self._query.search(result)
+        return result
+
+    @staticmethod
+    def _get_field_tree(fields):
+        # ['name', 'ip_configurations.name'] -> {'name': {}, 'ip_configurations': {'name': {}}}
+        tree = dict()
+        for field in fields:
+            node = tree
+            for part in field.split('.'):
+                node = node.setdefault(part, dict())
+        return tree
+
+    def _project(self, value, tree):
+        if value is None:
+            return None
+        if isinstance(value, list):
+            return [self._project(item, tree) for item in value]
+        if not tree:
+            if hasattr(value, 'as_dict'):
+                return value.as_dict()
+            if isinstance(value, dict):
+                return dict((key, self._project(item, tree)) for key, item in value.items())
+            if isinstance(value, Enum):
+                return value.value
+            if isinstance(value, (datetime.datetime, datetime.date)):
+                return value.isoformat()
+            return value
+        result = dict()
+        for key, subtree in tree.items():
+            child = value.get(key) if isinstance(value, dict) else getattr(value, key, None)
+            result[key] = self._project(child, subtree)
+        return result
+
+    @staticmethod
+    def _format_next_link(page_link, offset):
+        # the token points into a page, as pages are not aligned with max_items
+        return base64.urlsafe_b64encode(to_bytes(json.dumps([page_link, offset]))).decode('ascii')
+
+    def _parse_next_link(self, token):
+        try:
+            page_link, offset = json.loads(base64.urlsafe_b64decode(to_bytes(token)).decode('utf-8'))
+            return page_link, int(offset)
+        except (TypeError, ValueError):
+            self.fail("Invalid next_link {0}, use the next_link returned by the previous run".format(token))
 
     def _get_profile(self, profile="default"):
         path = expanduser("~/.azure/credentials")
@@ -558,10 +2174,57 @@ class AzureRMModuleBase(object):
             cli_credentials = self._get_azure_cli_credentials()
             return cli_credentials
         except CLIError as ce:
-            self.log('Error getting AzureCLI profile credentials - {0}'.format(ce))
+            self.log('Error getting AzureCLI profile credentials - {0}', ce)
 
         return None
 
+    def _get_token_cache(self):
+        path = os.environ.get(AZURE_TOKEN_CACHE_ENV, AZURE_TOKEN_CACHE_PATH)
+        if not path or path.lower() in AZURE_DISABLED_VALUES:
+            return None
+        return AzureRMTokenCache(path)
+
+    def _get_cached_credentials(self, factory, tenant, principal, secret):
+        '''
+        Return credentials built from a cached AAD token when one is still valid, otherwise
+        acquire a new token through factory() and store it for subsequent module runs.
+
+        The credentials keep the secret, so a cached token expiring during a long running
+        operation is replaced by a new one instead of failing the requests with 401.
+
+        :param factory: function returning ServicePrincipalCredentials or UserPassCredentials,
+                        without acquiring a token when called with cached=True
+        :param tenant: AAD tenant
+        :param principal: client id or user name
+        :param secret: client secret or password, part of the cache key only
+        :return: credentials object
+        '''
+        cache = self._get_token_cache()
+        if cache is None:
+            with self.timer('auth'):
+                return factory()
+
+        key = cache.make_key(self._cloud_environment.endpoints.active_directory,
+                             self._cloud_environment.endpoints.active_directory_resource_id,
+                             tenant,
+                             principal,
+                             secret)
+        token = cache.get(key)
+        if token:
+            try:
+                self.log('Using cached token for {0}', principal)
+                credentials = factory(cached=True)
+                credentials.token = token
+                credentials.signed_session()
+                return credentials
+            except Exception as exc:
+                self.log('Ignoring cached token - {0}', exc)
+
+        with self.timer('auth'):
+            credentials = factory()
+        cache.put(key, credentials.token)
+        return credentials
+
     def serialize_obj(self, obj, class_name, enum_modules=None):
         '''
         Return a JSON representation of an Azure object.
@@ -571,35 +2234,174 @@ class AzureRMModuleBase(object):
         :param enum_modules: List of module names to build enum dependencies from.
         :return: serialized result
         '''
-        enum_modules = [] if enum_modules is None else enum_modules
+        return self.get_serializer(enum_modules).body(obj, class_name, keep_readonly=True)
+
+    def serialize_many(self, objs, class_name, enum_modules=None):
+        '''
+        Return JSON representations of a list of Azure objects of the same class.
+
+        :param objs: iterable of Azure objects
+        :param class_name: Name of the objects' class
+        :param enum_modules: List of module names to build enum dependencies from.
+        :return: list of serialized results
+        '''
+        serializer = self.get_serializer(enum_modules)
+        return [serializer.body(obj, class_name, keep_readonly=True) for obj in objs]
 
-        dependencies = dict()
-        if enum_modules:
-            for module_name in enum_modules:
-                mod = importlib.import_module(module_name)
-                for mod_class_name, mod_class_obj in inspect.getmembers(mod, predicate=inspect.isclass):
-                    dependencies[mod_class_name] = mod_class_obj
-            self.log("dependencies: ")
-            self.log(str(dependencies))
-        serializer = Serializer(classes=dependencies)
-        return serializer.body(obj, class_name, keep_readonly=True)
+    def get_serializer(self, enum_modules=None):
+        '''
+        Return the Serializer knowing the classes of enum_modules. Serializers are built once per
+        process for every list of enum modules, importing and walking the modules is costly.
 
-    def get_poller_result(self, poller, wait=5):
+        :param enum_modules: List of module names to build enum dependencies from.
+        :return: msrest Serializer
+        '''
+        key = tuple(enum_modules or [])
+        with AZURE_SERIALIZERS_LOCK:
+            serializer = AZURE_SERIALIZERS.get(key)
+            if serializer is None:
+                dependencies = dict()
+                for module_name in key:
+                    mod = importlib.import_module(module_name)
+                    for mod_class_name, mod_class_obj in inspect.getmembers(mod, predicate=inspect.isclass):
+                        dependencies[mod_class_name] = mod_class_obj
+                if dependencies:
+                    self.log("dependencies: ")
+                    self.log("{0}", dependencies)
+                serializer = Serializer(classes=dependencies)
+                AZURE_SERIALIZERS[key] = serializer
+            return serializer
+
+    def get_poller_result(self, poller, wait=None, timeout=None, max_delay=None):
         '''
         Consistent method of waiting on and retrieving results from Azure's long poller
 
+        Status checks start after wait seconds and back off exponentially, with jitter, up to
+        max_delay seconds. A Retry-After returned by the service is never undercut.
+
         :param poller Azure poller object
+        :param wait initial delay between status checks, in seconds
+        :param timeout overall number of seconds to wait for the operation, unlimited if None
+        :param max_delay upper bound of the delay between status checks, in seconds
         :return object resulting from the original request
         '''
+        if self.module.params.get('wait') is False:
+            raise AzureRMAsyncOperation(self.get_operation_handle(poller))
+
+        delay = wait or AZURE_POLL_INITIAL_DELAY
+        max_delay = max_delay or get_env_number(AZURE_POLL_MAX_DELAY_ENV, AZURE_POLL_MAX_DELAY)
+        timeout = timeout or get_env_number(AZURE_POLL_TIMEOUT_ENV)
+        start = time.time()
+        polls = 0
         try:
-            delay = wait
             while not poller.done():
-                self.log("Waiting for {0} sec".format(delay))
-                poller.wait(timeout=delay)
+                elapsed = time.time() - start
+                if timeout and elapsed >= timeout:
+                    self.fail("Timed out after {0} seconds waiting for the long running operation to complete".format(int(elapsed)))
+                sleep = min(delay, max_delay) * (1 + random.uniform(-AZURE_POLL_JITTER, AZURE_POLL_JITTER))
+                sleep = max(sleep, self._get_poller_retry_after(poller))
+                if timeout:
+                    sleep = min(sleep, timeout - elapsed)
+                polls += 1
+                self.log("Waiting for {0:.1f} sec", sleep)
+                self._set_poller_delay(poller, sleep)
+                poller.wait(timeout=sleep)
+                delay *= 2
             return poller.result()
         except Exception as exc:
-            self.log(str(exc))
+            self.log("{0}", exc)
             raise
+        finally:
+            stats = self._poller_stats or dict(operations=0, polls=0, elapsed=0.0)
+            stats['operations'] += 1
+            stats['polls'] += polls
+            stats['elapsed'] = round(stats['elapsed'] + time.time() - start, 3)
+            self._poller_stats = stats
+            if self._timings is not None:
+                self._timings.add_phase('poller', start, time.time())
+
+    @staticmethod
+    def get_operation_handle(poller):
+        '''
+        Describe a started long running operation so that it can be awaited by another task,
+        see azure_rm_operation_wait.
+
+        :param poller: Azure poller object
+        :return: dict with the resource id, HTTP method, api version and status URLs
+        '''
+        polling = getattr(poller, '_polling_method', poller)
+        operation = getattr(polling, '_operation', None)
+        response = getattr(operation, 'initial_response', None) or getattr(polling, '_response', None)
+        request = getattr(response, 'request', None)
+        headers = getattr(response, 'headers', None) or dict()
+
+        url = urlparse.urlparse(getattr(request, 'url', None) or '')
+        method = (getattr(request, 'method', None) or getattr(operation, 'method', None) or '').upper()
+        resource_path = url.path
+        if method == 'POST':
+            # actions are posted to <resource id>/<action name>
+            resource_path = resource_path.rsplit('/', 1)[0]
+        try:
+            body = response.json()
+        except Exception:
+            body = None
+        if isinstance(body, dict) and body.get('id'):
+            resource_path = body['id']
+
+        return dict(
+            id=resource_path,
+            method=method,
+            endpoint='{0}://{1}'.format(url.scheme, url.netloc) if url.netloc else None,
+            api_version=(urlparse.parse_qs(url.query).get('api-version') or [None])[0],
+            azure_async_operation=getattr(operation, 'async_url', None) or headers.get('azure-asyncoperation'),
+            location=getattr(operation, 'location_url', None) or headers.get('location'),
+            started=int(time.time())
+        )
+
+    def wait_for_deletion(self, getter, poller=None, timeout=None):
+        '''
+        Wait until a deleted resource is no longer returned by the service. Some resources keep
+        being returned for a while after their delete operation has completed.
+
+        :param getter: function returning the resource, or a false value once it is gone
+        :param poller: poller returned by the delete operation, awaited first when given
+        :param timeout: overall number of seconds to wait, ANSIBLE_AZURE_DELETE_TIMEOUT by default
+        :return: None
+        '''
+        if self.module.params.get('wait') is False:
+            return
+        timeout = timeout or get_env_number(AZURE_DELETE_TIMEOUT_ENV, AZURE_DELETE_TIMEOUT)
+        start = time.time()
+        if poller is not None and hasattr(poller, 'done'):
+            self.get_poller_result(poller, timeout=timeout)
+
+        delay = AZURE_DELETE_INITIAL_DELAY
+        with self.timer('delete_wait'):
+            while getter():
+                elapsed = time.time() - start
+                if elapsed >= timeout:
+                    self.fail("Timed out after {0} seconds waiting for the resource to be deleted".format(int(elapsed)))
+                self.log("Resource still present, checking again in {0} sec", delay)
+                time.sleep(min(delay, timeout - elapsed))
+                delay = min(delay * 2, AZURE_DELETE_MAX_DELAY)
+
+    @staticmethod
+    def _get_poller_retry_after(poller):
+        # msrestazure AzureOperationPoller keeps the last response itself, msrest LROPoller in its polling method
+        polling = getattr(poller, '_polling_method', poller)
+        response = getattr(polling, '_response', None)
+        try:
+            return int(response.headers.get('retry-after', 0))
+        except (AttributeError, TypeError, ValueError):
+            return 0
+
+    @staticmethod
+    def _set_poller_delay(poller, delay):
+        # the SDK polls the operation status on a background thread, sleeping _timeout seconds
+        # between requests unless the service asks for a different interval
+        polling = getattr(poller, '_polling_method', poller)
+        if hasattr(polling, '_timeout'):
+            polling._timeout = delay
 
     def check_provisioning_state(self, azure_object, requested_state='present'):
         '''
@@ -636,7 +2438,20 @@ class AzureRMModuleBase(object):
                 self.fail("Error {0} has a provisioning state of {1}. Expecting state to be {2}.".format(
                     azure_object.name, azure_object.provisioning_state, AZURE_SUCCESS_STATE))
 
+    def check_data_plane_client(self, service):
+        '''
+        Fail in template mode before a data plane client is created: its requests do not go through
+        AzureRMHTTPAdapter, so they would be sent rather than recorded.
+
+        :param service: name of the data plane service, for the error message
+        :return: None
+        '''
+        if os.environ.get(AZURE_TEMPLATE_ENV):
+            self.fail("{0} can not be part of a template deployment, it writes to {1} directly".format(
+                self.module._name, service))
+
     def get_blob_client(self, resource_group_name, storage_account_name, storage_blob_type='block'):
+        self.check_data_plane_client('blob storage')
         keys = dict()
         try:
             # Get keys from the storage account
@@ -645,6 +2460,7 @@ class AzureRMModuleBase(object):
         except Exception as exc:
             self.fail("Error getting keys for account {0} - {1}".format(storage_account_name, str(exc)))
 
+        CloudStorageAccount = self.import_sdk('azure.storage.cloudstorageaccount', 'CloudStorageAccount')
         try:
             self.log('Create blob service')
             if storage_blob_type == 'page':
@@ -657,6 +2473,48 @@ class AzureRMModuleBase(object):
             self.fail("Error creating blob service client for storage account {0} - {1}".format(storage_account_name,
                                                                                                 str(exc)))
 
+    def get_storage_account_key(self, name):
+        '''
+        Return the first key of a storage account of the subscription, given by name only.
+
+        The storage accounts of the subscription are listed once per module run to index their ids by
+        name, and keys are fetched once per account.
+
+        :param name: storage account name
+        :return: storage account key
+        '''
+        with self._storage_account_lock:
+            if name in self._storage_account_keys:
+                return self._storage_account_keys[name]
+            if self._storage_account_ids is None:
+                self.log('Indexing storage accounts of the subscription')
+                try:
+                    self._storage_account_ids = dict((account.name, account.id) for account in self.storage_client.storage_accounts.list())
+                except CloudError as exc:
+                    self.fail("Error listing storage accounts - {0}".format(str(exc)))
+            resource_id = self._storage_account_ids.get(name)
+            if not resource_id:
+                self.fail('Error finding {0} storage account under current subscription'.format(name))
+            try:
+                keys = self.storage_client.storage_accounts.list_keys(azure_id_to_dict(resource_id)['resourceGroups'], name)
+            except CloudError as exc:
+                self.fail("Error getting keys for account {0} - {1}".format(name, str(exc)))
+            self._storage_account_keys[name] = keys.keys[0].value
+            return self._storage_account_keys[name]
+
+    def populate_mount_volume_keys(self, mount_volumes):
+        '''
+        Used by Batch AI modules to fill in the account key of the Azure File shares and blob containers
+        of mount volumes given without credentials.
+
+        :param mount_volumes: dict of lists of volumes, e.g. dict(azure_file_shares=[...], azure_blob_file_systems=[...])
+        :return: None
+        '''
+        for volumes in (mount_volumes or dict()).values():
+            for volume in volumes or []:
+                if isinstance(volume, dict) and 'account_name' in volume and 'credentials' not in volume:
+                    volume['credentials'] = {'account_key': self.get_storage_account_key(volume['account_name'])}
+
     def create_default_pip(self, resource_group, location, public_ip_name, allocation_method='Dynamic'):
         '''
         Create a default public IP address <public_ip_name> to associate with a network interface.
@@ -670,15 +2528,15 @@ class AzureRMModuleBase(object):
         '''
         pip = None
 
-        self.log("Starting create_default_pip {0}".format(public_ip_name))
-        self.log("Check to see if public IP {0} exists".format(public_ip_name))
+        self.log("Starting create_default_pip {0}", public_ip_name)
+        self.log("Check to see if public IP {0} exists", public_ip_name)
         try:
             pip = self.network_client.public_ip_addresses.get(resource_group, public_ip_name)
         except CloudError:
             pass
 
         if pip:
-            self.log("Public ip {0} found.".format(public_ip_name))
+            self.log("Public ip {0} found.", public_ip_name)
             self.check_provisioning_state(pip)
             return pip
 
@@ -686,7 +2544,7 @@ class AzureRMModuleBase(object):
             location=location,
             public_ip_allocation_method=allocation_method,
         )
-        self.log('Creating default public IP {0}'.format(public_ip_name))
+        self.log('Creating default public IP {0}', public_ip_name)
         try:
             poller = self.network_client.public_ip_addresses.create_or_update(resource_group, public_ip_name, params)
         except Exception as exc:
@@ -709,15 +2567,15 @@ class AzureRMModuleBase(object):
         '''
         group = None
 
-        self.log("Create security group {0}".format(security_group_name))
-        self.log("Check to see if security group {0} exists".format(security_group_name))
+        self.log("Create security group {0}", security_group_name)
+        self.log("Check to see if security group {0} exists", security_group_name)
         try:
             group = self.network_client.network_security_groups.get(resource_group, security_group_name)
         except CloudError:
             pass
 
         if group:
-            self.log("Security group {0} found.".format(security_group_name))
+            self.log("Security group {0} found.", security_group_name)
             self.check_provisioning_state(group)
             return group
 
@@ -753,7 +2611,7 @@ class AzureRMModuleBase(object):
                                                      destination_port_range=str(port), priority=priority, name=rule_name)
                 )
 
-        self.log('Creating default security group {0}'.format(security_group_name))
+        self.log('Creating default security group {0}', security_group_name)
         try:
             poller = self.network_client.network_security_groups.create_or_update(resource_group,
                                                                                   security_group_name,
@@ -763,13 +2621,47 @@ class AzureRMModuleBase(object):
 
         return self.get_poller_result(poller)
 
+    @staticmethod
+    def _session_configuration_callback(session, global_config, local_config, **kwargs):
+        AzureRMHTTPAdapter.mount(session)
+        return kwargs
+
     @staticmethod
     def _validation_ignore_callback(session, global_config, local_config, **kwargs):
         session.verify = False
+        return AzureRMModuleBase._session_configuration_callback(session, global_config, local_config, **kwargs)
+
+    def _get_credential_identity(self):
+        '''
+        Opaque identity of the credentials in use, clients are only shared between equal identities.
+        '''
+        if self.credentials.get('credentials') is not None:
+            parts = ['cli', self.subscription_id]
+        else:
+            parts = [self.credentials.get(key) for key in ('tenant', 'client_id', 'secret', 'ad_user', 'password')]
+        return AzureRMTokenCache.make_key(self._cloud_environment.name, self._cert_validation_mode, *parts)
 
     def get_mgmt_svc_client(self, client_type, base_url=None, api_version=None):
-        self.log('Getting management service client {0}'.format(client_type.__name__))
+        self.log('Getting management service client {0}', client_type.__name__)
         self.check_client_version(client_type)
+
+        pool = os.environ.get(AZURE_CLIENT_POOL_ENV, 'on')
+        if pool.lower() in AZURE_DISABLED_VALUES:
+            return self._create_mgmt_svc_client(client_type, base_url, api_version)
+
+        key = ('{0}.{1}'.format(client_type.__module__, client_type.__name__),
+               self.subscription_id,
+               base_url,
+               api_version,
+               self._get_credential_identity())
+        # credentials holding a secret acquire a new token on expiry, others are replaced with their client
+        token = getattr(self.azure_credentials, 'token', None)
+        renewable = hasattr(self.azure_credentials, 'set_token')
+        return AZURE_CLIENT_POOL.get(key,
+                                     lambda: self._create_mgmt_svc_client(client_type, base_url, api_version),
+                                     AzureRMTokenCache.token_expiry(token) if isinstance(token, dict) and not renewable else None)
+
+    def _create_mgmt_svc_client(self, client_type, base_url=None, api_version=None):
         if api_version:
             client = client_type(self.azure_credentials,
                                  self.subscription_id,
@@ -789,16 +2681,23 @@ class AzureRMModuleBase(object):
         if VSCODEEXT_USER_AGENT_KEY in os.environ:
             client.config.add_user_agent(os.environ[VSCODEEXT_USER_AGENT_KEY])
 
+        client.config.session_configuration_callback = self._session_configuration_callback
         if self._cert_validation_mode == 'ignore':
             client.config.session_configuration_callback = self._validation_ignore_callback
 
+        # reuse the same session, and so its connections, for all requests of the client
+        client.config.keep_alive = True
+
+        # first status check of a long running operation, get_poller_result backs off from there
+        client.config.long_running_operation_timeout = AZURE_POLL_INITIAL_DELAY
+
         return client
 
     @property
     def storage_client(self):
         self.log('Getting storage client...')
         if not self._storage_client:
-            self._storage_client = self.get_mgmt_svc_client(StorageManagementClient,
+            self._storage_client = self.get_mgmt_svc_client(self.import_sdk('azure.mgmt.storage', 'StorageManagementClient'),
                                                             base_url=self._cloud_environment.endpoints.resource_manager,
                                                             api_version='2017-10-01')
         return self._storage_client
@@ -806,13 +2705,13 @@ class AzureRMModuleBase(object):
     @property
     def storage_models(self):
         self.log('Getting storage models...')
-        return StorageManagementClient.models("2017-10-01")
+        return self.import_sdk('azure.mgmt.storage', 'StorageManagementClient').models("2017-10-01")
 
     @property
     def network_client(self):
         self.log('Getting network client')
         if not self._network_client:
-            self._network_client = self.get_mgmt_svc_client(NetworkManagementClient,
+            self._network_client = self.get_mgmt_svc_client(self.import_sdk('azure.mgmt.network', 'NetworkManagementClient'),
                                                             base_url=self._cloud_environment.endpoints.resource_manager,
                                                             api_version='2017-06-01')
         return self._network_client
@@ -820,13 +2719,13 @@ class AzureRMModuleBase(object):
     @property
     def network_models(self):
         self.log("Getting network models...")
-        return NetworkManagementClient.models("2017-06-01")
+        return self.import_sdk('azure.mgmt.network', 'NetworkManagementClient').models("2017-06-01")
 
     @property
     def rm_client(self):
         self.log('Getting resource manager client')
         if not self._resource_client:
-            self._resource_client = self.get_mgmt_svc_client(ResourceManagementClient,
+            self._resource_client = self.get_mgmt_svc_client(self.import_sdk('azure.mgmt.resource.resources', 'ResourceManagementClient'),
                                                              base_url=self._cloud_environment.endpoints.resource_manager,
                                                              api_version='2017-05-10')
         return self._resource_client
@@ -834,13 +2733,13 @@ class AzureRMModuleBase(object):
     @property
     def rm_models(self):
         self.log("Getting resource manager models")
-        return ResourceManagementClient.models("2017-05-10")
+        return self.import_sdk('azure.mgmt.resource.resources', 'ResourceManagementClient').models("2017-05-10")
 
     @property
     def compute_client(self):
         self.log('Getting compute client')
         if not self._compute_client:
-            self._compute_client = self.get_mgmt_svc_client(ComputeManagementClient,
+            self._compute_client = self.get_mgmt_svc_client(self.import_sdk('azure.mgmt.compute', 'ComputeManagementClient'),
                                                             base_url=self._cloud_environment.endpoints.resource_manager,
                                                             api_version='2017-03-30')
         return self._compute_client
@@ -848,13 +2747,13 @@ class AzureRMModuleBase(object):
     @property
     def compute_models(self):
         self.log("Getting compute models")
-        return ComputeManagementClient.models("2017-03-30")
+        return self.import_sdk('azure.mgmt.compute', 'ComputeManagementClient').models("2017-03-30")
 
     @property
     def dns_client(self):
         self.log('Getting dns client')
         if not self._dns_client:
-            self._dns_client = self.get_mgmt_svc_client(DnsManagementClient,
+            self._dns_client = self.get_mgmt_svc_client(self.import_sdk('azure.mgmt.dns', 'DnsManagementClient'),
                                                         base_url=self._cloud_environment.endpoints.resource_manager)
         return self._dns_client
 
@@ -862,7 +2761,7 @@ class AzureRMModuleBase(object):
     def web_client(self):
         self.log('Getting web client')
         if not self._web_client:
-            self._web_client = self.get_mgmt_svc_client(WebSiteManagementClient,
+            self._web_client = self.get_mgmt_svc_client(self.import_sdk('azure.mgmt.web', 'WebSiteManagementClient'),
                                                         base_url=self._cloud_environment.endpoints.resource_manager)
         return self._web_client
 
@@ -870,6 +2769,6 @@ class AzureRMModuleBase(object):
     def containerservice_client(self):
         self.log('Getting container service client')
         if not self._containerservice_client:
-            self._containerservice_client = self.get_mgmt_svc_client(ContainerServiceClient,
+            self._containerservice_client = self.get_mgmt_svc_client(self.import_sdk('azure.mgmt.containerservice', 'ContainerServiceClient'),
                                                                      base_url=self._cloud_environment.endpoints.resource_manager)
         return self._containerservice_client
@@ -0,0 +1,463 @@
+# Copyright (c) 2026 agent, <agent@local>
+#
+# This file is part of Ansible
+#
+# Ansible is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Ansible is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Ansible.  If not, see <http://www.gnu.org/licenses/>.
+
+'''
+Persistent worker processes running azure_rm modules, enabled with ANSIBLE_AZURE_WORKER=on.
+
+The module process started by Ansible validates its arguments, then AzureRMModuleBase hands the module
+source and arguments to a worker over a Unix socket and prints the result the worker returns. Workers
+keep the SDK packages they imported, management clients and their connections between tasks.
+
+A worker is started on first use by the module process, importing the module utils from where it did.
+There is one worker per credential identity and version of the module utils, so a worker never holds
+clients or tokens of other credentials. It forks ANSIBLE_AZURE_WORKER_PROCESSES processes which run one
+module at a time each, and exits once they have been idle for ANSIBLE_AZURE_WORKER_IDLE_TIMEOUT seconds.
+'''
+
+import binascii
+import errno
+import hashlib
+import hmac
+import json
+import os
+import shutil
+import socket
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+import zipfile
+
+import ansible.module_utils as module_utils
+from ansible.module_utils import basic
+from ansible.module_utils._text import to_bytes, to_text
+from ansible.module_utils.six import StringIO
+from ansible.module_utils.azure_rm_common import AZURE_COMMON_ARGS, AZURE_CREDENTIAL_ENV_MAPPING, AZURE_WORKER_ENV, \
+    AZURE_WORKER_DIR_ENV, AZURE_WORKER_DIR, AZURE_WORKER_PROCESSES_ENV, AZURE_WORKER_PROCESSES, \
+    AZURE_WORKER_IDLE_TIMEOUT_ENV, AZURE_WORKER_IDLE_TIMEOUT, AZURE_WORKER_MAX_REQUESTS_ENV, AZURE_WORKER_MAX_REQUESTS, fcntl, \
+    get_env_number
+
+# seconds to wait for a free worker process before running the module in the calling process
+AZURE_WORKER_CONNECT_TIMEOUT = 2
+# seconds to wait for a newly started worker to accept connections
+AZURE_WORKER_START_TIMEOUT = 10
+# exit code of worker processes which served ANSIBLE_AZURE_WORKER_MAX_REQUESTS modules and are replaced
+AZURE_WORKER_RECYCLE = 75
+
+# modules loaded by the worker, keyed by a hash of their source
+LOADED_MODULES = dict()
+
+# started with the configuration built by run_in_worker as argument, loads the ansible packages the
+# way the module process did
+WORKER_BOOTSTRAP = '''
+import json, sys
+config = json.loads(sys.argv[1])
+sys.path[:] = config['sys_path']
+import ansible.module_utils
+ansible.module_utils.__path__[:] = config['module_utils_path']
+from ansible.module_utils.azure_rm_worker import serve
+serve(config['socket_path'], config['key'])
+'''
+
+
+def _hash(data):
+    return hashlib.sha256(to_bytes(data)).hexdigest()
+
+
+def _send(connection, message):
+    data = to_bytes(json.dumps(message))
+    connection.sendall(struct.pack('!I', len(data)) + data)
+
+
+def _read(connection, size):
+    chunks = []
+    while size:
+        chunk = connection.recv(min(size, 65536))
+        if not chunk:
+            raise EOFError('connection closed')
+        chunks.append(chunk)
+        size -= len(chunk)
+    return b''.join(chunks)
+
+
+def _receive(connection):
+    size = struct.unpack('!I', _read(connection, 4))[0]
+    return json.loads(to_text(_read(connection, size)))
+
+
+def get_module_source(module):
+    '''
+    Source of a module, also when it was loaded from the AnsiballZ archive.
+
+    :param module: module object
+    :return: source text or None
+    '''
+    loader = getattr(module, '__loader__', None)
+    names = [getattr(getattr(module, '__spec__', None), 'name', None), getattr(module, '__name__', None)]
+    for name in [x for x in names if x]:
+        try:
+            source = loader.get_source(name)
+        except Exception:
+            continue
+        if source:
+            return to_text(source)
+    path = getattr(module, '__file__', None)
+    if path and path.endswith('.py') and os.path.isfile(path):
+        with open(path, 'rb') as source_file:
+            return to_text(source_file.read())
+    return None
+
+
+def _split_archive(path):
+    # '/tmp/ansible_x/payload.zip/ansible/module_utils' -> '/tmp/ansible_x/payload.zip', '/ansible/module_utils'
+    head = path
+    while head and not os.path.exists(head):
+        parent = os.path.dirname(head)
+        if parent == head:
+            break
+        head = parent
+    if head and os.path.isfile(head) and zipfile.is_zipfile(head):
+        return head, path[len(head):]
+    return None, path
+
+
+def export_import_paths(directory):
+    '''
+    Import paths for the worker to load the ansible packages from the same places as this process. The AnsiballZ
+    archive holding them is removed once the module process exits, so it is copied to directory first.
+
+    :param directory: worker directory
+    :return: sys.path, path of ansible.module_utils and hash of the code they point to
+    '''
+    digest = hashlib.sha256()
+    copies = dict()
+
+    def export(path):
+        archive, inner = _split_archive(path)
+        if archive is None:
+            digest.update(to_bytes(path))
+            return path
+        if archive not in copies:
+            with open(archive, 'rb') as archive_file:
+                archive_hash = hashlib.sha256(archive_file.read()).hexdigest()
+            copy = os.path.join(directory, 'code-{0}.zip'.format(archive_hash[:16]))
+            if not os.path.exists(copy):
+                fd, staging = tempfile.mkstemp(dir=directory, prefix='.code-')
+                os.close(fd)
+                shutil.copyfile(archive, staging)
+                os.rename(staging, copy)
+            copies[archive] = copy
+            digest.update(to_bytes(archive_hash))
+        return copies[archive] + inner
+
+    sys_path = [export(path) for path in sys.path]
+    module_utils_path = [export(path) for path in module_utils.__path__]
+    # module utils loaded from directories, the role being developed, are versioned by their content
+    for name in ('ansible.module_utils.azure_rm_common', 'ansible.module_utils.azure_rm_worker'):
+        digest.update(to_bytes(get_module_source(sys.modules.get(name)) or ''))
+    return sys_path, module_utils_path, digest.hexdigest()
+
+
+def get_worker_directory():
+    '''
+    Directory of the worker sockets, created private to the user. An existing directory is made private
+    when the user owns it, and not used otherwise.
+
+    :return: path of the directory
+    '''
+    directory = os.path.expanduser(os.environ.get(AZURE_WORKER_DIR_ENV, AZURE_WORKER_DIR))
+    if not os.path.isdir(directory):
+        os.makedirs(directory, 0o700)
+    status = os.stat(directory)
+    if status.st_uid != os.getuid():
+        raise OSError(errno.EPERM, 'worker directory {0} belongs to another user'.format(directory))
+    if status.st_mode & 0o077:
+        os.chmod(directory, 0o700)
+    return directory
+
+
+def get_worker_salt(directory):
+    '''
+    Random salt of the worker keys of the user, created on first use in a file only the user can read.
+
+    :param directory: worker directory
+    :return: salt as bytes
+    '''
+    path = os.path.join(directory, 'salt')
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except OSError as exc:
+        if exc.errno != errno.EEXIST:
+            raise
+    else:
+        with os.fdopen(fd, 'wb') as salt_file:
+            salt_file.write(to_bytes(binascii.hexlify(os.urandom(32))))
+    if os.stat(path).st_mode & 0o077:
+        raise OSError(errno.EPERM, 'worker salt {0} is readable by other users'.format(path))
+    with open(path, 'rb') as salt_file:
+        salt = salt_file.read().strip()
+    if not salt:
+        # the process creating it has not written it yet
+        raise OSError(errno.EAGAIN, 'worker salt {0} is empty'.format(path))
+    return salt
+
+
+def get_worker_key(params, code_hash, salt):
+    '''
+    Identity of the worker serving a module: credentials, wherever they come from, and module utils version.
+    Secrets are part of the identity, which is why it is a keyed hash, the salt of the user being the key.
+    '''
+    identity = dict((key, params.get(key)) for key in AZURE_COMMON_ARGS if not key.startswith('log_'))
+    identity['environ'] = dict((name, os.environ.get(name)) for name in
+                               list(AZURE_CREDENTIAL_ENV_MAPPING.values()) + ['AZURE_CONFIG_DIR', 'HOME'])
+    identity['uid'] = os.getuid()
+    identity['python'] = sys.executable
+    identity['code'] = code_hash
+    return hmac.new(salt, to_bytes(json.dumps(identity, sort_keys=True, default=str)), hashlib.sha256).hexdigest()
+
+
+def _connect(socket_path):
+    '''
+    Connect to a worker and wait until one of its processes is free.
+
+    :return: tuple of the connection, None when the worker is not running or busy, and a flag telling
+             whether the worker is running
+    '''
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    connection.settimeout(AZURE_WORKER_CONNECT_TIMEOUT)
+    try:
+        connection.connect(socket_path)
+    except socket.error:
+        connection.close()
+        return None, False
+    try:
+        if not _receive(connection).get('ready'):
+            raise ValueError('unexpected greeting')
+    except (socket.error, EOFError, ValueError):
+        connection.close()
+        return None, True
+    connection.settimeout(None)
+    return connection, True
+
+
+def _start_worker(config):
+    devnull = open(os.devnull, 'r+b')
+    try:
+        subprocess.Popen([sys.executable, '-c', WORKER_BOOTSTRAP, json.dumps(config)], stdin=devnull, stdout=devnull, stderr=devnull,
+                         close_fds=True, cwd='/', preexec_fn=os.setsid)
+    finally:
+        devnull.close()
+
+
+def _get_connection(socket_path, config):
+    connection, running = _connect(socket_path)
+    if connection is not None or running:
+        return connection
+    with open(socket_path + '.lock', 'a') as lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            connection, running = _connect(socket_path)
+            if connection is None and not running:
+                if os.path.exists(socket_path):
+                    # left behind by a worker which did not exit cleanly
+                    os.unlink(socket_path)
+                _start_worker(config)
+                deadline = time.time() + AZURE_WORKER_START_TIMEOUT
+                while connection is None and time.time() < deadline:
+                    time.sleep(0.05)
+                    connection, running = _connect(socket_path)
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+    return connection
+
+
+def run_in_worker(module):
+    '''
+    Run a module in its worker.
+
+    :param module: AzureRMModuleBase instance which validated its arguments
+    :return: tuple of exit code and output of the module, None when it has to run in this process
+    '''
+    if not hasattr(socket, 'AF_UNIX') or fcntl is None:
+        return None
+    try:
+        raw_args = to_text(basic._ANSIBLE_ARGS) if basic._ANSIBLE_ARGS is not None else None
+        source = get_module_source(sys.modules.get(type(module).__module__))
+        if raw_args is None or source is None:
+            return None
+        directory = get_worker_directory()
+        sys_path, module_utils_path, code_hash = export_import_paths(directory)
+        key = get_worker_key(module.module.params, code_hash, get_worker_salt(directory))
+        socket_path = os.path.join(directory, key[:32] + '.sock')
+        request = dict(key=key,
+                       source=source,
+                       class_name=type(module).__name__,
+                       args=raw_args,
+                       environ=dict(os.environ),
+                       cwd=os.getcwd())
+        connection = _get_connection(socket_path, dict(sys_path=sys_path,
+                                                       module_utils_path=module_utils_path,
+                                                       socket_path=socket_path,
+                                                       key=key))
+    except (IOError, OSError, ValueError, TypeError, UnicodeError) as exc:
+        module.log('Running without worker - {0}', exc, level='warning')
+        return None
+    if connection is None:
+        module.log('No worker available, running in this process', level='info')
+        return None
+
+    # the module may have started running from here, it is never run a second time
+    try:
+        _send(connection, request)
+        response = _receive(connection)
+    except (socket.error, EOFError, ValueError) as exc:
+        module.fail("Lost the connection to the Azure module worker - {0}".format(exc))
+    finally:
+        connection.close()
+    if response.get('error'):
+        module.fail("Azure module worker failed - {0}".format(response['error']))
+    return response['rc'], response['output']
+
+
+def _load_module(source):
+    code_hash = _hash(source)
+    if code_hash not in LOADED_MODULES:
+        namespace = dict(__name__='ansible_azure_worker_module')
+        exec(compile(source, '<azure_rm module>', 'exec'), namespace)
+        LOADED_MODULES[code_hash] = namespace
+    return LOADED_MODULES[code_hash]
+
+
+def run_request(request):
+    '''
+    Run a module forwarded by run_in_worker in this process, the way the module process would have.
+
+    :param request: module source, class, raw arguments, environment and working directory
+    :return: dict with exit code and output of the module
+    '''
+    os.environ.clear()
+    os.environ.update(request['environ'])
+    os.environ[AZURE_WORKER_ENV] = 'off'
+    try:
+        os.chdir(request['cwd'])
+    except OSError:
+        pass
+
+    stdout = sys.stdout
+    output = StringIO()
+    rc = 0
+    try:
+        namespace = _load_module(request['source'])
+        basic._ANSIBLE_ARGS = to_bytes(request['args'])
+        sys.stdout = output
+        namespace[request['class_name']]()
+    except SystemExit as exc:
+        rc = exc.code if isinstance(exc.code, int) else (0 if exc.code is None else 1)
+    except Exception as exc:
+        rc = 1
+        output.write(json.dumps(dict(failed=True, msg="Module failed in the Azure module worker - {0}".format(exc),
+                                     exception=traceback.format_exc())))
+    finally:
+        sys.stdout = stdout
+        basic._ANSIBLE_ARGS = None
+    return dict(rc=rc, output=output.getvalue())
+
+
+def _handle(connection, key):
+    connection.settimeout(None)
+    _send(connection, dict(ready=True))
+    request = _receive(connection)
+    if request.get('key') != key:
+        _send(connection, dict(error='the worker serves other credentials'))
+        return
+    _send(connection, run_request(request))
+
+
+def _serve_requests(listener, key, idle_timeout, max_requests):
+    listener.settimeout(idle_timeout)
+    handled = 0
+    while handled < max_requests:
+        try:
+            connection = listener.accept()[0]
+        except socket.timeout:
+            return 0
+        except socket.error as exc:
+            # another process of the worker accepted the connection first
+            if exc.args and exc.args[0] in (errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR):
+                continue
+            raise
+        try:
+            _handle(connection, key)
+        except Exception:
+            # the module process went away, nothing to report to
+            pass
+        finally:
+            connection.close()
+        handled += 1
+    return AZURE_WORKER_RECYCLE
+
+
+def serve(socket_path, key):
+    '''
+    Worker main loop, started by run_in_worker.
+
+    :param socket_path: Unix socket to listen on
+    :param key: identity of the modules the worker runs, see get_worker_key
+    :return: None
+    '''
+    os.environ[AZURE_WORKER_ENV] = 'off'
+    processes = int(get_env_number(AZURE_WORKER_PROCESSES_ENV, AZURE_WORKER_PROCESSES))
+    idle_timeout = get_env_number(AZURE_WORKER_IDLE_TIMEOUT_ENV, AZURE_WORKER_IDLE_TIMEOUT)
+    max_requests = max(1, int(get_env_number(AZURE_WORKER_MAX_REQUESTS_ENV, AZURE_WORKER_MAX_REQUESTS)))
+
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    umask = os.umask(0o177)
+    try:
+        listener.bind(socket_path)
+    except socket.error:
+        # another worker was started in the meantime
+        return
+    finally:
+        os.umask(umask)
+    listener.listen(64)
+
+    children = set()
+
+    def start():
+        pid = os.fork()
+        if pid == 0:
+            code = 1
+            try:
+                code = _serve_requests(listener, key, idle_timeout, max_requests)
+            finally:
+                os._exit(code)
+        children.add(pid)
+
+    try:
+        for _ in range(max(1, processes)):
+            start()
+        while children:
+            pid, status = os.wait()
+            children.discard(pid)
+            if os.WIFEXITED(status) and os.WEXITSTATUS(status) == AZURE_WORKER_RECYCLE:
+                start()
+    finally:
+        listener.close()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
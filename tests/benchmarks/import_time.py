@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2026 agent, <agent@local>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Measure the start-up import cost of the modules in library/.
+
+Every module is loaded in a fresh interpreter twice: once as it is loaded today
+(azure_rm_common imports management SDK packages on demand) and once with the SDK
+packages azure_rm_common used to import eagerly pre-loaded, which reproduces the
+previous start-up cost.
+
+Usage: python tests/benchmarks/import_time.py [--repeat N] [module_name ...]
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import argparse
+import glob
+import json
+import os
+import subprocess
+import sys
+
+ROLE_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+EAGER_IMPORTS = [
+    'azure.mgmt.network.version',
+    'azure.mgmt.storage.version',
+    'azure.mgmt.compute.version',
+    'azure.mgmt.resource.version',
+    'azure.mgmt.dns.version',
+    'azure.mgmt.web.version',
+    'azure.mgmt.network',
+    'azure.mgmt.resource.resources',
+    'azure.mgmt.storage',
+    'azure.mgmt.compute',
+    'azure.mgmt.dns',
+    'azure.mgmt.web',
+    'azure.mgmt.containerservice',
+    'azure.storage.cloudstorageaccount',
+]
+
+# Executed in the child interpreter: point ansible.module_utils at this role, optionally
+# pre-import the formerly eager SDK packages, then load the module without running main().
+CHILD = """
+import importlib, json, runpy, sys, time
+start = time.time()
+import ansible.module_utils
+ansible.module_utils.__path__.insert(0, {module_utils!r})
+failed = []
+for name in {eager!r}:
+    try:
+        importlib.import_module(name)
+    except ImportError:
+        failed.append(name)
+runpy.run_path({path!r}, run_name='import_benchmark')
+print(json.dumps(dict(seconds=time.time() - start, missing=failed)))
+"""
+
+
+def measure(path, eager, repeat):
+    code = CHILD.format(module_utils=os.path.join(ROLE_ROOT, 'module_utils'),
+                        eager=EAGER_IMPORTS if eager else [],
+                        path=path)
+    samples = []
+    for _ in range(repeat):
+        output = subprocess.check_output([sys.executable, '-c', code])
+        samples.append(json.loads(output.decode('utf-8').strip().splitlines()[-1])['seconds'])
+    return min(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=3, help='runs per module, the fastest one is reported')
+    parser.add_argument('modules', nargs='*', help='module names, all of library/azure_rm_* by default')
+    args = parser.parse_args()
+
+    if args.modules:
+        paths = [os.path.join(ROLE_ROOT, 'library', name + '.py') for name in args.modules]
+    else:
+        paths = sorted(glob.glob(os.path.join(ROLE_ROOT, 'library', 'azure_rm_*.py')))
+
+    print('{0:<60} {1:>10} {2:>10} {3:>10}'.format('module', 'eager ms', 'lazy ms', 'saved ms'))
+    total_eager = total_lazy = 0.0
+    for path in paths:
+        name = os.path.splitext(os.path.basename(path))[0]
+        try:
+            eager = measure(path, True, args.repeat)
+            lazy = measure(path, False, args.repeat)
+        except subprocess.CalledProcessError:
+            print('{0:<60} {1:>10}'.format(name, 'failed'))
+            continue
+        total_eager += eager
+        total_lazy += lazy
+        print('{0:<60} {1:>10.1f} {2:>10.1f} {3:>10.1f}'.format(name, eager * 1000, lazy * 1000, (eager - lazy) * 1000))
+    print('{0:<60} {1:>10.1f} {2:>10.1f} {3:>10.1f}'.format('total', total_eager * 1000, total_lazy * 1000,
+                                                          (total_eager - total_lazy) * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2026 agent, <agent@local>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Run the modules in library/ against the local mock ARM server and measure their overhead.
+
+Every module is run in a fresh interpreter with its required options set to synthetic values
+taken from its DOCUMENTATION, against an empty mock server, so create and update modules create
+their resource and facts modules list nothing. For each module the wall time, the number of
+requests the mock server received (authentication excluded) and the peak resident set size are
+reported, the fastest of --repeat runs is kept. Options the documentation does not mark as required,
+or values the synthetic ones do not fit, are given per module in the JSON file passed as --args:
+
+    {"azure_rm_sqlfirewallrule": {"start_ip_address": "10.0.0.1", "end_ip_address": "10.0.0.2"}}
+
+Usage: python tests/benchmarks/modules.py [--repeat N] [--lro-polls N] [--page-size N] [--args FILE] [--json FILE] [module_name ...]
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import argparse
+import ast
+import glob
+import json
+import os
+import sys
+
+import yaml
+
+ROLE_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path.insert(0, os.path.join(ROLE_ROOT, 'tests'))
+
+from mock_arm import MockARMServer, run_module
+
+
+def get_documentation(path):
+    with open(path) as source:
+        tree = ast.parse(source.read())
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and [getattr(x, 'id', None) for x in node.targets] == ['DOCUMENTATION']:
+            return yaml.safe_load(ast.literal_eval(node.value)) or dict()
+    return dict()
+
+
+def synthetic_value(name, option):
+    if name == 'location':
+        return 'eastus'
+    if name == 'resource_group':
+        return 'benchmark'
+    if option.get('choices'):
+        return option['choices'][0]
+    option_type = option.get('type', 'str')
+    if option_type == 'bool':
+        return False
+    if option_type == 'int':
+        return 1
+    if option_type == 'list':
+        return []
+    if option_type == 'dict':
+        return dict()
+    # lower case letters and digits only, valid as the name of most resources
+    return 'bench' + ''.join(x for x in name.lower() if x.isalnum())[:12]
+
+
+def get_arguments(path):
+    options = get_documentation(path).get('options') or dict()
+    return dict((name, synthetic_value(name, option or dict()))
+                for name, option in options.items() if (option or dict()).get('required'))
+
+
+def measure(server, name, args, repeat):
+    best = None
+    for _ in range(repeat):
+        server.arm.reset()
+        run = run_module(name, args, server.module_env())
+        run['calls'] = len(server.arm.requests)
+        if best is None or run['seconds'] < best['seconds']:
+            best = run
+    result = best['result'] or dict()
+    if best['rc'] != 0 or result.get('failed') or not best['result']:
+        best['status'] = 'failed'
+        best['msg'] = result.get('msg') or (best['stderr'].strip().splitlines() or [''])[-1]
+    else:
+        best['status'] = 'changed' if result.get('changed') else 'ok'
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeat', type=int, default=1, help='runs per module, the fastest one is reported')
+    parser.add_argument('--lro-polls', type=int, default=0, help='status checks before a create or update completes')
+    parser.add_argument('--page-size', type=int, default=100, help='number of resources per page of a listing')
+    parser.add_argument('--args', help='JSON file of module options, by module name, overriding the synthetic ones')
+    parser.add_argument('--json', help='file receiving the measures as JSON')
+    parser.add_argument('modules', nargs='*', help='module names, all of library/azure_rm_* by default')
+    args = parser.parse_args()
+
+    if args.modules:
+        paths = [os.path.join(ROLE_ROOT, 'library', name + '.py') for name in args.modules]
+    else:
+        paths = sorted(glob.glob(os.path.join(ROLE_ROOT, 'library', 'azure_rm_*.py')))
+
+    overrides = dict()
+    if args.args:
+        with open(args.args) as source:
+            overrides = json.load(source)
+
+    server = MockARMServer(lro_polls=args.lro_polls, page_size=args.page_size).start()
+    measures = []
+    print('{0:<60} {1:>8} {2:>10} {3:>8} {4:>10}'.format('module', 'status', 'seconds', 'calls', 'rss MB'))
+    try:
+        for path in paths:
+            name = os.path.splitext(os.path.basename(path))[0]
+            module_args = get_arguments(path)
+            module_args.update(overrides.get(name) or dict())
+            run = measure(server, name, module_args, args.repeat)
+            measures.append(dict(module=name, status=run['status'], seconds=round(run['seconds'], 3), calls=run['calls'],
+                                 max_rss_kb=run['max_rss_kb'], msg=run.get('msg')))
+            print('{0:<60} {1:>8} {2:>10.3f} {3:>8} {4:>10.1f}'.format(name, run['status'], run['seconds'], run['calls'],
+                                                                     (run['max_rss_kb'] or 0) / 1024.0))
+    finally:
+        server.stop()
+
+    succeeded = [x for x in measures if x['status'] != 'failed']
+    if succeeded:
+        print('{0:<60} {1:>8} {2:>10.3f} {3:>8} {4:>10.1f}'.format(
+            'total ({0} of {1} modules ran)'.format(len(succeeded), len(measures)), '',
+            sum(x['seconds'] for x in succeeded), sum(x['calls'] for x in succeeded),
+            max((x['max_rss_kb'] or 0) for x in succeeded) / 1024.0))
+    if args.json:
+        with open(args.json, 'w') as output:
+            json.dump(measures, output, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,157 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2026 agent, <agent@local>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Measure serialize_obj and serialize_many over a large list of synthetic models.
+
+The models live in a generated module holding as many classes as an SDK models package, it is
+passed as enum module. The first column rebuilds the enum dependency map and the Serializer for
+every model, as serialize_obj used to, the others reuse the serializer cached per enum module list.
+
+Usage: python tests/benchmarks/serialize_obj.py [--count N] [--classes N] [--repeat N]
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import argparse
+import importlib
+import inspect
+import os
+import sys
+import time
+import types
+
+ROLE_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+import ansible.module_utils
+ansible.module_utils.__path__.insert(0, os.path.join(ROLE_ROOT, 'module_utils'))
+
+from enum import Enum
+from msrest.serialization import Model, Serializer
+from ansible.module_utils.azure_rm_common import AzureRMModuleBase, AZURE_SERIALIZERS
+
+MODELS_MODULE = 'serialize_obj_benchmark_models'
+
+
+class SyntheticState(str, Enum):
+    succeeded = 'Succeeded'
+    failed = 'Failed'
+
+
+class SyntheticIPConfiguration(Model):
+    _attribute_map = {
+        'name': {'key': 'name', 'type': 'str'},
+        'private_ip_address': {'key': 'properties.privateIPAddress', 'type': 'str'},
+        'primary': {'key': 'properties.primary', 'type': 'bool'},
+    }
+
+    def __init__(self, **kwargs):
+        super(SyntheticIPConfiguration, self).__init__(**kwargs)
+        self.name = kwargs.get('name')
+        self.private_ip_address = kwargs.get('private_ip_address')
+        self.primary = kwargs.get('primary')
+
+
+class SyntheticNetworkInterface(Model):
+    _attribute_map = {
+        'id': {'key': 'id', 'type': 'str'},
+        'name': {'key': 'name', 'type': 'str'},
+        'location': {'key': 'location', 'type': 'str'},
+        'tags': {'key': 'tags', 'type': '{str}'},
+        'ip_configurations': {'key': 'properties.ipConfigurations', 'type': '[SyntheticIPConfiguration]'},
+        'provisioning_state': {'key': 'properties.provisioningState', 'type': 'SyntheticState'},
+    }
+
+    def __init__(self, **kwargs):
+        super(SyntheticNetworkInterface, self).__init__(**kwargs)
+        self.id = kwargs.get('id')
+        self.name = kwargs.get('name')
+        self.location = kwargs.get('location')
+        self.tags = kwargs.get('tags')
+        self.ip_configurations = kwargs.get('ip_configurations')
+        self.provisioning_state = kwargs.get('provisioning_state')
+
+
+def register_models_module(classes):
+    module = types.ModuleType(MODELS_MODULE)
+    for cls in [SyntheticState, SyntheticIPConfiguration, SyntheticNetworkInterface]:
+        setattr(module, cls.__name__, cls)
+    for index in range(classes):
+        name = 'SyntheticFiller{0}'.format(index)
+        setattr(module, name, type(name, (Model,), dict(_attribute_map={'name': {'key': 'name', 'type': 'str'}})))
+    sys.modules[MODELS_MODULE] = module
+
+
+def build_models(count):
+    prefix = '/subscriptions/00000000-0000-0000-0000-000000000000/resourceGroups/rg/providers/Microsoft.Network/networkInterfaces/'
+    return [SyntheticNetworkInterface(id=prefix + 'nic{0}'.format(index),
+                                      name='nic{0}'.format(index),
+                                      location='eastus',
+                                      tags=dict(index=str(index)),
+                                      ip_configurations=[SyntheticIPConfiguration(name='ipconfig1',
+                                                                                  private_ip_address='10.0.0.{0}'.format(index % 250),
+                                                                                  primary=True)],
+                                      provisioning_state=SyntheticState.succeeded)
+            for index in range(count)]
+
+
+def serialize_uncached(obj, class_name, enum_modules):
+    # serialize_obj before serializers were cached
+    dependencies = dict()
+    for module_name in enum_modules:
+        mod = importlib.import_module(module_name)
+        for mod_class_name, mod_class_obj in inspect.getmembers(mod, predicate=inspect.isclass):
+            dependencies[mod_class_name] = mod_class_obj
+    return Serializer(classes=dependencies).body(obj, class_name, keep_readonly=True)
+
+
+def measure(func, repeat):
+    samples = []
+    result = None
+    for _ in range(repeat):
+        AZURE_SERIALIZERS.clear()
+        start = time.time()
+        result = func()
+        samples.append(time.time() - start)
+    return min(samples), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=2000, help='number of models serialized')
+    parser.add_argument('--classes', type=int, default=500, help='number of classes in the enum module')
+    parser.add_argument('--repeat', type=int, default=3, help='runs per variant, the fastest one is reported')
+    args = parser.parse_args()
+
+    register_models_module(args.classes)
+    models = build_models(args.count)
+    enum_modules = [MODELS_MODULE]
+    # the benchmark only needs the serialization helpers, not an Ansible module run
+    module = AzureRMModuleBase.__new__(AzureRMModuleBase)
+    module._log_level = None
+
+    variants = [
+        ('uncached', lambda: [serialize_uncached(x, 'SyntheticNetworkInterface', enum_modules) for x in models]),
+        ('serialize_obj', lambda: [module.serialize_obj(x, 'SyntheticNetworkInterface', enum_modules) for x in models]),
+        ('serialize_many', lambda: module.serialize_many(models, 'SyntheticNetworkInterface', enum_modules)),
+    ]
+
+    print('{0:<20} {1:>10} {2:>14} {3:>10}'.format('variant', 'seconds', 'us per model', 'speedup'))
+    baseline = None
+    expected = None
+    for name, func in variants:
+        seconds, result = measure(func, args.repeat)
+        if expected is None:
+            expected = result
+        elif result != expected:
+            print('{0:<20} {1:>10}'.format(name, 'mismatch'))
+            continue
+        baseline = baseline or seconds
+        print('{0:<20} {1:>10.3f} {2:>14.1f} {3:>9.1f}x'.format(name, seconds, seconds * 1e6 / args.count, baseline / seconds))
+
+
+if __name__ == '__main__':
+    main()
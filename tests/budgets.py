@@ -0,0 +1,226 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2026 agent, <agent@local>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Check the number of ARM requests modules send against the budgets in tests/budgets.yml.
+
+The tasks of tests/integration/targets/<module>/tasks/main.yml calling modules of library/ are run
+in order against the local mock ARM server (tests/mock_arm.py), which records every request, so a
+target goes through the same create, check mode, idempotent re-run and delete steps as in the
+integration tests. A target whose integration tasks can not run against the mock server, as they
+lack arguments the module requires, is run from tests/budget_scenarios/<module>.yml instead, a
+mock-only scenario in the same format which is never run against Azure. The requests of each task, authentication excluded, are compared with the budget
+of the task in tests/budgets.yml:
+
+    azure_rm_sqlfirewallrule:
+      Create instance of Firewall Rule: 3        # exactly 3 requests
+      Delete instance of Firewall Rule:
+        max: 4                                   # at most 4 requests
+
+The script exits with status 1 when a task exceeds or misses its budget or fails, so an extra
+request added to a module fails CI. Tasks using loops, tasks of modules not in library/ and
+set_fact tasks are skipped, the test variables take fixed values (rpfx is 'budget').
+
+--update runs the targets and writes the observed counts as exact budgets, for the targets whose
+tasks all ran.
+
+Usage: python tests/budgets.py [--update] [--all] [--lro-polls N] [module_name ...]
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import argparse
+import os
+import re
+import sys
+
+import jinja2
+import yaml
+
+ROLE_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(ROLE_ROOT, 'tests'))
+
+from mock_arm import MockARMServer, run_module, SUBSCRIPTION_ID, TENANT, CLIENT_ID
+
+try:
+    string_types = basestring
+except NameError:
+    string_types = str
+
+BUDGETS_PATH = os.path.join(ROLE_ROOT, 'tests', 'budgets.yml')
+TARGETS_PATH = os.path.join(ROLE_ROOT, 'tests', 'integration', 'targets')
+SCENARIOS_PATH = os.path.join(ROLE_ROOT, 'tests', 'budget_scenarios')
+
+BUDGETS_HEADER = """\
+# Number of ARM requests, authentication excluded, sent by each task of
+# tests/integration/targets/<module>/tasks/main.yml, or of tests/budget_scenarios/<module>.yml when
+# the target has one, when run against tests/mock_arm.py.
+# An integer is an exact budget, {max: N} an upper bound. Checked by tests/budgets.py.
+"""
+
+# test variables, the integration tests get them from the inventory or from set_fact tasks
+TEST_VARS = dict(resource_group='budgets',
+                 resource_group_secondary='budgets2',
+                 rpfx='budget',
+                 azure_subscription_id=SUBSCRIPTION_ID,
+                 azure_tenant=TENANT,
+                 azure_client_id=CLIENT_ID)
+
+TASK_KEYWORDS = ['name', 'register', 'check_mode', 'ignore_errors', 'run_once', 'when', 'tags', 'delegate_to']
+LOOP_KEYWORDS = ['with_items', 'with_sequence', 'with_dict', 'loop']
+
+
+class RegisteredUndefined(jinja2.Undefined):
+    # variables the tasks refer to but this script does not know render as their name
+    def __str__(self):
+        return self._undefined_name or ''
+
+
+ENVIRONMENT = jinja2.Environment(undefined=RegisteredUndefined)
+
+
+def render(value, variables):
+    if isinstance(value, dict):
+        return dict((key, render(item, variables)) for key, item in value.items())
+    if isinstance(value, list):
+        return [render(item, variables) for item in value]
+    if not isinstance(value, string_types) or '{{' not in value:
+        return value
+    match = re.match(r'^\{\{(.*)\}\}$', value.strip())
+    if match and '{{' not in match.group(1):
+        # a single expression keeps the type of its value
+        result = ENVIRONMENT.compile_expression(match.group(1), undefined_to_none=False)(**variables)
+        return str(result) if isinstance(result, jinja2.Undefined) else result
+    return ENVIRONMENT.from_string(value).render(**variables)
+
+
+def get_targets(names=None):
+    if names:
+        return names
+    targets = set(x for x in os.listdir(TARGETS_PATH) if os.path.exists(os.path.join(TARGETS_PATH, x, 'tasks', 'main.yml')))
+    targets.update(os.path.splitext(x)[0] for x in os.listdir(SCENARIOS_PATH) if x.endswith('.yml'))
+    return sorted(targets)
+
+
+def get_tasks_path(target):
+    '''
+    :return: path of the mock-only scenario of a target when it has one, of its integration tasks otherwise
+    '''
+    path = os.path.join(SCENARIOS_PATH, target + '.yml')
+    if os.path.exists(path):
+        return path
+    return os.path.join(TARGETS_PATH, target, 'tasks', 'main.yml')
+
+
+def run_target(server, target):
+    '''
+    Run the tasks of a target calling modules of library/.
+
+    :return: list of dicts with the name, module, number of requests and status of every task
+    '''
+    with open(get_tasks_path(target)) as source:
+        tasks = yaml.safe_load(source) or []
+
+    server.arm.reset()
+    env = server.module_env()
+    variables = dict(TEST_VARS)
+    outcomes = []
+    for task in tasks:
+        module = [x for x in task if x not in TASK_KEYWORDS and x not in LOOP_KEYWORDS]
+        module = module[0] if len(module) == 1 else None
+        if not module or not module.startswith('azure_rm_'):
+            continue
+        name = task.get('name') or module
+        if not os.path.exists(os.path.join(ROLE_ROOT, 'library', module + '.py')) or \
+                any(x in task for x in LOOP_KEYWORDS):
+            outcomes.append(dict(name=name, module=module, calls=None, status='skipped'))
+            continue
+
+        try:
+            args = render(task[module] or dict(), variables)
+        except jinja2.UndefinedError:
+            # the arguments come from the result of a skipped task
+            outcomes.append(dict(name=name, module=module, calls=None, status='skipped'))
+            continue
+
+        start = len(server.arm.requests)
+        run = run_module(module, args, env, check_mode=bool(task.get('check_mode')))
+        result = run['result'] or dict()
+        if task.get('register'):
+            variables[task['register']] = result
+        failed = run['rc'] != 0 or result.get('failed') or not run['result']
+        status = 'failed' if failed and not task.get('ignore_errors') else 'ok'
+        outcomes.append(dict(name=name, module=module, calls=len(server.arm.requests) - start, status=status,
+                             msg=(result.get('msg') or (run['stderr'].strip().splitlines() or [''])[-1]) if failed else None))
+    return outcomes
+
+
+def check(outcome, budget):
+    '''
+    :return: None when the task is within its budget, otherwise the reason it is not
+    '''
+    if outcome['status'] == 'failed':
+        return 'failed: {0}'.format(outcome['msg'])
+    if budget is None or outcome['calls'] is None:
+        return None
+    if isinstance(budget, dict):
+        if outcome['calls'] > budget['max']:
+            return '{0} requests, at most {1} expected'.format(outcome['calls'], budget['max'])
+    elif outcome['calls'] != budget:
+        return '{0} requests, {1} expected'.format(outcome['calls'], budget)
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--update', action='store_true', help='write the observed counts to tests/budgets.yml')
+    parser.add_argument('--all', action='store_true', help='run every integration target, not only the budgeted ones')
+    parser.add_argument('--lro-polls', type=int, default=0, help='status checks before a create or update completes')
+    parser.add_argument('targets', nargs='*', help='integration targets, the budgeted ones by default')
+    args = parser.parse_args()
+
+    budgets = dict()
+    if os.path.exists(BUDGETS_PATH):
+        with open(BUDGETS_PATH) as source:
+            budgets = yaml.safe_load(source) or dict()
+    targets = get_targets(args.targets or (None if args.all or args.update else sorted(budgets)))
+
+    server = MockARMServer(lro_polls=args.lro_polls).start()
+    violations = 0
+    try:
+        for target in targets:
+            outcomes = run_target(server, target)
+            target_budgets = budgets.get(target) or dict()
+            for outcome in outcomes:
+                problem = check(outcome, target_budgets.get(outcome['name']))
+                violations += 1 if problem else 0
+                print('{0:<50} {1:<70} {2:>6} {3:>6} {4}'.format(
+                    target, outcome['name'][:70], '-' if outcome['calls'] is None else outcome['calls'],
+                    str(target_budgets.get(outcome['name'], '-')) if not isinstance(target_budgets.get(outcome['name']), dict)
+                    else '<={0}'.format(target_budgets[outcome['name']]['max']),
+                    problem or outcome['status']))
+            if args.update and outcomes and all(x['status'] == 'ok' for x in outcomes if x['status'] != 'skipped'):
+                observed = dict((x['name'], x['calls']) for x in outcomes if x['calls'] is not None)
+                if observed:
+                    # upper bounds set by hand are kept
+                    observed.update((key, value) for key, value in target_budgets.items() if isinstance(value, dict))
+                    budgets[target] = observed
+    finally:
+        server.stop()
+
+    if args.update:
+        with open(BUDGETS_PATH, 'w') as output:
+            output.write(BUDGETS_HEADER)
+            yaml.safe_dump(budgets, output, default_flow_style=False, width=200)
+        return 0
+    if violations:
+        print('{0} tasks out of budget'.format(violations))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
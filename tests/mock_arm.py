@@ -0,0 +1,455 @@
+#!/usr/bin/env python
+#
+# Copyright (c) 2026 agent, <agent@local>
+#
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+"""
+Local stand-in for Azure Resource Manager, to run the modules in library/ without a subscription.
+
+The server answers the cloud metadata and AAD token requests made while authenticating, then keeps
+the resources it is sent in memory: PUT creates or replaces a resource, PATCH updates it, GET reads it
+or lists a collection page by page, DELETE removes it with its child resources. Creates and updates can
+be made long running operations which complete after a number of status checks, deletes complete at
+once as operations which are not long running accept no other answer. New resources get the read-only
+properties their service would set, see SERVICE_PROPERTIES and SERVICE_FIELDS. Template deployments
+create the resources of their template and return the reference() outputs of these resources.
+
+Responses recorded in a JSON file take precedence over this behaviour, each entry holds a method,
+a regular expression searched in the path, a status, an optional body, optional headers and an
+optional number of times it is used:
+
+    [{"method": "GET", "path": "/providers/Microsoft.Sql/servers/s1$", "status": 200, "body": {...}}]
+
+The server speaks HTTPS, as the SDK sends tokens over HTTPS only, with a certificate for 127.0.0.1
+generated by openssl when it starts. Point modules at the server with cloud_environment (or
+AZURE_CLOUD_ENVIRONMENT) set to its URL and REQUESTS_CA_BUNDLE set to its certificate, see
+MockARMServer.module_env. Every request but the metadata, token and control ones is recorded and
+returned by GET /mock/requests, POST /mock/reset clears them together with the resources.
+
+Usage: python tests/mock_arm.py [--port N] [--recording FILE] [--lro-polls N] [--page-size N]
+"""
+
+from __future__ import absolute_import, division, print_function
+
+import argparse
+import json
+import os
+import re
+import shutil
+import ssl
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+try:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+    from urlparse import urlparse, parse_qs
+except ImportError:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+    from urllib.parse import urlparse, parse_qs
+
+import ansible.module_utils
+
+ROLE_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# modules run with the ansible.module_utils of this process, which are the ones of this role
+if os.path.join(ROLE_ROOT, 'module_utils') not in ansible.module_utils.__path__:
+    ansible.module_utils.__path__.insert(0, os.path.join(ROLE_ROOT, 'module_utils'))
+
+from ansible.module_utils.azure_rm_common import run_module as run_module_file
+
+SUBSCRIPTION_ID = '00000000-0000-0000-0000-000000000000'
+TENANT = '00000000-0000-0000-0000-000000000001'
+CLIENT_ID = '00000000-0000-0000-0000-000000000002'
+
+# read-only properties the services set on the resources they create, by resource type, {name} is the
+# name of the resource
+SERVICE_PROPERTIES = {
+    'microsoft.sql/servers': dict(version='12.0', state='Ready',
+                                  fullyQualifiedDomainName='{name}.database.windows.net'),
+    'microsoft.sql/servers/databases': dict(databaseId='00000000-0000-0000-0000-000000000003', status='Online'),
+    'microsoft.sql/servers/elasticpools': dict(state='Ready'),
+    'microsoft.sql/servers/communicationlinks': dict(state='Ready'),
+    'microsoft.sql/servers/virtualnetworkrules': dict(state='Ready'),
+    'microsoft.sql/servers/syncagents': dict(state='NeverConnected', version='4.2.0.0'),
+    'microsoft.dbformysql/servers': dict(version='5.7', userVisibleState='Ready',
+                                         fullyQualifiedDomainName='{name}.mysql.database.azure.com'),
+    'microsoft.dbformysql/servers/virtualnetworkrules': dict(state='Ready'),
+    'microsoft.dbforpostgresql/servers': dict(version='9.6', userVisibleState='Ready',
+                                              fullyQualifiedDomainName='{name}.postgres.database.azure.com'),
+    'microsoft.dbforpostgresql/servers/virtualnetworkrules': dict(state='Ready'),
+    'microsoft.containerregistry/registries': dict(status=dict(displayStatus='Ready')),
+    'microsoft.containerregistry/registries/replications': dict(status=dict(displayStatus='Ready')),
+    'microsoft.containerregistry/registries/webhooks': dict(status='enabled'),
+    'microsoft.web/sites': dict(state='Running'),
+    'microsoft.web/serverfarms': dict(status='Ready'),
+    'microsoft.web/hostingenvironments': dict(status='Ready'),
+    'microsoft.certificateregistration/certificateorders': dict(status='Pendingissuance'),
+}
+
+# the same for the services returning their resources without a properties object
+SERVICE_FIELDS = {
+    'microsoft.batch/batchaccounts/applications/versions': dict(version='{name}', state='pending'),
+}
+
+# services answering the create of a resource with 200 rather than 201, and its delete with 204 rather than
+# 200 and the deleted resource, by resource type
+CREATE_OK_TYPES = ['microsoft.batch/batchaccounts', 'microsoft.batch/batchaccounts/certificates',
+                   'microsoft.batch/batchaccounts/pools', 'microsoft.batchai/clusters', 'microsoft.batchai/fileservers',
+                   'microsoft.batchai/jobs', 'microsoft.dbformysql/servers/configurations',
+                   'microsoft.dbforpostgresql/servers/configurations', 'microsoft.domainregistration/domains',
+                   'microsoft.web/certificates', 'microsoft.web/hostingenvironments', 'microsoft.web/serverfarms',
+                   'microsoft.web/sites']
+DELETE_NO_CONTENT_TYPES = ['microsoft.batch/batchaccounts/applications', 'microsoft.batch/batchaccounts/applications/versions',
+                           'microsoft.network/networkwatchers', 'microsoft.network/networkwatchers/packetcaptures',
+                           'microsoft.web/hostingenvironments']
+
+
+class MockARM(object):
+    '''
+    In-memory resources, long running operations and the log of requests of the mock server.
+    '''
+
+    def __init__(self, recording=None, lro_polls=0, page_size=100):
+        self.lock = threading.Lock()
+        self.recording = [dict(x) for x in recording or []]
+        self.lro_polls = lro_polls
+        self.page_size = page_size
+        self.resources = dict()
+        self.operations = dict()
+        self.requests = []
+
+    def reset(self):
+        with self.lock:
+            self.resources.clear()
+            self.operations.clear()
+            self.requests = []
+
+    def log(self, method, path, status):
+        with self.lock:
+            self.requests.append(dict(method=method, path=path, status=status))
+
+    def handle(self, method, url, body, base_url):
+        '''
+        :return: tuple of status, response body and response headers
+        '''
+        parsed = urlparse(url)
+        path = parsed.path.rstrip('/') or '/'
+        query = parse_qs(parsed.query)
+
+        if path == '/metadata/endpoints':
+            return 200, dict(galleryEndpoint=base_url + '/',
+                             graphEndpoint=base_url + '/',
+                             portalEndpoint=base_url + '/',
+                             authentication=dict(loginEndpoint=base_url, audiences=[base_url + '/'])), {}
+        if path.endswith('/oauth2/token'):
+            return 200, dict(token_type='Bearer',
+                             access_token='mock-token',
+                             expires_in='3600',
+                             expires_on=str(int(time.time()) + 3600),
+                             resource=base_url + '/'), {}
+        if path == '/mock/requests':
+            with self.lock:
+                return 200, dict(requests=list(self.requests)), {}
+        if path == '/mock/reset':
+            self.reset()
+            return 200, dict(), {}
+
+        status, response, headers = self.replay(method, path)
+        if status is None:
+            status, response, headers = self.serve(method, path, query, body, base_url)
+        self.log(method, path, status)
+        return status, response, headers
+
+    def replay(self, method, path):
+        with self.lock:
+            for entry in self.recording:
+                if entry.get('method', 'GET').upper() != method or not re.search(entry['path'], path, re.IGNORECASE):
+                    continue
+                if entry.get('times') is not None:
+                    if entry['times'] <= 0:
+                        continue
+                    entry['times'] -= 1
+                return entry.get('status', 200), entry.get('body'), entry.get('headers') or {}
+        return None, None, None
+
+    def serve(self, method, path, query, body, base_url):
+        pieces = path.strip('/').split('/')
+        key = path.lower()
+        if key.startswith('/mock/operations/'):
+            return self.get_operation(pieces[-1])
+        if len(pieces) < 2 or pieces[0].lower() != 'subscriptions':
+            return error(404, 'InvalidResourceType', "No route for {0}".format(path))
+
+        # resource groups always exist, they are not part of the modules of this role
+        if len(pieces) == 3 and pieces[2].lower() == 'resourcegroups':
+            return 200, dict(value=[]), {}
+        if len(pieces) == 4 and pieces[2].lower() == 'resourcegroups':
+            return 200, dict(id=path, name=pieces[3], location='eastus', properties=dict(provisioningState='Succeeded')), {}
+
+        provider = [x.lower() for x in pieces].index('providers') if 'providers' in [x.lower() for x in pieces] else None
+        if provider is None or len(pieces) < provider + 3:
+            return error(404, 'InvalidResourceType', "No route for {0}".format(path))
+        types = pieces[provider + 2:]
+        resource_type = '/'.join([pieces[provider + 1]] + types[0::2])
+
+        if len(types) % 2:
+            if method == 'GET':
+                return self.list(path, query, base_url)
+            if method == 'POST':
+                return self.action(path)
+            return error(405, 'MethodNotAllowed', "{0} is not allowed on {1}".format(method, path))
+
+        if method == 'GET':
+            with self.lock:
+                resource = self.resources.get(key)
+            if resource is None:
+                return error(404, 'ResourceNotFound', "The Resource '{0}' was not found.".format(resource_type))
+            return 200, resource, {}
+        if method in ['PUT', 'PATCH']:
+            with self.lock:
+                existing = self.resources.get(key)
+                if method == 'PATCH':
+                    if existing is None:
+                        return error(404, 'ResourceNotFound', "The Resource '{0}' was not found.".format(resource_type))
+                    resource = merge(existing, body or dict())
+                else:
+                    resource = dict(body or dict())
+                resource.update(id=path, name=pieces[-1], type=resource_type)
+                resource['properties'] = dict(resource.get('properties') or dict(), provisioningState='Succeeded')
+                for name, value in SERVICE_PROPERTIES.get(resource_type.lower(), dict()).items():
+                    resource['properties'].setdefault(name, value.format(name=pieces[-1]) if isinstance(value, str) else value)
+                for name, value in SERVICE_FIELDS.get(resource_type.lower(), dict()).items():
+                    resource.setdefault(name, value.format(name=pieces[-1]))
+                if resource_type.lower() == 'microsoft.resources/deployments':
+                    self.deploy('/'.join(pieces[:provider]), resource['properties'])
+                self.resources[key] = resource
+            created = existing is None and method == 'PUT' and resource_type.lower() not in CREATE_OK_TYPES
+            return self.start_operation(201 if created else 200, resource, base_url)
+        if method == 'DELETE':
+            with self.lock:
+                resource = self.resources.get(key)
+                removed = [x for x in self.resources if x == key or x.startswith(key + '/')]
+                for name in removed:
+                    del self.resources[name]
+            if not removed or resource_type.lower() in DELETE_NO_CONTENT_TYPES:
+                return 204, None, {}
+            return 200, resource, {}
+        return error(405, 'MethodNotAllowed', "{0} is not allowed on {1}".format(method, path))
+
+    def deploy(self, resource_group, properties):
+        '''
+        Create the resources of a template deployment and set its outputs, only reference() of a
+        resource of the template is evaluated. Called holding the lock.
+        '''
+        for entry in (properties.get('template') or dict()).get('resources') or []:
+            types = entry['type'].split('/')
+            names = entry['name'].split('/')
+            path = '/{0}/providers/{1}/{2}'.format(resource_group, types[0],
+                                                  '/'.join(x for pair in zip(types[1:], names) for x in pair))
+            resource = dict((key, value) for key, value in entry.items() if key not in ['apiVersion', 'dependsOn'])
+            resource.update(id=path, name=names[-1])
+            resource['properties'] = dict(resource.get('properties') or dict(), provisioningState='Succeeded')
+            self.resources[path.lower()] = resource
+        outputs = dict()
+        for name, output in ((properties.get('template') or dict()).get('outputs') or dict()).items():
+            match = re.match(r"^\[reference\('([^']+)'", to_text(output.get('value')))
+            if match and match.group(1).lower() in self.resources:
+                outputs[name] = dict(type='Object', value=self.resources[match.group(1).lower()])
+        properties['outputs'] = outputs
+
+    def list(self, path, query, base_url):
+        key = path.lower()
+        pieces = key.strip('/').split('/')
+        with self.lock:
+            if '/resourcegroups/' in key:
+                matches = [value for name, value in sorted(self.resources.items()) if name.rsplit('/', 1)[0] == key]
+            else:
+                # subscription wide listing, by resource type
+                resource_type = '/'.join(pieces[pieces.index('providers') + 1:])
+                matches = [value for name, value in sorted(self.resources.items())
+                           if name.startswith('/' + '/'.join(pieces[:2]) + '/') and value['type'].lower() == resource_type]
+        skip = int(query.get('$skiptoken', ['0'])[0])
+        page = dict(value=matches[skip:skip + self.page_size])
+        if skip + self.page_size < len(matches):
+            page['nextLink'] = '{0}{1}?api-version={2}&$skiptoken={3}'.format(base_url, path, query.get('api-version', [''])[0],
+                                                                             skip + self.page_size)
+        return 200, page, {}
+
+    @staticmethod
+    def action(path):
+        if path.lower().endswith('/listkeys'):
+            return 200, dict(keys=[dict(keyName='key1', value='bW9jay1rZXkx', permissions='Full'),
+                                   dict(keyName='key2', value='bW9jay1rZXky', permissions='Full')]), {}
+        return 200, dict(), {}
+
+    def start_operation(self, status, resource, base_url):
+        if not self.lro_polls:
+            return status, resource, {}
+        with self.lock:
+            name = str(len(self.operations) + 1)
+            self.operations[name] = self.lro_polls
+        headers = {'Azure-AsyncOperation': '{0}/mock/operations/{1}?api-version=2017-01-01'.format(base_url, name),
+                   'Retry-After': '0'}
+        return 201, resource, headers
+
+    def get_operation(self, name):
+        with self.lock:
+            if name not in self.operations:
+                return error(404, 'NotFound', "Operation {0} not found".format(name))
+            self.operations[name] -= 1
+            done = self.operations[name] <= 0
+        return 200, dict(status='Succeeded' if done else 'InProgress'), {} if done else {'Retry-After': '0'}
+
+
+def to_text(value):
+    return value if isinstance(value, type(u'')) else u'{0}'.format(value or '')
+
+
+def merge(current, update):
+    result = dict(current)
+    for key, value in update.items():
+        if isinstance(value, dict) and isinstance(result.get(key), dict):
+            result[key] = merge(result[key], value)
+        else:
+            result[key] = value
+    return result
+
+
+def error(status, code, message):
+    return status, dict(error=dict(code=code, message=message)), {}
+
+
+class MockARMRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def handle_request(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        raw = self.rfile.read(length) if length else b''
+        try:
+            body = json.loads(raw.decode('utf-8')) if raw and 'json' in (self.headers.get('Content-Type') or 'json') else None
+        except ValueError:
+            body = None
+        status, response, headers = self.server.arm.handle(self.command, self.path, body, self.server.url)
+        data = json.dumps(response).encode('utf-8') if response is not None else b''
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.send_header('x-ms-request-id', str(len(self.server.arm.requests)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    do_GET = do_PUT = do_PATCH = do_POST = do_DELETE = do_HEAD = handle_request
+
+    def log_message(self, format, *args):
+        pass
+
+
+class MockARMServer(ThreadingMixIn, HTTPServer):
+    '''
+    Threaded HTTPS server answering as Azure Resource Manager, on 127.0.0.1.
+    '''
+    daemon_threads = True
+
+    def __init__(self, port=0, recording=None, lro_polls=0, page_size=100):
+        HTTPServer.__init__(self, ('127.0.0.1', port), MockARMRequestHandler)
+        self.directory = tempfile.mkdtemp(prefix='mock-arm-')
+        self.certificate = os.path.join(self.directory, 'certificate.pem')
+        key = os.path.join(self.directory, 'key.pem')
+        subprocess.check_call(['openssl', 'req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-days', '2',
+                               '-subj', '/CN=127.0.0.1', '-addext', 'subjectAltName=IP:127.0.0.1',
+                               '-keyout', key, '-out', self.certificate],
+                              stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        context = ssl.SSLContext(getattr(ssl, 'PROTOCOL_TLS_SERVER', ssl.PROTOCOL_SSLv23))
+        context.load_cert_chain(self.certificate, key)
+        # the handshake happens in the thread handling the connection
+        self.socket = context.wrap_socket(self.socket, server_side=True, do_handshake_on_connect=False)
+        self.arm = MockARM(recording, lro_polls, page_size)
+        self.url = 'https://127.0.0.1:{0}'.format(self.server_address[1])
+        self.thread = None
+
+    def start(self):
+        self.thread = threading.Thread(target=self.serve_forever)
+        self.thread.daemon = True
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def server_close(self):
+        HTTPServer.server_close(self)
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def module_env(self, env=None):
+        '''
+        Environment running modules against the server: service principal credentials, the server as cloud
+        environment trusted through its certificate, and the caches and pacing of azure_rm_common off so that
+        every run sends the same requests.
+        '''
+        env = dict(os.environ if env is None else env)
+        env.update(AZURE_SUBSCRIPTION_ID=SUBSCRIPTION_ID,
+                   AZURE_TENANT=TENANT,
+                   AZURE_CLIENT_ID=CLIENT_ID,
+                   AZURE_SECRET='mock-secret',
+                   AZURE_CLOUD_ENVIRONMENT=self.url,
+                   REQUESTS_CA_BUNDLE=self.certificate,
+                   NO_PROXY='127.0.0.1',
+                   no_proxy='127.0.0.1',
+                   ANSIBLE_AZURE_TOKEN_CACHE='off',
+                   ANSIBLE_AZURE_THROTTLE='off',
+                   ANSIBLE_AZURE_RESOURCE_GROUP_CACHE='off',
+                   ANSIBLE_AZURE_WORKER='off',
+                   ANSIBLE_AZURE_POLL_MAX_DELAY='0')
+        for name in ['AZURE_PROFILE', 'AZURE_AD_USER', 'AZURE_PASSWORD', 'AZURE_CERT_VALIDATION_MODE']:
+            env.pop(name, None)
+        return env
+
+
+def run_module(name, args, env, check_mode=False):
+    '''
+    Run a module of library/ in a new interpreter.
+
+    :return: dict with the return code, the result (None when the module printed none), the wall time
+             in seconds, the peak resident set size in KB and stderr
+    '''
+    usage = dict()
+    rc, result, stdout, stderr = run_module_file(os.path.join(ROLE_ROOT, 'library', name + '.py'),
+                                                 dict(args, _ansible_check_mode=check_mode, _ansible_module_name=name),
+                                                 env, usage)
+    return dict(rc=rc, result=result, seconds=usage['seconds'], max_rss_kb=usage['max_rss_kb'], stderr=stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--port', type=int, default=0, help='port to listen on, any free port by default')
+    parser.add_argument('--recording', help='JSON file of recorded responses')
+    parser.add_argument('--lro-polls', type=int, default=0, help='status checks before a write completes, 0 for synchronous writes')
+    parser.add_argument('--page-size', type=int, default=100, help='number of resources per page of a listing')
+    args = parser.parse_args()
+
+    recording = None
+    if args.recording:
+        with open(args.recording) as source:
+            recording = json.load(source)
+    server = MockARMServer(args.port, recording, args.lro_polls, args.page_size)
+    print('Listening on {0}, set AZURE_CLOUD_ENVIRONMENT={0}'.format(server.url))
+    sys.stdout.flush()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
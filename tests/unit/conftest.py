@@ -0,0 +1,50 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# Load ansible.module_utils.azure_rm_* from this role rather than from the installed ansible, and
+# provide the mock ARM server of tests/mock_arm.py to the tests running modules.
+
+import os
+import sys
+
+import ansible.module_utils
+import pytest
+
+ROLE_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+ansible.module_utils.__path__.insert(0, os.path.join(ROLE_ROOT, 'module_utils'))
+sys.path.insert(0, os.path.join(ROLE_ROOT, 'tests'))
+
+from mock_arm import MockARMServer
+
+
+def load_library_module(name):
+    '''
+    Import a module of library/, for the tests of its functions.
+    '''
+    path = os.path.join(ROLE_ROOT, 'library', name + '.py')
+    try:
+        from importlib.util import spec_from_file_location, module_from_spec
+    except ImportError:
+        import imp
+        return imp.load_source(name, path)
+    spec = spec_from_file_location(name, path)
+    module = module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope='session')
+def mock_server():
+    server = MockARMServer().start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def arm(mock_server):
+    '''
+    Mock ARM server without resources nor recorded requests.
+    '''
+    mock_server.arm.reset()
+    mock_server.arm.recording = []
+    return mock_server
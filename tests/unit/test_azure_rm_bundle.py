@@ -0,0 +1,155 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+import os
+
+import pytest
+
+from conftest import ROLE_ROOT, load_library_module
+from mock_arm import run_module, SUBSCRIPTION_ID
+from ansible.module_utils.azure_rm_common import AZURE_TEMPLATE_ENV
+
+bundle = load_library_module('azure_rm_bundle')
+
+GROUP = '/subscriptions/{0}/resourceGroups/{{0}}/providers/'.format(SUBSCRIPTION_ID)
+VNET = GROUP.format('app') + 'Microsoft.Network/virtualNetworks/vnet'
+SUBNET = VNET + '/subnets/sub'
+NIC = GROUP.format('app') + 'Microsoft.Network/networkInterfaces/nic'
+TABLE = GROUP.format('net') + 'Microsoft.Network/routeTables/table'
+
+RESOURCES = [
+    dict(name='subnet', module='azure_rm_appgwsubnet',
+         args=dict(resource_group='app', virtual_network_name='vnet', subnet_name='sub', address_prefix='10.0.0.0/24',
+                   route_table=dict(id=TABLE))),
+    dict(name='vnet', module='azure_rm_appgwvirtualnetwork',
+         args=dict(resource_group='app', virtual_network_name='vnet', location='eastus',
+                   address_space=dict(address_prefixes=['10.0.0.0/16']))),
+    dict(name='table', module='azure_rm_appgwroutetable',
+         args=dict(resource_group='net', route_table_name='table')),
+    dict(name='route', module='azure_rm_appgwroute',
+         args=dict(resource_group='net', route_table_name='table', route_name='r', address_prefix='10.1.0.0/16',
+                   next_hop_type='virtual_network_gateway')),
+]
+
+
+class Failed(Exception):
+    pass
+
+
+def make_bundle():
+    instance = bundle.AzureRMBundle.__new__(bundle.AzureRMBundle)
+    instance.subscription_id = SUBSCRIPTION_ID
+
+    def fail(msg, **kwargs):
+        raise Failed(msg)
+    instance.fail = fail
+    return instance
+
+
+def request(resource_id, body):
+    return dict(url='https://management.azure.com{0}?api-version=2017-11-01'.format(resource_id), body=body)
+
+
+def template_resource(resource_id, output, body=None):
+    resource = make_bundle().get_template_resource(request(resource_id, body or dict())['url'], body or dict())
+    resource.pop('resource_group')
+    resource['output'] = output
+    return resource
+
+
+def run_bundle(arm, resources, check_mode=False):
+    return run_module('azure_rm_bundle', dict(library_path=os.path.join(ROLE_ROOT, 'library'), resources=resources),
+                      arm.module_env(), check_mode=check_mode)
+
+
+def test_get_template_resource():
+    resource = make_bundle().get_template_resource(request(SUBNET, dict(id='x', name='y', properties=dict(a=1)))['url'],
+                                                   dict(id='x', name='y', properties=dict(a=1)))
+    assert resource == dict(id=SUBNET, resource_group='app', type='Microsoft.Network/virtualNetworks/subnets',
+                            name='vnet/sub', apiVersion='2017-11-01', properties=dict(a=1))
+
+
+def test_get_template_resource_of_another_subscription_fails():
+    with pytest.raises(Failed):
+        make_bundle().get_template_resource(request(VNET.replace(SUBSCRIPTION_ID, 'other'), dict())['url'], dict())
+
+
+def test_get_template_depends_on_parents_and_references():
+    resources = dict((x['id'].lower(), x) for x in [
+        template_resource(VNET, 'resource0'),
+        template_resource(SUBNET, 'resource1'),
+        template_resource(NIC, 'resource2', dict(properties=dict(ipConfigurations=[dict(subnet=dict(id=SUBNET.upper()))]))),
+    ])
+    template = bundle.AzureRMBundle.get_template(resources)
+
+    # referring to a child resource depends on its parent as well, whichever of them the template creates
+    depends_on = dict((x['name'], x.get('dependsOn')) for x in template['resources'])
+    assert depends_on == dict(vnet=None, nic=[VNET, SUBNET], **{'vnet/sub': [VNET]})
+    assert template['outputs']['resource2'] == dict(type='object', value="[reference('{0}', '2017-11-01', 'Full')]".format(NIC))
+    assert all('id' not in x and 'output' not in x for x in template['resources'])
+
+
+def test_get_deployments_orders_resource_groups_by_references():
+    outcomes = [dict(name='subnet', requests=[request(SUBNET, dict(properties=dict(routeTable=dict(id=TABLE))))], resources=[]),
+                dict(name='table', requests=[request(TABLE, dict(location='eastus'))], resources=[])]
+    deployments = make_bundle().get_deployments(outcomes)
+
+    assert [x['resource_group'] for x in deployments] == ['net', 'app']
+    assert [x['id'] for x in outcomes[0]['resources']] == [SUBNET]
+    assert deployments[1]['outcomes'][outcomes[0]['resources'][0]['output']] is outcomes[0]
+
+
+def test_get_deployments_fails_on_resource_groups_referring_to_each_other():
+    outcomes = [dict(name='subnet', requests=[request(SUBNET, dict(properties=dict(routeTable=dict(id=TABLE))))], resources=[]),
+                dict(name='table', requests=[request(TABLE, dict(tags=dict(subnet=SUBNET)))], resources=[])]
+    with pytest.raises(Failed, match="refer to each other"):
+        make_bundle().get_deployments(outcomes)
+
+
+def test_bundle_deploys_captured_requests(arm):
+    run = run_bundle(arm, RESOURCES)
+    assert run['rc'] == 0, run['stderr']
+    result = run['result']
+
+    # the modules only read their resources, the writes reach the server as deployments, in reference order
+    writes = [x['path'] for x in arm.arm.requests if x['method'] != 'GET']
+    assert writes == ['/subscriptions/{0}/resourcegroups/{1}/providers/Microsoft.Resources/deployments/ansible-bundle'.format(SUBSCRIPTION_ID, x)
+                      for x in ['net', 'app']]
+    assert result['changed']
+    assert [x['resource_group'] for x in result['deployments']] == ['net', 'app']
+
+    # the outputs of the deployments give the state of every resource
+    states = dict((x['name'], [y['state'] for y in x['resources']]) for x in result['resources'])
+    assert states['route'][0]['properties']['nextHopType'] == 'VirtualNetworkGateway'
+    assert states['subnet'][0]['properties']['routeTable']['id'] == TABLE
+    assert arm.arm.resources[SUBNET.lower()]['properties']['addressPrefix'] == '10.0.0.0/24'
+
+
+def test_bundle_in_check_mode_sends_no_write(arm):
+    run = run_bundle(arm, RESOURCES, check_mode=True)
+    assert run['rc'] == 0, run['stderr']
+
+    assert [x for x in arm.arm.requests if x['method'] != 'GET'] == []
+    assert run['result']['changed']
+    assert run['result']['deployments'] == []
+
+
+def test_bundle_rejects_data_plane_modules(arm):
+    pytest.importorskip('azure.storage.file')
+    run = run_bundle(arm, [dict(name='share', module='azure_rm_storageshare',
+                                args=dict(resource_group='app', storage_account_name='account', share='share'))])
+
+    assert run['result']['failed']
+    assert 'can not be part of a template deployment' in run['result']['msg']
+    assert [x for x in arm.arm.requests if x['method'] not in ['GET', 'POST']] == []
+
+
+def test_data_plane_clients_fail_in_template_mode(monkeypatch):
+    instance = make_bundle()
+    instance.module = type('Module', (object,), dict(_name='azure_rm_storageshare'))()
+    instance.check_data_plane_client('file storage')
+
+    monkeypatch.setenv(AZURE_TEMPLATE_ENV, os.devnull)
+    with pytest.raises(Failed, match='azure_rm_storageshare can not be part of a template deployment'):
+        instance.check_data_plane_client('file storage')
@@ -0,0 +1,69 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+import datetime
+
+from ansible.module_utils.azure_rm_common import resource_differences, get_enum_values
+
+
+ENUM_VALUES = get_enum_values(dict(sku=dict(type='str', choices=['standard_lrs', 'premium_lrs']),
+                                   site_config=dict(type='dict', options=dict(ftps_state=dict(choices=['AllAllowed', 'Disabled'])))))
+
+
+def test_identical_resource_has_no_differences():
+    desired = dict(location='eastus', sku=dict(name='Standard_LRS'), tags=dict(a='1'), enabled=True, size=10)
+    actual = dict(location='East US', sku=dict(name='Standard_LRS', tier='Standard'), tags=dict(a='1'), enabled=True,
+                  size=10.0, id='/subscriptions/x', provisioning_state='Succeeded')
+    assert resource_differences(desired, actual, ENUM_VALUES) == []
+
+
+def test_free_text_compares_case_sensitively():
+    desired = dict(description='Hello', app_settings=[dict(name='MODE', value='Debug')])
+    actual = dict(description='hello', app_settings=[dict(name='MODE', value='debug')])
+    assert resource_differences(desired, actual, ENUM_VALUES) == ['description', 'app_settings[MODE].value']
+
+
+def test_enum_members_locations_and_ids_compare_case_insensitively():
+    desired = dict(sku=dict(name='standard_lrs'), ftps_state='disabled', location='westeurope',
+                   subnet=dict(id='/subscriptions/S/resourceGroups/RG/providers/Microsoft.Network/virtualNetworks/V/subnets/A'))
+    actual = dict(sku=dict(name='Standard_LRS'), ftps_state='Disabled', location='West Europe',
+                  subnet=dict(id='/subscriptions/s/resourcegroups/rg/providers/Microsoft.Network/virtualNetworks/v/subnets/a'))
+    assert resource_differences(desired, actual, ENUM_VALUES) == []
+
+
+def test_enum_members_are_compared_with_actual_value():
+    assert resource_differences(dict(sku='premium_lrs'), dict(sku='Standard_LRS'), ENUM_VALUES) == ['sku']
+
+
+def test_empty_desired_values_match_omitted_values():
+    desired = dict(rules=[], tags=dict(), properties=dict(comment=''), settings=dict())
+    actual = dict(properties=dict())
+    assert resource_differences(desired, actual) == []
+
+
+def test_empty_desired_values_differ_from_actual_values():
+    desired = dict(rules=[], comment='')
+    actual = dict(rules=[dict(name='a')], comment='set')
+    assert resource_differences(desired, actual) == ['rules', 'comment']
+
+
+def test_tag_values_and_lists():
+    desired = dict(tags=dict(env='Prod'), ports=[80, 443], rules=[dict(name='a', priority=1)])
+    actual = dict(tags=dict(env='prod'), ports=[443, 80], rules=[dict(name='A', priority=2)])
+    assert resource_differences(desired, actual) == ['tags.env', 'rules[a].priority']
+
+
+def test_write_only_values_are_ignored_when_not_returned():
+    assert resource_differences(dict(administrator_login_password='secret'), dict()) == []
+
+
+def test_write_only_service_uri_consent_and_data_are_ignored_when_not_returned():
+    desired = dict(service_uri='http://example.com/hook', consent=dict(agreed_by='1.2.3.4'), data='MIIC')
+    assert resource_differences(desired, dict(status='enabled')) == []
+
+
+def test_dates_and_times_compare_as_instants():
+    desired = dict(start=datetime.datetime(2018, 6, 1), end='2018-06-01T12:30:00+02:00', expiry='2018-06-02T00:00:00Z')
+    actual = dict(start='2018-06-01T00:00:00.000Z', end=datetime.datetime(2018, 6, 1, 10, 30), expiry='2018-06-02T00:00:01Z')
+    assert resource_differences(desired, actual) == ['expiry']
@@ -0,0 +1,184 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+import os
+import threading
+import time
+
+import pytest
+
+from conftest import ROLE_ROOT, load_library_module
+from mock_arm import run_module, SUBSCRIPTION_ID
+
+graph = load_library_module('azure_rm_graph')
+
+TABLE = '/subscriptions/{0}/resourceGroups/rg/providers/Microsoft.Network/routeTables/table'.format(SUBSCRIPTION_ID)
+
+
+class Failed(Exception):
+    pass
+
+
+def make_graph(resources=None, concurrency=4):
+    instance = graph.AzureRMGraph.__new__(graph.AzureRMGraph)
+    instance.resources = resources or []
+    instance.library_path = os.path.join(ROLE_ROOT, 'library')
+    instance.concurrency = concurrency
+
+    def fail(msg, **kwargs):
+        raise Failed(msg)
+    instance.fail = fail
+    instance.log = lambda *args, **kwargs: None
+    return instance
+
+
+def node(key, depends_on=(), module='azure_rm_appgwroute', **args):
+    return dict(name=key, module=module, args=args, depends_on=list(depends_on))
+
+
+def diamond():
+    # table <- left, right <- last
+    return make_graph([node('table', module='azure_rm_appgwroutetable', resource_group='rg', route_table_name='table'),
+                       node('left', ['table'], resource_group='rg', route_table_name='table', route_name='left'),
+                       node('right', ['table'], resource_group='rg', route_table_name='table', route_name='right'),
+                       node('last', ['left', 'right'], resource_group='rg', route_table_name='table', route_name='last')])
+
+
+def test_dependencies_are_inferred_from_names_and_ids(tmpdir):
+    # get_nodes only checks that the modules exist
+    for name in ['azure_rm_appgwroutetable', 'azure_rm_appgwroute', 'azure_rm_appgwsubnet']:
+        tmpdir.join(name + '.py').write('')
+    instance = make_graph([node('table', module='azure_rm_appgwroutetable', resource_group='rg', name='table'),
+                           node('route', resource_group='rg', route_table_name='table', name='route'),
+                           node('subnet', module='azure_rm_appgwsubnet', resource_group='other', name='subnet',
+                                route_table=dict(id=TABLE)),
+                           node('unrelated', module='azure_rm_appgwroutetable', resource_group='other', name='table')])
+    instance.library_path = str(tmpdir)
+    nodes = instance.get_nodes()
+
+    assert nodes['table']['depends_on'] == set()
+    assert nodes['route']['depends_on'] == set(['table'])
+    # the route table of another resource group is referred to by id
+    assert nodes['subnet']['depends_on'] == set(['table'])
+    assert nodes['unrelated']['depends_on'] == set()
+
+
+def test_unknown_dependencies_fail():
+    with pytest.raises(Failed, match='depends on unknown resources: missing'):
+        make_graph([node('route', ['missing'])]).get_nodes()
+
+
+def test_diamond_is_ordered():
+    instance = diamond()
+    assert instance.get_order(instance.get_nodes()) == ['table', 'left', 'right', 'last']
+
+
+def test_cycle_fails():
+    instance = make_graph([node('a', ['c']), node('b', ['a']), node('c', ['b']), node('d')])
+    with pytest.raises(Failed, match='Dependency cycle, unable to order resources: a, b, c'):
+        instance.get_order(instance.get_nodes())
+
+
+def fake_apply(instance, statuses, delay=0.1):
+    '''
+    Replace the modules of the nodes by a sleep, recording the nodes running at the same time.
+    '''
+    lock = threading.Lock()
+    running = set()
+    overlaps = []
+
+    def apply_node(node):
+        start = time.time()
+        with lock:
+            running.add(node['name'])
+            overlaps.append(set(running))
+        time.sleep(delay)
+        with lock:
+            running.discard(node['name'])
+        end = time.time()
+        return node['name'], dict(status=statuses.get(node['name'], 'changed'), started=start, end=end, elapsed=end - start)
+
+    instance.apply_node = apply_node
+    return overlaps
+
+
+def test_apply_runs_independent_nodes_in_parallel():
+    instance = diamond()
+    nodes = instance.get_nodes()
+    overlaps = fake_apply(instance, dict())
+    outcomes = instance.apply(nodes)
+
+    assert all(outcomes[x]['status'] == 'changed' for x in nodes)
+    assert set(['left', 'right']) in overlaps
+    assert outcomes['table']['end'] <= min(outcomes['left']['started'], outcomes['right']['started'])
+    assert max(outcomes['left']['end'], outcomes['right']['end']) <= outcomes['last']['started']
+    assert instance.get_critical_path(nodes, outcomes) in (['table', 'left', 'last'], ['table', 'right', 'last'])
+
+
+def test_apply_concurrency_is_bounded():
+    instance = make_graph([node(str(x)) for x in range(6)], concurrency=2)
+    nodes = instance.get_nodes()
+    overlaps = fake_apply(instance, dict(), delay=0.05)
+    instance.apply(nodes)
+
+    assert max(len(x) for x in overlaps) == 2
+
+
+def test_dependents_of_failed_nodes_are_skipped():
+    instance = make_graph([node('table'), node('left', ['table']), node('right'), node('last', ['left', 'right']),
+                           node('after_last', ['last'])])
+    nodes = instance.get_nodes()
+    fake_apply(instance, dict(left='failed'), delay=0.01)
+    outcomes = instance.apply(nodes)
+
+    assert dict((x, outcomes[x]['status']) for x in nodes) == dict(table='changed', left='failed', right='changed',
+                                                                    last='skipped', after_last='skipped')
+    assert outcomes['last']['msg'] == 'Skipped as left did not apply'
+    assert outcomes['after_last']['msg'] == 'Skipped as last did not apply'
+    assert instance.get_critical_path(nodes, outcomes)[-1] in ('left', 'right')
+
+
+def run_graph(arm, resources):
+    return run_module('azure_rm_graph', dict(library_path=os.path.join(ROLE_ROOT, 'library'), resources=resources), arm.module_env())
+
+
+def graph_resources():
+    return [dict(name=x['name'], module=x['module'], args=x['args'], depends_on=x['depends_on']) for x in diamond().resources]
+
+
+def test_graph_applies_diamond(arm):
+    run = run_graph(arm, [dict(x, args=dict(x['args'], address_prefix='10.0.0.0/16', next_hop_type='none'))
+                          if x['module'] == 'azure_rm_appgwroute' else x for x in graph_resources()])
+    assert run['rc'] == 0, run['stderr']
+    result = run['result']
+
+    assert result['changed']
+    assert [(x['name'], x['status']) for x in result['resources']] == [(x, 'changed') for x in ['table', 'left', 'right', 'last']]
+    puts = [x['path'].rsplit('/', 1)[-1] for x in arm.arm.requests if x['method'] == 'PUT']
+    assert puts[0] == 'table' and puts[-1] == 'last'
+    assert result['critical_path'][0] == 'table' and result['critical_path'][-1] == 'last'
+
+
+def test_graph_skips_dependents_of_failed_resources(arm):
+    arm.arm.recording = [dict(method='PUT', path='/routes/left$', status=400,
+                              body=dict(error=dict(code='InvalidParameter', message='bad route')))]
+    run = run_graph(arm, [dict(x, args=dict(x['args'], address_prefix='10.0.0.0/16', next_hop_type='none'))
+                          if x['module'] == 'azure_rm_appgwroute' else x for x in graph_resources()])
+    result = run['result']
+
+    assert result['failed']
+    assert result['msg'] == '1 of 4 resources failed'
+    assert dict((x['name'], x['status']) for x in result['resources']) == dict(table='changed', left='failed',
+                                                                               right='changed', last='skipped')
+    assert not any(x['path'].endswith('/last') for x in arm.arm.requests)
+
+
+def test_graph_fails_on_cycle(arm):
+    resources = graph_resources()
+    resources[0]['depends_on'] = ['last']
+    run = run_graph(arm, resources)
+
+    assert run['result']['failed']
+    assert run['result']['msg'] == 'Dependency cycle, unable to order resources: last, left, right, table'
+    assert arm.arm.requests == []
@@ -0,0 +1,244 @@
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+import json
+import os
+import socket
+import stat
+import sys
+import threading
+import time
+
+import ansible.module_utils
+import pytest
+
+from ansible.module_utils import azure_rm_worker as worker
+from mock_arm import run_module
+
+# module printing the pid of the process running it, or exiting with the code given in its arguments
+MODULE_SOURCE = '''
+import json, os, sys
+from ansible.module_utils import basic
+
+class PidModule(object):
+    def __init__(self):
+        args = json.loads(basic._ANSIBLE_ARGS)
+        if args.get('exit'):
+            sys.exit(args['exit'])
+        print(json.dumps(dict(pid=os.getpid(), cwd=os.getcwd())))
+'''
+
+
+@pytest.fixture
+def environ():
+    # run_request replaces the environment of the process running it
+    saved = dict(os.environ)
+    yield
+    os.environ.clear()
+    os.environ.update(saved)
+
+
+@pytest.fixture
+def directory(tmpdir, monkeypatch):
+    # Unix socket paths are limited to about 100 characters
+    path = str(tmpdir.join('w'))
+    monkeypatch.setenv('ANSIBLE_AZURE_WORKER_DIR', path)
+    return path
+
+
+def make_request(key='key', **args):
+    return dict(key=key, source=MODULE_SOURCE, class_name='PidModule', args=json.dumps(args),
+                environ=dict(os.environ), cwd=os.getcwd())
+
+
+def call(socket_path, request, connection=None):
+    '''
+    Send a request to a running worker, as run_in_worker does.
+    '''
+    if connection is None:
+        connection, running = worker._connect(socket_path)
+    assert connection is not None
+    try:
+        worker._send(connection, request)
+        return worker._receive(connection)
+    finally:
+        connection.close()
+
+
+def start_worker(socket_path, monkeypatch, **settings):
+    for name, value in settings.items():
+        monkeypatch.setenv('ANSIBLE_AZURE_WORKER_' + name.upper(), str(value))
+    config = dict(sys_path=list(sys.path), module_utils_path=list(ansible.module_utils.__path__),
+                  socket_path=socket_path, key='key')
+    return worker._get_connection(socket_path, config)
+
+
+def wait_for_exit(socket_path, timeout=10):
+    deadline = time.time() + timeout
+    while os.path.exists(socket_path) and time.time() < deadline:
+        time.sleep(0.05)
+    return not os.path.exists(socket_path)
+
+
+def test_messages_round_trip():
+    left, right = socket.socketpair()
+    try:
+        # larger than the socket buffers, sent while it is received
+        message = dict(text=u'caf\xe9' * 100000, items=list(range(10)))
+        sender = threading.Thread(target=worker._send, args=(left, message))
+        sender.start()
+        assert worker._receive(right) == message
+        sender.join(5)
+        left.close()
+        with pytest.raises(EOFError):
+            worker._receive(right)
+    finally:
+        left.close()
+        right.close()
+
+
+def handle_in_thread(key):
+    left, right = socket.socketpair()
+    thread = threading.Thread(target=worker._handle, args=(right, key))
+    thread.daemon = True
+    thread.start()
+    assert worker._receive(left) == dict(ready=True)
+    return left, thread
+
+
+def test_handle_rejects_other_credentials(environ):
+    connection, thread = handle_in_thread('key')
+    worker._send(connection, make_request(key='other'))
+    assert worker._receive(connection) == dict(error='the worker serves other credentials')
+    thread.join(5)
+    connection.close()
+
+
+def test_handle_runs_module(environ, tmpdir):
+    connection, thread = handle_in_thread('key')
+    request = make_request()
+    request['cwd'] = str(tmpdir)
+    worker._send(connection, request)
+    response = worker._receive(connection)
+    thread.join(5)
+    connection.close()
+
+    assert response['rc'] == 0
+    assert json.loads(response['output']) == dict(pid=os.getpid(), cwd=str(tmpdir))
+    assert os.environ['ANSIBLE_AZURE_WORKER'] == 'off'
+
+
+def test_run_request_reports_exit_code(environ):
+    assert worker.run_request(make_request(exit=3)) == dict(rc=3, output='')
+
+
+def test_worker_directory_is_private(directory):
+    os.makedirs(directory, 0o755)
+    os.chmod(directory, 0o755)
+    assert worker.get_worker_directory() == directory
+    assert stat.S_IMODE(os.stat(directory).st_mode) == 0o700
+
+
+def test_worker_salt_is_random_and_private(directory, tmpdir):
+    other = str(tmpdir.join('other'))
+    os.makedirs(directory)
+    os.makedirs(other)
+    salt = worker.get_worker_salt(directory)
+
+    assert len(salt) == 64
+    assert worker.get_worker_salt(directory) == salt
+    assert worker.get_worker_salt(other) != salt
+    assert stat.S_IMODE(os.stat(os.path.join(directory, 'salt')).st_mode) == 0o600
+
+    os.chmod(os.path.join(directory, 'salt'), 0o644)
+    with pytest.raises(OSError):
+        worker.get_worker_salt(directory)
+
+
+def test_worker_key_depends_on_salt_and_credentials():
+    params = dict(client_id='id', secret='secret', tenant='tenant')
+    key = worker.get_worker_key(params, 'code', b'salt')
+
+    assert worker.get_worker_key(params, 'code', b'salt') == key
+    assert worker.get_worker_key(params, 'code', b'other salt') != key
+    assert worker.get_worker_key(dict(params, secret='other'), 'code', b'salt') != key
+    assert worker.get_worker_key(params, 'other code', b'salt') != key
+
+
+def test_serve_requests_recycles_and_times_out(environ, directory):
+    os.makedirs(directory)
+    socket_path = os.path.join(directory, 'test.sock')
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(socket_path)
+    listener.listen(4)
+    try:
+        codes = []
+        thread = threading.Thread(target=lambda: codes.append(worker._serve_requests(listener, 'key', 5, 2)))
+        thread.start()
+        responses = [call(socket_path, make_request()) for _ in range(2)]
+        thread.join(5)
+        assert [x['rc'] for x in responses] == [0, 0]
+        assert codes == [worker.AZURE_WORKER_RECYCLE]
+
+        start = time.time()
+        assert worker._serve_requests(listener, 'key', 0.2, 2) == 0
+        assert time.time() - start < 2
+    finally:
+        listener.close()
+
+
+def test_get_connection_gives_up_on_busy_worker(directory, monkeypatch):
+    os.makedirs(directory)
+    socket_path = os.path.join(directory, 'busy.sock')
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(socket_path)
+    listener.listen(4)
+    monkeypatch.setattr(worker, 'AZURE_WORKER_CONNECT_TIMEOUT', 0.2)
+    monkeypatch.setattr(worker, '_start_worker', lambda config: pytest.fail('a running worker was started again'))
+    try:
+        # the worker accepts the connection but none of its processes is free to greet
+        assert worker._get_connection(socket_path, dict()) is None
+    finally:
+        listener.close()
+
+
+def test_worker_starts_over_stale_socket_recycles_and_exits(directory, monkeypatch):
+    os.makedirs(directory)
+    socket_path = os.path.join(directory, 'worker.sock')
+    # left behind by a worker which was killed
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(socket_path)
+    stale.close()
+
+    connection = start_worker(socket_path, monkeypatch, processes=1, max_requests=2, idle_timeout=1)
+    pids = [json.loads(call(socket_path, make_request(), connection if x == 0 else None)['output'])['pid'] for x in range(5)]
+
+    # every process serves two modules and is then replaced
+    assert pids[0] == pids[1] and pids[2] == pids[3]
+    assert len(set(pids)) == 3
+    assert call(socket_path, make_request(key='other')) == dict(error='the worker serves other credentials')
+    assert wait_for_exit(socket_path)
+
+
+def test_modules_run_in_worker(arm, directory, tmpdir):
+    env = arm.module_env()
+    env.update(ANSIBLE_AZURE_WORKER='on', ANSIBLE_AZURE_WORKER_DIR=directory, ANSIBLE_AZURE_WORKER_PROCESSES='1',
+               ANSIBLE_AZURE_WORKER_IDLE_TIMEOUT='2')
+    logs = [str(tmpdir.join('run{0}.log'.format(x))) for x in range(2)]
+    runs = [run_module('azure_rm_appgwroutetable', dict(resource_group='rg', route_table_name='table', log_mode='file',
+                                                         log_path=log), env) for log in logs]
+
+    assert [x['rc'] for x in runs] == [0, 0], [x['stderr'] for x in runs]
+    assert [x['result']['changed'] for x in runs] == [True, False]
+    assert [x['method'] for x in arm.arm.requests if x['method'] != 'GET'] == ['PUT']
+
+    # both modules ran in the same worker process
+    pids = [set(json.loads(line)['pid'] for line in open(log)) for log in logs]
+    assert pids[0] & pids[1]
+
+    sockets = [x for x in os.listdir(directory) if x.endswith('.sock')]
+    assert len(sockets) == 1
+    assert stat.S_IMODE(os.stat(directory).st_mode) == 0o700
+    assert stat.S_IMODE(os.stat(os.path.join(directory, 'salt')).st_mode) == 0o600
+    assert wait_for_exit(os.path.join(directory, sockets[0]))